@@ -1,13 +1,15 @@
 """Hash generation utilities for deterministic data hashing."""
 
 import hashlib
-import io
 from typing import Optional
 
 import pandas as pd
 
 from .exceptions import HashGenerationError
 
+# Rows serialized per update when hashing without an explicit chunk size.
+DEFAULT_CHUNK_ROWS = 50_000
+
 
 class HashGenerator:
     """Generates deterministic hashes for DataFrames."""
@@ -48,23 +50,18 @@ class HashGenerator:
 
     def _generate_single_hash(self, data: pd.DataFrame, normalize: bool) -> str:
         """Generate hash for entire DataFrame at once."""
-        # Prepare data for hashing
-        prepared_data = self._prepare_data_for_hashing(data, normalize)
-
-        # Convert to bytes
-        data_bytes = self._dataframe_to_bytes(prepared_data)
-
-        # Generate hash
-        hasher = hashlib.new(self.algorithm)
-        hasher.update(data_bytes)
-
-        return hasher.hexdigest()
+        return self._generate_chunked_hash(data, normalize, DEFAULT_CHUNK_ROWS)
 
     def _generate_chunked_hash(self,
                               data: pd.DataFrame,
                               normalize: bool,
                               chunk_size: int) -> str:
-        """Generate hash by processing data in chunks."""
+        """Generate hash by processing data in chunks.
+
+        Rows are serialized ``chunk_size`` at a time straight into the hasher, so
+        the CSV text of the whole dataset is never held in memory. The digest is
+        the same whatever the chunk size.
+        """
         # For chunked hashing to be deterministic, we need to prepare the entire
         # dataset first, then process it in chunks
         prepared_data = self._prepare_data_for_hashing(data, normalize)
@@ -93,61 +90,30 @@ class HashGenerator:
             normalize: Whether to normalize the data
 
         Returns:
-            Prepared DataFrame
+            Prepared DataFrame (``data`` itself when not normalizing; it is only read)
 
         """
-        prepared = data.copy()
-
-        if normalize:
-            # Sort by all columns for consistent ordering
-            prepared = prepared.sort_values(by=list(prepared.columns))
-
-            # Reset index to ensure consistent row ordering
-            prepared = prepared.reset_index(drop=True)
-
-            # Handle different data types consistently
-            for col in prepared.columns:
-                if prepared[col].dtype == "object":
-                    # Convert to string and handle NaN consistently
-                    prepared[col] = prepared[col].astype(str).replace("nan", "")
-                elif prepared[col].dtype in ["float64", "float32"]:
-                    # Round floats to avoid precision issues
-                    prepared[col] = prepared[col].round(10)
-                elif pd.api.types.is_datetime64_any_dtype(prepared[col]):
-                    # Convert datetime to ISO format string
-                    prepared[col] = prepared[col].dt.strftime("%Y-%m-%d %H:%M:%S")
+        if not normalize:
+            return data
+
+        # Sort by all columns for consistent ordering and reset the index; the
+        # sort already returns a new frame, so the input is never modified
+        prepared = data.sort_values(by=list(data.columns), ignore_index=True)
+
+        # Handle different data types consistently
+        for col in prepared.columns:
+            if prepared[col].dtype == "object":
+                # Convert to string and handle NaN consistently
+                prepared[col] = prepared[col].astype(str).replace("nan", "")
+            elif prepared[col].dtype in ["float64", "float32"]:
+                # Round floats to avoid precision issues
+                prepared[col] = prepared[col].round(10)
+            elif pd.api.types.is_datetime64_any_dtype(prepared[col]):
+                # Convert datetime to ISO format string
+                prepared[col] = prepared[col].dt.strftime("%Y-%m-%d %H:%M:%S")
 
         return prepared
 
-    def _dataframe_to_bytes(self, data: pd.DataFrame) -> bytes:
-        """Convert DataFrame to bytes for hashing.
-
-        Args:
-            data: DataFrame to convert
-
-        Returns:
-            Bytes representation of the DataFrame
-
-        """
-        # Create a string representation that includes both data and structure
-        buffer = io.StringIO()
-
-        # Include column names and types
-        buffer.write("COLUMNS:")
-        buffer.write(",".join(data.columns))
-        buffer.write("\n")
-
-        buffer.write("DTYPES:")
-        buffer.write(",".join(str(dtype) for dtype in data.dtypes))
-        buffer.write("\n")
-
-        # Include data
-        buffer.write("DATA:\n")
-        data.to_csv(buffer, index=False, header=False, na_rep="")
-
-        # Convert to bytes
-        return buffer.getvalue().encode("utf-8")
-
     def verify_hash(self,
                    data: pd.DataFrame,
                    expected_hash: str,
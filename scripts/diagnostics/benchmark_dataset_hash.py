@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+"""Benchmark streaming dataset hashing against the in-memory implementations it replaced.
+
+Generates a synthetic dataset, then hashes it once per implementation, each in a
+fresh interpreter so peak RSS is measured in isolation:
+
+* ``file``: the custom-eval dataset hash (load every row, sort by canonical JSON,
+  dump the whole array) vs :func:`src.utils.dataset_hash.canonical_dataset_sha256`.
+* ``frame``: ``DataIntegrator.calculate_data_hash`` (sorted copy plus one
+  ``to_json`` document) vs :func:`src.utils.dataset_hash.dataframe_records_sha256`.
+* ``cli``: the ``hokusai-validate`` hash (frame copy plus a full CSV buffer) vs the
+  chunked :class:`hokusai_validate.hash_generator.HashGenerator`.
+
+Each pair must produce the same digest. ``frame`` and ``cli`` hash a loaded
+DataFrame, so the frame itself counts toward their peak RSS on both sides.
+
+Example::
+
+    PYTHONPATH=. python scripts/diagnostics/benchmark_dataset_hash.py --rows 2000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import io
+import json
+import logging
+import os
+import random
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Any, Callable
+
+LOGGER = logging.getLogger(__name__)
+REPO_ROOT = Path(__file__).resolve().parents[2]
+GENERATE_BATCH_ROWS = 100_000
+
+
+class BenchmarkError(RuntimeError):
+    """Raised when an implementation fails or the digests of a pair disagree."""
+
+
+def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
+    """Parse CLI arguments."""
+    parser = argparse.ArgumentParser(
+        description="Compare peak RSS and wall time of dataset hashing implementations."
+    )
+    parser.add_argument("--rows", type=int, default=1_000_000, help="Synthetic rows to hash")
+    parser.add_argument(
+        "--format",
+        choices=("jsonl", "parquet"),
+        default="parquet",
+        help="File format used for the file-hash comparison",
+    )
+    parser.add_argument(
+        "--only",
+        nargs="+",
+        choices=("file", "frame", "cli"),
+        default=("file", "frame", "cli"),
+        help="Comparisons to run",
+    )
+    parser.add_argument(
+        "--work-dir",
+        type=Path,
+        default=None,
+        help="Directory for the generated dataset (defaults to a temporary directory)",
+    )
+    parser.add_argument("--_measure", nargs=2, metavar=("IMPL", "PATH"), help=argparse.SUPPRESS)
+    return parser.parse_args(argv)
+
+
+def _peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is kilobytes on Linux and bytes on macOS
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def _synthetic_rows(start: int, count: int, rng: random.Random) -> list[dict[str, Any]]:
+    return [
+        {
+            "row_id": f"row-{index:09d}",
+            "prompt": " ".join(rng.choice(("alpha", "beta", "gamma", "delta")) for _ in range(12)),
+            "label": rng.choice(("qualified", "unqualified", "spam")),
+            "score": rng.random(),
+            "tokens": rng.randint(1, 4096),
+            "accepted": rng.random() < 0.5,
+        }
+        for index in range(start, start + count)
+    ]
+
+
+def _generate_dataset(rows: int, work_dir: Path, file_format: str) -> Path:
+    """Write ``rows`` synthetic rows batch by batch, in shuffled order."""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    rng = random.Random(7)
+    starts = list(range(0, rows, GENERATE_BATCH_ROWS))
+    rng.shuffle(starts)
+    path = work_dir / f"dataset.{file_format}"
+    if file_format == "jsonl":
+        with path.open("w", encoding="utf-8") as f:
+            for start in starts:
+                for row in _synthetic_rows(start, min(GENERATE_BATCH_ROWS, rows - start), rng):
+                    f.write(json.dumps(row))
+                    f.write("\n")
+        return path
+
+    writer = None
+    try:
+        for start in starts:
+            batch = _synthetic_rows(start, min(GENERATE_BATCH_ROWS, rows - start), rng)
+            table = pa.Table.from_pylist(batch)
+            if writer is None:
+                writer = pq.ParquetWriter(path, table.schema)
+            writer.write_table(table)
+    finally:
+        if writer is not None:
+            writer.close()
+    return path
+
+
+def _load_frame(path: Path) -> Any:  # noqa: ANN401
+    import pandas as pd
+
+    if path.suffix == ".jsonl":
+        return pd.read_json(path, lines=True)
+    return pd.read_parquet(path)
+
+
+def _file_legacy(path: Path) -> str:
+    """Custom-eval hash before streaming: every row in memory, sorted by its dump."""
+    if path.suffix == ".jsonl":
+        with path.open(encoding="utf-8") as f:
+            rows = [json.loads(line) for line in f if line.strip()]
+    else:
+        rows = _load_frame(path).to_dict("records")
+    rows = sorted(rows, key=lambda row: json.dumps(row, sort_keys=True, separators=(",", ":")))
+    canonical = json.dumps(rows, sort_keys=True, separators=(",", ":"))
+    return "sha256:" + hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def _file_streaming(path: Path) -> str:
+    from src.utils.dataset_hash import canonical_dataset_sha256
+
+    return canonical_dataset_sha256(path)
+
+
+def _frame_legacy(path: Path) -> str:
+    """DataIntegrator hash before streaming: sorted copy and one JSON document."""
+    data_str = _load_frame(path).sort_index().sort_index(axis=1).to_json(orient="records")
+    return hashlib.sha256(data_str.encode()).hexdigest()
+
+
+def _frame_streaming(path: Path) -> str:
+    from src.utils.dataset_hash import dataframe_records_sha256
+
+    return dataframe_records_sha256(_load_frame(path))
+
+
+def _cli_legacy(path: Path) -> str:
+    """hokusai-validate hash before streaming: frame copy and a full CSV buffer."""
+    prepared = _load_frame(path).copy()
+    prepared = prepared.sort_values(by=list(prepared.columns)).reset_index(drop=True)
+    for col in prepared.columns:
+        if prepared[col].dtype == "object":
+            prepared[col] = prepared[col].astype(str).replace("nan", "")
+        elif prepared[col].dtype in ["float64", "float32"]:
+            prepared[col] = prepared[col].round(10)
+    buffer = io.StringIO()
+    buffer.write("COLUMNS:" + ",".join(prepared.columns) + "\n")
+    buffer.write("DTYPES:" + ",".join(str(dtype) for dtype in prepared.dtypes) + "\n")
+    buffer.write("DATA:\n")
+    prepared.to_csv(buffer, index=False, header=False, na_rep="")
+    return hashlib.sha256(buffer.getvalue().encode("utf-8")).hexdigest()
+
+
+def _cli_streaming(path: Path) -> str:
+    sys.path.insert(0, str(REPO_ROOT / "cli"))
+    from hokusai_validate.hash_generator import HashGenerator
+
+    return HashGenerator().generate(_load_frame(path))
+
+
+_RUNNERS: dict[str, Callable[[Path], str]] = {
+    "file-legacy": _file_legacy,
+    "file-streaming": _file_streaming,
+    "frame-legacy": _frame_legacy,
+    "frame-streaming": _frame_streaming,
+    "cli-legacy": _cli_legacy,
+    "cli-streaming": _cli_streaming,
+}
+
+
+def _measure(implementation: str, path: Path) -> int:
+    """Child mode: hash once and report digest, wall time and peak RSS as JSON."""
+    import pandas  # noqa: F401 - keep library import cost out of the baseline
+    import pyarrow.parquet  # noqa: F401
+
+    baseline_mb = _peak_rss_mb()
+    started = time.perf_counter()
+    digest = _RUNNERS[implementation](path)
+    result = {
+        "digest": digest,
+        "seconds": time.perf_counter() - started,
+        "baseline_rss_mb": baseline_mb,
+        "peak_rss_mb": _peak_rss_mb(),
+    }
+    sys.stdout.write(json.dumps(result) + "\n")
+    return 0
+
+
+def _run_child(implementation: str, path: Path) -> dict[str, Any]:
+    completed = subprocess.run(  # noqa: S603
+        [sys.executable, __file__, "--_measure", implementation, str(path)],
+        capture_output=True,
+        text=True,
+        check=False,
+        cwd=REPO_ROOT,
+        env={**os.environ, "PYTHONPATH": str(REPO_ROOT)},
+    )
+    if completed.returncode != 0:
+        raise BenchmarkError(f"{implementation} failed:\n{completed.stderr.strip()}")
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def _run_benchmark(args: argparse.Namespace) -> int:
+    with tempfile.TemporaryDirectory(prefix="dataset-hash-bench-") as scratch:
+        work_dir = args.work_dir or Path(scratch)
+        work_dir.mkdir(parents=True, exist_ok=True)
+        LOGGER.info("Generating %d %s rows in %s", args.rows, args.format, work_dir)
+        path = _generate_dataset(args.rows, work_dir, args.format)
+        size_mb = path.stat().st_size / (1024 * 1024)
+
+        lines = [
+            f"Dataset: {args.rows} rows, {args.format}, {size_mb:.1f} MB on disk",
+            "",
+            "| implementation | wall s | peak RSS MB | RSS over baseline MB |",
+            "| --- | ---: | ---: | ---: |",
+        ]
+        for comparison in args.only:
+            results = {}
+            for variant in ("legacy", "streaming"):
+                implementation = f"{comparison}-{variant}"
+                LOGGER.info("Running %s", implementation)
+                results[variant] = result = _run_child(implementation, path)
+                lines.append(
+                    f"| {implementation} | {result['seconds']:.2f} | "
+                    f"{result['peak_rss_mb']:.0f} | "
+                    f"{result['peak_rss_mb'] - result['baseline_rss_mb']:.0f} |"
+                )
+            if results["legacy"]["digest"] != results["streaming"]["digest"]:
+                raise BenchmarkError(f"{comparison} digests differ: {results}")
+
+    sys.stdout.write("\n".join(lines) + "\n")
+    return 0
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Run the dataset hash benchmark CLI."""
+    logging.basicConfig(level=logging.INFO)
+    try:
+        args = parse_args(argv)
+        if args._measure:
+            implementation, path = args._measure
+            if implementation not in _RUNNERS:
+                raise BenchmarkError(f"Unknown implementation: {implementation}")
+            return _measure(implementation, Path(path))
+        return _run_benchmark(args)
+    except BenchmarkError as exc:
+        sys.stderr.write(f"{exc}\n")
+        return 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -11,6 +11,7 @@ OutputNormalizer = Callable[[Any, Any], dict[str, Any]]
 ModelCaller = Callable[[str, object, dict[str, float] | None], Any]
 CacheChecker = Callable[[str], bool]
 LocalPredictor = Callable[[Any, dict[str, Any], dict[str, Any] | None], dict[str, Any]]
+BatchPredictor = Callable[[Any, list[dict[str, Any]], dict[str, Any] | None], list[dict[str, Any]]]
 
 
 @dataclass(frozen=True)
@@ -39,6 +40,7 @@ class ModelRegistryEntry:
     repository_id: str | None = None
     cache_duration: int | None = None
     local_predictor: LocalPredictor | None = None
+    batch_predictor: BatchPredictor | None = None
 
     def as_public_config(self: ModelRegistryEntry) -> dict[str, Any]:
         """Return the JSON-safe config shape exposed by API endpoints."""
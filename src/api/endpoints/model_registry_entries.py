@@ -33,7 +33,7 @@ MODEL_CONFIGS: dict[str, ModelRegistryEntry] = {
         is_private=True,
         inference_method="local",
         cache_duration=3600,
-        max_batch_size=100,
+        max_batch_size=1000,
         supported_inference_methods=("api", "local"),
     ),
     "27": ModelRegistryEntry(
@@ -12,20 +12,20 @@ import asyncio
 import logging
 import os
 import pickle
-import tempfile
 import time
 from dataclasses import replace
 from datetime import datetime
 from typing import Any, Dict, Optional
 
 import numpy as np
+import pandas as pd
 import requests
 from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Request
 from fastapi.responses import JSONResponse
-from huggingface_hub import hf_hub_download, snapshot_download
 from pydantic import BaseModel, Field, ValidationError
 
 from ...middleware.auth import require_auth
+from ...services.model_storage.artifact_cache import BoundedModelCache, ModelArtifactCache
 from ...utils.mlflow_health import check_mlflow_registry_sdk
 from ..dependencies import get_contributor_logger
 from ..middleware.validation_logging import (
@@ -52,6 +52,30 @@ logger = logging.getLogger(__name__)
 # Create router
 router = APIRouter(prefix="/api/v1/models", tags=["model-serving"])
 
+# Sales lead (model 21) feature encodings, shared by the single and batch paths
+SALES_LEAD_NUMERIC_FIELDS = (
+    "company_size",
+    "engagement_score",
+    "website_visits",
+    "email_opens",
+    "content_downloads",
+)
+SALES_LEAD_BOOLEAN_FIELDS = ("demo_requested", "budget_confirmed")
+SALES_LEAD_INDUSTRY_SCORES = {
+    "Technology": 3,
+    "Finance": 3,
+    "Healthcare": 2,
+    "Retail": 1,
+    "Other": 1,
+}
+SALES_LEAD_TIMELINE_SCORES = {
+    "Q1 2025": 3,
+    "Q2 2025": 2,
+    "Q3 2025": 1,
+    "Q4 2025": 1,
+    "Not specified": 0,
+}
+
 
 def _log_mlflow_inference_failure(
     model_id: str,
@@ -115,7 +139,12 @@ def _enforce_model_30_warmup_gate(model_id: str) -> None:
 class PredictionRequest(BaseModel):
     """Request schema for model predictions."""
 
-    inputs: dict[str, Any] = Field(..., description="Input data for prediction")
+    inputs: dict[str, Any] | list[dict[str, Any]] = Field(
+        ...,
+        description=(
+            "Input data for prediction, or a list of records for models that support batches"
+        ),
+    )
     options: Optional[dict[str, Any]] = Field(
         default_factory=dict, description="Additional options"
     )
@@ -144,7 +173,13 @@ class ModelServingService:
     """
 
     def __init__(self):
-        self.model_cache = {}
+        max_cache_bytes = os.getenv("MODEL_SERVING_MODEL_CACHE_MAX_BYTES")
+        self.model_cache = BoundedModelCache(
+            max_entries=int(os.getenv("MODEL_SERVING_MAX_CACHED_MODELS", "8")),
+            max_bytes=int(max_cache_bytes) if max_cache_bytes else None,
+        )
+        self._artifact_cache: Optional[ModelArtifactCache] = None
+        self._artifact_sizes: dict[str, int] = {}
         self.hf_token = os.getenv("HUGGINGFACE_API_KEY")
         self.inference_api_url = "https://api-inference.huggingface.co/models"
         self.prediction_timeout_seconds = float(
@@ -161,6 +196,7 @@ class ModelServingService:
             MODEL_CONFIGS["21"] = replace(
                 model_21_entry,
                 local_predictor=self._predict_sales_lead_local,
+                batch_predictor=self._predict_sales_lead_batch,
             )
 
     def get_registry_entry(self, model_id: str) -> ModelRegistryEntry:
@@ -220,30 +256,30 @@ class ModelServingService:
             logger.error(f"Failed to load model from HuggingFace: {str(e)}")
             raise HTTPException(status_code=500, detail=f"Failed to load model: {str(e)}")
 
+    @property
+    def artifact_cache(self) -> ModelArtifactCache:
+        """Persistent on-disk artifact cache, created on first use."""
+        if self._artifact_cache is None:
+            self._artifact_cache = ModelArtifactCache()
+        return self._artifact_cache
+
     def _load_model_from_huggingface_sync(self, repository_id: str, model_type: str) -> Any:
-        with tempfile.TemporaryDirectory() as tmpdir:
-            if model_type == "sklearn":
-                model_path = hf_hub_download(
-                    repo_id=repository_id,
-                    filename="model.pkl",
-                    token=self.hf_token,
-                    cache_dir=tmpdir,
-                )
-                with open(model_path, "rb") as f:
-                    return pickle.load(f)
-
-            if model_type == "pytorch":
-                model_path = hf_hub_download(
-                    repo_id=repository_id,
-                    filename="pytorch_model.bin",
-                    token=self.hf_token,
-                    cache_dir=tmpdir,
-                )
-                import torch
+        if model_type == "sklearn":
+            model_path = self.artifact_cache.fetch(repository_id, "model.pkl", token=self.hf_token)
+            self._artifact_sizes[repository_id] = model_path.stat().st_size
+            with open(model_path, "rb") as f:
+                return pickle.load(f)
+
+        if model_type == "pytorch":
+            model_path = self.artifact_cache.fetch(
+                repository_id, "pytorch_model.bin", token=self.hf_token
+            )
+            self._artifact_sizes[repository_id] = model_path.stat().st_size
+            import torch
 
-                return torch.load(model_path)
+            return torch.load(model_path)
 
-            return snapshot_download(repo_id=repository_id, token=self.hf_token, cache_dir=tmpdir)
+        return str(self.artifact_cache.fetch_snapshot(repository_id, token=self.hf_token))
 
     async def predict_with_inference_api(
         self, repository_id: str, inputs: dict[str, Any]
@@ -297,11 +333,40 @@ class ModelServingService:
             timeout=self.prediction_timeout_seconds,
         )
 
+    async def predict_local_batch(
+        self,
+        entry: ModelRegistryEntry,
+        model: Any,
+        records: list[dict[str, Any]],
+        options: Optional[dict[str, Any]] = None,
+    ) -> list[dict[str, Any]]:
+        """Run one vectorized local prediction over a batch of records."""
+        if entry.batch_predictor is None:
+            raise NotImplementedError(f"Batch prediction not implemented for model {entry.name}")
+
+        return await asyncio.wait_for(
+            asyncio.to_thread(entry.batch_predictor, model, records, options),
+            timeout=self.prediction_timeout_seconds,
+        )
+
     @staticmethod
     def _predict_sales_lead_sync(classifier: Any, features: np.ndarray) -> tuple[Any, Any]:
-        prediction = classifier.predict(features)[0]
-        probabilities = classifier.predict_proba(features)[0]
-        return prediction, probabilities
+        # predict() would repeat the forward pass; derive the label from the probabilities
+        probabilities = np.asarray(classifier.predict_proba(features))
+        labels = probabilities.argmax(axis=1)
+        classes = getattr(classifier, "classes_", None)
+        if classes is not None:
+            labels = np.asarray(classes)[labels]
+        return labels[0], probabilities[0]
+
+    @staticmethod
+    def _get_sales_lead_classifier(model: Any) -> Any:
+        if isinstance(model, dict):
+            classifier = model.get("model")
+            if classifier is None:
+                raise ValueError("Model not found in loaded data")
+            return classifier
+        return model
 
     def _prepare_sales_lead_features(self, data: dict[str, Any]) -> np.ndarray:
         """Prepare features for Sales Lead Scoring Model (ID 21).
@@ -322,22 +387,12 @@ class ModelServingService:
         features.append(1 if data.get("budget_confirmed", False) else 0)
 
         # Categorical features (simplified encoding)
-        industry_score = {
-            "Technology": 3,
-            "Finance": 3,
-            "Healthcare": 2,
-            "Retail": 1,
-            "Other": 1,
-        }.get(data.get("industry", "Other"), 1)
+        industry_score = SALES_LEAD_INDUSTRY_SCORES.get(data.get("industry", "Other"), 1)
         features.append(industry_score)
 
-        timeline_score = {
-            "Q1 2025": 3,
-            "Q2 2025": 2,
-            "Q3 2025": 1,
-            "Q4 2025": 1,
-            "Not specified": 0,
-        }.get(data.get("decision_timeline", "Not specified"), 0)
+        timeline_score = SALES_LEAD_TIMELINE_SCORES.get(
+            data.get("decision_timeline", "Not specified"), 0
+        )
         features.append(timeline_score)
 
         # Title feature
@@ -353,6 +408,89 @@ class ModelServingService:
 
         return np.array(features).reshape(1, -1)
 
+    @staticmethod
+    def _prepare_sales_lead_features_batch(records: list[dict[str, Any]]) -> np.ndarray:
+        """Prepare the model 21 feature matrix for many leads at once.
+
+        Column-wise equivalent of ``_prepare_sales_lead_features``: categorical
+        lookups become ``Series.map`` and title scoring becomes vectorized
+        substring matching, so the cost per lead stays flat as batches grow.
+        """
+        frame = pd.DataFrame.from_records(
+            records,
+            columns=[
+                *SALES_LEAD_NUMERIC_FIELDS,
+                *SALES_LEAD_BOOLEAN_FIELDS,
+                "industry",
+                "decision_timeline",
+                "title",
+            ],
+        )
+        features = np.empty((len(frame), 10), dtype=np.float64)
+
+        for i, field in enumerate(SALES_LEAD_NUMERIC_FIELDS):
+            features[:, i] = frame[field].fillna(0).to_numpy(dtype=np.float64)
+        for i, field in enumerate(SALES_LEAD_BOOLEAN_FIELDS, start=5):
+            features[:, i] = frame[field].fillna(False).astype(bool).to_numpy()
+
+        features[:, 7] = frame["industry"].map(SALES_LEAD_INDUSTRY_SCORES).fillna(1).to_numpy()
+        features[:, 8] = (
+            frame["decision_timeline"].map(SALES_LEAD_TIMELINE_SCORES).fillna(0).to_numpy()
+        )
+
+        titles = frame["title"].fillna("").astype(str).str.lower()
+        features[:, 9] = np.select(
+            [
+                titles.str.contains("vp", regex=False)
+                | titles.str.contains("vice president", regex=False),
+                titles.str.contains("director", regex=False),
+                titles.str.contains("manager", regex=False),
+            ],
+            [3, 2, 1],
+            default=0,
+        )
+        return features
+
+    def _predict_sales_lead_batch(
+        self,
+        model: Any,
+        records: list[dict[str, Any]],
+        options: Optional[dict[str, Any]] = None,
+    ) -> list[dict[str, Any]]:
+        """Score many leads with a single ``predict_proba`` call."""
+        del options
+        features = self._prepare_sales_lead_features_batch(records)
+        classifier = self._get_sales_lead_classifier(model)
+
+        probabilities = np.asarray(classifier.predict_proba(features))
+        conversion = probabilities[:, 1]
+        lead_scores = (conversion * 100).astype(int)
+        recommendations = np.select(
+            [lead_scores >= 70, lead_scores >= 40], ["Hot", "Warm"], default="Cold"
+        )
+        confidences = probabilities.max(axis=1)
+        high_engagement = features[:, 1] > 70
+
+        results = []
+        for i, lead in enumerate(records):
+            factors = []
+            if lead.get("demo_requested"):
+                factors.append("Demo requested")
+            if lead.get("budget_confirmed"):
+                factors.append("Budget confirmed")
+            if high_engagement[i]:
+                factors.append("High engagement")
+            results.append(
+                {
+                    "lead_score": int(lead_scores[i]),
+                    "conversion_probability": float(conversion[i]),
+                    "recommendation": str(recommendations[i]),
+                    "factors": factors,
+                    "confidence": float(confidences[i]),
+                }
+            )
+        return results
+
     def _predict_sales_lead_local(
         self,
         model: Any,
@@ -362,13 +500,7 @@ class ModelServingService:
         """Predict using the sales lead local sklearn artifact."""
         del options
         features = self._prepare_sales_lead_features(inputs)
-
-        if isinstance(model, dict):
-            classifier = model.get("model")
-            if classifier is None:
-                raise ValueError("Model not found in loaded data")
-        else:
-            classifier = model
+        classifier = self._get_sales_lead_classifier(model)
 
         _prediction, probabilities = self._predict_sales_lead_sync(classifier, features)
         lead_score = int(probabilities[1] * 100)
@@ -399,7 +531,7 @@ class ModelServingService:
     async def serve_prediction(  # noqa: C901
         self,
         model_id: str,
-        inputs: dict[str, Any],
+        inputs: dict[str, Any] | list[dict[str, Any]],
         options: dict[str, Any],
         request_id: str = "",
         caller_context: dict | None = None,
@@ -409,7 +541,7 @@ class ModelServingService:
         Args:
         ----
             model_id: Model ID (e.g., "21")
-            inputs: Input data for prediction
+            inputs: Input data for prediction, or a list of records to score as one batch
             options: Additional options
 
         Returns:
@@ -432,6 +564,9 @@ class ModelServingService:
         # Determine inference method
         inference_method = options.get("inference_method", config["inference_method"])
 
+        if isinstance(inputs, list):
+            self._validate_batch(entry, inputs, inference_method)
+
         if inference_method == "api":
             # Use HuggingFace Inference API (rate limited but no download needed)
             predictions = await self.predict_with_inference_api(config["repository_id"], inputs)
@@ -451,16 +586,17 @@ class ModelServingService:
                         "model": model,
                         "loaded_at": datetime.utcnow(),
                         "config": config,
+                        "size_bytes": self._artifact_sizes.get(repository_id, 0),
                     }
                     cached_model = self.model_cache[cache_key]
 
             # Run local prediction
-            predictions = await self.predict_local(
-                entry,
-                cached_model["model"] if cached_model else None,
-                inputs,
-                options,
-            )
+            model = cached_model["model"] if cached_model else None
+            if isinstance(inputs, list):
+                results = await self.predict_local_batch(entry, model, inputs, options)
+                predictions = {"results": results, "count": len(results)}
+            else:
+                predictions = await self.predict_local(entry, model, inputs, options)
 
         elif inference_method == "mlflow_pyfunc":
             predictions = await self._serve_mlflow_prediction(
@@ -478,6 +614,26 @@ class ModelServingService:
 
         return predictions
 
+    @staticmethod
+    def _validate_batch(
+        entry: ModelRegistryEntry, records: list[dict[str, Any]], inference_method: str
+    ) -> None:
+        if entry.batch_predictor is None or inference_method != "local":
+            raise HTTPException(
+                status_code=400,
+                detail=f"Batch prediction is not supported for {entry.name} ({inference_method})",
+            )
+        if not records:
+            raise HTTPException(status_code=400, detail="Batch inputs must not be empty")
+        if len(records) > entry.max_batch_size:
+            raise HTTPException(
+                status_code=400,
+                detail=(
+                    f"Batch of {len(records)} records exceeds max_batch_size "
+                    f"{entry.max_batch_size} for {entry.name}"
+                ),
+            )
+
     def _get_required_mlflow_component(self, entry: ModelRegistryEntry, field_name: str) -> Any:
         value = getattr(entry, field_name)
         if value is None:
@@ -750,7 +906,9 @@ async def predict(
     """Run prediction for a model.
 
     This is the main endpoint that clients call with their Hokusai API key.
-    Authentication is handled by APIKeyAuthMiddleware.
+    Authentication is handled by APIKeyAuthMiddleware. Models with a batch
+    predictor (e.g. model 21) also accept a list of records as ``inputs`` and
+    return ``{"results": [...], "count": n}``.
 
     Args:
     ----
@@ -820,6 +978,10 @@ async def predict(
             "user_id": user_id,
             "api_key_id": api_key_id,
         }
+        if isinstance(payload.inputs, list):
+            metadata["batch_size"] = len(payload.inputs)
+            # Validated and served: APIKeyAuthMiddleware bills one prediction per record
+            http_request.state.predictions_count = len(payload.inputs)
         if model_config["storage_type"] == "mlflow":
             metadata.update(
                 {
@@ -843,7 +1005,9 @@ async def predict(
             api_token_id=str(api_key_id or "unknown"),
             model_name=model_config.get("name", model_id),
             model_version=model_version,
-            input_payload=payload.inputs,
+            input_payload=(
+                {"records": payload.inputs} if isinstance(payload.inputs, list) else payload.inputs
+            ),
             output_payload=predictions,
             trace_metadata={
                 "latency_ms": inference_latency_ms,
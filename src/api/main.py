@@ -148,7 +148,8 @@ from src.api.routes import mlflow_proxy_improved as mlflow_proxy
 # TODO: Fix missing APIKeyModel dependency before enabling auth
 # from src.api import auth
 from src.api.utils.config import get_settings
-from src.middleware.auth import APIKeyAuthMiddleware
+from src.events.publishers.factory import close_publisher
+from src.middleware.auth import APIKeyAuthMiddleware, close_auth_middleware_clients
 from src.middleware.rate_limiter import RateLimitMiddleware
 from src.utils.mlflow_url import get_mlflow_url
 
@@ -384,6 +385,16 @@ async def shutdown_event() -> None:
     """Cleanup on shutdown."""
     logger.info("Shutting down Hokusai MLOps API...")
 
+    await close_auth_middleware_clients()
+    await mlflow_proxy.close_proxy_client()
+    # Deliver queued webhooks before exit; blocks up to the publisher's drain timeout
+    await asyncio.to_thread(close_publisher)
+    from src.api.dependencies import get_contribution_service
+
+    # Flush queued auth-service notifications if the contribution service was used
+    if get_contribution_service.cache_info().currsize:
+        await asyncio.to_thread(get_contribution_service().close)
+
     # Stop evaluation scheduler if running
     scheduler = getattr(app.state, "evaluation_scheduler", None)
     if scheduler is not None:
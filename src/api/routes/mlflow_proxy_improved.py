@@ -1,13 +1,18 @@
 """MLflow proxy router to forward requests to MLflow server with improved routing."""
 
+import asyncio
 import datetime
+import importlib.util
 import json
 import logging
 import os
+import threading
 from typing import Any
 
 import httpx
 from fastapi import APIRouter, HTTPException, Request, Response
+from fastapi.responses import StreamingResponse
+from starlette.background import BackgroundTask
 
 from src.utils.mlflow_mtls import mlflow_mtls_httpx_kwargs
 from src.utils.mlflow_url import get_mlflow_url
@@ -19,6 +24,65 @@ router = APIRouter()
 MLFLOW_SERVER_URL = get_mlflow_url()
 PROXY_TIMEOUT = 30.0  # seconds
 ENABLE_DEBUG_LOGGING = os.getenv("MLFLOW_PROXY_DEBUG", "false").lower() == "true"
+PROXY_LIMITS = httpx.Limits(
+    max_connections=int(os.getenv("MLFLOW_PROXY_MAX_CONNECTIONS", "100")),
+    max_keepalive_connections=int(os.getenv("MLFLOW_PROXY_MAX_KEEPALIVE", "20")),
+    keepalive_expiry=30.0,
+)
+# HTTP/2 is negotiated over TLS only and needs the optional ``h2`` package
+PROXY_HTTP2 = importlib.util.find_spec("h2") is not None
+# Hop-by-hop headers (RFC 9110 section 7.6.1) that a proxy must not forward in
+# either direction; h2 also rejects them as connection-specific fields
+_HOP_BY_HOP_HEADERS = frozenset(
+    {"connection", "keep-alive", "proxy-connection", "te", "transfer-encoding", "upgrade"}
+)
+
+_proxy_clients: dict[asyncio.AbstractEventLoop, httpx.AsyncClient] = {}
+_proxy_client_lock = threading.Lock()
+
+
+def get_proxy_client() -> httpx.AsyncClient:
+    """Return the process-wide pooled MLflow client for the running event loop.
+
+    One client keeps TLS (and mTLS) connections to MLflow alive across proxied
+    requests instead of paying a handshake per call. Connections are bound to
+    the loop that opened them, so each loop gets its own client. Clients of
+    loops that have since closed are dropped.
+    """
+    loop = asyncio.get_running_loop()
+    with _proxy_client_lock:
+        client = _proxy_clients.get(loop)
+        if client is None:
+            for stale in [other for other in _proxy_clients if other.is_closed()]:
+                del _proxy_clients[stale]
+            client = httpx.AsyncClient(
+                timeout=PROXY_TIMEOUT,
+                limits=PROXY_LIMITS,
+                http2=PROXY_HTTP2,
+                **mlflow_mtls_httpx_kwargs(),
+            )
+            _proxy_clients[loop] = client
+    return client
+
+
+async def close_proxy_client() -> None:
+    """Release every pooled MLflow client, e.g. on application shutdown.
+
+    Each client is closed on its own loop; clients of loops that are no longer
+    running are dropped.
+    """
+    with _proxy_client_lock:
+        clients = dict(_proxy_clients)
+        _proxy_clients.clear()
+    current = asyncio.get_running_loop()
+    for loop, client in clients.items():
+        try:
+            if loop is current:
+                await client.aclose()
+            elif loop.is_running():
+                await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(client.aclose(), loop))
+        except Exception as e:
+            logger.warning(f"Error closing MLflow proxy client: {e}")
 
 
 def _translate_path(path: str, mlflow_base_url: str) -> str:
@@ -49,25 +113,37 @@ def _check_artifact_serving(path: str) -> None:
         )
 
 
+def _strip_hop_by_hop(headers: dict[str, str]) -> dict[str, str]:
+    """Drop hop-by-hop headers, including any listed in ``Connection``."""
+    connection = next((v for k, v in headers.items() if k.lower() == "connection"), "")
+    dropped = _HOP_BY_HOP_HEADERS | {
+        name.strip().lower() for name in connection.split(",") if name.strip()
+    }
+    return {key: value for key, value in headers.items() if key.lower() not in dropped}
+
+
 def _prepare_headers(request: Request) -> dict[str, str]:
     """Build forwarding headers from the incoming request."""
-    headers = dict(request.headers)
+    headers = _strip_hop_by_hop(dict(request.headers))
     if hasattr(request.state, "user_id"):
         headers["X-Hokusai-User-Id"] = str(request.state.user_id)
         headers["X-Hokusai-API-Key-Id"] = str(request.state.api_key_id)
         logger.info(f"Adding user context: user_id={request.state.user_id}")
     # CRITICAL: Authorization (Bearer / MLFLOW_TRACKING_TOKEN) and X-API-Key
-    # must be forwarded unchanged; only host/content-length are dropped.
+    # must be forwarded unchanged; only hop-by-hop headers and host/content-length
+    # are dropped.
     headers.pop("host", None)
     headers.pop("content-length", None)
     return headers
 
 
 def _build_mlflow_response(response: httpx.Response, original_path: str) -> Response:
-    """Convert an httpx response from MLflow into a FastAPI Response."""
+    """Convert a fully read httpx response from MLflow into a FastAPI Response."""
     response_headers = dict(response.headers)
     response_headers.pop("transfer-encoding", None)
+    # ``content`` is decoded, so the upstream encoding and length no longer apply
     response_headers.pop("content-encoding", None)
+    response_headers.pop("content-length", None)
 
     if response.status_code >= 400:
         logger.warning(
@@ -91,6 +167,22 @@ def _build_mlflow_response(response: httpx.Response, original_path: str) -> Resp
     )
 
 
+def _build_streaming_response(response: httpx.Response) -> StreamingResponse:
+    """Relay an MLflow response body chunk by chunk without buffering it.
+
+    Raw (still encoded) bytes are passed through, so ``content-encoding`` and
+    ``content-length`` stay valid. The upstream connection returns to the pool
+    once the body has been sent.
+    """
+    response_headers = _strip_hop_by_hop(dict(response.headers))
+    return StreamingResponse(
+        response.aiter_raw(),
+        status_code=response.status_code,
+        headers=response_headers,
+        background=BackgroundTask(response.aclose),
+    )
+
+
 async def proxy_request(
     request: Request, path: str, mlflow_base_url: str | None = None
 ) -> Response:
@@ -132,25 +224,38 @@ async def proxy_request(
 
     body = None
     if method in ["post", "put", "patch"]:
-        body = await request.body()
-        if ENABLE_DEBUG_LOGGING and body:
-            logger.debug(f"Request body size: {len(body)} bytes")
+        # Stream the upload through; a known length is kept so MLflow does not
+        # need to accept a chunked body, otherwise httpx sends it chunked.
+        body = request.stream()
+        content_length = request.headers.get("content-length")
+        if content_length is not None:
+            headers["content-length"] = content_length
+        if ENABLE_DEBUG_LOGGING:
+            logger.debug(f"Streaming request body (content-length={content_length})")
 
     try:
-        async with httpx.AsyncClient(timeout=PROXY_TIMEOUT, **mlflow_mtls_httpx_kwargs()) as client:
-            response = await client.request(
-                method=method,
-                url=target_url,
-                headers=headers,
-                params=query_params,
-                content=body,
-                follow_redirects=False,
-            )
-            logger.info(
-                f"MLflow response: status={response.status_code}, "
-                f"path={original_path}, target={target_url}"
-            )
-            return _build_mlflow_response(response, original_path)
+        client = get_proxy_client()
+        upstream_request = client.build_request(
+            method=method,
+            url=target_url,
+            headers=headers,
+            params=query_params,
+            content=body,
+        )
+        response = await client.send(upstream_request, stream=True, follow_redirects=False)
+        logger.info(
+            f"MLflow response: status={response.status_code}, "
+            f"path={original_path}, target={target_url}"
+        )
+        if response.status_code < 400:
+            return _build_streaming_response(response)
+
+        # Error bodies are small and are logged or rewritten, so read them fully
+        try:
+            await response.aread()
+        finally:
+            await response.aclose()
+        return _build_mlflow_response(response, original_path)
 
     except httpx.TimeoutException:
         logger.error(f"Timeout connecting to MLflow server at {target_url}")
@@ -2,13 +2,19 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 import os
+import queue
+import threading
 import time
+from collections import OrderedDict
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from decimal import Decimal
-from typing import Any, Literal
+from typing import Any, Callable, Literal, Optional
 from urllib.parse import quote
 from uuid import UUID
 
@@ -39,6 +45,17 @@ _AUTH_DIRECT_MINT_SETTLEMENT_PATH = "/api/v1/internal/rewards/settlements/direct
 _AUTH_WALLET_RESOLUTION_PATH = "/api/v1/internal/users/{user_id}/wallet"
 _SUBMISSION_SOURCE = "hokusai_data_pipeline"
 _ENDPOINT_TEMPLATE = "/api/v1/models/{model_id}/contributions"
+_DEFAULT_MAX_CONNECTIONS = 20
+_DEFAULT_WALLET_CACHE_TTL_SECONDS = 300.0
+_WALLET_CACHE_MAX_ENTRIES = 10_000
+_DEFAULT_WALLET_RESOLUTION_CONCURRENCY = 8
+_DEFAULT_OUTBOX_WORKERS = 2
+_DEFAULT_OUTBOX_MAX_SIZE = 1000
+_DEFAULT_OUTBOX_DRAIN_TIMEOUT = 10.0
+
+# (delivered, error_message) as returned by the notify_* methods
+DeliveryResult = tuple[bool, Optional[str]]
+DeliveryCallback = Callable[[bool, Optional[str]], None]
 
 
 @dataclass(frozen=True)
@@ -58,6 +75,11 @@ class WalletResolution:
     wallet_address: str | None
 
 
+_UNRESOLVED_WALLET = WalletResolution(
+    resolved=False, has_verified_wallet=False, wallet_address=None
+)
+
+
 class RewardEntitlementContributor(BaseModel):
     """Contributor-level reward entitlement information."""
 
@@ -206,8 +228,112 @@ def _build_vesting_schedule(
     return schedule
 
 
+class NotificationOutbox:
+    """Bounded queue whose worker threads deliver notifications off the request path.
+
+    Tasks return ``(delivered, error_message)``; an optional callback receives the
+    result once delivery (including retries) has finished. Workers start on the
+    first submission and stop in ``close``.
+    """
+
+    def __init__(
+        self: NotificationOutbox,
+        *,
+        workers: int = _DEFAULT_OUTBOX_WORKERS,
+        max_size: int = _DEFAULT_OUTBOX_MAX_SIZE,
+    ) -> None:
+        self.workers = max(1, workers)
+        self._queue: queue.Queue[
+            tuple[Callable[[], DeliveryResult], DeliveryCallback | None]
+        ] = queue.Queue(maxsize=max_size)
+        self._threads: list[threading.Thread] = []
+        self._lock = threading.Lock()
+        self._idle = threading.Condition(self._lock)
+        self._pending = 0
+        self._closed = False
+
+    @property
+    def pending(self: NotificationOutbox) -> int:
+        """Return the number of submitted tasks that have not finished yet."""
+        return self._pending
+
+    def submit(
+        self: NotificationOutbox,
+        task: Callable[[], DeliveryResult],
+        on_complete: DeliveryCallback | None = None,
+    ) -> bool:
+        """Queue a delivery task; return False when the outbox is full or closed."""
+        with self._lock:
+            if self._closed:
+                return False
+            if not self._threads:
+                for index in range(self.workers):
+                    thread = threading.Thread(
+                        target=self._run, name=f"auth-notifier-outbox-{index}", daemon=True
+                    )
+                    thread.start()
+                    self._threads.append(thread)
+            try:
+                self._queue.put_nowait((task, on_complete))
+            except queue.Full:
+                return False
+            self._pending += 1
+        return True
+
+    def drain(self: NotificationOutbox, timeout: float | None = None) -> bool:
+        """Wait until every submitted task has finished; return False on timeout."""
+        with self._idle:
+            return self._idle.wait_for(lambda: self._pending == 0, timeout=timeout)
+
+    def close(self: NotificationOutbox, timeout: float = _DEFAULT_OUTBOX_DRAIN_TIMEOUT) -> None:
+        """Finish queued deliveries (up to ``timeout``) and stop the workers."""
+        with self._lock:
+            self._closed = True
+            threads, self._threads = self._threads, []
+        if not self.drain(timeout):
+            LOGGER.warning(
+                json.dumps(
+                    {"event": "auth_notifier_outbox_drain_timeout", "pending": self._pending},
+                    sort_keys=True,
+                )
+            )
+        for _ in threads:
+            try:
+                self._queue.put(None, timeout=1.0)  # type: ignore[arg-type]
+            except queue.Full:
+                break
+        for thread in threads:
+            thread.join(timeout=1.0)
+
+    def _run(self: NotificationOutbox) -> None:
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            task, on_complete = item
+            try:
+                delivered, error_message = task()
+            except Exception as exc:  # noqa: BLE001
+                delivered, error_message = False, str(exc)
+            try:
+                if on_complete is not None:
+                    on_complete(delivered, error_message)
+            except Exception:  # noqa: BLE001
+                LOGGER.exception("Auth notification completion callback failed")
+            finally:
+                with self._idle:
+                    self._pending -= 1
+                    self._idle.notify_all()
+
+
 class AuthServiceNotifier:
-    """Small sync client for accepted-submission ledger events."""
+    """Small sync client for accepted-submission ledger events.
+
+    HTTP calls share one pooled ``httpx.Client`` (plus an ``httpx.AsyncClient`` per
+    event loop for the async helpers). Acceptance and lifecycle notifications can be
+    handed to a ``NotificationOutbox`` via ``submit_accepted`` and
+    ``submit_lifecycle_update`` so callers do not wait on auth-service.
+    """
 
     def __init__(
         self: AuthServiceNotifier,
@@ -217,12 +343,36 @@ class AuthServiceNotifier:
         dry_run: bool,
         timeout: float = 5.0,
         retry_attempts: int = 2,
+        max_connections: int = _DEFAULT_MAX_CONNECTIONS,
+        wallet_cache_ttl_seconds: float | None = None,
+        wallet_resolution_concurrency: int = _DEFAULT_WALLET_RESOLUTION_CONCURRENCY,
+        outbox: NotificationOutbox | None = None,
     ) -> None:
         self.auth_service_url = auth_service_url.rstrip("/")
         self.internal_token = (internal_token or "").strip()
         self.dry_run = dry_run
         self.timeout = timeout
         self.retry_attempts = max(1, retry_attempts)
+        self.limits = httpx.Limits(
+            max_connections=max_connections, max_keepalive_connections=max_connections
+        )
+        self.wallet_cache_ttl_seconds = (
+            wallet_cache_ttl_seconds
+            if wallet_cache_ttl_seconds is not None
+            else float(
+                os.getenv(
+                    "HOKUSAI_AUTH_WALLET_CACHE_TTL_SECONDS",
+                    str(_DEFAULT_WALLET_CACHE_TTL_SECONDS),
+                )
+            )
+        )
+        self.wallet_resolution_concurrency = max(1, wallet_resolution_concurrency)
+        self.outbox = outbox or NotificationOutbox()
+        self._client: httpx.Client | None = None
+        self._async_clients: dict[asyncio.AbstractEventLoop, httpx.AsyncClient] = {}
+        self._client_lock = threading.Lock()
+        self._wallet_cache: OrderedDict[str, tuple[float, WalletResolution]] = OrderedDict()
+        self._wallet_cache_lock = threading.Lock()
         self.lifecycle_callback_path = (
             os.getenv("HOKUSAI_AUTH_LIFECYCLE_CALLBACK_PATH", _AUTH_LIFECYCLE_PATH).strip()
             or _AUTH_LIFECYCLE_PATH
@@ -270,6 +420,96 @@ class AuthServiceNotifier:
             dry_run=not callback_enabled or not bool(internal_token.strip()),
         )
 
+    def _get_client(self: AuthServiceNotifier) -> httpx.Client:
+        """Return the pooled sync client, creating it on first use."""
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    self._client = httpx.Client(timeout=self.timeout, limits=self.limits)
+        return self._client
+
+    def _get_async_client(self: AuthServiceNotifier) -> httpx.AsyncClient:
+        """Return the pooled async client for the running event loop.
+
+        Connections are bound to the loop that opened them, so each loop gets its
+        own client. Clients of loops that have since closed are dropped.
+        """
+        loop = asyncio.get_running_loop()
+        with self._client_lock:
+            client = self._async_clients.get(loop)
+            if client is None:
+                for stale in [other for other in self._async_clients if other.is_closed()]:
+                    del self._async_clients[stale]
+                client = httpx.AsyncClient(timeout=self.timeout, limits=self.limits)
+                self._async_clients[loop] = client
+        return client
+
+    def close(self: AuthServiceNotifier) -> None:
+        """Deliver queued notifications and release the sync connection pool."""
+        self.outbox.close()
+        with self._client_lock:
+            client, self._client = self._client, None
+        if client is not None:
+            client.close()
+
+    async def aclose(self: AuthServiceNotifier) -> None:
+        """Release every async connection pool, then the outbox and sync pool.
+
+        Each client is closed on its own loop; clients of loops that are no
+        longer running are dropped.
+        """
+        with self._client_lock:
+            clients, self._async_clients = self._async_clients, {}
+        current = asyncio.get_running_loop()
+        for loop, client in clients.items():
+            try:
+                if loop is current:
+                    await client.aclose()
+                elif loop.is_running():
+                    await asyncio.wrap_future(
+                        asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+                    )
+            except Exception as e:
+                LOGGER.warning("Error closing auth service async client: %s", e)
+        await asyncio.to_thread(self.close)
+
+    def submit_accepted(
+        self: AuthServiceNotifier,
+        *,
+        record: StoredContributionRecord,
+        auth: dict[str, Any],
+        storage_ref: str | None = None,
+    ) -> None:
+        """Queue ``notify_accepted`` on the outbox; deliver inline if the outbox is full."""
+
+        def deliver() -> DeliveryResult:
+            self.notify_accepted(record=record, auth=auth, storage_ref=storage_ref)
+            return True, None
+
+        if self.dry_run or not self.outbox.submit(deliver):
+            deliver()
+
+    def submit_lifecycle_update(
+        self: AuthServiceNotifier,
+        payload: LifecycleUpdatePayload,
+        on_complete: DeliveryCallback,
+    ) -> None:
+        """Queue ``notify_lifecycle_update`` and report its result to ``on_complete``.
+
+        Delivery happens inline (still reporting through ``on_complete``) in dry-run
+        mode or when the outbox is full.
+        """
+
+        def deliver() -> DeliveryResult:
+            return self.notify_lifecycle_update(payload)
+
+        if self.dry_run or not self.outbox.submit(deliver, on_complete):
+            try:
+                delivered, error_message = deliver()
+            except Exception as exc:  # noqa: BLE001
+                delivered, error_message = False, str(exc)
+            on_complete(delivered, error_message)
+
     def notify_reward_entitlement(
         self: AuthServiceNotifier,
         *,
@@ -461,7 +701,9 @@ class AuthServiceNotifier:
             if attempt > 1:
                 time.sleep(2 ** (attempt - 2))
             try:
-                response = httpx.post(url, json=body, headers=headers, timeout=self.timeout)
+                response = self._get_client().post(
+                    url, json=body, headers=headers, timeout=self.timeout
+                )
             except httpx.HTTPError as exc:
                 error_message = str(exc)
                 LOGGER.warning(
@@ -689,7 +931,9 @@ class AuthServiceNotifier:
             if attempt > 1:
                 time.sleep(2 ** (attempt - 2))
             try:
-                response = httpx.post(url, json=body, headers=headers, timeout=self.timeout)
+                response = self._get_client().post(
+                    url, json=body, headers=headers, timeout=self.timeout
+                )
             except httpx.HTTPError as exc:
                 error_message = str(exc)
                 LOGGER.warning(
@@ -826,7 +1070,9 @@ class AuthServiceNotifier:
             if attempt > 1:
                 time.sleep(2 ** (attempt - 2))
             try:
-                response = httpx.post(url, json=payload, headers=headers, timeout=self.timeout)
+                response = self._get_client().post(
+                    url, json=payload, headers=headers, timeout=self.timeout
+                )
             except httpx.HTTPError as exc:
                 self._log_retryable_warning(
                     event="auth_submission_notification_request_error",
@@ -915,7 +1161,7 @@ class AuthServiceNotifier:
             )
         )
 
-    def resolve_wallet(  # noqa: C901
+    def resolve_wallet(
         self: AuthServiceNotifier,
         *,
         user_id: str | None,
@@ -928,55 +1174,185 @@ class AuthServiceNotifier:
         bearer token. ``api_key_id``/``service_id`` are accepted for caller compatibility
         but unused: the deployed resolver is keyed solely by ``user_id`` (auth handles the
         api_key->user_id seam internally). See ``WalletResolution`` for how callers branch.
+        Definitive answers are cached for ``wallet_cache_ttl_seconds``.
         """
-        unresolved = WalletResolution(
-            resolved=False, has_verified_wallet=False, wallet_address=None
-        )
+        unresolved = _UNRESOLVED_WALLET
         if not user_id:
             return unresolved
         if self.dry_run:
-            LOGGER.info(
-                json.dumps(
-                    {"event": "auth_wallet_resolution_dry_run", "user_id": user_id},
-                    default=str,
-                    sort_keys=True,
-                )
-            )
+            self._log_wallet_resolution_dry_run(user_id)
             return unresolved
+        cached = self._cached_wallet(user_id)
+        if cached is not None:
+            return cached
 
         headers = {"Authorization": f"Bearer {self.internal_token}"}
-        path = self.wallet_resolution_path.format(user_id=quote(str(user_id), safe=""))
-        url = f"{self.auth_service_url}{path}"
+        url = self._wallet_resolution_url(user_id)
         for attempt in range(1, self.retry_attempts + 1):
             if attempt > 1:
                 time.sleep(2 ** (attempt - 2))
             try:
-                response = httpx.get(url, headers=headers, timeout=self.timeout)
+                response = self._get_client().get(url, headers=headers, timeout=self.timeout)
             except httpx.HTTPError:
                 continue
             except Exception:  # noqa: BLE001
                 return unresolved
 
-            if response.status_code == 200:
-                try:
-                    body = response.json()
-                except Exception:  # noqa: BLE001
-                    return unresolved
-                wallet = body.get("wallet_address")
-                if wallet is not None and not isinstance(wallet, str):
-                    return unresolved
-                return WalletResolution(
-                    resolved=True,
-                    has_verified_wallet=bool(body.get("has_verified_wallet")),
-                    wallet_address=wallet,
-                )
+            resolution = self._wallet_resolution_from_response(user_id, response)
+            if resolution is not None:
+                return resolution
+        return unresolved
 
-            if response.status_code >= 500:
-                continue
-            # 401/403 (auth/token), 404 (unknown user), 422 (bad id): no definitive answer.
+    async def aresolve_wallet(
+        self: AuthServiceNotifier,
+        *,
+        user_id: str | None,
+    ) -> WalletResolution:
+        """Async variant of ``resolve_wallet`` using the pooled async client."""
+        unresolved = _UNRESOLVED_WALLET
+        if not user_id:
+            return unresolved
+        if self.dry_run:
+            self._log_wallet_resolution_dry_run(user_id)
             return unresolved
+        cached = self._cached_wallet(user_id)
+        if cached is not None:
+            return cached
+
+        headers = {"Authorization": f"Bearer {self.internal_token}"}
+        url = self._wallet_resolution_url(user_id)
+        for attempt in range(1, self.retry_attempts + 1):
+            if attempt > 1:
+                await asyncio.sleep(2 ** (attempt - 2))
+            try:
+                response = await self._get_async_client().get(
+                    url, headers=headers, timeout=self.timeout
+                )
+            except httpx.HTTPError:
+                continue
+            except Exception:  # noqa: BLE001
+                return unresolved
+
+            resolution = self._wallet_resolution_from_response(user_id, response)
+            if resolution is not None:
+                return resolution
         return unresolved
 
+    def resolve_wallets(
+        self: AuthServiceNotifier,
+        account_ids: Iterable[str],
+    ) -> dict[str, WalletResolution]:
+        """Resolve many accounts at once, fanning cache misses out over the pooled client.
+
+        Returns a mapping keyed by every distinct non-empty account id.
+        """
+        unique_ids = [account_id for account_id in dict.fromkeys(account_ids) if account_id]
+        resolutions: dict[str, WalletResolution] = {}
+        misses: list[str] = []
+        for account_id in unique_ids:
+            cached = None if self.dry_run else self._cached_wallet(account_id)
+            if cached is None:
+                misses.append(account_id)
+            else:
+                resolutions[account_id] = cached
+
+        if len(misses) > 1 and not self.dry_run:
+            workers = min(self.wallet_resolution_concurrency, len(misses))
+            with ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix="auth-wallet-resolution"
+            ) as executor:
+                results = executor.map(
+                    lambda account_id: self.resolve_wallet(user_id=account_id), misses
+                )
+                resolutions.update(zip(misses, results))
+        else:
+            for account_id in misses:
+                resolutions[account_id] = self.resolve_wallet(user_id=account_id)
+        return {account_id: resolutions[account_id] for account_id in unique_ids}
+
+    async def aresolve_wallets(
+        self: AuthServiceNotifier,
+        account_ids: Iterable[str],
+    ) -> dict[str, WalletResolution]:
+        """Async variant of ``resolve_wallets`` bounded by ``wallet_resolution_concurrency``."""
+        unique_ids = [account_id for account_id in dict.fromkeys(account_ids) if account_id]
+        semaphore = asyncio.Semaphore(self.wallet_resolution_concurrency)
+
+        async def resolve(account_id: str) -> WalletResolution:
+            async with semaphore:
+                return await self.aresolve_wallet(user_id=account_id)
+
+        results = await asyncio.gather(*(resolve(account_id) for account_id in unique_ids))
+        return dict(zip(unique_ids, results))
+
+    def _wallet_resolution_url(self: AuthServiceNotifier, user_id: str) -> str:
+        path = self.wallet_resolution_path.format(user_id=quote(str(user_id), safe=""))
+        return f"{self.auth_service_url}{path}"
+
+    def _wallet_resolution_from_response(
+        self: AuthServiceNotifier,
+        user_id: str,
+        response: httpx.Response,
+    ) -> WalletResolution | None:
+        """Map a resolver response to a resolution, or None when it should be retried."""
+        if response.status_code == 200:
+            try:
+                body = response.json()
+            except Exception:  # noqa: BLE001
+                return _UNRESOLVED_WALLET
+            wallet = body.get("wallet_address")
+            if wallet is not None and not isinstance(wallet, str):
+                return _UNRESOLVED_WALLET
+            resolution = WalletResolution(
+                resolved=True,
+                has_verified_wallet=bool(body.get("has_verified_wallet")),
+                wallet_address=wallet,
+            )
+            self._cache_wallet(user_id, resolution)
+            return resolution
+
+        if response.status_code >= 500:
+            return None
+        # 401/403 (auth/token), 404 (unknown user), 422 (bad id): no definitive answer.
+        return _UNRESOLVED_WALLET
+
+    def _cached_wallet(self: AuthServiceNotifier, user_id: str) -> WalletResolution | None:
+        with self._wallet_cache_lock:
+            entry = self._wallet_cache.get(user_id)
+            if entry is None:
+                return None
+            expires_at, resolution = entry
+            if expires_at <= time.monotonic():
+                del self._wallet_cache[user_id]
+                return None
+            return resolution
+
+    def _cache_wallet(
+        self: AuthServiceNotifier,
+        user_id: str,
+        resolution: WalletResolution,
+    ) -> None:
+        if self.wallet_cache_ttl_seconds <= 0:
+            return
+        with self._wallet_cache_lock:
+            self._wallet_cache[user_id] = (
+                time.monotonic() + self.wallet_cache_ttl_seconds,
+                resolution,
+            )
+            self._wallet_cache.move_to_end(user_id)
+            while len(self._wallet_cache) > _WALLET_CACHE_MAX_ENTRIES:
+                self._wallet_cache.popitem(last=False)
+
+    @staticmethod
+    def _log_wallet_resolution_dry_run(user_id: str) -> None:
+        LOGGER.info(
+            json.dumps(
+                {"event": "auth_wallet_resolution_dry_run", "user_id": user_id},
+                default=str,
+                sort_keys=True,
+            )
+        )
+
     def _parse_uuid(
         self: AuthServiceNotifier,
         *,
@@ -1121,7 +1497,7 @@ class AuthServiceNotifier:
             if attempt > 1:
                 time.sleep(2 ** (attempt - 2))
             try:
-                response = httpx.post(
+                response = self._get_client().post(
                     url,
                     json=body,
                     headers=headers,
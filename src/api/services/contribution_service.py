@@ -7,13 +7,13 @@ import json
 import logging
 import os
 from dataclasses import dataclass
-from datetime import datetime, timezone
-from functools import lru_cache
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache, partial
 from typing import TYPE_CHECKING, Any, Callable, Protocol
 
 import boto3
 from botocore.exceptions import ClientError
-from sqlalchemy import create_engine
+from sqlalchemy import and_, create_engine, or_
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session, sessionmaker
 
@@ -298,6 +298,12 @@ class ContributionService:
     def store(self: ContributionService, value: ContributionStore) -> None:
         self._store = value
 
+    def close(self: ContributionService) -> None:
+        """Flush queued auth notifications and release the notifier's connections."""
+        close = getattr(self._notifier, "close", None)
+        if close is not None:
+            close()
+
     @staticmethod
     def canonicalize_body(request: ContributionRequest, path_model_id: str) -> dict[str, Any]:
         """Return the internal canonical request payload used for hashing/persistence."""
@@ -542,7 +548,7 @@ class ContributionService:
             session.refresh(row)
             record = self._encode_lifecycle_row(row)
             try:
-                self._notify_lifecycle_update(session=session, row=row)
+                self._notify_lifecycle_update(session=session, row=row, wait=False)
             except Exception:  # noqa: BLE001
                 logger.warning(
                     "Failed to persist lifecycle callback tracking",
@@ -557,7 +563,12 @@ class ContributionService:
             session.close()
 
     def retry_failed_callbacks(self: ContributionService, *, limit: int = 50) -> int:
-        """Retry failed lifecycle callbacks up to the configured max-attempt threshold."""
+        """Retry failed lifecycle callbacks up to the configured max-attempt threshold.
+
+        Callbacks still ``pending`` in the notifier outbox after
+        ``LIFECYCLE_CALLBACK_PENDING_GRACE_SECONDS`` (e.g. lost in a restart) are
+        retried as well.
+        """
         session_factory = self._get_lifecycle_session_factory()
         if session_factory is None:
             raise ContributionLifecycleUnavailableError(
@@ -565,12 +576,22 @@ class ContributionService:
             )
 
         max_attempts = max(1, int(os.getenv("LIFECYCLE_CALLBACK_MAX_ATTEMPTS", "5")))
+        pending_grace = float(os.getenv("LIFECYCLE_CALLBACK_PENDING_GRACE_SECONDS", "300"))
+        stale_pending_before = datetime.now(timezone.utc) - timedelta(seconds=pending_grace)
         session = session_factory()
         delivered = 0
         try:
             rows = (
                 session.query(ContributionLifecycle)
-                .filter(ContributionLifecycle.callback_status == "failed")
+                .filter(
+                    or_(
+                        ContributionLifecycle.callback_status == "failed",
+                        and_(
+                            ContributionLifecycle.callback_status == "pending",
+                            ContributionLifecycle.callback_last_attempt_at < stale_pending_before,
+                        ),
+                    )
+                )
                 .filter(ContributionLifecycle.callback_attempts < max_attempts)
                 .order_by(ContributionLifecycle.updated_at.asc())
                 .limit(limit)
@@ -724,9 +745,13 @@ class ContributionService:
         *,
         session: Session,
         row: ContributionLifecycle,
+        wait: bool = True,
     ) -> bool:
         if self._notifier is None or row.state not in _NOTIFIABLE_LIFECYCLE_STATES:
             return False
+        submit = getattr(self._notifier, "submit_lifecycle_update", None)
+        if not wait and submit is not None:
+            return self._submit_lifecycle_update(session=session, row=row, submit=submit)
 
         delivered = False
         error_message = None
@@ -753,6 +778,71 @@ class ContributionService:
         session.refresh(row)
         return delivered
 
+    def _submit_lifecycle_update(
+        self: ContributionService,
+        *,
+        session: Session,
+        row: ContributionLifecycle,
+        submit: Callable[..., None],
+    ) -> bool:
+        """Mark the callback pending and hand it to the notifier outbox."""
+        try:
+            payload = self._build_lifecycle_update_payload(row)
+        except Exception:  # noqa: BLE001
+            # Let the synchronous path record the failure
+            return self._notify_lifecycle_update(session=session, row=row)
+        row.callback_status = "pending"
+        row.callback_attempts = (row.callback_attempts or 0) + 1
+        row.callback_last_error = None
+        row.callback_last_attempt_at = datetime.now(timezone.utc)
+        session.add(row)
+        session.commit()
+        submit(
+            payload,
+            partial(
+                self._record_lifecycle_callback_result,
+                submission_id=row.submission_id,
+                state=row.state,
+                attempt=row.callback_attempts,
+            ),
+        )
+        return False
+
+    def _record_lifecycle_callback_result(
+        self: ContributionService,
+        delivered: bool,
+        error_message: str | None,
+        *,
+        submission_id: str,
+        state: str,
+        attempt: int,
+    ) -> None:
+        """Persist the outcome of a queued lifecycle callback unless a newer one superseded it."""
+        session_factory = self._get_lifecycle_session_factory()
+        if session_factory is None:
+            return
+        session = session_factory()
+        try:
+            row = (
+                session.query(ContributionLifecycle)
+                .filter(ContributionLifecycle.submission_id == submission_id)
+                .first()
+            )
+            if row is None or row.state != state or row.callback_attempts != attempt:
+                return
+            row.callback_status = "delivered" if delivered else "failed"
+            row.callback_last_error = None if delivered else error_message
+            session.commit()
+        except Exception:  # noqa: BLE001
+            session.rollback()
+            logger.warning(
+                "Failed to persist lifecycle callback result",
+                extra={"submission_id": submission_id, "state": state},
+                exc_info=True,
+            )
+        finally:
+            session.close()
+
     def _build_lifecycle_update_payload(
         self: ContributionService,
         row: ContributionLifecycle,
@@ -875,8 +965,9 @@ class ContributionService:
     ) -> None:
         if self._notifier is None:
             return
+        notify = getattr(self._notifier, "submit_accepted", None) or self._notifier.notify_accepted
         try:
-            self._notifier.notify_accepted(
+            notify(
                 record=record,
                 auth=auth,
                 storage_ref=self._storage_ref_for_record(record),
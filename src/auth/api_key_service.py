@@ -1,16 +1,30 @@
 """API key generation and validation service."""
 
+import hashlib
+import hmac
+import logging
+import os
 import secrets
 import string
 import uuid
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
 import bcrypt
 
 from src.database.operations import DatabaseOperations
 
+logger = logging.getLogger(__name__)
+
+# Environments where an unkeyed lookup digest is refused outright
+_PROTECTED_ENVIRONMENTS = {"production", "staging"}
+
+# Environment prefixes issued by generate_api_key; the stored display prefix
+# appends the first three characters of the random part
+_KEY_PREFIXES = ("hk_live", "hk_test", "hk_dev")
+_KEY_PREFIX_RANDOM_CHARS = 3
+
 
 # Custom exceptions
 class APIKeyError(Exception):
@@ -77,12 +91,52 @@ class ValidationResult:
 
 
 class APIKeyService:
-    """Service for managing API keys."""
+    """Service for managing API keys.
+
+    Keys are stored as a bcrypt hash plus a deterministic HMAC-SHA256
+    ``key_lookup_hash`` and the ``key_lookup_version`` of the secret that keyed
+    it. Validation fetches the single row matching the lookup digest and runs
+    one bcrypt verification against it. Rows created before the digest existed,
+    or digested under a since-rotated secret, are fetched by display prefix from
+    the unmigrated set and re-digested on first successful use.
+    """
+
+    def __init__(
+        self,
+        db: DatabaseOperations,
+        lookup_secret: Optional[str] = None,
+        legacy_lookup: Optional[bool] = None,
+    ):
+        """Initialize API key service.
+
+        ``legacy_lookup`` defaults to the ``API_KEY_LEGACY_LOOKUP`` environment
+        flag (on unless set to ``false``); turn it off once every row carries a
+        current lookup digest.
 
-    def __init__(self, db: DatabaseOperations):
-        """Initialize API key service."""
+        Raises:
+            APIKeyError: If no lookup secret is configured in staging or production.
+
+        """
         self.db = db
         self._key_length = 40  # Length of random part
+        if lookup_secret is None:
+            lookup_secret = os.getenv("API_KEY_LOOKUP_SECRET", "")
+        if not lookup_secret:
+            environment = os.getenv("ENVIRONMENT", "development").strip().lower()
+            if environment in _PROTECTED_ENVIRONMENTS:
+                raise APIKeyError(
+                    f"API_KEY_LOOKUP_SECRET must be set in {environment}; "
+                    "unkeyed lookup digests can be guessed offline"
+                )
+            logger.warning(
+                "API_KEY_LOOKUP_SECRET is not set; API key lookup digests are unkeyed. "
+                "Configure a secret before running outside local development."
+            )
+        self._lookup_secret = lookup_secret.encode("utf-8")
+        self._lookup_version = self._secret_version(self._lookup_secret)
+        if legacy_lookup is None:
+            legacy_lookup = os.getenv("API_KEY_LEGACY_LOOKUP", "true").lower() == "true"
+        self._legacy_lookup = legacy_lookup
 
     def generate_api_key(
         self,
@@ -108,6 +162,8 @@ class APIKeyService:
             # api_key_model = APIKeyModel(
             #     key_id=key_id,
             #     key_hash=key_hash,
+            #     key_lookup_hash=self._lookup_hash(full_key),
+            #     key_lookup_version=self._lookup_version,
             #     key_prefix=f"{prefix}_{random_part[:3]}",
             #     user_id=user_id,
             #     name=key_name,
@@ -144,15 +200,7 @@ class APIKeyService:
     def validate_api_key(self, api_key: str, client_ip: Optional[str] = None) -> ValidationResult:
         """Validate an API key."""
         try:
-            # Look up all API keys and verify against hashes
-            # (bcrypt hashes are not deterministic, so we can't hash and lookup)
-            all_keys = self.db.get_all_api_keys()
-
-            api_key_data = None
-            for key_data in all_keys:
-                if self._verify_api_key(api_key, key_data.get("key_hash", "")):
-                    api_key_data = key_data
-                    break
+            api_key_data = self._find_api_key(api_key)
 
             if not api_key_data:
                 return ValidationResult(is_valid=False, error="API key not found")
@@ -283,6 +331,81 @@ class APIKeyService:
             # Don't fail the request if we can't update last used
             pass
 
+    def _find_api_key(self, api_key: str) -> Optional[Dict[str, Any]]:
+        """Return the stored row for a presented key, or None if it does not match."""
+        lookup_hash = self._lookup_hash(api_key)
+        key_data = self.db.get_api_key_by_lookup_hash(lookup_hash)
+        if key_data:
+            if self._verify_api_key(api_key, key_data.get("key_hash", "")):
+                return key_data
+            return None
+
+        if not self._legacy_lookup:
+            return None
+        return self._find_legacy_api_key(api_key, lookup_hash)
+
+    def _find_legacy_api_key(self, api_key: str, lookup_hash: str) -> Optional[Dict[str, Any]]:
+        """Verify rows without a current lookup digest and backfill the one that matches.
+
+        bcrypt hashes are salted, so rows issued before ``key_lookup_hash``
+        existed, or digested under a previous secret, can only be found by
+        verification. Only unmigrated rows sharing the presented key's stored
+        display prefix are fetched, through an indexed query, so an unknown key
+        never loads the whole table and the candidate set shrinks to nothing as
+        keys are migrated.
+        """
+        key_prefix = self._stored_key_prefix(api_key)
+        if key_prefix is None:
+            return None
+
+        candidates = self.db.get_unmigrated_api_keys(
+            key_prefix=key_prefix, lookup_version=self._lookup_version
+        )
+        for key_data in candidates:
+            if (
+                key_data.get("key_lookup_hash")
+                and key_data.get("key_lookup_version") == self._lookup_version
+            ):
+                continue
+            stored_prefix = key_data.get("key_prefix")
+            if stored_prefix and stored_prefix != key_prefix:
+                continue
+            if not self._verify_api_key(api_key, key_data.get("key_hash", "")):
+                continue
+
+            try:
+                self.db.update_api_key(
+                    key_data["key_id"],
+                    {"key_lookup_hash": lookup_hash, "key_lookup_version": self._lookup_version},
+                )
+            except Exception:
+                # Backfill is best-effort; the next use retries it
+                pass
+            return key_data
+        return None
+
+    @staticmethod
+    def _secret_version(secret: bytes) -> str:
+        """Return a short, non-reversible identifier for a lookup secret.
+
+        Stored next to each digest so rows keyed by a rotated secret are
+        recognized as stale rather than silently never matching.
+        """
+        return hmac.new(secret, b"api-key-lookup-version", hashlib.sha256).hexdigest()[:16]
+
+    def _lookup_hash(self, api_key: str) -> str:
+        """Return the deterministic, non-reversible lookup digest for a key."""
+        return hmac.new(self._lookup_secret, api_key.encode("utf-8"), hashlib.sha256).hexdigest()
+
+    @staticmethod
+    def _stored_key_prefix(api_key: str) -> Optional[str]:
+        """Return the ``key_prefix`` stored for a key of this shape, or None if malformed."""
+        for prefix in _KEY_PREFIXES:
+            head = f"{prefix}_"
+            if api_key.startswith(head) and len(api_key) >= len(head) + _KEY_PREFIX_RANDOM_CHARS:
+                return api_key[: len(head) + _KEY_PREFIX_RANDOM_CHARS]
+        return None
+
     def _get_key_prefix(self, environment: str) -> str:
         """Get the prefix for an API key based on environment."""
         prefixes = {"production": "hk_live", "test": "hk_test", "development": "hk_dev"}
@@ -5,10 +5,17 @@ from __future__ import annotations
 import json
 import logging
 import math
+from itertools import chain
 from typing import Any
 
+import numpy as np
 import pandas as pd
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
 OUTCOME_COLUMN = "completed_successfully"
@@ -50,34 +57,7 @@ def attribute(
         & (joined[f"{OUTCOME_COLUMN}_candidate"] == True)  # noqa: E712
     ]
 
-    identity_totals: dict[str, dict[str, Any]] = {}
-    skipped_no_identity_shares = 0.0
-
-    for _, row in eligible.iterrows():
-        per_identity, skipped_share = _row_identity_shares(
-            row_id=str(row[ROW_ID_COLUMN]),
-            encoded_neighbor_provenance=row[NEIGHBOR_PROVENANCE_COLUMN],
-        )
-        skipped_no_identity_shares += skipped_share
-        for identity, identity_share in per_identity.items():
-            aggregate = identity_totals.setdefault(
-                identity,
-                {
-                    "account_id": identity_share["account_id"],
-                    "wallet": identity_share["wallet"],
-                    "submission_ids": set(),
-                    "rows_credited": set(),
-                    "raw_score": 0.0,
-                },
-            )
-            # Backfill the other identity field if a later slot supplies one the first lacked.
-            if aggregate["wallet"] is None and identity_share["wallet"] is not None:
-                aggregate["wallet"] = identity_share["wallet"]
-            if aggregate["account_id"] is None and identity_share["account_id"] is not None:
-                aggregate["account_id"] = identity_share["account_id"]
-            aggregate["submission_ids"].update(identity_share["submission_ids"])
-            aggregate["rows_credited"].add(str(row[ROW_ID_COLUMN]))
-            aggregate["raw_score"] += identity_share["share"]
+    identity_totals, skipped_no_identity_shares = _aggregate_identity_totals(eligible)
 
     if skipped_no_identity_shares:
         logger.info(
@@ -111,45 +91,118 @@ def _require_columns(
         raise ValueError(f"{frame_name} per-row frame missing required columns: {missing}")
 
 
-def _row_identity_shares(
-    *,
-    row_id: str,
-    encoded_neighbor_provenance: Any,
+def _aggregate_identity_totals(
+    eligible: pd.DataFrame,
 ) -> tuple[dict[str, dict[str, Any]], float]:
-    neighbors = _decode_neighbor_provenance(encoded_neighbor_provenance, row_id=row_id)
+    """Credit each improved row's neighbor shares to contributor identities.
+
+    The emitted provenance is flattened into one array entry per neighbor slot, so
+    per-row normalization and per-identity aggregation are ``bincount`` reductions.
+    Shares are summed per (row, identity) first and then per identity in row order,
+    which keeps the floating-point results identical to crediting row by row.
+    """
+    row_ids = [str(row_id) for row_id in eligible[ROW_ID_COLUMN].tolist()]
+    decoded = [
+        _decode_neighbor_provenance(encoded, row_id=row_id)
+        for encoded, row_id in zip(
+            eligible[NEIGHBOR_PROVENANCE_COLUMN].tolist(), row_ids, strict=True
+        )
+    ]
+    neighbors = list(chain.from_iterable(decoded))
     if not neighbors:
         return {}, 0.0
 
-    weights = [max(float(neighbor.get("weight", 0.0)), 0.0) for neighbor in neighbors]
-    total_weight = sum(weights)
-    if total_weight <= 0:
-        normalized = [1.0 / len(neighbors)] * len(neighbors)
-    else:
-        normalized = [weight / total_weight for weight in weights]
-
-    per_identity: dict[str, dict[str, Any]] = {}
-    skipped_no_identity_shares = 0.0
-    for neighbor, share in zip(neighbors, normalized, strict=True):
-        if share <= 0:
-            continue
-        account_id = neighbor.get("account_id")
-        wallet = neighbor.get("wallet")
-        # Identity is the account (preferred) or the wallet; account-centric provenance may
-        # omit the wallet (resolved at mint). Skip only when neither is present.
-        identity = account_id if account_id is not None else wallet
-        if identity is None:
-            skipped_no_identity_shares += share
-            continue
-        identity_key = str(identity)
-        aggregate = per_identity.setdefault(
-            identity_key,
-            {"account_id": account_id, "wallet": wallet, "submission_ids": set(), "share": 0.0},
-        )
-        aggregate["share"] += share
-        submission_id = neighbor.get("submission_id")
+    counts = np.fromiter(map(len, decoded), dtype=np.int64, count=len(decoded))
+    slot_rows = np.repeat(np.arange(len(decoded)), counts)
+    weights = np.maximum(
+        np.array([float(neighbor.get("weight", 0.0)) for neighbor in neighbors]), 0.0
+    )
+    row_totals = np.bincount(slot_rows, weights=weights, minlength=len(decoded))[slot_rows]
+    shares = np.divide(
+        weights,
+        row_totals,
+        out=1.0 / counts[slot_rows],
+        where=~(row_totals <= 0),
+    )
+
+    account_ids = _object_array([neighbor.get("account_id") for neighbor in neighbors])
+    wallets = _object_array([neighbor.get("wallet") for neighbor in neighbors])
+    # Identity is the account (preferred) or the wallet; account-centric provenance may
+    # omit the wallet (resolved at mint). Skip only when neither is present.
+    identities = np.where(account_ids != None, account_ids, wallets)  # noqa: E711
+    has_identity = identities != None  # noqa: E711
+    positive = ~(shares <= 0)
+    skipped_no_identity_shares = float(shares[positive & ~has_identity].sum())
+
+    kept = np.flatnonzero(positive & has_identity)
+    if not len(kept):
+        return {}, skipped_no_identity_shares
+    identity_codes, identity_keys = pd.factorize(
+        np.array([str(identity) for identity in identities[kept]], dtype=object)
+    )
+    identity_count = len(identity_keys)
+
+    # Pairs sort by (row, identity): their shares sum in slot order within a row and
+    # identity totals then accumulate in row order.
+    pair_keys, pair_first, pair_of_slot = np.unique(
+        slot_rows[kept] * identity_count + identity_codes,
+        return_index=True,
+        return_inverse=True,
+    )
+    pair_shares = np.bincount(pair_of_slot, weights=shares[kept], minlength=len(pair_keys))
+    pair_identities = pair_keys % identity_count
+    raw_scores = np.bincount(pair_identities, weights=pair_shares, minlength=identity_count)
+
+    # Rows are credited by row_id, so duplicated ids count once.
+    row_codes, _ = pd.factorize(np.array(row_ids, dtype=object))
+    credited_pairs = np.unique(
+        row_codes[pair_keys // identity_count] * identity_count + pair_identities
+    )
+    rows_credited = np.bincount(credited_pairs % identity_count, minlength=identity_count)
+
+    # Each identity's account_id and wallet come from the first non-null value among the
+    # first slot of each credited row.
+    first_slots = kept[pair_first]
+    account_ids = _first_non_null(account_ids[first_slots], pair_identities, identity_count)
+    wallets = _first_non_null(wallets[first_slots], pair_identities, identity_count)
+
+    submission_ids: list[set[str]] = [set() for _ in range(identity_count)]
+    slot_submissions = pd.DataFrame(
+        {
+            "identity": identity_codes,
+            "submission_id": [neighbors[index].get("submission_id") for index in kept.tolist()],
+        }
+    ).drop_duplicates()
+    for code, submission_id in slot_submissions.itertuples(index=False):
         if submission_id:
-            aggregate["submission_ids"].add(str(submission_id))
-    return per_identity, skipped_no_identity_shares
+            submission_ids[code].add(str(submission_id))
+
+    identity_totals = {
+        str(identity): {
+            "account_id": account_ids[code],
+            "wallet": wallets[code],
+            "submission_ids": submission_ids[code],
+            "rows_credited": int(rows_credited[code]),
+            "raw_score": float(raw_scores[code]),
+        }
+        for code, identity in enumerate(identity_keys)
+    }
+    return identity_totals, skipped_no_identity_shares
+
+
+def _object_array(values: list[Any]) -> np.ndarray:
+    array = np.empty(len(values), dtype=object)
+    array[:] = values
+    return array
+
+
+def _first_non_null(values: np.ndarray, groups: np.ndarray, group_count: int) -> list[Any]:
+    first: list[Any] = [None] * group_count
+    present = np.flatnonzero(values != None)  # noqa: E711
+    codes, positions = np.unique(groups[present], return_index=True)
+    for code, position in zip(codes.tolist(), positions.tolist(), strict=True):
+        first[code] = values[present[position]]
+    return first
 
 
 def _decode_neighbor_provenance(
@@ -163,12 +216,22 @@ def _decode_neighbor_provenance(
         logger.info("neighbor_provenance missing for row_id=%s; treating as empty", row_id)
         return []
     if isinstance(encoded_neighbor_provenance, str):
-        decoded = json.loads(encoded_neighbor_provenance)
+        decoded = _loads(encoded_neighbor_provenance)
     else:
         decoded = encoded_neighbor_provenance
     if not isinstance(decoded, list):
         raise ValueError(f"neighbor_provenance must be a list for row_id={row_id}")
-    return [dict(item) for item in decoded]
+    return [item if isinstance(item, dict) else dict(item) for item in decoded]
+
+
+def _loads(encoded: str) -> Any:  # noqa: ANN401
+    if orjson is not None:
+        try:
+            return orjson.loads(encoded)
+        except orjson.JSONDecodeError:
+            # orjson rejects NaN/Infinity literals that the stdlib parser accepts
+            pass
+    return json.loads(encoded)
 
 
 def _finalize_contributors(identity_totals: dict[str, dict[str, Any]]) -> list[dict[str, Any]]:
@@ -195,7 +258,7 @@ def _finalize_contributors(identity_totals: dict[str, dict[str, Any]]) -> list[d
         totals = identity_totals[i]
         item: dict[str, Any] = {
             "submission_ids": sorted(totals["submission_ids"]),
-            "rows_credited": len(totals["rows_credited"]),
+            "rows_credited": int(totals["rows_credited"]),
             "raw_score": round(float(totals["raw_score"]), 12),
             "weight_bps": int(floor_bps[i]),
         }
@@ -2,17 +2,27 @@
 
 from __future__ import annotations
 
+import hashlib
 import itertools
+import json
+import logging
 import math
+import os
+import pickle
 import random
-from collections.abc import Callable, Sequence
+import tempfile
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from concurrent.futures import Executor, ProcessPoolExecutor
 from dataclasses import dataclass
+from pathlib import Path
 from statistics import fmean, pstdev
 from typing import Any, TypeAlias
 
 TrainFn: TypeAlias = Callable[[frozenset[str], int], Any]
 EvalFn: TypeAlias = Callable[[Any, int], float]
 
+logger = logging.getLogger(__name__)
+
 
 @dataclass(frozen=True)
 class Cohort:
@@ -68,8 +78,25 @@ def attribute(
     manifest_hash: str,
     total_rows_evaluated: int,
     config: RetrainingConfig = RetrainingConfig(),
+    executor: Executor | None = None,
+    max_workers: int | None = None,
+    score_cache_dir: str | os.PathLike[str] | None = None,
+    train_config: Mapping[str, Any] | None = None,
 ) -> dict[str, Any]:
-    """Compute deterministic attribution weights from retraining marginals."""
+    """Compute deterministic attribution weights from retraining marginals.
+
+    Independent subset retrains (LOCO, add-one-in and exact Shapley subsets) are
+    dispatched concurrently on ``executor``. Without one, a process pool of
+    ``max_workers`` is used when ``train_fn`` and ``eval_fn`` can be pickled, and
+    retrains run in-process otherwise. Subset scores are persisted under
+    ``score_cache_dir`` (default ``ATTRIBUTION_SUBSET_CACHE_DIR``; disabled when
+    unset), keyed by the included cohorts, the dataset and manifest hashes, the
+    ``train_fn``/``eval_fn`` identities and ``train_config``, so repeated
+    attributions reuse earlier retrains. A cache enabled only through the
+    environment is skipped when no ``train_config`` is given, since nothing would
+    then distinguish retrains of changed training code. Reused scores still count
+    toward ``config.budget`` so reports do not depend on the cache.
+    """
     ordered_cohorts = _normalize_cohorts(cohorts)
     if not ordered_cohorts:
         raise ValueError("at least one cohort is required")
@@ -78,13 +105,84 @@ def attribute(
     if config.budget < len(groups) + 2:
         raise ValueError("retrain budget too small for LOCO")
 
+    eval_seed = config.eval_seeds[0] if config.eval_seeds else 0
+    cache_dir = score_cache_dir
+    if cache_dir is None and os.getenv("ATTRIBUTION_SUBSET_CACHE_DIR"):
+        if train_config is None:
+            logger.warning(
+                "ATTRIBUTION_SUBSET_CACHE_DIR is set but no train_config was given; "
+                "subset score cache disabled"
+            )
+        else:
+            cache_dir = os.getenv("ATTRIBUTION_SUBSET_CACHE_DIR")
+    score_cache = None
+    if cache_dir:
+        score_cache = SubsetScoreCache(
+            cache_dir,
+            fingerprint={
+                "model_id": model_id,
+                "dataset_hash": dataset_hash,
+                "manifest_hash": manifest_hash,
+                "rng_seed": config.rng_seed,
+                "eval_seed": eval_seed,
+                "train_fn": _callable_identity(train_fn),
+                "eval_fn": _callable_identity(eval_fn),
+                "train_config": dict(train_config or {}),
+            },
+        )
+    owns_executor = executor is None
+    if executor is None:
+        executor = _default_executor(train_fn, eval_fn, max_workers=max_workers)
+
     evaluator = _SubsetEvaluator(
         train_fn=train_fn,
         eval_fn=eval_fn,
         rng_seed=config.rng_seed,
-        eval_seed=config.eval_seeds[0] if config.eval_seeds else 0,
+        eval_seed=eval_seed,
         budget=config.budget,
+        executor=executor,
+        score_cache=score_cache,
+        group_members={
+            group.group_id: tuple(cohort.cohort_id for cohort in group.cohorts) for group in groups
+        },
     )
+    try:
+        return _attribute_groups(
+            ordered_cohorts=ordered_cohorts,
+            groups=groups,
+            evaluator=evaluator,
+            train_fn=train_fn,
+            eval_fn=eval_fn,
+            model_id=model_id,
+            baseline_run_id=baseline_run_id,
+            candidate_run_id=candidate_run_id,
+            created_at=created_at,
+            dataset_hash=dataset_hash,
+            manifest_hash=manifest_hash,
+            total_rows_evaluated=total_rows_evaluated,
+            config=config,
+        )
+    finally:
+        if owns_executor and executor is not None:
+            executor.shutdown()
+
+
+def _attribute_groups(
+    *,
+    ordered_cohorts: list[Cohort],
+    groups: list[_Group],
+    evaluator: _SubsetEvaluator,
+    train_fn: TrainFn,
+    eval_fn: EvalFn,
+    model_id: str,
+    baseline_run_id: str,
+    candidate_run_id: str,
+    created_at: str,
+    dataset_hash: str,
+    manifest_hash: str,
+    total_rows_evaluated: int,
+    config: RetrainingConfig,
+) -> dict[str, Any]:
     all_group_ids = frozenset(group.group_id for group in groups)
     all_identities = sorted(
         {
@@ -106,6 +204,7 @@ def attribute(
     baseline_scores = [float(eval_fn(baseline_handle, seed)) for seed in baseline_eval_seeds]
     evaluator.prime(all_group_ids, float(eval_fn(baseline_handle, baseline_eval_seeds[0])))
     v_full = fmean(baseline_scores) if baseline_scores else 0.0
+    evaluator.prefetch([frozenset(), *(all_group_ids - {group.group_id} for group in groups)])
     v_empty = evaluator.value(frozenset())
     total_lift = v_full - v_empty
     gap_undefined = math.isclose(total_lift, 0.0, abs_tol=1e-12)
@@ -127,6 +226,7 @@ def attribute(
 
     can_try_add_one = config.enable_add_one_in and evaluator.remaining_budget >= len(groups)
     if noise_floor_ok and can_try_add_one:
+        evaluator.prefetch(frozenset({group.group_id}) for group in groups)
         add_one_values = {
             group.group_id: evaluator.value(frozenset({group.group_id})) - v_empty
             for group in groups
@@ -203,6 +303,89 @@ def attribute(
     }
 
 
+class SubsetScoreCache:
+    """On-disk store of subset scores shared across attribution runs.
+
+    Scores live in ``<directory>/<fingerprint>/<subset>.json``. The fingerprint
+    hashes the data and training configuration; the subset key hashes the sorted
+    cohort ids that were included in the retrain. Writes go through a temporary
+    file and ``os.replace`` so concurrent runs never see partial entries.
+    """
+
+    def __init__(
+        self: SubsetScoreCache,
+        directory: str | os.PathLike[str],
+        *,
+        fingerprint: Mapping[str, Any],
+    ) -> None:
+        self.fingerprint = _stable_hash(fingerprint)
+        self.directory = Path(directory) / self.fingerprint
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.hits = 0
+
+    def get(self: SubsetScoreCache, cohort_ids: Iterable[str]) -> float | None:
+        try:
+            entry = json.loads(self._path(cohort_ids).read_text(encoding="utf-8"))
+        except (FileNotFoundError, ValueError):
+            return None
+        self.hits += 1
+        return float(entry["score"])
+
+    def put(self: SubsetScoreCache, cohort_ids: Iterable[str], score: float) -> None:
+        path = self._path(cohort_ids)
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                json.dump({"cohort_ids": sorted(cohort_ids), "score": score}, handle)
+            os.replace(tmp_path, path)
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+
+    def _path(self: SubsetScoreCache, cohort_ids: Iterable[str]) -> Path:
+        return self.directory / f"{_stable_hash(sorted(cohort_ids))}.json"
+
+
+def _callable_identity(fn: Any) -> str:  # noqa: ANN401
+    """Return ``module:qualname`` for a function, or its repr for other callables."""
+    module = getattr(fn, "__module__", None)
+    qualname = getattr(fn, "__qualname__", None)
+    if module is None or qualname is None:
+        return repr(fn)
+    return f"{module}:{qualname}"
+
+
+def _stable_hash(value: Any) -> str:  # noqa: ANN401
+    encoded = json.dumps(value, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def _default_executor(
+    train_fn: TrainFn, eval_fn: EvalFn, *, max_workers: int | None
+) -> Executor | None:
+    """Return a process pool for picklable retrain callables, else None (in-process)."""
+    workers = max_workers if max_workers is not None else (os.cpu_count() or 1)
+    if workers <= 1:
+        return None
+    try:
+        pickle.dumps((train_fn, eval_fn))
+    except Exception:  # noqa: BLE001
+        logger.debug("train_fn/eval_fn are not picklable; running subset retrains in-process")
+        return None
+    return ProcessPoolExecutor(max_workers=workers)
+
+
+def _train_and_score(
+    train_fn: TrainFn,
+    eval_fn: EvalFn,
+    subset: frozenset[str],
+    rng_seed: int,
+    eval_seed: int,
+) -> float:
+    handle = train_fn(subset, rng_seed)
+    return float(eval_fn(handle, eval_seed))
+
+
 class _SubsetEvaluator:
     """Cache subset evaluations and enforce a hard retraining budget."""
 
@@ -214,12 +397,18 @@ class _SubsetEvaluator:
         rng_seed: int,
         eval_seed: int,
         budget: int,
+        executor: Executor | None = None,
+        score_cache: SubsetScoreCache | None = None,
+        group_members: Mapping[str, tuple[str, ...]] | None = None,
     ) -> None:
         self._train_fn = train_fn
         self._eval_fn = eval_fn
         self._rng_seed = rng_seed
         self._eval_seed = eval_seed
         self._budget = budget
+        self._executor = executor
+        self._score_cache = score_cache
+        self._group_members = dict(group_members or {})
         self._cache: dict[frozenset[str], float] = {}
 
     @property
@@ -239,11 +428,69 @@ class _SubsetEvaluator:
             return self._cache[subset]
         if self.retrain_count >= self._budget:
             raise ValueError("retrain budget exhausted")
-        handle = self._train_fn(subset, self._rng_seed)
-        score = float(self._eval_fn(handle, self._eval_seed))
+        score = self._stored_score(subset)
+        if score is None:
+            score = _train_and_score(
+                self._train_fn, self._eval_fn, subset, self._rng_seed, self._eval_seed
+            )
+            self._store_score(subset, score)
         self._cache[subset] = score
         return score
 
+    def prefetch(self: _SubsetEvaluator, subsets: Iterable[frozenset[str]]) -> None:
+        """Evaluate independent subsets up front, retraining misses concurrently."""
+        pending = [
+            subset
+            for subset in dict.fromkeys(frozenset(subset) for subset in subsets)
+            if subset not in self._cache
+        ]
+        if len(pending) > self.remaining_budget:
+            raise ValueError("retrain budget exhausted")
+
+        to_train = []
+        for subset in pending:
+            score = self._stored_score(subset)
+            if score is None:
+                to_train.append(subset)
+            else:
+                self._cache[subset] = score
+        if self._executor is None or len(to_train) < 2:
+            for subset in to_train:
+                self.value(subset)
+            return
+
+        futures = [
+            self._executor.submit(
+                _train_and_score,
+                self._train_fn,
+                self._eval_fn,
+                subset,
+                self._rng_seed,
+                self._eval_seed,
+            )
+            for subset in to_train
+        ]
+        for subset, future in zip(to_train, futures):
+            score = float(future.result())
+            self._store_score(subset, score)
+            self._cache[subset] = score
+
+    def _cohort_ids(self: _SubsetEvaluator, subset: frozenset[str]) -> list[str]:
+        return [
+            cohort_id
+            for group_id in subset
+            for cohort_id in self._group_members.get(group_id, (group_id,))
+        ]
+
+    def _stored_score(self: _SubsetEvaluator, subset: frozenset[str]) -> float | None:
+        if self._score_cache is None:
+            return None
+        return self._score_cache.get(self._cohort_ids(subset))
+
+    def _store_score(self: _SubsetEvaluator, subset: frozenset[str], score: float) -> None:
+        if self._score_cache is not None:
+            self._score_cache.put(self._cohort_ids(subset), score)
+
     def prime(self: _SubsetEvaluator, included_ids: frozenset[str], score: float) -> None:
         subset = frozenset(included_ids)
         self._cache.setdefault(subset, float(score))
@@ -304,6 +551,11 @@ def _exact_shapley(*, groups: Sequence[_Group], evaluator: _SubsetEvaluator) ->
     factorials = [math.factorial(index) for index in range(n_groups + 1)]
     all_group_ids = tuple(group.group_id for group in groups)
     result = {group_id: 0.0 for group_id in all_group_ids}
+    evaluator.prefetch(
+        frozenset(subset_tuple)
+        for subset_size in range(n_groups + 1)
+        for subset_tuple in itertools.combinations(all_group_ids, subset_size)
+    )
     for subset_size in range(n_groups):
         for subset_tuple in itertools.combinations(all_group_ids, subset_size):
             subset = frozenset(subset_tuple)
@@ -10,6 +10,7 @@ from scipy import stats
 from src.evaluation.schema import ComparatorResult
 
 _DEFAULT_N_BOOTSTRAP = 2000
+_MAX_BOOTSTRAP_MATRIX_CELLS = 1 << 22
 
 
 def evaluate(
@@ -161,26 +162,50 @@ def _cluster_bootstrap_ci(
 ) -> tuple[float, float]:
     """Cluster bootstrap CI for mean difference (treatment - control).
 
-    Resamples unique cluster IDs with replacement per arm, concatenates all
-    rows from selected clusters, and computes ``mean(treatment) - mean(control)``.
+    Resamples unique cluster IDs with replacement per arm and computes
+    ``mean(treatment) - mean(control)`` over all rows of the selected clusters.
+    Rows are reduced to per-cluster sums and counts up front, so each replicate's
+    mean is a product of its cluster draw counts with those statistics.
     Percentile CI bounds are returned.
     """
-    unique_t = np.unique(treatment_unit_ids)
-    unique_c = np.unique(control_unit_ids)
-    n_t_clusters = len(unique_t)
-    n_c_clusters = len(unique_c)
-
-    t_cluster_map = {cid: treatment[treatment_unit_ids == cid] for cid in unique_t}
-    c_cluster_map = {cid: control[control_unit_ids == cid] for cid in unique_c}
-
-    deltas = np.empty(n_bootstrap)
-    for i in range(n_bootstrap):
-        t_sampled = rng.choice(unique_t, size=n_t_clusters, replace=True)
-        c_sampled = rng.choice(unique_c, size=n_c_clusters, replace=True)
-        t_rows = np.concatenate([t_cluster_map[cid] for cid in t_sampled])
-        c_rows = np.concatenate([c_cluster_map[cid] for cid in c_sampled])
-        deltas[i] = t_rows.mean() - c_rows.mean()
+    t_means = _cluster_resample_means(treatment, treatment_unit_ids, n_bootstrap, rng)
+    c_means = _cluster_resample_means(control, control_unit_ids, n_bootstrap, rng)
+    deltas = t_means - c_means
 
     ci_low = float(np.percentile(deltas, 100.0 * alpha / 2.0))
     ci_high = float(np.percentile(deltas, 100.0 * (1.0 - alpha / 2.0)))
     return ci_low, ci_high
+
+
+def _cluster_resample_means(
+    values: np.ndarray,
+    unit_ids: np.ndarray,
+    n_bootstrap: int,
+    rng: np.random.Generator,
+) -> np.ndarray:
+    """Row means of ``n_bootstrap`` cluster resamples of one arm."""
+    _, inverse = np.unique(unit_ids, return_inverse=True)
+    inverse = inverse.reshape(-1)
+    n_clusters = int(inverse.max()) + 1
+    # Columns: per-cluster value sums and row counts
+    cluster_stats = np.column_stack(
+        [
+            np.bincount(inverse, weights=values, minlength=n_clusters),
+            np.bincount(inverse, minlength=n_clusters).astype(float),
+        ]
+    )
+
+    totals = np.empty((n_bootstrap, 2))
+    # Draw and count one block of replicates at a time so neither the draws nor
+    # the count matrix exceed _MAX_BOOTSTRAP_MATRIX_CELLS for arms with many
+    # clusters. Draws are consumed in row order, so results do not depend on
+    # the block size.
+    chunk = max(1, _MAX_BOOTSTRAP_MATRIX_CELLS // n_clusters)
+    for start in range(0, n_bootstrap, chunk):
+        block = rng.integers(0, n_clusters, size=(min(chunk, n_bootstrap - start), n_clusters))
+        rows = np.arange(len(block))[:, None] * n_clusters
+        draw_counts = np.bincount(
+            (block + rows).ravel(), minlength=len(block) * n_clusters
+        ).reshape(len(block), n_clusters)
+        totals[start : start + chunk] = draw_counts @ cluster_stats
+    return totals[:, 0] / totals[:, 1]
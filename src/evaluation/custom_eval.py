@@ -12,7 +12,7 @@ import tempfile
 from dataclasses import dataclass
 from pathlib import Path
 from types import SimpleNamespace
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from src.evaluation.schema import MetricFamily
 from src.evaluation.spec_translation import RuntimeAdapterSpec, translate_benchmark_spec
@@ -31,9 +31,12 @@ from src.evaluation.tags import (
     SCORER_REF_TAG,
     STATUS_TAG,
 )
-from src.utils.dataset_hash import parse_sha256_dataset_version
+from src.utils.dataset_hash import canonical_dataset_sha256, parse_sha256_dataset_version
 from src.utils.metric_naming import derive_mlflow_name
 
+if TYPE_CHECKING:
+    from src.evaluation.scorers.columnar import ScorerFrame
+
 logger = logging.getLogger(__name__)
 
 _PER_ROW_ARTIFACT_DIR = "eval_results"
@@ -113,7 +116,8 @@ def compute_dataset_hash(
     """Return a ``sha256:<hex>`` dataset hash.
 
     Priority: (1) spec_dataset_version if already in sha256 form;
-    (2) SHA-256 of canonical-JSON of dataset rows from local path.
+    (2) SHA-256 of canonical-JSON of dataset rows from local path, streamed
+    through an external sort so large JSONL/parquet files hash in bounded memory.
     """
     canonical_dataset_version = parse_sha256_dataset_version(spec_dataset_version)
     if canonical_dataset_version:
@@ -123,8 +127,7 @@ def compute_dataset_hash(
         p = Path(dataset_path)
         if p.exists() and p.is_file():
             try:
-                canonical = _canonicalize_local_dataset_for_hash(p)
-                return "sha256:" + hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+                return canonical_dataset_sha256(p)
             except Exception:  # noqa: S110
                 pass
 
@@ -412,9 +415,12 @@ def _count_rows(local_path: str | None) -> int | None:
             if isinstance(payload, dict):
                 return 1
         elif suffix == ".jsonl":
-            return sum(1 for line in p.read_text(encoding="utf-8").splitlines() if line.strip())
+            with p.open(encoding="utf-8") as f:
+                return sum(1 for line in f if line.strip())
         elif suffix == ".parquet":
-            return len(_load_parquet_rows(p))
+            import pyarrow.parquet as pq
+
+            return pq.ParquetFile(p).metadata.num_rows
         elif suffix in (".csv", ".tsv"):
             lines = p.read_text(encoding="utf-8").splitlines()
             return max(0, len(lines) - 1)
@@ -671,6 +677,7 @@ def _dispatch_deterministic_scorers(
     run_id: str,
 ) -> SimpleNamespace:
     """Compute deterministic scorer-backed metrics directly from registered callables."""
+    from src.evaluation.scorers.columnar import evaluate_scorers
     from src.evaluation.scorers.registry import resolve_scorer
 
     metric_specs = _metric_specs_with_scorers(runtime_spec)
@@ -687,17 +694,25 @@ def _dispatch_deterministic_scorers(
         metric_name_map[mlflow_metric_name] = spec_name
         resolved_scorers.append((spec_name, mlflow_metric_name, resolve_scorer(scorer_ref)))
 
-    rows = _load_sales_outcome_rows(dataset_reference)
+    frame = _load_sales_outcome_frame(dataset_reference)
     logger.info(
         "Running direct deterministic scorer dispatch for %d rows and scorer refs %s",
-        len(rows),
+        len(frame),
         [registered.metadata.scorer_ref for _, _, registered in resolved_scorers],
     )
 
+    # sales_outcome_row/v1 requires both ``metric_name`` and ``scorer_ref``, but
+    # matching either field keeps dispatch tolerant of older or partially-normalized
+    # rows while still isolating scorer-specific metrics.
+    scorer_values = evaluate_scorers(
+        frame,
+        [registered for _, _, registered in resolved_scorers],
+        partition_by=("scorer_ref", "metric_name"),
+    )
+
     metrics: dict[str, float] = {}
     for _, mlflow_metric_name, registered in resolved_scorers:
-        scorer_rows = _rows_for_sales_scorer(rows, registered.metadata.scorer_ref)
-        metric_value = registered.callable_(scorer_rows)
+        metric_value = scorer_values[registered.metadata.scorer_ref]
         if not isinstance(metric_value, (int, float)):
             raise DatasetLoadError(
                 f"deterministic scorer {registered.metadata.scorer_ref!r} returned non-numeric "
@@ -707,7 +722,7 @@ def _dispatch_deterministic_scorers(
 
     result = SimpleNamespace(
         metrics=metrics,
-        result_df=_build_per_row_result_df(rows, metrics),
+        result_df=_build_per_row_result_df(frame, metrics),
     )
     _persist_per_row_artifact(
         mlflow_module=mlflow_module,
@@ -726,6 +741,7 @@ def _dispatch_task_router_scorers(
     run_id: str,
 ) -> SimpleNamespace:
     """Compute task-router metrics directly; every row contributes to every scorer."""
+    from src.evaluation.scorers.columnar import evaluate_scorers
     from src.evaluation.scorers.registry import resolve_scorer
 
     metric_specs = _metric_specs_with_scorers(runtime_spec)
@@ -742,16 +758,22 @@ def _dispatch_task_router_scorers(
         metric_name_map[mlflow_metric_name] = spec_name
         resolved_scorers.append((spec_name, mlflow_metric_name, resolve_scorer(scorer_ref)))
 
-    rows = _load_task_router_rows(dataset_reference)
+    frame = _load_scorer_frame(
+        dataset_reference=dataset_reference,
+        schema_version=("technical_task_router_row/v1", "technical_task_router_row/v2"),
+        dataset_label="task-router",
+    )
     logger.info(
         "Running direct task-router scorer dispatch for %d rows and scorer refs %s",
-        len(rows),
+        len(frame),
         [registered.metadata.scorer_ref for _, _, registered in resolved_scorers],
     )
 
+    scorer_values = evaluate_scorers(frame, [registered for _, _, registered in resolved_scorers])
+
     metrics: dict[str, float] = {}
     for _, mlflow_metric_name, registered in resolved_scorers:
-        metric_value = registered.callable_(rows)
+        metric_value = scorer_values[registered.metadata.scorer_ref]
         if not isinstance(metric_value, (int, float)):
             raise DatasetLoadError(
                 f"task-router scorer {registered.metadata.scorer_ref!r} returned non-numeric "
@@ -761,7 +783,7 @@ def _dispatch_task_router_scorers(
 
     result = SimpleNamespace(
         metrics=metrics,
-        result_df=_build_per_row_result_df(rows, metrics),
+        result_df=_build_per_row_result_df(frame, metrics),
     )
     _persist_per_row_artifact(
         mlflow_module=mlflow_module,
@@ -772,28 +794,8 @@ def _dispatch_task_router_scorers(
     return result
 
 
-def _rows_for_sales_scorer(rows: list[dict[str, Any]], scorer_ref: str) -> list[dict[str, Any]]:
-    """Return only rows intended for a given sales scorer.
-
-    sales_outcome_row/v1 requires both ``metric_name`` and ``scorer_ref``, but
-    matching either field keeps dispatch tolerant of older or partially-normalized
-    rows while still isolating scorer-specific metrics.
-    """
-    return [
-        row
-        for row in rows
-        if row.get("scorer_ref") == scorer_ref or row.get("metric_name") == scorer_ref
-    ]
-
-
-def _build_per_row_result_df(rows: list[dict[str, Any]], metrics: dict[str, float]) -> Any:
-    import pandas as pd
-
-    result_rows = []
-    for row in rows:
-        metric_columns = dict(metrics)
-        result_rows.append({**row, **metric_columns})
-    return pd.DataFrame(result_rows)
+def _build_per_row_result_df(frame: ScorerFrame, metrics: dict[str, float]) -> Any:
+    return frame.frame.assign(**metrics)
 
 
 def _parse_s3_uri(uri: str) -> tuple[str, str]:
@@ -820,65 +822,29 @@ def _load_s3_object_bytes(dataset_reference: str) -> bytes:
 
 
 def _load_sales_outcome_rows(dataset_reference: str) -> list[dict[str, Any]]:
-    if dataset_reference.startswith("s3://"):
-        rows = _load_sales_outcome_rows_from_suffix(
-            dataset_reference,
-            Path(dataset_reference).suffix.lower(),
-            _load_s3_object_bytes(dataset_reference),
-        )
-    elif _is_remote(dataset_reference):
-        raise DatasetAccessNotImplementedError(
-            f"deterministic scorer dispatch does not support remote dataset_reference "
-            f"{dataset_reference!r}"
-        )
-    else:
-        dataset_path = Path(dataset_reference)
-        if not dataset_path.exists() or not dataset_path.is_file():
-            raise DatasetLoadError(
-                f"dataset_reference is not a readable file: {dataset_reference!r}"
-            )
+    return _load_sales_outcome_frame(dataset_reference).records()
 
-        rows = _load_sales_outcome_rows_from_suffix(
-            dataset_reference,
-            dataset_path.suffix.lower(),
-            dataset_path,
-        )
 
-    if not rows:
-        raise DatasetLoadError("deterministic scorer datasets must contain at least one row")
-
-    for index, row in enumerate(rows):
-        if not isinstance(row, dict):
-            raise DatasetLoadError(f"row {index} is not an object")
-        if row.get("schema_version") != "sales_outcome_row/v1":
-            raise DatasetLoadError(
-                f"row {index} has unsupported schema_version {row.get('schema_version')!r}"
-            )
-    return rows
-
-
-def _load_task_router_rows(dataset_reference: str) -> list[dict[str, Any]]:
-    rows = _load_rows_for_schema(
+def _load_sales_outcome_frame(dataset_reference: str) -> ScorerFrame:
+    return _load_scorer_frame(
         dataset_reference=dataset_reference,
-        schema_version=("technical_task_router_row/v1", "technical_task_router_row/v2"),
-        dataset_label="task-router",
+        schema_version="sales_outcome_row/v1",
+        dataset_label="sales",
     )
-    return rows
 
 
-def _load_rows_for_schema(
+def _load_scorer_frame(
     *,
     dataset_reference: str,
     schema_version: str | tuple[str, ...],
     dataset_label: str,
-) -> list[dict[str, Any]]:
+) -> ScorerFrame:
+    """Load a deterministic scorer dataset as columns, validating every row's schema."""
+    from src.evaluation.scorers.columnar import ScorerFrame
+
     if dataset_reference.startswith("s3://"):
-        rows = _load_rows_from_suffix(
-            dataset_reference,
-            Path(dataset_reference).suffix.lower(),
-            _load_s3_object_bytes(dataset_reference),
-            dataset_label,
-        )
+        suffix = Path(dataset_reference).suffix.lower()
+        source: Path | bytes = _load_s3_object_bytes(dataset_reference)
     elif _is_remote(dataset_reference):
         raise DatasetAccessNotImplementedError(
             f"deterministic scorer dispatch does not support remote dataset_reference "
@@ -890,36 +856,31 @@ def _load_rows_for_schema(
             raise DatasetLoadError(
                 f"dataset_reference is not a readable file: {dataset_reference!r}"
             )
+        suffix = dataset_path.suffix.lower()
+        source = dataset_path
 
-        rows = _load_rows_from_suffix(
-            dataset_reference,
-            dataset_path.suffix.lower(),
-            dataset_path,
-            dataset_label,
+    if suffix == ".parquet":
+        frame = ScorerFrame(_load_parquet_frame(source, dataset_reference))
+        if not len(frame):
+            raise DatasetLoadError("deterministic scorer datasets must contain at least one row")
+    else:
+        rows = _load_rows_from_suffix(dataset_reference, suffix, source, dataset_label)
+        if not rows:
+            raise DatasetLoadError("deterministic scorer datasets must contain at least one row")
+        for index, row in enumerate(rows):
+            if not isinstance(row, dict):
+                raise DatasetLoadError(f"row {index} is not an object")
+        frame = ScorerFrame.from_rows(rows)
+
+    supported_versions = (schema_version,) if isinstance(schema_version, str) else schema_version
+    unsupported = ~frame.column("schema_version").isin(supported_versions).to_numpy()
+    if unsupported.any():
+        index = int(unsupported.argmax())
+        raise DatasetLoadError(
+            f"row {index} has unsupported schema_version "
+            f"{frame.records()[index].get('schema_version')!r}"
         )
-
-    if not rows:
-        raise DatasetLoadError("deterministic scorer datasets must contain at least one row")
-
-    for index, row in enumerate(rows):
-        if not isinstance(row, dict):
-            raise DatasetLoadError(f"row {index} is not an object")
-        supported_versions = (
-            (schema_version,) if isinstance(schema_version, str) else schema_version
-        )
-        if row.get("schema_version") not in supported_versions:
-            raise DatasetLoadError(
-                f"row {index} has unsupported schema_version {row.get('schema_version')!r}"
-            )
-    return rows
-
-
-def _load_sales_outcome_rows_from_suffix(
-    dataset_reference: str,
-    suffix: str,
-    source: Path | bytes,
-) -> list[dict[str, Any]]:
-    return _load_rows_from_suffix(dataset_reference, suffix, source, "sales")
+    return frame
 
 
 def _load_rows_from_suffix(
@@ -936,10 +897,6 @@ def _load_rows_from_suffix(
         if isinstance(source, Path):
             return _load_jsonl_rows(source)
         return _load_jsonl_rows_from_text(source.decode("utf-8"), dataset_reference)
-    if suffix == ".parquet":
-        if isinstance(source, Path):
-            return _load_parquet_rows(source)
-        return _load_parquet_rows_from_bytes(source, dataset_reference)
     raise DatasetLoadError(
         f"unsupported deterministic {dataset_label} dataset format "
         f"{suffix!r} for {dataset_reference!r}"
@@ -988,53 +945,18 @@ def _load_jsonl_rows_from_text(text: str, label: str) -> list[dict[str, Any]]:
     return rows
 
 
-def _load_parquet_rows(path: Path) -> list[dict[str, Any]]:
-    try:
-        import pandas as pd
-    except ImportError as exc:
-        raise DatasetLoadError("pandas is required to load parquet datasets") from exc
-
-    try:
-        return pd.read_parquet(path).to_dict("records")
-    except Exception as exc:  # noqa: BLE001
-        raise DatasetLoadError(f"invalid parquet dataset at {path}: {exc}") from exc
-
-
-def _load_parquet_rows_from_bytes(data: bytes, label: str) -> list[dict[str, Any]]:
+def _load_parquet_frame(source: Path | bytes, label: str) -> Any:
     try:
         import pandas as pd
     except ImportError as exc:
         raise DatasetLoadError("pandas is required to load parquet datasets") from exc
 
     try:
-        return pd.read_parquet(io.BytesIO(data)).to_dict("records")
+        return pd.read_parquet(source if isinstance(source, Path) else io.BytesIO(source))
     except Exception as exc:  # noqa: BLE001
         raise DatasetLoadError(f"invalid parquet dataset at {label}: {exc}") from exc
 
 
-def _canonicalize_local_dataset_for_hash(path: Path) -> str:
-    suffix = path.suffix.lower()
-    if suffix == ".json":
-        payload = json.loads(path.read_text(encoding="utf-8"))
-        return _canonicalize_json_payload(payload)
-    if suffix == ".jsonl":
-        return _canonicalize_json_payload(_load_jsonl_rows(path))
-    if suffix == ".parquet":
-        return _canonicalize_json_payload(_load_parquet_rows(path))
-    payload = json.loads(path.read_text(encoding="utf-8"))
-    return _canonicalize_json_payload(payload)
-
-
-def _canonicalize_json_payload(payload: Any) -> str:
-    if isinstance(payload, list):
-        sorted_rows = sorted(
-            payload,
-            key=lambda row: json.dumps(row, sort_keys=True, separators=(",", ":")),
-        )
-        return json.dumps(sorted_rows, sort_keys=True, separators=(",", ":"))
-    return json.dumps(payload, sort_keys=True, separators=(",", ":"))
-
-
 def _extract_metrics(result: Any) -> dict[str, Any]:
     if hasattr(result, "metrics") and isinstance(result.metrics, dict):
         return result.metrics
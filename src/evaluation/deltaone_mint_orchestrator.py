@@ -735,6 +735,13 @@ class DeltaOneMintOrchestrator:
         """
         resolved: list[dict[str, Any]] = []
         escrow_accounts: list[str] = []
+        resolutions = self._resolve_account_wallets(
+            [
+                str(contributor["account_id"])
+                for contributor in contributors
+                if not contributor.get("wallet_address") and contributor.get("account_id")
+            ]
+        )
         for contributor in contributors:
             if contributor.get("wallet_address"):
                 resolved.append(contributor)
@@ -745,7 +752,7 @@ class DeltaOneMintOrchestrator:
                     "contributors",
                     f"contributor for run {run_id} has neither wallet_address nor account_id",
                 )
-            resolution = self._resolve_account_wallet(str(account_id))
+            resolution = resolutions.get(str(account_id))
             if (
                 resolution is not None
                 and resolution.has_verified_wallet
@@ -778,6 +785,27 @@ class DeltaOneMintOrchestrator:
             )
         return resolved
 
+    def _resolve_account_wallets(
+        self: DeltaOneMintOrchestrator, account_ids: list[str]
+    ) -> dict[str, Any | None]:
+        """Resolve wallets in one batch call when the notifier supports it."""
+        if not account_ids:
+            return {}
+        batch_resolver = getattr(self._reward_entitlement_notifier, "resolve_wallets", None)
+        if batch_resolver is not None:
+            try:
+                return dict(batch_resolver(account_ids))
+            except Exception as exc:  # noqa: BLE001
+                logger.warning(
+                    "event=wallet_batch_resolution_failed count=%d error=%s",
+                    len(account_ids),
+                    exc,
+                )
+        return {
+            account_id: self._resolve_account_wallet(account_id)
+            for account_id in dict.fromkeys(account_ids)
+        }
+
     def _resolve_account_wallet(self: DeltaOneMintOrchestrator, account_id: str) -> Any | None:
         resolver = getattr(self._reward_entitlement_notifier, "resolve_wallet", None)
         if resolver is None:
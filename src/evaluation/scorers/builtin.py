@@ -2,6 +2,14 @@
 
 from __future__ import annotations
 
+from functools import partial
+from itertools import chain
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from src.evaluation.scorers.columnar import ColumnarScorer, ScorerFrame, is_true, ordered_mean
 from src.evaluation.scorers.metadata import Aggregation, MetricFamily
 from src.evaluation.scorers.registry import register_scorer
 
@@ -435,6 +443,255 @@ def _bounded_score(value: float) -> float:
     return _clamp(value, 0.0, 1.0)
 
 
+# ---------------------------------------------------------------------------
+# Columnar implementations — same values as the row scorers above, computed over
+# ScorerFrame column views. Masks shared by several scorers are derived once per
+# frame, so fused evaluation does not repeat per-row work for each scorer.
+# ---------------------------------------------------------------------------
+
+
+def _raw_value(frame: ScorerFrame, column: str, position: int) -> Any:  # noqa: ANN401
+    # Report the value as stored in the row, not its float-coerced column form.
+    return frame.records()[position].get(column)
+
+
+def _sales_qualified_meeting_rate_columnar(frame: ScorerFrame) -> float:
+    labels = frame.column("qualified_meeting")
+    observed = labels[labels.notna()]
+    if not len(observed):
+        return 0.0
+    return int(observed.astype(bool).sum()) / len(observed)
+
+
+def _sales_revenue_per_1000_messages_columnar(frame: ScorerFrame) -> float:
+    delivered = frame.numeric("delivered_count").fillna(0.0).to_numpy()
+    cents = frame.numeric("revenue_amount_cents").fillna(0.0).to_numpy()
+    invalid = np.flatnonzero((delivered < 0) | ((delivered > 0) & (cents < 0)))
+    if len(invalid):
+        position = int(invalid[0])
+        if delivered[position] < 0:
+            value = _raw_value(frame, "delivered_count", position)
+            raise ValueError(f"Negative delivered_count is not allowed: {value!r}")
+        value = _raw_value(frame, "revenue_amount_cents", position)
+        raise ValueError(f"Negative revenue_amount_cents is not allowed: {value!r}")
+    counted = delivered > 0
+    total_delivered = float(delivered[counted].sum())
+    if total_delivered == 0:
+        return 0.0
+    total_cents = float(sum(cents[counted].tolist()))
+    return (total_cents / 100.0 / total_delivered) * 1000.0
+
+
+def _sales_event_rate_columnar(frame: ScorerFrame, field: str) -> float:
+    flags = frame.column(field)
+    observed = flags.notna().to_numpy()
+    delivered = frame.numeric("delivered_count").fillna(0.0).to_numpy()
+    negative = np.flatnonzero(observed & (delivered < 0))
+    if len(negative):
+        value = _raw_value(frame, "delivered_count", int(negative[0]))
+        raise ValueError(f"Negative delivered_count is not allowed: {value!r}")
+    counted = observed & (delivered != 0)
+    denominator = float(delivered[counted].sum())
+    numerator = int(flags[counted].astype(bool).sum())
+    return numerator / denominator if denominator else 0.0
+
+
+def _sales_spam_complaint_rate_columnar(frame: ScorerFrame) -> float:
+    return _sales_event_rate_columnar(frame, "spam_complaint")
+
+
+def _sales_unsubscribe_rate_columnar(frame: ScorerFrame) -> float:
+    return _sales_event_rate_columnar(frame, "unsubscribe")
+
+
+def _task_router_selection_valid(frame: ScorerFrame) -> np.ndarray:
+    """Rows whose selected_models and allowed_models are string lists, selected ⊆ allowed."""
+    return frame.derived("task_router.selection_valid", _compute_task_router_selection_valid)
+
+
+def _compute_task_router_selection_valid(frame: ScorerFrame) -> np.ndarray:
+    selected = frame.column("selected_models")
+    allowed = frame.column("allowed_models")
+    valid = ((selected.map(type) == list) & (allowed.map(type) == list)).to_numpy()
+    rows = np.flatnonzero(valid)
+    if not len(rows):
+        return valid
+
+    flattened = []
+    for models in (selected.iloc[rows], allowed.iloc[rows]):
+        lengths = models.map(len).to_numpy(dtype=np.int64)
+        values = pd.Series(list(chain.from_iterable(models)), dtype=object)
+        flattened.append((np.repeat(rows, lengths), values, (values.map(type) == str).to_numpy()))
+
+    for positions, _, is_str in flattened:
+        valid[positions[~is_str]] = False
+
+    # Encode (row, model) pairs as integers and check every selected pair is allowed.
+    (
+        (selected_rows, selected_values, selected_str),
+        (allowed_rows, allowed_values, allowed_str),
+    ) = flattened
+    codes, uniques = pd.factorize(
+        pd.concat([selected_values[selected_str], allowed_values[allowed_str]], ignore_index=True)
+    )
+    selected_count = int(selected_str.sum())
+    width = max(len(uniques), 1)
+    selected_keys = selected_rows[selected_str] * width + codes[:selected_count]
+    allowed_keys = allowed_rows[allowed_str] * width + codes[selected_count:]
+    valid[selected_rows[selected_str][~np.isin(selected_keys, allowed_keys)]] = False
+    return valid
+
+
+def _task_router_feasible(frame: ScorerFrame) -> np.ndarray:
+    def compute(frame: ScorerFrame) -> np.ndarray:
+        actual_cost_usd = frame.numeric("actual_cost_usd").to_numpy()
+        max_cost_usd = frame.numeric("max_cost_usd").to_numpy()
+        return (
+            _task_router_selection_valid(frame)
+            & (actual_cost_usd >= 0)
+            & (max_cost_usd > 0)
+            & (actual_cost_usd <= max_cost_usd)
+        )
+
+    return frame.derived("task_router.feasible", compute)
+
+
+def _task_router_success(frame: ScorerFrame) -> np.ndarray:
+    return frame.derived(
+        "task_router.success_under_budget",
+        lambda frame: _task_router_feasible(frame)
+        & is_true(frame.column("completed_successfully")),
+    )
+
+
+def _task_router_feasibility_columnar(frame: ScorerFrame) -> float:
+    if not len(frame):
+        return 0.0
+    return int(_task_router_feasible(frame).sum()) / len(frame)
+
+
+def _task_router_success_under_budget_columnar(frame: ScorerFrame) -> float:
+    if not len(frame):
+        return 0.0
+    return int(_task_router_success(frame).sum()) / len(frame)
+
+
+def _task_router_invalid_selection_rate_columnar(frame: ScorerFrame) -> float:
+    if not len(frame):
+        return 0.0
+    return int((~_task_router_selection_valid(frame)).sum()) / len(frame)
+
+
+def _task_router_cost_efficiency_v2_columnar(frame: ScorerFrame) -> float:
+    success = _task_router_success(frame)
+    ratio = np.divide(
+        frame.numeric("actual_cost_usd").to_numpy(),
+        frame.numeric("max_cost_usd").to_numpy(),
+        out=np.zeros(len(frame)),
+        where=success,
+    )
+    headroom = np.where(success, 1.0 - np.clip(ratio, 0.0, 1.0), 0.0)
+    return _bounded_score(ordered_mean(headroom))
+
+
+def _task_router_scenario_success_rate_columnar(frame: ScorerFrame, scenarios: set[str]) -> float:
+    in_scenarios = frame.column("scenario").isin(scenarios).to_numpy()
+    if not in_scenarios.any():
+        joined = ", ".join(sorted(scenarios))
+        raise ValueError(
+            f"technical_task_router.benchmark_score/v2 missing scenario rows: {joined}"
+        )
+    return int(_task_router_success(frame)[in_scenarios].sum()) / int(in_scenarios.sum())
+
+
+def _task_router_sparse_cell_generalization_v2_columnar(frame: ScorerFrame) -> float:
+    return _task_router_scenario_success_rate_columnar(frame, {"sparse_cell"})
+
+
+def _task_router_candidate_pool_robustness_v2_columnar(frame: ScorerFrame) -> float:
+    return _task_router_scenario_success_rate_columnar(
+        frame,
+        {"challenger_present", "dominant_model_removed", "low_budget"},
+    )
+
+
+def _task_router_benchmark_score_v2_columnar(frame: ScorerFrame) -> float:
+    success = _task_router_success_under_budget_columnar(frame)
+    cost_efficiency = _task_router_cost_efficiency_v2_columnar(frame)
+    sparse_cell = _task_router_sparse_cell_generalization_v2_columnar(frame)
+    candidate_pool = _task_router_candidate_pool_robustness_v2_columnar(frame)
+    return _bounded_score(
+        (0.70 * success) + (0.15 * cost_efficiency) + (0.10 * sparse_cell) + (0.05 * candidate_pool)
+    )
+
+
+def _task_router_absolute_error_columnar(frame: ScorerFrame, estimate: str, actual: str) -> float:
+    estimated = frame.numeric(estimate).to_numpy()
+    observed = frame.numeric(actual).to_numpy()
+    present = ~np.isnan(estimated) & ~np.isnan(observed)
+    return ordered_mean(np.abs(estimated[present] - observed[present]))
+
+
+def _task_router_cost_mae_usd_columnar(frame: ScorerFrame) -> float:
+    return _task_router_absolute_error_columnar(frame, "estimated_cost_usd", "actual_cost_usd")
+
+
+def _task_router_duration_mae_seconds_columnar(frame: ScorerFrame) -> float:
+    return _task_router_absolute_error_columnar(
+        frame, "estimated_duration_seconds", "actual_time_seconds"
+    )
+
+
+def _task_router_reliability_brier_score_columnar(frame: ScorerFrame) -> float:
+    estimated = frame.numeric("estimated_success_under_budget").to_numpy()
+    present = ~np.isnan(estimated)
+    observed = _task_router_success(frame).astype(float)
+    return ordered_mean((estimated[present] - observed[present]) ** 2)
+
+
+def _task_router_objective_success_columnar(frame: ScorerFrame, objective: str) -> float:
+    matching = (frame.column("routing_objective") == objective).to_numpy()
+    if not matching.any():
+        return 0.0
+    return int(_task_router_success(frame)[matching].sum()) / int(matching.sum())
+
+
+_COLUMNAR_SCORERS: dict[str, ColumnarScorer] = {
+    "sales:qualified_meeting_rate": _sales_qualified_meeting_rate_columnar,
+    "sales:revenue_per_1000_messages": _sales_revenue_per_1000_messages_columnar,
+    "sales:spam_complaint_rate": _sales_spam_complaint_rate_columnar,
+    "sales:unsubscribe_rate": _sales_unsubscribe_rate_columnar,
+    "technical_task_router.feasibility/v1": _task_router_feasibility_columnar,
+    "technical_task_router.success_under_budget/v1": _task_router_success_under_budget_columnar,
+    "technical_task_router.benchmark_score/v1": _task_router_success_under_budget_columnar,
+    "technical_task_router.invalid_selection_rate/v1": (
+        _task_router_invalid_selection_rate_columnar
+    ),
+    "technical_task_router.cost_efficiency/v2": _task_router_cost_efficiency_v2_columnar,
+    "technical_task_router.sparse_cell_generalization/v2": (
+        _task_router_sparse_cell_generalization_v2_columnar
+    ),
+    "technical_task_router.candidate_pool_robustness/v2": (
+        _task_router_candidate_pool_robustness_v2_columnar
+    ),
+    "technical_task_router.benchmark_score/v2": _task_router_benchmark_score_v2_columnar,
+    "technical_task_router.cost_mae_usd/v1": _task_router_cost_mae_usd_columnar,
+    "technical_task_router.duration_mae_seconds/v1": _task_router_duration_mae_seconds_columnar,
+    "technical_task_router.reliability_brier_score/v1": (
+        _task_router_reliability_brier_score_columnar
+    ),
+    "technical_task_router.lowest_cost_success_under_budget/v1": partial(
+        _task_router_objective_success_columnar, objective="lowest_cost"
+    ),
+    "technical_task_router.fastest_completion_success_under_budget/v1": partial(
+        _task_router_objective_success_columnar, objective="fastest_completion"
+    ),
+    "technical_task_router.highest_reliability_success_under_budget/v1": partial(
+        _task_router_objective_success_columnar, objective="highest_reliability"
+    ),
+}
+
+
 _OUTCOME_SCORERS = [
     ("mean", _mean, Aggregation.MEAN),
     ("sum", _sum, Aggregation.SUM),
@@ -534,6 +791,7 @@ for _ref, _fn, _agg, _desc in _SALES_SCORERS:
         metric_family=MetricFamily.OUTCOME,
         aggregation=_agg,
         description=_desc,
+        columnar_=_COLUMNAR_SCORERS[_ref],
     )
 
 _TASK_ROUTER_SCORERS = [
@@ -690,4 +948,5 @@ for _ref, _fn, _desc, _agg, _family in _TASK_ROUTER_SCORERS:
         metric_family=_family,
         aggregation=_agg,
         description=_desc,
+        columnar_=_COLUMNAR_SCORERS[_ref],
     )
@@ -0,0 +1,157 @@
+"""Columnar scorer protocol and fused multi-scorer evaluation.
+
+A columnar scorer receives a :class:`ScorerFrame` (column views over the rows it
+scores) instead of ``list[dict]``. :func:`evaluate_scorers` partitions the rows
+once, evaluates every requested scorer over shared frames, and falls back to the
+row-based callable for scorers registered without a columnar implementation.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, Any, Callable, Protocol
+
+import numpy as np
+import pandas as pd
+
+if TYPE_CHECKING:
+    from src.evaluation.scorers.registry import RegisteredScorer
+
+
+class ColumnarScorer(Protocol):
+    """A scorer computed from column views rather than row dicts."""
+
+    def __call__(self, frame: ScorerFrame) -> float:
+        ...  # noqa: D102
+
+
+class ScorerFrame:
+    """Rows to score, exposed as columns with a per-frame cache of derived values.
+
+    ``rows`` keeps the original row dicts when the dataset was loaded from JSON so
+    row-based scorers see exactly what they saw before (absent keys stay absent).
+    Frames loaded from parquet build row dicts on first use.
+    """
+
+    def __init__(
+        self,
+        frame: pd.DataFrame,
+        rows: list[dict[str, Any]] | None = None,
+    ) -> None:
+        """Initialize the scorer frame.
+
+        Args:
+        ----
+            frame: Rows as a DataFrame
+            rows: The same rows as dicts, when already materialized
+
+        """
+        self.frame = frame.reset_index(drop=True)
+        self._rows = rows
+        self._derived: dict[str, Any] = {}
+
+    @classmethod
+    def from_rows(cls: type[ScorerFrame], rows: list[dict[str, Any]]) -> ScorerFrame:
+        """Build a frame from row dicts, keeping the dicts for row-based scorers."""
+        return cls(pd.DataFrame(rows), rows=rows)
+
+    def __len__(self) -> int:
+        return len(self.frame)
+
+    def column(self, name: str) -> pd.Series:
+        """Return a column, or an all-null column when no row has the field."""
+        if name in self.frame.columns:
+            return self.frame[name]
+        return pd.Series([None] * len(self.frame), index=self.frame.index, dtype=object)
+
+    def numeric(self, name: str) -> pd.Series:
+        """Return a column as floats; values that are not numbers become NaN."""
+        return self.derived(
+            f"numeric:{name}", lambda frame: pd.to_numeric(frame.column(name), errors="coerce")
+        )
+
+    def derived(self, key: str, compute: Callable[[ScorerFrame], Any]) -> Any:  # noqa: ANN401
+        """Return ``compute(self)``, computed once per frame and shared across scorers."""
+        if key not in self._derived:
+            self._derived[key] = compute(self)
+        return self._derived[key]
+
+    def records(self) -> list[dict[str, Any]]:
+        """Return the rows as dicts for row-based scorers."""
+        if self._rows is None:
+            self._rows = self.frame.to_dict("records")
+        return self._rows
+
+    def take(self, positions: np.ndarray) -> ScorerFrame:
+        """Return a frame over the rows at ``positions`` (in order)."""
+        rows = None
+        if self._rows is not None:
+            rows = [self._rows[position] for position in positions.tolist()]
+        return ScorerFrame(self.frame.iloc[positions], rows=rows)
+
+    def partition(self, refs: Sequence[str], by: Sequence[str]) -> dict[str, ScorerFrame]:
+        """Split rows by ref in a single pass over the ``by`` columns.
+
+        A row belongs to a ref when any ``by`` column equals it, so a row can land
+        in more than one partition. Row order is preserved within each partition.
+        """
+        groups = [
+            self.column(column).groupby(self.column(column), sort=False).indices
+            for column in by
+            if column in self.frame.columns
+        ]
+        empty = np.empty(0, dtype=np.int64)
+        partitions: dict[str, ScorerFrame] = {}
+        for ref in dict.fromkeys(refs):
+            positions = np.unique(
+                np.concatenate([empty, *(group.get(ref, empty) for group in groups)])
+            )
+            partitions[ref] = self.take(positions)
+        return partitions
+
+
+def score(registered: RegisteredScorer, frame: ScorerFrame) -> Any:  # noqa: ANN401
+    """Evaluate one scorer, preferring its columnar implementation."""
+    if registered.columnar_ is not None:
+        return registered.columnar_(frame)
+    return registered.callable_(frame.records())
+
+
+def evaluate_scorers(
+    frame: ScorerFrame,
+    scorers: Sequence[RegisteredScorer],
+    *,
+    partition_by: Sequence[str] | None = None,
+) -> dict[str, Any]:
+    """Evaluate several scorers over one frame in a single fused pass.
+
+    Args:
+    ----
+        frame: Rows to score
+        scorers: Registered scorers to evaluate; duplicates are computed once
+        partition_by: Columns naming the scorer each row is intended for. When
+            omitted every scorer sees every row.
+
+    Returns:
+    -------
+        Mapping of scorer ref to the value its scorer returned
+
+    """
+    unique = {registered.metadata.scorer_ref: registered for registered in scorers}
+    if partition_by:
+        frames = frame.partition(list(unique), partition_by)
+    else:
+        frames = dict.fromkeys(unique, frame)
+    return {ref: score(registered, frames[ref]) for ref, registered in unique.items()}
+
+
+def is_true(values: pd.Series) -> np.ndarray:
+    """Return a mask of values that are the boolean ``True`` (``value is True``)."""
+    if pd.api.types.is_bool_dtype(values):
+        return values.to_numpy(dtype=bool)
+    return (values.map(type) == bool).to_numpy() & (values == True).to_numpy()  # noqa: E712
+
+
+def ordered_mean(values: np.ndarray) -> float:
+    """Mean that sums in order with ``sum`` so results match the row-based scorers."""
+    return sum(values.tolist()) / len(values) if len(values) else 0.0
@@ -6,11 +6,14 @@ import inspect
 import json
 from dataclasses import dataclass
 from hashlib import sha256
-from typing import Any, Callable
+from typing import TYPE_CHECKING, Any, Callable
 
 from src.evaluation.scorers.metadata import Aggregation, MetricFamily, ScorerMetadata
 from src.utils.metric_naming import derive_mlflow_name, validate_mlflow_metric_key
 
+if TYPE_CHECKING:
+    from src.evaluation.scorers.columnar import ColumnarScorer
+
 
 class UnknownScorerError(KeyError):
     """Raised when a scorer ref is not found in the registry."""
@@ -28,10 +31,11 @@ class ScorerConflictError(ValueError):
 
 @dataclass(frozen=True)
 class RegisteredScorer:
-    """A scorer paired with its callable."""
+    """A scorer paired with its callable and optional columnar implementation."""
 
     metadata: ScorerMetadata
     callable_: Callable[..., Any]
+    columnar_: ColumnarScorer | None = None
 
 
 _REGISTRY: dict[str, RegisteredScorer] = {}
@@ -85,8 +89,14 @@ def register_scorer(
     metric_family: MetricFamily,
     aggregation: Aggregation,
     description: str | None = None,
+    columnar_: ColumnarScorer | None = None,
 ) -> None:
-    """Register a scorer. Idempotent if metadata is identical; raises on conflict."""
+    """Register a scorer. Idempotent if metadata is identical; raises on conflict.
+
+    ``columnar_`` is an optional implementation over a ``ScorerFrame`` that must
+    return the same value as ``callable_``. It is used by fused evaluation and is
+    not part of the scorer's identity, so adding one leaves ``source_hash`` unchanged.
+    """
     for key in output_metric_keys:
         # Canonical keys may contain ':' (e.g. 'sales:spam_complaint_rate'); validate
         # the derived MLflow-safe name rather than the canonical key directly.
@@ -119,7 +129,9 @@ def register_scorer(
             raise ScorerConflictError(scorer_ref)
         return
 
-    _REGISTRY[scorer_ref] = RegisteredScorer(metadata=metadata, callable_=callable_)
+    _REGISTRY[scorer_ref] = RegisteredScorer(
+        metadata=metadata, callable_=callable_, columnar_=columnar_
+    )
 
 
 def resolve_scorer(ref: str) -> RegisteredScorer:
@@ -169,6 +169,11 @@ def get_publisher() -> AbstractPublisher:
                         "circuit_breaker_recovery_time": int(
                             os.getenv("WEBHOOK_CIRCUIT_BREAKER_RECOVERY_TIME", "60")
                         ),
+                        "max_queue_size": int(os.getenv("WEBHOOK_MAX_QUEUE_SIZE", "1000")),
+                        "max_concurrent_deliveries": int(
+                            os.getenv("WEBHOOK_MAX_CONCURRENT_DELIVERIES", "4")
+                        ),
+                        "spill_dir": os.getenv("WEBHOOK_SPILL_DIR") or None,
                     }
                 )
                 logger.info(f"Created webhook publisher for: {webhook_url}")
@@ -5,15 +5,23 @@ This publisher provides graceful degradation by:
 1. Logging messages when Redis is down
 2. Queuing messages locally for potential replay
 3. Providing health status indicating fallback mode
+
+When a storage directory is configured (``storage_dir`` or the
+``FALLBACK_PUBLISHER_STORAGE_DIR`` environment variable), messages are appended
+to segment files on disk instead of an in-memory deque, so nothing is dropped
+during a long outage and queued messages survive a restart.
 """
 
 import json
 import logging
+import os
 import threading
 import time
-from collections import deque
+from collections import Counter, deque
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from itertools import islice
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 try:
     from .base import AbstractPublisher
@@ -23,6 +31,209 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_SEGMENT_MAX_BYTES = 16 * 1024 * 1024
+DEFAULT_REPLAY_BATCH_SIZE = 100
+
+# (segment number, byte offset) of a record in the segment log
+LogPosition = Tuple[int, int]
+
+
+class SegmentLog:
+    """
+    Append-only log of JSON records split across size-bounded segment files.
+
+    Each record is one line in ``segment-<n>.log``. ``checkpoint.json`` holds the
+    position of the first record that has not been replayed yet and is replaced
+    atomically, so after a crash replay resumes from the last committed batch.
+    Segments that lie entirely before the checkpoint are deleted.
+    """
+
+    CHECKPOINT_FILE = "checkpoint.json"
+
+    def __init__(
+        self,
+        directory: str,
+        segment_max_bytes: int = DEFAULT_SEGMENT_MAX_BYTES,
+        fsync: bool = False
+    ):
+        """
+        Open (or create) a segment log.
+
+        Args:
+            directory: Directory holding the segment and checkpoint files
+            segment_max_bytes: Size after which a new segment is started
+            fsync: Whether to fsync after every append
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.segment_max_bytes = segment_max_bytes
+        self.fsync = fsync
+        self.checkpoint = self._load_checkpoint()
+
+        segments = self.segments()
+        self._segment = segments[-1] if segments else self.checkpoint[0]
+        self._truncate_torn_tail(self._segment_path(self._segment))
+        self._open_writer()
+
+    def segments(self) -> List[int]:
+        """Return the numbers of the segment files on disk, oldest first."""
+        return sorted(
+            int(path.stem.split("-", 1)[1])
+            for path in self.directory.glob("segment-*.log")
+        )
+
+    def append(self, record: Dict[str, Any]) -> LogPosition:
+        """
+        Append a record and return its position.
+
+        Args:
+            record: JSON-serializable record
+
+        Returns:
+            Position of the record in the log
+        """
+        line = (json.dumps(record, default=str, separators=(",", ":")) + "\n").encode()
+        if self._size and self._size + len(line) > self.segment_max_bytes:
+            self._writer.close()
+            self._segment += 1
+            self._open_writer()
+
+        position = (self._segment, self._size)
+        try:
+            self._writer.write(line)
+            self._writer.flush()
+            if self.fsync:
+                os.fsync(self._writer.fileno())
+        except OSError:
+            # Drop a partially written line so later records stay readable
+            self._writer.close()
+            os.truncate(self._segment_path(self._segment), self._size)
+            self._open_writer()
+            raise
+
+        self._size += len(line)
+        return position
+
+    def read(self, positions: List[LogPosition]) -> List[Dict[str, Any]]:
+        """
+        Read the records at the given positions.
+
+        Args:
+            positions: Record positions, in log order
+
+        Returns:
+            Records in the same order as ``positions``
+        """
+        records = []
+        handle = None
+        handle_segment = None
+        try:
+            for segment, offset in positions:
+                if segment != handle_segment:
+                    if handle:
+                        handle.close()
+                    handle = open(self._segment_path(segment), "rb")
+                    handle_segment = segment
+                handle.seek(offset)
+                records.append(json.loads(handle.readline()))
+        finally:
+            if handle:
+                handle.close()
+        return records
+
+    def iter_from(
+        self, position: LogPosition
+    ) -> Iterator[Tuple[LogPosition, LogPosition, Dict[str, Any]]]:
+        """
+        Iterate over complete records starting at ``position``.
+
+        Yields:
+            Tuples of (record position, position after the record, record)
+        """
+        start_segment, start_offset = position
+        for segment in self.segments():
+            if segment < start_segment:
+                continue
+            offset = start_offset if segment == start_segment else 0
+            with open(self._segment_path(segment), "rb") as f:
+                f.seek(offset)
+                for line in f:
+                    if not line.endswith(b"\n"):
+                        break
+                    next_offset = offset + len(line)
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        logger.error(
+                            f"Skipping corrupt fallback record at segment {segment}, "
+                            f"offset {offset}"
+                        )
+                    else:
+                        yield (segment, offset), (segment, next_offset), record
+                    offset = next_offset
+
+    def end_position(self) -> LogPosition:
+        """Return the position the next appended record will get."""
+        return (self._segment, self._size)
+
+    def save_checkpoint(self, position: LogPosition) -> None:
+        """
+        Atomically record ``position`` as the first unreplayed record.
+
+        Args:
+            position: New checkpoint position
+        """
+        path = self.directory / self.CHECKPOINT_FILE
+        tmp_path = path.with_suffix(".tmp")
+        with open(tmp_path, "w") as f:
+            json.dump({"segment": position[0], "offset": position[1]}, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+        self.checkpoint = position
+
+        for segment in self.segments():
+            if segment >= min(position[0], self._segment):
+                break
+            self._segment_path(segment).unlink(missing_ok=True)
+
+    def close(self) -> None:
+        """Flush and close the active segment."""
+        if not self._writer.closed:
+            self._writer.flush()
+            os.fsync(self._writer.fileno())
+            self._writer.close()
+
+    def _load_checkpoint(self) -> LogPosition:
+        try:
+            with open(self.directory / self.CHECKPOINT_FILE) as f:
+                data = json.load(f)
+            return (int(data["segment"]), int(data["offset"]))
+        except FileNotFoundError:
+            return (0, 0)
+        except (ValueError, KeyError) as e:
+            logger.error(f"Unreadable fallback checkpoint, replaying from the start: {e}")
+            return (0, 0)
+
+    def _open_writer(self) -> None:
+        path = self._segment_path(self._segment)
+        self._writer = open(path, "ab")
+        self._size = path.stat().st_size
+
+    def _segment_path(self, segment: int) -> Path:
+        return self.directory / f"segment-{segment:010d}.log"
+
+    @staticmethod
+    def _truncate_torn_tail(path: Path) -> None:
+        """Cut off a record left half-written by a crash."""
+        if not path.exists():
+            return
+        data = path.read_bytes()
+        if data and not data.endswith(b"\n"):
+            keep = data.rfind(b"\n") + 1
+            os.truncate(path, keep)
+            logger.warning(f"Truncated {len(data) - keep} bytes of a torn record from {path}")
+
 
 class FallbackPublisher(AbstractPublisher):
     """
@@ -30,17 +241,25 @@ class FallbackPublisher(AbstractPublisher):
     
     Features:
     - Logs all messages for debugging/audit purposes
-    - Queues messages in memory for potential replay
+    - Queues messages in memory, or durably on disk, for potential replay
     - Provides degraded health status
     - Thread-safe operations
     - Configurable queue limits to prevent memory issues
+
+    In durable mode only a per-queue index of record positions is kept in
+    memory; payloads stay in the segment log, nothing is dropped and TTL
+    expiry does not apply.
     """
     
     def __init__(
         self,
         max_queued_messages: int = 1000,
         queue_ttl_seconds: int = 3600,
-        enable_message_logging: bool = True
+        enable_message_logging: bool = True,
+        storage_dir: Optional[str] = None,
+        segment_max_bytes: int = DEFAULT_SEGMENT_MAX_BYTES,
+        replay_batch_size: int = DEFAULT_REPLAY_BATCH_SIZE,
+        fsync_writes: bool = False
     ):
         """
         Initialize fallback publisher.
@@ -49,14 +268,32 @@ class FallbackPublisher(AbstractPublisher):
             max_queued_messages: Maximum messages to queue in memory
             queue_ttl_seconds: Time to keep messages in queue (for replay)
             enable_message_logging: Whether to log message contents
+            storage_dir: Directory for the durable segment log (defaults to
+                ``FALLBACK_PUBLISHER_STORAGE_DIR``; in-memory queue when unset)
+            segment_max_bytes: Size at which a new segment file is started
+            replay_batch_size: Messages replayed between checkpoints
+            fsync_writes: Whether to fsync every appended message
         """
         self.max_queued_messages = max_queued_messages
         self.queue_ttl_seconds = queue_ttl_seconds
         self.enable_message_logging = enable_message_logging
+        self.storage_dir = storage_dir or os.getenv("FALLBACK_PUBLISHER_STORAGE_DIR") or None
+        self.replay_batch_size = replay_batch_size
         
         # Thread-safe queue for storing messages
         self.queued_messages = deque(maxlen=max_queued_messages)
+        self._queue_counts: Counter = Counter()
         self._lock = threading.RLock()
+        self._replay_lock = threading.Lock()
+        
+        # Durable mode: positions of pending records per queue, in log order
+        self._log: Optional[SegmentLog] = None
+        self._queue_index: Dict[str, deque] = {}
+        self._pending_count = 0
+        self._last_queued_at: Optional[datetime] = None
+        if self.storage_dir:
+            self._log = SegmentLog(self.storage_dir, segment_max_bytes, fsync=fsync_writes)
+            self._rebuild_index()
         
         # Statistics
         self.messages_published = 0
@@ -65,9 +302,15 @@ class FallbackPublisher(AbstractPublisher):
         
         logger.warning(
             f"Initialized FallbackPublisher: max_queued={max_queued_messages}, "
-            f"ttl={queue_ttl_seconds}s, logging_enabled={enable_message_logging}"
+            f"ttl={queue_ttl_seconds}s, logging_enabled={enable_message_logging}, "
+            f"storage_dir={self.storage_dir}, recovered={self._pending_count}"
         )
     
+    @property
+    def durable(self) -> bool:
+        """Whether messages are stored in the on-disk segment log."""
+        return self._log is not None
+    
     def publish(self, message: Dict[str, Any], queue_name: str) -> bool:
         """
         Publish message to fallback system (log and queue).
@@ -92,26 +335,24 @@ class FallbackPublisher(AbstractPublisher):
         }
         
         with self._lock:
-            # Add to queue (will auto-evict old messages if at capacity)
-            was_full = len(self.queued_messages) >= self.max_queued_messages
-            self.queued_messages.append(envelope)
-            
-            if was_full:
-                self.messages_dropped += 1
-                logger.warning(
-                    f"Message queue full, dropped oldest message. "
-                    f"Queue size: {len(self.queued_messages)}, "
-                    f"Total dropped: {self.messages_dropped}"
-                )
+            if self._log is not None:
+                try:
+                    self._append_durable(envelope)
+                except OSError as e:
+                    logger.error(f"Failed to persist fallback message, queuing in memory: {e}")
+                    self._append_in_memory(envelope)
+            else:
+                self._append_in_memory(envelope)
             
             self.messages_published += 1
+            total_queued = self._current_queue_size()
         
         # Log message details if enabled
         if self.enable_message_logging:
             logger.info(
                 f"FALLBACK: Published message to '{queue_name}' "
                 f"(ID: {envelope['message_id']}, "
-                f"Total queued: {len(self.queued_messages)})",
+                f"Total queued: {total_queued})",
                 extra={
                     "message_id": envelope["message_id"],
                     "queue_name": queue_name,
@@ -130,6 +371,54 @@ class FallbackPublisher(AbstractPublisher):
         
         return True
     
+    def _append_in_memory(self, envelope: Dict[str, Any]) -> None:
+        """Add an envelope to the in-memory queue, evicting the oldest if full."""
+        was_full = len(self.queued_messages) >= self.max_queued_messages
+        if was_full:
+            self._queue_counts[self.queued_messages[0]["queue_name"]] -= 1
+        self.queued_messages.append(envelope)
+        self._queue_counts[envelope["queue_name"]] += 1
+        
+        if was_full:
+            self.messages_dropped += 1
+            logger.warning(
+                f"Message queue full, dropped oldest message. "
+                f"Queue size: {len(self.queued_messages)}, "
+                f"Total dropped: {self.messages_dropped}"
+            )
+    
+    def _append_durable(self, envelope: Dict[str, Any]) -> None:
+        """Append an envelope to the segment log and index its position."""
+        record = dict(
+            envelope,
+            timestamp=envelope["timestamp"].isoformat(),
+            queued_at=envelope["queued_at"].isoformat()
+        )
+        position = self._log.append(record)
+        self._queue_index.setdefault(envelope["queue_name"], deque()).append(position)
+        self._pending_count += 1
+        self._last_queued_at = envelope["queued_at"]
+    
+    def _rebuild_index(self) -> None:
+        """Index the records after the checkpoint left by a previous process."""
+        for position, _, record in self._log.iter_from(self._log.checkpoint):
+            self._queue_index.setdefault(record["queue_name"], deque()).append(position)
+            self._pending_count += 1
+            self._last_queued_at = datetime.fromisoformat(record["queued_at"])
+    
+    def _current_queue_size(self) -> int:
+        """Return the number of messages waiting for replay."""
+        return self._pending_count + len(self.queued_messages)
+    
+    @staticmethod
+    def _from_record(record: Dict[str, Any]) -> Dict[str, Any]:
+        """Turn a stored record back into a message envelope."""
+        return dict(
+            record,
+            timestamp=datetime.fromisoformat(record["timestamp"]),
+            queued_at=datetime.fromisoformat(record["queued_at"])
+        )
+    
     def health_check(self) -> Dict[str, Any]:
         """
         Return health status indicating fallback mode.
@@ -141,11 +430,11 @@ class FallbackPublisher(AbstractPublisher):
         uptime = (current_time - self.started_at).total_seconds()
         
         with self._lock:
-            queue_size = len(self.queued_messages)
+            queue_size = self._current_queue_size()
             
             # Clean up expired messages
             self._cleanup_expired_messages()
-            cleaned_queue_size = len(self.queued_messages)
+            cleaned_queue_size = self._current_queue_size()
         
         return {
             "status": "degraded",
@@ -159,24 +448,26 @@ class FallbackPublisher(AbstractPublisher):
                 "max_queue_size": self.max_queued_messages,
                 "messages_cleaned": queue_size - cleaned_queue_size
             },
-            "configuration": {
-                "max_queued_messages": self.max_queued_messages,
-                "queue_ttl_seconds": self.queue_ttl_seconds,
-                "message_logging_enabled": self.enable_message_logging
-            }
+            "configuration": self._configuration()
         }
     
     def close(self) -> None:
         """
         Clean up fallback publisher resources.
+        
+        Messages in the durable log are kept on disk for the next process.
         """
         with self._lock:
             queue_size = len(self.queued_messages)
             self.queued_messages.clear()
+            self._queue_counts.clear()
+            if self._log is not None:
+                self._log.close()
         
         logger.info(
             f"Closed FallbackPublisher: published={self.messages_published}, "
-            f"dropped={self.messages_dropped}, queue_cleared={queue_size}"
+            f"dropped={self.messages_dropped}, queue_cleared={queue_size}, "
+            f"persisted={self._pending_count}"
         )
     
     def get_queue_depth(self, queue_name: str) -> Optional[int]:
@@ -190,11 +481,9 @@ class FallbackPublisher(AbstractPublisher):
             Number of messages for this queue (or None if unavailable)
         """
         with self._lock:
-            # Count messages for specific queue
-            count = sum(
-                1 for msg in self.queued_messages 
-                if msg.get("queue_name") == queue_name
-            )
+            count = self._queue_counts.get(queue_name, 0)
+            if queue_name in self._queue_index:
+                count += len(self._queue_index[queue_name])
             return count
     
     def get_all_queued_messages(self) -> List[Dict[str, Any]]:
@@ -205,7 +494,14 @@ class FallbackPublisher(AbstractPublisher):
             List of all queued message envelopes
         """
         with self._lock:
-            return list(self.queued_messages)
+            messages = list(self.queued_messages)
+            if self._log is not None:
+                stored = [
+                    self._from_record(record)
+                    for _, _, record in self._log.iter_from(self._log.checkpoint)
+                ]
+                messages = stored + messages
+            return messages
     
     def get_messages_for_queue(self, queue_name: str) -> List[Dict[str, Any]]:
         """
@@ -218,17 +514,32 @@ class FallbackPublisher(AbstractPublisher):
             List of message envelopes for the specified queue
         """
         with self._lock:
-            return [
-                msg for msg in self.queued_messages 
-                if msg.get("queue_name") == queue_name
-            ]
+            messages = []
+            if queue_name in self._queue_index:
+                records = self._log.read(list(self._queue_index[queue_name]))
+                messages = [self._from_record(record) for record in records]
+            if self._queue_counts.get(queue_name):
+                messages.extend(
+                    msg for msg in self.queued_messages 
+                    if msg.get("queue_name") == queue_name
+                )
+            return messages
     
-    def replay_messages(self, target_publisher: AbstractPublisher) -> Dict[str, Any]:
+    def replay_messages(
+        self,
+        target_publisher: AbstractPublisher,
+        batch_size: Optional[int] = None
+    ) -> Dict[str, Any]:
         """
         Replay queued messages to a target publisher (when primary system recovers).
         
+        In durable mode messages are replayed in log order, ``batch_size`` at a
+        time, and the checkpoint is advanced after every batch. Replay stops at
+        the first failed message so that it is retried, in order, next time.
+        
         Args:
             target_publisher: Publisher to replay messages to
+            batch_size: Messages per checkpointed batch (durable mode only)
             
         Returns:
             Replay statistics
@@ -245,9 +556,15 @@ class FallbackPublisher(AbstractPublisher):
             "errors": []
         }
         
+        if self._log is not None:
+            with self._replay_lock:
+                self._replay_durable(
+                    target_publisher, batch_size or self.replay_batch_size, replay_stats
+                )
+        
         with self._lock:
             messages_to_replay = list(self.queued_messages)
-            replay_stats["total_messages"] = len(messages_to_replay)
+            replay_stats["total_messages"] += len(messages_to_replay)
         
         logger.info(f"Starting message replay: {replay_stats['total_messages']} messages")
         
@@ -288,6 +605,7 @@ class FallbackPublisher(AbstractPublisher):
                 # In production, you might want more sophisticated tracking
                 if replay_stats["failed_replays"] == 0:
                     self.queued_messages.clear()
+                    self._queue_counts.clear()
                     logger.info("Cleared all replayed messages from fallback queue")
         
         logger.info(
@@ -297,10 +615,61 @@ class FallbackPublisher(AbstractPublisher):
         
         return replay_stats
     
+    def _replay_durable(
+        self,
+        target_publisher: AbstractPublisher,
+        batch_size: int,
+        replay_stats: Dict[str, Any]
+    ) -> None:
+        """Replay the segment log in checkpointed batches."""
+        with self._lock:
+            position = self._log.checkpoint
+            replay_stats["total_messages"] += self._pending_count
+        
+        while True:
+            with self._lock:
+                batch = list(islice(self._log.iter_from(position), batch_size))
+            if not batch:
+                return
+            
+            replayed_queues = []
+            failed = False
+            for _, next_position, record in batch:
+                try:
+                    success = target_publisher.publish(record["payload"], record["queue_name"])
+                    error_msg = f"Replay failed for message {record['message_id']}"
+                except Exception as e:
+                    success = False
+                    error_msg = f"Exception replaying message {record['message_id']}: {str(e)}"
+                    logger.error(error_msg)
+                
+                if not success:
+                    replay_stats["failed_replays"] += 1
+                    replay_stats["errors"].append(error_msg)
+                    failed = True
+                    break
+                
+                replay_stats["successful_replays"] += 1
+                replayed_queues.append(record["queue_name"])
+                position = next_position
+            
+            if replayed_queues:
+                with self._lock:
+                    self._log.save_checkpoint(position)
+                    for queue_name in replayed_queues:
+                        positions = self._queue_index[queue_name]
+                        positions.popleft()
+                        if not positions:
+                            del self._queue_index[queue_name]
+                    self._pending_count -= len(replayed_queues)
+            
+            if failed:
+                return
+    
     def _cleanup_expired_messages(self):
         """Remove expired messages from the queue."""
-        if not self.queue_ttl_seconds:
-            return  # No TTL configured
+        if not self.queue_ttl_seconds or not self.queued_messages:
+            return  # No TTL configured, or nothing held in memory
         
         current_time = datetime.utcnow()
         cutoff_time = current_time.timestamp() - self.queue_ttl_seconds
@@ -315,6 +684,7 @@ class FallbackPublisher(AbstractPublisher):
         
         cleaned_count = original_length - len(self.queued_messages)
         if cleaned_count > 0:
+            self._queue_counts = Counter(msg["queue_name"] for msg in self.queued_messages)
             logger.debug(f"Cleaned up {cleaned_count} expired messages from fallback queue")
     
     def clear_queue(self) -> int:
@@ -324,9 +694,14 @@ class FallbackPublisher(AbstractPublisher):
         Returns:
             Number of messages that were cleared
         """
-        with self._lock:
-            count = len(self.queued_messages)
+        with self._replay_lock, self._lock:
+            count = self._current_queue_size()
             self.queued_messages.clear()
+            self._queue_counts.clear()
+            if self._log is not None:
+                self._log.save_checkpoint(self._log.end_position())
+                self._queue_index.clear()
+                self._pending_count = 0
             
         logger.info(f"Manually cleared {count} messages from fallback queue")
         return count
@@ -342,16 +717,25 @@ class FallbackPublisher(AbstractPublisher):
         uptime = (current_time - self.started_at).total_seconds()
         
         with self._lock:
-            queue_size = len(self.queued_messages)
+            queue_size = self._current_queue_size()
+            oldest_queued_at = None
+            newest_queued_at = None
+            if self.queued_messages:
+                oldest_queued_at = self.queued_messages[0]["queued_at"]
+                newest_queued_at = self.queued_messages[-1]["queued_at"]
+            if self._pending_count:
+                # The oldest pending record sits right at the checkpoint
+                first = next(self._log.iter_from(self._log.checkpoint), None)
+                if first is not None:
+                    oldest_queued_at = datetime.fromisoformat(first[2]["queued_at"])
+                newest_queued_at = max(
+                    filter(None, [newest_queued_at, self._last_queued_at])
+                )
             
             # Calculate queue age statistics
-            if self.queued_messages:
-                oldest_message_age = (
-                    current_time - self.queued_messages[0]["queued_at"]
-                ).total_seconds()
-                newest_message_age = (
-                    current_time - self.queued_messages[-1]["queued_at"]
-                ).total_seconds()
+            if oldest_queued_at is not None:
+                oldest_message_age = (current_time - oldest_queued_at).total_seconds()
+                newest_message_age = (current_time - newest_queued_at).total_seconds()
             else:
                 oldest_message_age = 0
                 newest_message_age = 0
@@ -366,9 +750,21 @@ class FallbackPublisher(AbstractPublisher):
             "oldest_message_age_seconds": oldest_message_age,
             "newest_message_age_seconds": newest_message_age,
             "publish_rate_per_second": self.messages_published / max(uptime, 1),
-            "configuration": {
-                "max_queued_messages": self.max_queued_messages,
-                "queue_ttl_seconds": self.queue_ttl_seconds,
-                "message_logging_enabled": self.enable_message_logging
-            }
-        }
\ No newline at end of file
+            "configuration": self._configuration()
+        }
+    
+    def _configuration(self) -> Dict[str, Any]:
+        """Build the configuration block shared by health and statistics reports."""
+        configuration = {
+            "max_queued_messages": self.max_queued_messages,
+            "queue_ttl_seconds": self.queue_ttl_seconds,
+            "message_logging_enabled": self.enable_message_logging,
+            "durable": self.durable
+        }
+        if self._log is not None:
+            configuration.update({
+                "storage_dir": self.storage_dir,
+                "segment_count": len(self._log.segments()),
+                "replay_batch_size": self.replay_batch_size
+            })
+        return configuration
\ No newline at end of file
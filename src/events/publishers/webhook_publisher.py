@@ -1,13 +1,19 @@
 """Webhook-based message publisher implementation."""
 
 import asyncio
+import atexit
+import concurrent.futures
 import hashlib
 import hmac
 import json
 import logging
+import os
+import threading
 import time
 import uuid
+from dataclasses import dataclass
 from datetime import datetime
+from pathlib import Path
 from typing import Any, Dict, Optional
 from urllib.parse import urlparse
 
@@ -23,6 +29,18 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_MAX_QUEUE_SIZE = 1000
+DEFAULT_MAX_CONCURRENT_DELIVERIES = 4
+DEFAULT_DRAIN_TIMEOUT = 30.0
+
+
+@dataclass
+class _Delivery:
+    """A webhook payload waiting for delivery, optionally backed by a spill file."""
+
+    payload: Dict[str, Any]
+    spill_path: Optional[Path] = None
+
 
 class CircuitBreaker:
     """Simple circuit breaker implementation for webhook reliability."""
@@ -75,7 +93,17 @@ class CircuitBreaker:
 
 
 class WebhookPublisher(AbstractPublisher):
-    """Publisher that sends HTTP webhooks for model registration notifications."""
+    """Publisher that sends HTTP webhooks for model registration notifications.
+
+    ``publish`` validates the message and enqueues it; delivery, retries and
+    backoff run on a background worker thread with its own event loop and a
+    persistent pooled client. Up to ``max_concurrent_deliveries`` webhooks are
+    in flight at once, so one slow delivery does not hold up the rest. When the
+    in-memory queue is full, messages are written to ``spill_dir`` (if set) and
+    picked up again as the queue drains, including after a restart. Callers that
+    never call ``close`` are drained by an ``atexit`` hook, bounded by
+    ``drain_timeout``, so queued webhooks are not lost when the process exits.
+    """
 
     def __init__(
         self,
@@ -109,6 +137,13 @@ class WebhookPublisher(AbstractPublisher):
         config = config or {}
         self.timeout = config.get("timeout", 30.0)
         self.retry_delays = config.get("retry_delays", [2, 4, 8, 16, 32])
+        self.max_queue_size = config.get("max_queue_size", DEFAULT_MAX_QUEUE_SIZE)
+        self.max_concurrent_deliveries = config.get(
+            "max_concurrent_deliveries", DEFAULT_MAX_CONCURRENT_DELIVERIES
+        )
+        self.drain_timeout = config.get("drain_timeout", DEFAULT_DRAIN_TIMEOUT)
+        spill_dir = config.get("spill_dir")
+        self.spill_dir = Path(spill_dir) if spill_dir else None
 
         # Initialize circuit breaker
         cb_config = config.get("circuit_breaker", {})
@@ -128,10 +163,31 @@ class WebhookPublisher(AbstractPublisher):
             },
         )
 
+        # Background delivery state; the worker thread starts on first use
+        self._state_lock = threading.Lock()
+        self._worker_lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._worker_thread: Optional[threading.Thread] = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._consumers: list = []
+        self._queued = 0
+        self._in_flight = 0
+        self._spilled = 0
+        self._claimed_spill_files: set = set()
+        self._delivered = 0
+        self._failed = 0
+        self._dropped = 0
+
+        if self.spill_dir is not None:
+            self.spill_dir.mkdir(parents=True, exist_ok=True)
+            self._spilled = len(list(self.spill_dir.glob("*.json")))
+            if self._spilled:
+                logger.info(f"Found {self._spilled} spilled webhooks to replay in {spill_dir}")
+
         logger.info(f"WebhookPublisher initialized for {webhook_url}")
 
     def publish(self, message: Dict[str, Any], queue_name: Optional[str] = None) -> bool:
-        """Publish message via webhook.
+        """Queue a message for webhook delivery and return immediately.
 
         Args:
         ----
@@ -140,7 +196,7 @@ class WebhookPublisher(AbstractPublisher):
 
         Returns:
         -------
-            True if successful, False otherwise
+            True if the message was accepted for delivery, False otherwise
 
         """
         if self._closed:
@@ -157,13 +213,184 @@ class WebhookPublisher(AbstractPublisher):
             # Create webhook payload
             webhook_payload = self._create_webhook_payload(model_message)
 
-            # Send webhook with circuit breaker protection
-            return asyncio.run(self._send_with_circuit_breaker(webhook_payload))
+            return self._enqueue(webhook_payload)
 
         except Exception as e:
             logger.error(f"Failed to publish webhook: {str(e)}")
             return False
 
+    def _enqueue(self, payload: Dict[str, Any]) -> bool:
+        """Hand a payload to the delivery worker, spilling to disk when the queue is full."""
+        self._ensure_worker()
+        with self._state_lock:
+            has_room = self._queued < self.max_queue_size and not self._spilled
+            if has_room:
+                self._queued += 1
+
+        if has_room:
+            self._loop.call_soon_threadsafe(self._queue.put_nowait, _Delivery(payload))
+            return True
+
+        if self.spill_dir is not None:
+            self._spill(payload)
+            # Consumers may all be idle by now; make sure the file gets picked up
+            self._loop.call_soon_threadsafe(self._load_spilled)
+            return True
+
+        with self._state_lock:
+            self._dropped += 1
+        logger.error(
+            f"Webhook queue full ({self.max_queue_size} messages), dropping webhook "
+            f"{payload.get('_idempotency_key', '')}"
+        )
+        return False
+
+    def _spill(self, payload: Dict[str, Any]) -> None:
+        """Write a payload to the spill directory atomically."""
+        # Zero-padded nanoseconds keep spill files in publish order when listed
+        name = f"{time.time_ns():020d}-{uuid.uuid4().hex}.json"
+        tmp_path = self.spill_dir / f".{name}.tmp"
+        tmp_path.write_text(json.dumps(payload, separators=(",", ":")))
+        os.replace(tmp_path, self.spill_dir / name)
+        with self._state_lock:
+            self._spilled += 1
+        logger.warning(f"Webhook queue full, spilled message to {self.spill_dir / name}")
+
+    def _load_spilled(self) -> None:
+        """Move spilled payloads back into the in-memory queue while there is room."""
+        if self.spill_dir is None or not self._spilled:
+            return
+
+        for path in sorted(self.spill_dir.glob("*.json")):
+            with self._state_lock:
+                if self._queued >= self.max_queue_size:
+                    return
+                if path in self._claimed_spill_files:
+                    continue
+                self._claimed_spill_files.add(path)
+                self._queued += 1
+                self._spilled -= 1
+            try:
+                payload = json.loads(path.read_text())
+            except (OSError, ValueError) as e:
+                logger.error(f"Discarding unreadable spilled webhook {path}: {e}")
+                path.unlink(missing_ok=True)
+                with self._state_lock:
+                    self._claimed_spill_files.discard(path)
+                    self._queued -= 1
+                continue
+            self._queue.put_nowait(_Delivery(payload, spill_path=path))
+
+    def _ensure_worker(self) -> None:
+        """Start the delivery thread and its event loop if they are not running."""
+        if self._loop is not None:
+            return
+        with self._worker_lock:
+            if self._loop is not None:
+                return
+            loop = asyncio.new_event_loop()
+            started = threading.Event()
+
+            def run() -> None:
+                asyncio.set_event_loop(loop)
+                self._queue = asyncio.Queue()
+                self._consumers = [
+                    loop.create_task(self._consume()) for _ in range(self.max_concurrent_deliveries)
+                ]
+                # Replay webhooks spilled by a previous process
+                loop.call_soon(self._load_spilled)
+                started.set()
+                loop.run_forever()
+
+            self._worker_thread = threading.Thread(
+                target=run, name="webhook-publisher", daemon=True
+            )
+            self._worker_thread.start()
+            started.wait()
+            self._loop = loop
+            # The worker is a daemon thread, so scripts and other non-API callers
+            # rely on this hook to deliver what they queued before exiting
+            atexit.register(self.close)
+
+    async def _consume(self) -> None:
+        """Deliver queued webhooks one at a time; several consumers run concurrently."""
+        while True:
+            delivery = await self._queue.get()
+            with self._state_lock:
+                self._queued -= 1
+                self._in_flight += 1
+            try:
+                success = await self._send_with_circuit_breaker(delivery.payload)
+            except asyncio.CancelledError:
+                # Shut down mid-delivery: keep the webhook for the next process
+                with self._state_lock:
+                    self._in_flight -= 1
+                    self._claimed_spill_files.discard(delivery.spill_path)
+                if self.spill_dir is not None and delivery.spill_path is None:
+                    self._spill(delivery.payload)
+                raise
+            except Exception as e:
+                logger.error(f"Unexpected webhook delivery error: {str(e)}")
+                success = False
+
+            if delivery.spill_path is not None:
+                delivery.spill_path.unlink(missing_ok=True)
+            with self._state_lock:
+                self._in_flight -= 1
+                self._claimed_spill_files.discard(delivery.spill_path)
+                if success:
+                    self._delivered += 1
+                else:
+                    self._failed += 1
+            # Refill from disk before marking done so drain() sees spilled work
+            self._load_spilled()
+            self._queue.task_done()
+
+    async def _wait_idle(self) -> None:
+        while True:
+            await self._queue.join()
+            self._load_spilled()
+            if self._queue.empty():
+                return
+
+    def drain(self, timeout: Optional[float] = None) -> bool:
+        """Block until every queued and spilled webhook has been attempted.
+
+        Args:
+        ----
+            timeout: Maximum seconds to wait (defaults to ``drain_timeout``)
+
+        Returns:
+        -------
+            True if the queue drained, False on timeout
+
+        """
+        if self._loop is None:
+            return True
+
+        future = asyncio.run_coroutine_threadsafe(self._wait_idle(), self._loop)
+        try:
+            future.result(timeout=self.drain_timeout if timeout is None else timeout)
+            return True
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            logger.warning(f"Timed out draining webhooks: {self.get_delivery_stats()}")
+            return False
+
+    def get_delivery_stats(self) -> Dict[str, Any]:
+        """Return queue depth and delivery counters for metrics."""
+        with self._state_lock:
+            return {
+                "queued": self._queued,
+                "in_flight": self._in_flight,
+                "spilled": self._spilled,
+                "delivered": self._delivered,
+                "failed": self._failed,
+                "dropped": self._dropped,
+                "max_queue_size": self.max_queue_size,
+                "max_concurrent_deliveries": self.max_concurrent_deliveries,
+            }
+
     def publish_model_ready(
         self,
         model_id: str,
@@ -513,8 +740,13 @@ class WebhookPublisher(AbstractPublisher):
                         "circuit_breaker_state": self.circuit_breaker.state,
                     }
 
-            # Run async health check
-            return asyncio.run(_health_check())
+            # Run on the worker loop, which owns the pooled client's connections
+            self._ensure_worker()
+            result = asyncio.run_coroutine_threadsafe(_health_check(), self._loop).result(
+                timeout=self.timeout
+            )
+            result["queue"] = self.get_delivery_stats()
+            return result
 
         except Exception as e:
             return {
@@ -525,30 +757,62 @@ class WebhookPublisher(AbstractPublisher):
             }
 
     def get_queue_depth(self, queue_name: str) -> Optional[int]:
-        """Get number of messages in queue.
-
-        Note: Not supported for webhook publishing as there's no queue.
+        """Get number of webhooks waiting for delivery, including spilled ones.
 
         Args:
         ----
-            queue_name: Queue name (ignored)
+            queue_name: Queue name (ignored, webhooks use a single queue)
 
         Returns:
         -------
-            None (not supported for webhooks)
+            Number of undelivered webhooks
 
         """
-        return None
+        with self._state_lock:
+            return self._queued + self._spilled
 
     def close(self) -> None:
-        """Close HTTP client and clean up resources."""
+        """Drain pending webhooks, then stop the worker and close the HTTP client."""
         if self._closed:
             return
+        self._closed = True
+        atexit.unregister(self.close)
 
         try:
-            asyncio.run(self._client.aclose())
-            self._closed = True
+            if self._loop is None:
+                asyncio.run(self._client.aclose())
+            else:
+                self.drain()
+                asyncio.run_coroutine_threadsafe(self._shutdown_worker(), self._loop).result(
+                    timeout=self.timeout
+                )
+                self._loop.call_soon_threadsafe(self._loop.stop)
+                self._worker_thread.join(timeout=self.timeout)
+                if not self._worker_thread.is_alive():
+                    self._loop.close()
             logger.info("WebhookPublisher closed successfully")
         except Exception as e:
             logger.error(f"Error closing WebhookPublisher: {str(e)}")
-            self._closed = True
+
+    async def _shutdown_worker(self) -> None:
+        for consumer in self._consumers:
+            consumer.cancel()
+        await asyncio.gather(*self._consumers, return_exceptions=True)
+
+        # Keep undelivered webhooks for the next process when spilling is enabled
+        undelivered = 0
+        while not self._queue.empty():
+            delivery = self._queue.get_nowait()
+            undelivered += 1
+            with self._state_lock:
+                self._queued -= 1
+                self._claimed_spill_files.discard(delivery.spill_path)
+            if self.spill_dir is not None and delivery.spill_path is None:
+                self._spill(delivery.payload)
+        if undelivered:
+            action = "spilled" if self.spill_dir is not None else "dropped"
+            logger.warning(
+                f"WebhookPublisher closed with {undelivered} undelivered webhooks {action}"
+            )
+
+        await self._client.aclose()
@@ -1,24 +1,30 @@
 """API key authentication middleware using external auth service."""
 
 import asyncio
+import inspect
 import json
 import logging
 import os
 import re
+import threading
 import time
-from dataclasses import dataclass
-from typing import Any, Optional
+import weakref
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from typing import Any, Optional, Union
 
 import boto3
 import botocore.exceptions
 import httpx
 import redis
+import redis.asyncio as redis_asyncio
 from fastapi import Request
 from fastapi.responses import JSONResponse
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.types import ASGIApp
 
 from src.api.utils.config import get_settings
+from src.middleware.usage_debit import UsageDebitAggregator
 
 try:
     import sentry_sdk
@@ -35,6 +41,14 @@ _UPSTREAM_SCHEMA_ERROR_MARKERS = (
 _LOG_RESPONSE_BODY_LIMIT = 2048
 _DEBIT_REJECTED_HTTP_STATUS = 402
 _CONTRIBUTION_INGESTION_PATH_RE = re.compile(r"^/api/v1/models/[^/]+/contributions/?$")
+_REDIS_VALIDATION_CACHE_TTL_SECONDS = 60
+_LOCAL_VALIDATION_CACHE_SIZE = 10_000
+_LOCAL_VALIDATION_CACHE_TTL_SECONDS = 10.0
+_NEGATIVE_VALIDATION_CACHE_TTL_SECONDS = 5.0
+_AUTH_HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20)
+
+# Live middleware instances, so application shutdown can release their pooled clients.
+_ACTIVE_MIDDLEWARES: "weakref.WeakSet[APIKeyAuthMiddleware]" = weakref.WeakSet()
 
 
 @dataclass
@@ -61,6 +75,45 @@ class ValidationResult:
     error_type: Optional[str] = None
 
 
+class _ValidationCache:
+    """Bounded in-process TTL/LRU cache of validation results.
+
+    Sits in front of Redis so repeat requests with the same key skip the network
+    entirely. Entries expire after ``ttl`` seconds and the least recently used
+    entry is evicted once ``maxsize`` is reached.
+    """
+
+    def __init__(self, maxsize: int, ttl: float) -> None:  # noqa: ANN101
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict[Any, tuple[float, ValidationResult]] = OrderedDict()
+
+    def get(self, key: Any) -> Optional[ValidationResult]:  # noqa: ANN101, ANN401
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, result = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return result
+
+    def put(self, key: Any, result: ValidationResult) -> None:  # noqa: ANN101, ANN401
+        if self.maxsize <= 0 or self.ttl <= 0:
+            return
+        self._entries[key] = (time.monotonic() + self.ttl, result)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:  # noqa: ANN101
+        self._entries.clear()
+
+    def __len__(self) -> int:  # noqa: ANN101
+        return len(self._entries)
+
+
 def _normalize_email(email: str) -> str:
     return email.strip().strip("\"'").lower()
 
@@ -98,9 +151,13 @@ class APIKeyAuthMiddleware(BaseHTTPMiddleware):
         self,  # noqa: ANN101
         app: ASGIApp,
         auth_service_url: Optional[str] = None,
-        cache: Optional[redis.Redis] = None,
+        cache: Optional[Union[redis_asyncio.Redis, redis.Redis]] = None,
         excluded_paths: Optional[list[str]] = None,
         timeout: float = 5.0,
+        local_cache_size: int = _LOCAL_VALIDATION_CACHE_SIZE,
+        local_cache_ttl: float = _LOCAL_VALIDATION_CACHE_TTL_SECONDS,
+        negative_cache_ttl: float = _NEGATIVE_VALIDATION_CACHE_TTL_SECONDS,
+        debit_batching: Optional[bool] = None,
     ) -> None:
         """Initialize authentication middleware.
 
@@ -108,9 +165,15 @@ class APIKeyAuthMiddleware(BaseHTTPMiddleware):
         ----
             app: The ASGI application
             auth_service_url: URL of the external auth service
-            cache: Optional Redis cache instance
+            cache: Optional Redis cache instance. An asyncio client is awaited;
+                a synchronous client is still accepted for compatibility.
             excluded_paths: List of paths that don't require authentication
             timeout: Timeout for auth service requests in seconds
+            local_cache_size: Maximum entries in the in-process validation cache
+            local_cache_ttl: Seconds a valid key is served from process memory
+            negative_cache_ttl: Seconds an invalid key is rejected from process memory
+            debit_batching: Queue usage debits on a background aggregator instead of
+                posting one debit per request. Defaults to ENABLE_USAGE_DEBIT_BATCHING.
 
         """
         super().__init__(app)
@@ -154,15 +217,20 @@ class APIKeyAuthMiddleware(BaseHTTPMiddleware):
 
                 # Only try to connect if not localhost (avoid hanging on local dev)
                 if "localhost" not in redis_url and "127.0.0.1" not in redis_url:
-                    self.cache = redis.from_url(
-                        redis_url,
-                        decode_responses=True,
-                        socket_connect_timeout=2,  # 2 second connection timeout
-                        socket_timeout=2,  # 2 second operation timeout
-                        ssl_cert_reqs=None,  # Allow self-signed certs for ElastiCache
-                    )
-                    # Test connection with timeout
-                    self.cache.ping()
+                    redis_options = {
+                        "decode_responses": True,
+                        "socket_connect_timeout": 2,  # 2 second connection timeout
+                        "socket_timeout": 2,  # 2 second operation timeout
+                        "ssl_cert_reqs": None,  # Allow self-signed certs for ElastiCache
+                    }
+                    # Test connection once at startup; requests use the asyncio client
+                    # so cache lookups never block the event loop.
+                    probe = redis.from_url(redis_url, **redis_options)
+                    try:
+                        probe.ping()
+                    finally:
+                        probe.close()
+                    self.cache = redis_asyncio.from_url(redis_url, **redis_options)
                     logger.info("Redis cache connected for auth middleware")
                 else:
                     logger.info("Skipping Redis connection for localhost")
@@ -190,6 +258,153 @@ class APIKeyAuthMiddleware(BaseHTTPMiddleware):
         ]
         self._cloudwatch_disabled = False
 
+        # In-process tier in front of Redis. Valid results are keyed by API key like the
+        # Redis entries; rejections also key on client IP because IP restrictions can
+        # make the same key valid from one address and invalid from another.
+        self._local_cache = _ValidationCache(local_cache_size, local_cache_ttl)
+        self._negative_cache = _ValidationCache(local_cache_size, negative_cache_ttl)
+        self._inflight_validations: dict[tuple[str, Optional[str]], asyncio.Future] = {}
+        self._http_clients: dict[asyncio.AbstractEventLoop, httpx.AsyncClient] = {}
+        self._http_client_lock = threading.Lock()
+
+        if debit_batching is None:
+            debit_batching = os.getenv("ENABLE_USAGE_DEBIT_BATCHING", "false").lower() == "true"
+        self._debit_aggregator: Optional[UsageDebitAggregator] = None
+        if debit_batching:
+            self._debit_aggregator = UsageDebitAggregator(
+                send=self._send_batched_debit,
+                service_id=self.settings.auth_service_id,
+            )
+        _ACTIVE_MIDDLEWARES.add(self)
+
+    def _get_http_client(self) -> httpx.AsyncClient:  # noqa: ANN101
+        """Return the pooled auth-service client for the running event loop.
+
+        Reusing one client keeps TLS connections to the auth service alive across
+        requests. Connections are bound to the loop that opened them, so each loop
+        gets its own client. Clients of loops that have since closed are dropped.
+        """
+        loop = asyncio.get_running_loop()
+        with self._http_client_lock:
+            client = self._http_clients.get(loop)
+            if client is None:
+                for stale in [other for other in self._http_clients if other.is_closed()]:
+                    del self._http_clients[stale]
+                client = httpx.AsyncClient(timeout=self.timeout, limits=_AUTH_HTTP_LIMITS)
+                self._http_clients[loop] = client
+        return client
+
+    async def aclose(self) -> None:  # noqa: ANN101
+        """Flush queued debits, then release the pooled clients.
+
+        Each auth-service client is closed on its own loop; clients of loops that
+        are no longer running are dropped.
+        """
+        if self._debit_aggregator is not None:
+            try:
+                await self._debit_aggregator.close()
+            except Exception as e:
+                logger.warning(f"Error flushing queued usage debits: {e}")
+        with self._http_client_lock:
+            clients, self._http_clients = self._http_clients, {}
+        current = asyncio.get_running_loop()
+        for loop, client in clients.items():
+            try:
+                if loop is current:
+                    await client.aclose()
+                elif loop.is_running():
+                    await asyncio.wrap_future(
+                        asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+                    )
+            except Exception as e:
+                logger.warning(f"Error closing auth service client: {e}")
+        if isinstance(self.cache, redis_asyncio.Redis):
+            try:
+                await self.cache.aclose()
+            except Exception as e:
+                logger.warning(f"Error closing Redis cache: {e}")
+
+    async def _cache_call(self, method: str, *args: Any) -> Any:  # noqa: ANN101, ANN401
+        """Invoke a Redis cache method, awaiting it when the client is asyncio-based."""
+        result = getattr(self.cache, method)(*args)
+        if inspect.isawaitable(result):
+            result = await result
+        return result
+
+    async def _resolve_validation(
+        self,  # noqa: ANN101
+        api_key: str,
+        client_ip: Optional[str],
+    ) -> ValidationResult:
+        """Resolve a key through the in-process cache, Redis, then the auth service.
+
+        Concurrent misses for the same key and client IP share a single upstream
+        validation instead of each calling the auth service.
+        """
+        validation_result = self._local_cache.get(api_key) or self._negative_cache.get(
+            (api_key, client_ip)
+        )
+        if validation_result is not None:
+            return validation_result
+
+        flight_key = (api_key, client_ip)
+        loop = asyncio.get_running_loop()
+        flight = self._inflight_validations.get(flight_key)
+        if flight is None or flight.get_loop() is not loop:
+            flight = loop.create_task(self._load_validation(api_key, client_ip))
+            self._inflight_validations[flight_key] = flight
+            flight.add_done_callback(
+                lambda done: self._inflight_validations.pop(flight_key, None)
+                if self._inflight_validations.get(flight_key) is done
+                else None
+            )
+        # Shield so a disconnecting caller doesn't cancel the lookup for the others.
+        return await asyncio.shield(flight)
+
+    async def _load_validation(
+        self,  # noqa: ANN101
+        api_key: str,
+        client_ip: Optional[str],
+    ) -> ValidationResult:
+        """Load a validation result from Redis or the auth service and cache it."""
+        cache_key = f"api_key:validation:{api_key}"
+
+        if self.cache:
+            try:
+                cached_data = await self._cache_call("get", cache_key)
+                if cached_data:
+                    validation_result = ValidationResult(**json.loads(cached_data))
+                    logger.debug(f"Using cached validation for key {api_key[:8]}...")
+                    self._local_cache.put(api_key, validation_result)
+                    return validation_result
+            except Exception as e:
+                logger.warning(f"Cache read error: {e}")
+
+        validation_result = await self.validate_with_auth_service(api_key, client_ip)
+
+        if validation_result.is_valid:
+            self._local_cache.put(api_key, validation_result)
+            # Cache successful validation in Redis for 60 seconds
+            if self.cache:
+                try:
+                    cache_data = asdict(validation_result)
+                    cache_data.pop("error")
+                    cache_data.pop("error_type")
+                    await self._cache_call(
+                        "setex",
+                        cache_key,
+                        _REDIS_VALIDATION_CACHE_TTL_SECONDS,
+                        json.dumps(cache_data),
+                    )
+                except Exception as e:
+                    logger.warning(f"Cache write error: {e}")
+        elif validation_result.error_type is None:
+            # Only genuine credential rejections are remembered; transient upstream
+            # failures and rate limiting must be retried on the next request.
+            self._negative_cache.put((api_key, client_ip), validation_result)
+
+        return validation_result
+
     def _truncate_response_body(self, body: Optional[str]) -> str:  # noqa: ANN101
         """Keep logged upstream bodies bounded."""
         return (body or "")[:_LOG_RESPONSE_BODY_LIMIT]
@@ -246,74 +461,72 @@ class APIKeyAuthMiddleware(BaseHTTPMiddleware):
 
         """
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                # FIXED: Send API key in Authorization header, not JSON body
-                headers = {"Authorization": f"Bearer {api_key}", "Content-Type": "application/json"}
-
-                # Only send service_id and client_ip in body
-                body = {
-                    "service_id": self.settings.auth_service_id  # Configurable service ID
-                }
-                if client_ip:
-                    body["client_ip"] = client_ip
-
-                response = await client.post(
-                    f"{self.auth_service_url}/api/v1/keys/validate", headers=headers, json=body
-                )
+            client = self._get_http_client()
+            # FIXED: Send API key in Authorization header, not JSON body
+            headers = {"Authorization": f"Bearer {api_key}", "Content-Type": "application/json"}
+
+            # Only send service_id and client_ip in body
+            body = {
+                "service_id": self.settings.auth_service_id  # Configurable service ID
+            }
+            if client_ip:
+                body["client_ip"] = client_ip
+
+            response = await client.post(
+                f"{self.auth_service_url}/api/v1/keys/validate", headers=headers, json=body
+            )
 
-                if response.status_code == 200:
-                    data = response.json()
-                    if not isinstance(data, dict):
-                        logger.warning(
-                            json.dumps(
-                                {
-                                    "event": "auth_service_non_dict_response",
-                                    "endpoint": "/api/v1/keys/validate",
-                                    "observed_type": type(data).__name__,
-                                }
-                            )
-                        )
-                        return ValidationResult(
-                            is_valid=False, error="Authentication service error"
+            if response.status_code == 200:
+                data = response.json()
+                if not isinstance(data, dict):
+                    logger.warning(
+                        json.dumps(
+                            {
+                                "event": "auth_service_non_dict_response",
+                                "endpoint": "/api/v1/keys/validate",
+                                "observed_type": type(data).__name__,
+                            }
                         )
-                    user_data = data.get("user") if isinstance(data.get("user"), dict) else {}
-                    return ValidationResult(
-                        is_valid=True,
-                        user_id=data.get("user_id") or user_data.get("id"),
-                        email=data.get("email") or user_data.get("email"),
-                        key_id=data.get("key_id"),
-                        service_id=data.get("service_id"),
-                        scopes=data.get("scopes", []),
-                        roles=data.get("roles") or user_data.get("roles") or [],
-                        is_admin=bool(data.get("is_admin") or user_data.get("is_admin")),
-                        rate_limit_per_hour=data.get("rate_limit_per_hour", 1000),
-                        has_sufficient_balance=data.get("has_sufficient_balance", True),
-                        balance=data.get("balance", 0.0),
-                    )
-                elif response.status_code == 401:
-                    return ValidationResult(is_valid=False, error="Invalid or expired API key")
-                elif response.status_code == 429:
-                    return ValidationResult(
-                        is_valid=False,
-                        error="Rate limit exceeded",
-                        error_type="rate_limited",
-                    )
-                else:
-                    if response.status_code >= 500:
-                        error_marker = self._get_upstream_schema_error_marker(response.text)
-                        if error_marker:
-                            self._log_auth_service_schema_error(
-                                status_code=response.status_code,
-                                endpoint="/api/v1/keys/validate",
-                                response_body=response.text,
-                                error_marker=error_marker,
-                            )
-                    logger.error(f"Auth service returned {response.status_code}")
-                    return ValidationResult(
-                        is_valid=False,
-                        error="Authentication service error",
-                        error_type="unavailable",
                     )
+                    return ValidationResult(is_valid=False, error="Authentication service error")
+                user_data = data.get("user") if isinstance(data.get("user"), dict) else {}
+                return ValidationResult(
+                    is_valid=True,
+                    user_id=data.get("user_id") or user_data.get("id"),
+                    email=data.get("email") or user_data.get("email"),
+                    key_id=data.get("key_id"),
+                    service_id=data.get("service_id"),
+                    scopes=data.get("scopes", []),
+                    roles=data.get("roles") or user_data.get("roles") or [],
+                    is_admin=bool(data.get("is_admin") or user_data.get("is_admin")),
+                    rate_limit_per_hour=data.get("rate_limit_per_hour", 1000),
+                    has_sufficient_balance=data.get("has_sufficient_balance", True),
+                    balance=data.get("balance", 0.0),
+                )
+            elif response.status_code == 401:
+                return ValidationResult(is_valid=False, error="Invalid or expired API key")
+            elif response.status_code == 429:
+                return ValidationResult(
+                    is_valid=False,
+                    error="Rate limit exceeded",
+                    error_type="rate_limited",
+                )
+            else:
+                if response.status_code >= 500:
+                    error_marker = self._get_upstream_schema_error_marker(response.text)
+                    if error_marker:
+                        self._log_auth_service_schema_error(
+                            status_code=response.status_code,
+                            endpoint="/api/v1/keys/validate",
+                            response_body=response.text,
+                            error_marker=error_marker,
+                        )
+                logger.error(f"Auth service returned {response.status_code}")
+                return ValidationResult(
+                    is_valid=False,
+                    error="Authentication service error",
+                    error_type="unavailable",
+                )
 
         except httpx.TimeoutException:
             logger.error("Auth service request timed out")
@@ -621,47 +834,7 @@ class APIKeyAuthMiddleware(BaseHTTPMiddleware):
         if not api_key:
             return JSONResponse(status_code=401, content={"detail": "API key required"})
 
-        # Check cache first (client_ip already extracted above)
-        validation_result = None
-        cache_key = f"api_key:validation:{api_key}"
-
-        if self.cache:
-            try:
-                cached_data = self.cache.get(cache_key)
-                if cached_data:
-                    cached_result = json.loads(cached_data)
-                    validation_result = ValidationResult(**cached_result)
-                    logger.debug(f"Using cached validation for key {api_key[:8]}...")
-            except Exception as e:
-                logger.warning(f"Cache read error: {e}")
-
-        # Validate with auth service if not cached
-        if validation_result is None:
-            validation_result = await self.validate_with_auth_service(api_key, client_ip)
-
-            # Cache successful validation for 60 seconds
-            if self.cache and validation_result.is_valid:
-                try:
-                    cache_data = {
-                        "is_valid": validation_result.is_valid,
-                        "user_id": validation_result.user_id,
-                        "email": validation_result.email,
-                        "key_id": validation_result.key_id,
-                        "service_id": validation_result.service_id,
-                        "scopes": validation_result.scopes,
-                        "roles": validation_result.roles,
-                        "is_admin": validation_result.is_admin,
-                        "rate_limit_per_hour": validation_result.rate_limit_per_hour,
-                        "has_sufficient_balance": validation_result.has_sufficient_balance,
-                        "balance": validation_result.balance,
-                    }
-                    self.cache.setex(
-                        cache_key,
-                        60,  # 60 second TTL
-                        json.dumps(cache_data),
-                    )
-                except Exception as e:
-                    logger.warning(f"Cache write error: {e}")
+        validation_result = await self._resolve_validation(api_key, client_ip)
 
         # Check validation result
         if not validation_result.is_valid:
@@ -788,8 +961,60 @@ class APIKeyAuthMiddleware(BaseHTTPMiddleware):
         # Process request
         response = await call_next(request)
 
+        # A validated, successful batch predict sets ``predictions_count``; the
+        # admission debit above covered one record, so bill the rest now.
+        predictions_count = getattr(request.state, "predictions_count", 1)
+        if (
+            isinstance(predictions_count, int)
+            and predictions_count > 1
+            and response.status_code < 400
+            and validation_result.key_id
+            and not is_registry_request
+        ):
+            await self._debit_batch_records(request, validation_result, predictions_count - 1)
+
         return response
 
+    async def _debit_batch_records(
+        self,  # noqa: ANN101
+        request: Request,
+        validation_result: ValidationResult,
+        records: int,
+    ) -> None:
+        """Debit the records of a served batch beyond the one billed at admission.
+
+        The batch has already been served, so failures and rejections are logged
+        rather than surfaced; a rejection still blocks the key's next request.
+        """
+        try:
+            outcome = await self._debit_usage(
+                validation_result.key_id,
+                self._extract_model_id(request.url.path),
+                request.url.path,
+                0,
+                0,
+                request_id=request.headers.get("x-request-id"),
+                account_id=validation_result.user_id,
+                predictions_count=records,
+                idempotency_suffix="batch-records",
+            )
+        except Exception:
+            logger.exception(
+                "batch usage debit raised unexpectedly",
+                extra={"key_id": validation_result.key_id, "path": request.url.path},
+            )
+            return
+        if outcome in ("rejected", "error"):
+            logger.warning(
+                "batch usage debit not accepted",
+                extra={
+                    "key_id": validation_result.key_id,
+                    "path": request.url.path,
+                    "records": records,
+                    "outcome": outcome,
+                },
+            )
+
     def _extract_model_id(self, path: str) -> Optional[str]:  # noqa: ANN101
         """Extract model ID from the request URL path.
 
@@ -852,7 +1077,7 @@ class APIKeyAuthMiddleware(BaseHTTPMiddleware):
         except Exception as exc:
             logger.warning(f"UsageDebitRejected metric: unexpected error: {exc}")
 
-    async def _debit_usage(  # noqa: C901
+    async def _debit_usage(
         self,  # noqa: ANN101
         key_id: str,
         model_id: Optional[str],
@@ -863,9 +1088,15 @@ class APIKeyAuthMiddleware(BaseHTTPMiddleware):
         request_id: Optional[str] = None,
         account_id: Optional[str] = None,
         request_state: Any = None,
+        predictions_count: int = 1,
+        idempotency_suffix: Optional[str] = None,
     ) -> str:
         """Debit usage to auth service with retry logic.
 
+        With debit batching enabled the debit is queued on the aggregator and
+        ``"queued"`` is returned, unless the key's credit snapshot already shows a
+        rejection, in which case ``"rejected"`` is returned without a network call.
+
         Args:
         ----
             key_id: The API key ID
@@ -877,9 +1108,25 @@ class APIKeyAuthMiddleware(BaseHTTPMiddleware):
             request_id: Request identifier for logging
             account_id: Account/user identifier for logging
             request_state: Request state object to store rejection details for the response
+            predictions_count: Number of predictions billed, e.g. the records in a batch
+            idempotency_suffix: Distinguishes a second debit for the same request
 
         """
         idempotency_key = f"{key_id}-{int(time.time() * 1000)}"
+        if idempotency_suffix:
+            idempotency_key = f"{idempotency_key}-{idempotency_suffix}"
+        if self._debit_aggregator is not None:
+            return await self._debit_aggregator.submit(
+                key_id,
+                model_id,
+                endpoint,
+                response_time_ms,
+                status_code,
+                idempotency_key,
+                request_state=request_state,
+                predictions_count=predictions_count,
+            )
+
         payload = {
             "model_id": model_id,
             "endpoint": endpoint,
@@ -888,115 +1135,152 @@ class APIKeyAuthMiddleware(BaseHTTPMiddleware):
             "service_id": self.settings.auth_service_id,
             "idempotency_key": idempotency_key,
             "compute_ms": response_time_ms,
-            "predictions_count": 1,
+            "predictions_count": predictions_count,
         }
+        return await self._post_debit(
+            key_id,
+            model_id,
+            endpoint,
+            payload,
+            max_retries=max_retries,
+            request_id=request_id,
+            account_id=account_id,
+            request_state=request_state,
+        )
+
+    async def _send_batched_debit(
+        self,  # noqa: ANN101
+        key_id: str,
+        model_id: Optional[str],
+        endpoint: str,
+        payload: dict[str, Any],
+        request_state: Any,  # noqa: ANN401
+    ) -> str:
+        """Send one aggregated debit batch for the usage-debit aggregator."""
+        return await self._post_debit(
+            key_id, model_id, endpoint, payload, request_state=request_state
+        )
+
+    async def _post_debit(  # noqa: C901
+        self,  # noqa: ANN101
+        key_id: str,
+        model_id: Optional[str],
+        endpoint: str,
+        payload: dict[str, Any],
+        max_retries: int = 1,
+        request_id: Optional[str] = None,
+        account_id: Optional[str] = None,
+        request_state: Any = None,
+    ) -> str:
+        """POST a debit payload to the auth service and classify the outcome."""
+        idempotency_key = payload["idempotency_key"]
 
         for attempt in range(max_retries):
             try:
-                async with httpx.AsyncClient(timeout=self.timeout) as client:
-                    response = await client.post(
-                        f"{self.auth_service_url}/api/v1/usage/{key_id}/debit",
-                        json=payload,
+                client = self._get_http_client()
+                response = await client.post(
+                    f"{self.auth_service_url}/api/v1/usage/{key_id}/debit",
+                    json=payload,
+                )
+                if response.status_code < 300:
+                    return "accepted"
+
+                if response.status_code == _DEBIT_REJECTED_HTTP_STATUS:
+                    try:
+                        response_data = response.json()
+                    except Exception:
+                        response_data = {}
+
+                    detail = (
+                        response_data.get("detail", {})
+                        if isinstance(response_data, dict)
+                        else response_data
                     )
-                    if response.status_code < 300:
-                        return "accepted"
-
-                    if response.status_code == _DEBIT_REJECTED_HTTP_STATUS:
-                        try:
-                            response_data = response.json()
-                        except Exception:
-                            response_data = {}
-
-                        detail = (
-                            response_data.get("detail", {})
-                            if isinstance(response_data, dict)
-                            else response_data
-                        )
-                        if isinstance(detail, dict):
-                            reason = detail.get("message") or detail.get("reason")
-                            reason_code = detail.get("error")
-                        elif detail:
-                            reason = None
-                            reason_code = str(detail)
-                        else:
-                            reason = None
-                            reason_code = None
+                    if isinstance(detail, dict):
+                        reason = detail.get("message") or detail.get("reason")
+                        reason_code = detail.get("error")
+                    elif detail:
+                        reason = None
+                        reason_code = str(detail)
+                    else:
+                        reason = None
+                        reason_code = None
 
-                        if request_state is not None:
-                            request_state._debit_reject_reason = reason
-                            request_state._debit_reject_reason_code = reason_code
+                    if request_state is not None:
+                        request_state._debit_reject_reason = reason
+                        request_state._debit_reject_reason_code = reason_code
 
-                        logger.warning(
-                            "usage debit rejected",
-                            extra={
-                                "event": "usage.debit.rejected",
+                    logger.warning(
+                        "usage debit rejected",
+                        extra={
+                            "event": "usage.debit.rejected",
+                            "account_id": account_id,
+                            "model_id": model_id,
+                            "reason_code": reason_code,
+                            "request_id": request_id,
+                        },
+                    )
+                    if sentry_sdk:
+                        sentry_sdk.set_context(
+                            "usage_debit",
+                            {
                                 "account_id": account_id,
                                 "model_id": model_id,
+                                "reason": reason,
                                 "reason_code": reason_code,
                                 "request_id": request_id,
                             },
                         )
-                        if sentry_sdk:
-                            sentry_sdk.set_context(
-                                "usage_debit",
-                                {
-                                    "account_id": account_id,
-                                    "model_id": model_id,
-                                    "reason": reason,
-                                    "reason_code": reason_code,
-                                    "request_id": request_id,
-                                },
-                            )
-                            sentry_sdk.capture_message("usage.debit.rejected", level="warning")
-                        self._emit_usage_debit_rejected_metric(
-                            model_id, rejection_reason="InsufficientBalance"
-                        )
-                        return "rejected"
-
-                    response_body = self._truncate_response_body(response.text)
-
-                    failure_fields = {
-                        "event": "usage_debit_failure",
-                        "status_code": response.status_code,
-                        "response_body": response_body,
-                        "key_id": key_id,
-                        "model_id": model_id,
-                        "endpoint": endpoint,
-                        "idempotency_key": idempotency_key,
-                    }
+                        sentry_sdk.capture_message("usage.debit.rejected", level="warning")
+                    self._emit_usage_debit_rejected_metric(
+                        model_id, rejection_reason="InsufficientBalance"
+                    )
+                    return "rejected"
 
-                    if response.status_code < 500:
-                        logger.warning(json.dumps(failure_fields))
-                        return "error"  # Client error — don't retry
+                response_body = self._truncate_response_body(response.text)
 
-                    error_marker = self._get_upstream_schema_error_marker(response.text)
-                    if error_marker:
-                        self._log_auth_service_schema_error(
-                            status_code=response.status_code,
-                            endpoint=endpoint,
-                            response_body=response.text,
-                            error_marker=error_marker,
-                            key_id=key_id,
-                            idempotency_key=idempotency_key,
-                        )
-                        self._emit_usage_debit_rejected_metric(
-                            model_id, rejection_reason="UpstreamSchemaError"
-                        )
-                        return "error"
+                failure_fields = {
+                    "event": "usage_debit_failure",
+                    "status_code": response.status_code,
+                    "response_body": response_body,
+                    "key_id": key_id,
+                    "model_id": model_id,
+                    "endpoint": endpoint,
+                    "idempotency_key": idempotency_key,
+                }
 
+                if response.status_code < 500:
                     logger.warning(json.dumps(failure_fields))
+                    return "error"  # Client error — don't retry
+
+                error_marker = self._get_upstream_schema_error_marker(response.text)
+                if error_marker:
+                    self._log_auth_service_schema_error(
+                        status_code=response.status_code,
+                        endpoint=endpoint,
+                        response_body=response.text,
+                        error_marker=error_marker,
+                        key_id=key_id,
+                        idempotency_key=idempotency_key,
+                    )
+                    self._emit_usage_debit_rejected_metric(
+                        model_id, rejection_reason="UpstreamSchemaError"
+                    )
+                    return "error"
+
+                logger.warning(json.dumps(failure_fields))
 
-                    if attempt == max_retries - 1:
-                        logger.error(
-                            json.dumps(
-                                {
-                                    **failure_fields,
-                                    "event": "usage_debit_retry_exhausted",
-                                    "attempts": max_retries,
-                                }
-                            )
+                if attempt == max_retries - 1:
+                    logger.error(
+                        json.dumps(
+                            {
+                                **failure_fields,
+                                "event": "usage_debit_retry_exhausted",
+                                "attempts": max_retries,
+                            }
                         )
-                        return "error"
+                    )
+                    return "error"
             except Exception as e:
                 if attempt == max_retries - 1:
                     logger.warning(
@@ -1011,6 +1295,12 @@ class APIKeyAuthMiddleware(BaseHTTPMiddleware):
         return "error"
 
 
+async def close_auth_middleware_clients() -> None:
+    """Close pooled clients held by every live APIKeyAuthMiddleware instance."""
+    for middleware in list(_ACTIVE_MIDDLEWARES):
+        await middleware.aclose()
+
+
 # Compatibility functions for routes that expect these functions
 from fastapi import HTTPException, status  # noqa: E402, F811
 from fastapi.security import HTTPBearer  # noqa: E402
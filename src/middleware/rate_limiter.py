@@ -1,6 +1,11 @@
 """Rate limiting middleware."""
 
+import logging
+import math
+import threading
 import time
+import uuid
+from collections import OrderedDict
 from dataclasses import dataclass
 from typing import Optional
 
@@ -10,6 +15,35 @@ from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.types import ASGIApp
 import redis
 
+logger = logging.getLogger(__name__)
+
+# Prune, count, record and expire in a single server-side step so concurrent
+# requests cannot race past the limit. Rejected attempts are not recorded, so a
+# client that keeps retrying does not extend its own lockout. Returns
+# {allowed, requests including this one, unix time the oldest entry expires}.
+SLIDING_WINDOW_LUA = """
+local key = KEYS[1]
+local now = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local limit = tonumber(ARGV[3])
+
+redis.call('ZREMRANGEBYSCORE', key, '-inf', now - window)
+local count = redis.call('ZCARD', key)
+local allowed = 0
+if count < limit then
+    redis.call('ZADD', key, now, ARGV[4])
+    allowed = 1
+end
+redis.call('EXPIRE', key, math.ceil(window) + 60)
+
+local reset = now + window
+local oldest = redis.call('ZRANGE', key, 0, 0, 'WITHSCORES')
+if oldest[2] then
+    reset = tonumber(oldest[2]) + window
+end
+return {allowed, count + 1, math.ceil(reset)}
+"""
+
 
 class RateLimitExceeded(Exception):
     """Rate limit exceeded exception."""
@@ -50,11 +84,77 @@ def format_rate_limit_headers(result: RateLimitResult) -> dict:
     return headers
 
 
+class LocalRateLimiter:
+    """In-process rate limiter used when Redis is unavailable.
+    
+    Approximates a sliding window from the current and previous fixed windows,
+    so each key costs two counters regardless of its limit. Limits are enforced
+    per process rather than across the fleet.
+    """
+    
+    def __init__(self, max_keys: int = 10_000):
+        """Initialize local limiter tracking at most ``max_keys`` keys."""
+        self.max_keys = max_keys
+        # key -> [window index, requests in current window, requests in previous window]
+        self._windows: "OrderedDict[str, list[int]]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def check(
+        self,
+        key: str,
+        limit: int,
+        window_seconds: int,
+        burst_limit: Optional[int] = None
+    ) -> RateLimitResult:
+        """Record a request for ``key`` if it is within the limit."""
+        now = time.time()
+        window_index = int(now // window_seconds)
+        elapsed_fraction = (now - window_index * window_seconds) / window_seconds
+        effective_limit = limit + (burst_limit or 0)
+        
+        with self._lock:
+            counters = self._windows.get(key)
+            if counters is None or counters[0] < window_index - 1:
+                counters = [window_index, 0, 0]
+            elif counters[0] == window_index - 1:
+                counters = [window_index, 0, counters[1]]
+            self._windows[key] = counters
+            self._windows.move_to_end(key)
+            while len(self._windows) > self.max_keys:
+                self._windows.popitem(last=False)
+            
+            weighted_previous = math.floor(counters[2] * (1 - elapsed_fraction))
+            current_requests = weighted_previous + counters[1] + 1
+            allowed = current_requests <= effective_limit
+            if allowed:
+                counters[1] += 1
+        
+        return RateLimitResult(
+            allowed=allowed,
+            current_requests=current_requests,
+            limit=limit,
+            remaining=max(0, effective_limit - current_requests),
+            reset_time=(window_index + 1) * window_seconds,
+            burst_limit=burst_limit
+        )
+
+
 class RateLimiter:
     """Rate limiter implementation."""
     
-    def __init__(self, redis_client: Optional[redis.Redis] = None):
-        """Initialize rate limiter."""
+    def __init__(
+        self,
+        redis_client: Optional[redis.Redis] = None,
+        local_limiter: Optional[LocalRateLimiter] = None
+    ):
+        """Initialize rate limiter.
+        
+        Args:
+            redis_client: Redis client shared by all API processes
+            local_limiter: In-process limiter used when Redis is unavailable
+        """
+        self._local_limiter = local_limiter or LocalRateLimiter()
+        self._sliding_window_script = None
         if redis_client is None:
             try:
                 self.redis = redis.Redis(
@@ -77,13 +177,9 @@ class RateLimiter:
     ) -> RateLimitResult:
         """Check if request is within rate limit."""
         if not self.redis:
-            # No Redis, allow all requests
-            return RateLimitResult(
-                allowed=True,
-                current_requests=0,
-                limit=limit,
-                remaining=limit,
-                reset_time=int(time.time()) + 3600
+            # No Redis, limit per process instead
+            return self._local_limiter.check(
+                f"hourly:{key_id}", limit, 3600, burst_limit=burst_limit
             )
         
         # Use fixed window rate limiting (simpler than sliding window)
@@ -119,17 +215,11 @@ class RateLimiter:
             )
             
         except Exception as e:
-            # On error, allow request (fail open)
-            import logging
-            logger = logging.getLogger(__name__)
+            # On error, fall back to the per-process limiter
             logger.error(f"Rate limit check failed: {str(e)}")
             
-            return RateLimitResult(
-                allowed=True,
-                current_requests=0,
-                limit=limit,
-                remaining=limit,
-                reset_time=int(time.time()) + 3600
+            return self._local_limiter.check(
+                f"hourly:{key_id}", limit, 3600, burst_limit=burst_limit
             )
     
     def check_sliding_window(
@@ -138,58 +228,41 @@ class RateLimiter:
         limit: int,
         window_seconds: int = 3600
     ) -> RateLimitResult:
-        """Check rate limit using sliding window algorithm."""
+        """Check rate limit using sliding window algorithm.
+        
+        The whole check runs as one Lua script, so it costs a single atomic
+        round-trip. Falls back to the per-process limiter when Redis is not
+        configured or the script fails.
+        """
         if not self.redis:
-            return RateLimitResult(
-                allowed=True,
-                current_requests=0,
-                limit=limit,
-                remaining=limit,
-                reset_time=int(time.time()) + window_seconds
-            )
+            return self._local_limiter.check(f"sliding:{key_id}", limit, window_seconds)
         
         now = time.time()
-        window_start = now - window_seconds
         window_key = f"rate_limit:sliding:{key_id}"
         
         try:
-            # Remove old entries
-            self.redis.zremrangebyscore(window_key, 0, window_start)
-            
-            # Add current request
-            request_id = f"{now}:{id(now)}"
-            self.redis.zadd(window_key, {request_id: now})
+            if self._sliding_window_script is None:
+                # Registration is client-side; calls use EVALSHA and reload on NOSCRIPT
+                self._sliding_window_script = self.redis.register_script(SLIDING_WINDOW_LUA)
             
-            # Count requests in window
-            current_requests = self.redis.zcard(window_key)
-            
-            # Set expiration
-            self.redis.expire(window_key, window_seconds + 60)
-            
-            # Check if allowed
-            allowed = current_requests <= limit
-            remaining = max(0, limit - current_requests)
+            allowed, current_requests, reset_time = self._sliding_window_script(
+                keys=[window_key],
+                args=[now, window_seconds, limit, f"{now}:{uuid.uuid4().hex}"]
+            )
+            current_requests = int(current_requests)
             
             return RateLimitResult(
-                allowed=allowed,
+                allowed=bool(int(allowed)),
                 current_requests=current_requests,
                 limit=limit,
-                remaining=remaining,
-                reset_time=int(now + window_seconds)
+                remaining=max(0, limit - current_requests),
+                reset_time=int(reset_time)
             )
             
         except Exception as e:
-            import logging
-            logger = logging.getLogger(__name__)
             logger.error(f"Sliding window rate limit failed: {str(e)}")
             
-            return RateLimitResult(
-                allowed=True,
-                current_requests=0,
-                limit=limit,
-                remaining=limit,
-                reset_time=int(time.time()) + window_seconds
-            )
+            return self._local_limiter.check(f"sliding:{key_id}", limit, window_seconds)
     
     def get_rate_limit_info(self, key_id: str) -> dict:
         """Get current rate limit information."""
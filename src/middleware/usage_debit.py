@@ -0,0 +1,223 @@
+"""Batched usage-debit aggregation for the auth middleware.
+
+Debits for the same API key, model, endpoint and status code are coalesced into a
+single ``/api/v1/usage/{key_id}/debit`` call carrying the combined
+``predictions_count`` and ``compute_ms``. Batches are flushed when they reach a
+size limit or when the flush window elapses, whichever comes first.
+"""
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from types import SimpleNamespace
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_BATCH_SIZE = 50
+DEFAULT_FLUSH_INTERVAL_SECONDS = 0.5
+DEFAULT_MAX_PENDING_DEBITS = 10_000
+DEFAULT_CREDIT_SNAPSHOT_TTL_SECONDS = 10.0
+
+# (key_id, model_id, endpoint, payload, request_state) -> "accepted" | "rejected" | "error"
+DebitSender = Callable[[str, Optional[str], str, dict[str, Any], Any], Awaitable[str]]
+
+
+@dataclass
+class _PendingDebit:
+    """Debits for one key/model/endpoint/status accumulated since the last flush."""
+
+    key_id: str
+    model_id: Optional[str]
+    endpoint: str
+    status_code: int
+    first_idempotency_key: str
+    count: int = 0
+    response_time_ms: int = 0
+    predictions: int = 0
+
+    def payload(self, service_id: str) -> dict[str, Any]:  # noqa: ANN101
+        """Build the debit payload for this batch.
+
+        A single debit keeps its original idempotency key; a batch derives one
+        from its first member so retries of the same batch stay idempotent.
+        """
+        idempotency_key = self.first_idempotency_key
+        if self.count > 1:
+            idempotency_key = f"{idempotency_key}-batch{self.count}"
+        return {
+            "model_id": self.model_id,
+            "endpoint": self.endpoint,
+            "response_time_ms": self.response_time_ms,
+            "status_code": self.status_code,
+            "service_id": service_id,
+            "idempotency_key": idempotency_key,
+            "compute_ms": self.response_time_ms,
+            "predictions_count": self.predictions,
+        }
+
+
+@dataclass
+class _CreditSnapshot:
+    """Most recent debit rejection seen for an API key."""
+
+    rejected_until: float
+    reason: Optional[str] = None
+    reason_code: Optional[str] = None
+
+
+@dataclass
+class UsageDebitAggregator:
+    """Buffer usage debits per key and flush them in batches.
+
+    Rejections (402) from a flushed batch are remembered per key for
+    ``credit_snapshot_ttl`` seconds so subsequent requests for that key are
+    rejected immediately instead of being queued. Once ``max_pending`` debits are
+    buffered, ``submit`` flushes inline before accepting more, which bounds memory
+    and pushes back on callers when the auth service falls behind.
+    """
+
+    send: DebitSender
+    service_id: str
+    max_batch_size: int = DEFAULT_MAX_BATCH_SIZE
+    flush_interval: float = DEFAULT_FLUSH_INTERVAL_SECONDS
+    max_pending: int = DEFAULT_MAX_PENDING_DEBITS
+    credit_snapshot_ttl: float = DEFAULT_CREDIT_SNAPSHOT_TTL_SECONDS
+    _pending: dict[tuple, _PendingDebit] = field(default_factory=dict, init=False)
+    _pending_count: int = field(default=0, init=False)
+    _credit: dict[str, _CreditSnapshot] = field(default_factory=dict, init=False)
+    _flush_requested: Optional[asyncio.Event] = field(default=None, init=False)
+    _flusher: Optional[asyncio.Task] = field(default=None, init=False)
+    _flush_lock: Optional[asyncio.Lock] = field(default=None, init=False)
+    _closed: bool = field(default=False, init=False)
+
+    @property
+    def pending_count(self) -> int:  # noqa: ANN101
+        """Number of debits buffered and not yet sent."""
+        return self._pending_count
+
+    async def submit(
+        self,  # noqa: ANN101
+        key_id: str,
+        model_id: Optional[str],
+        endpoint: str,
+        response_time_ms: int,
+        status_code: int,
+        idempotency_key: str,
+        request_state: Any = None,  # noqa: ANN401
+        predictions_count: int = 1,
+    ) -> str:
+        """Queue one debit, returning ``"rejected"`` if the key has no credit left.
+
+        ``predictions_count`` is the number of predictions the request is billed
+        for, e.g. the record count of a batch predict call.
+        """
+        snapshot = self._credit.get(key_id)
+        if snapshot is not None:
+            if snapshot.rejected_until > time.monotonic():
+                if request_state is not None:
+                    request_state._debit_reject_reason = snapshot.reason
+                    request_state._debit_reject_reason_code = snapshot.reason_code
+                return "rejected"
+            del self._credit[key_id]
+
+        if self._closed:
+            # After shutdown there is no flusher left to drain the buffer.
+            payload = _PendingDebit(
+                key_id,
+                model_id,
+                endpoint,
+                status_code,
+                idempotency_key,
+                1,
+                response_time_ms,
+                predictions_count,
+            ).payload(self.service_id)
+            return await self.send(key_id, model_id, endpoint, payload, request_state)
+
+        if self._pending_count >= self.max_pending:
+            await self.flush()
+
+        group_key = (key_id, model_id, endpoint, status_code)
+        pending = self._pending.get(group_key)
+        if pending is None:
+            pending = _PendingDebit(key_id, model_id, endpoint, status_code, idempotency_key)
+            self._pending[group_key] = pending
+        pending.count += 1
+        pending.response_time_ms += response_time_ms
+        pending.predictions += predictions_count
+        self._pending_count += 1
+
+        self._ensure_flusher()
+        if pending.count >= self.max_batch_size:
+            self._flush_requested.set()
+        return "queued"
+
+    async def flush(self) -> None:  # noqa: ANN101
+        """Send every buffered batch to the auth service."""
+        if self._flush_lock is None:
+            self._flush_lock = asyncio.Lock()
+        async with self._flush_lock:
+            batches = list(self._pending.values())
+            self._pending = {}
+            self._pending_count = 0
+            if batches:
+                await asyncio.gather(*(self._send_batch(batch) for batch in batches))
+
+    async def close(self) -> None:  # noqa: ANN101
+        """Stop the background flusher and send whatever is still buffered."""
+        self._closed = True
+        flusher, self._flusher = self._flusher, None
+        if flusher is not None and not flusher.done():
+            flusher.cancel()
+            try:
+                await flusher
+            except asyncio.CancelledError:
+                pass
+        await self.flush()
+
+    def _ensure_flusher(self) -> None:  # noqa: ANN101
+        loop = asyncio.get_running_loop()
+        if self._flusher is None or self._flusher.done() or self._flusher.get_loop() is not loop:
+            self._flush_requested = asyncio.Event()
+            self._flush_lock = asyncio.Lock()
+            self._flusher = loop.create_task(self._run())
+
+    async def _run(self) -> None:  # noqa: ANN101
+        while True:
+            try:
+                await asyncio.wait_for(self._flush_requested.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._flush_requested.clear()
+            try:
+                await self.flush()
+            except Exception:
+                logger.exception("usage debit flush failed")
+
+    async def _send_batch(self, batch: _PendingDebit) -> None:  # noqa: ANN101
+        state = SimpleNamespace()
+        try:
+            outcome = await self.send(
+                batch.key_id,
+                batch.model_id,
+                batch.endpoint,
+                batch.payload(self.service_id),
+                state,
+            )
+        except Exception:
+            logger.exception(
+                "usage debit batch raised unexpectedly", extra={"key_id": batch.key_id}
+            )
+            return
+
+        if outcome == "rejected":
+            self._credit[batch.key_id] = _CreditSnapshot(
+                rejected_until=time.monotonic() + self.credit_snapshot_ttl,
+                reason=getattr(state, "_debit_reject_reason", None),
+                reason_code=getattr(state, "_debit_reject_reason_code", None),
+            )
+        elif outcome == "accepted":
+            self._credit.pop(batch.key_id, None)
@@ -6,14 +6,16 @@ environment such as ``MLFLOW_TRACKING_TOKEN``.
 
 from __future__ import annotations
 
+import copy
 import json
 import math
 from collections.abc import Iterable, Mapping
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from itertools import product
 from typing import Any
 
 import mlflow.pyfunc
+import numpy as np
 import pandas as pd
 
 ROUTER_DATASET_ARTIFACT = "router_dataset"
@@ -77,6 +79,37 @@ FEATURE_DEFAULTS = {
     "risk_level": "low",
 }
 
+SIMILARITY_CATEGORICAL_WEIGHTS = {
+    "task_type": 2.0,
+    "language": 1.0,
+    "domain": 1.2,
+    "repo_size_bucket": 0.7,
+    "files_touched_bucket": 0.5,
+    "description_length_bucket": 0.4,
+    "risk_level": 0.8,
+}
+
+SIMILARITY_BOOLEAN_WEIGHTS = {
+    "requires_tests": 0.5,
+    "is_migration": 0.5,
+    "ui_heavy": 0.5,
+    "cross_service": 0.4,
+}
+
+SIMILARITY_COMPLEXITY_WEIGHT = 1.0
+NEIGHBOR_QUERY_CHUNK_ROWS = 256
+
+# Serving features read after neighbor selection. Batch rows that share a
+# neighbor set and these values produce identical routes.
+ROUTE_FEATURE_KEYS = (
+    "workflow_stages",
+    "routing_objective",
+    "preferred_models",
+    *dict.fromkeys(column for columns in AVAILABLE_COLUMNS.values() for column in columns),
+    "max_cost_usd",
+    "expected_cost_usd",
+)
+
 
 @dataclass(frozen=True)
 class NormalizedServingFeatures:
@@ -158,6 +191,198 @@ class StrategyCandidate:
         }
 
 
+@dataclass(frozen=True)
+class _NeighborIndex:
+    """Array-backed view of the router dataset used for nearest-neighbor search.
+
+    Categorical features are stored as integer codes against a per-column
+    vocabulary so a query compares one integer per row instead of re-lowering
+    every string. Scores are accumulated in the same order as ``_similarity``
+    so vectorized similarities are bit-identical to the row-wise reference.
+    """
+
+    categorical_codes: dict[str, np.ndarray]
+    vocabularies: dict[str, dict[str, int]]
+    boolean_values: dict[str, np.ndarray]
+    complexity: np.ndarray
+    completed_successfully: np.ndarray
+    score: np.ndarray
+    score_missing: np.ndarray
+    positions: np.ndarray
+
+    @classmethod
+    def from_dataset(cls: type[_NeighborIndex], dataset: pd.DataFrame) -> _NeighborIndex:
+        """Encode the prepared router dataset into contiguous NumPy arrays."""
+        row_count = len(dataset)
+        categorical_codes: dict[str, np.ndarray] = {}
+        vocabularies: dict[str, dict[str, int]] = {}
+        for key in SIMILARITY_CATEGORICAL_WEIGHTS:
+            values = (
+                dataset[key].astype(str).str.lower()
+                if key in dataset.columns
+                else pd.Series([""] * row_count, index=dataset.index, dtype="object")
+            )
+            codes, uniques = pd.factorize(values, sort=True)
+            categorical_codes[key] = codes.astype(np.int64, copy=False)
+            vocabularies[key] = {str(value): code for code, value in enumerate(uniques)}
+
+        boolean_values = {
+            key: (
+                np.fromiter((_coerce_bool(value) for value in dataset[key]), bool, row_count)
+                if key in dataset.columns
+                else np.zeros(row_count, dtype=bool)
+            )
+            for key in SIMILARITY_BOOLEAN_WEIGHTS
+        }
+        complexity = (
+            np.fromiter(
+                (_finite_float_or_default(value, 5.0) for value in dataset["complexity"]),
+                float,
+                row_count,
+            )
+            if "complexity" in dataset.columns
+            else np.full(row_count, 5.0)
+        )
+        score = pd.to_numeric(dataset["score"], errors="coerce").to_numpy(dtype=float)
+        return cls(
+            categorical_codes=categorical_codes,
+            vocabularies=vocabularies,
+            boolean_values=boolean_values,
+            complexity=complexity,
+            completed_successfully=np.fromiter(
+                (_coerce_bool(value) for value in dataset["completed_successfully"]),
+                bool,
+                row_count,
+            ),
+            score=score,
+            score_missing=np.isnan(score),
+            positions=np.arange(row_count),
+        )
+
+    def similarity_matrix(
+        self: _NeighborIndex,
+        features_batch: list[dict[str, Any]],
+    ) -> np.ndarray:
+        """Return a ``(len(features_batch), rows)`` matrix of ``_similarity`` values."""
+        score = np.zeros((len(features_batch), len(self.positions)))
+        total = 0.0
+        for key, weight in SIMILARITY_CATEGORICAL_WEIGHTS.items():
+            total += weight
+            vocabulary = self.vocabularies[key]
+            query_codes = np.array(
+                [
+                    vocabulary.get(str(features.get(key, "")).lower(), -1)
+                    for features in features_batch
+                ],
+                dtype=np.int64,
+            )
+            score += np.where(
+                self.categorical_codes[key][np.newaxis, :] == query_codes[:, np.newaxis],
+                weight,
+                0.0,
+            )
+
+        for key, weight in SIMILARITY_BOOLEAN_WEIGHTS.items():
+            total += weight
+            query_values = np.array(
+                [_coerce_bool(features.get(key)) for features in features_batch],
+                dtype=bool,
+            )
+            score += np.where(
+                self.boolean_values[key][np.newaxis, :] == query_values[:, np.newaxis],
+                weight,
+                0.0,
+            )
+
+        total += SIMILARITY_COMPLEXITY_WEIGHT
+        query_complexity = np.array(
+            [_feature_float(features, "complexity", default=5.0) for features in features_batch],
+            dtype=float,
+        )
+        score += 1.0 - np.minimum(
+            np.abs(query_complexity[:, np.newaxis] - self.complexity[np.newaxis, :]) / 10.0,
+            1.0,
+        )
+
+        return score / total if total else np.zeros_like(score)
+
+    def nearest(
+        self: _NeighborIndex,
+        features: dict[str, Any],
+        k_neighbors: int,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Return dataset positions and similarities of the top-k rows."""
+        return self.nearest_batch([features], k_neighbors)[0]
+
+    def nearest_batch(
+        self: _NeighborIndex,
+        features_batch: list[dict[str, Any]],
+        k_neighbors: int,
+    ) -> list[tuple[np.ndarray, np.ndarray]]:
+        """Return top-k dataset positions and similarities for every query row.
+
+        Ordering matches a stable sort on similarity, success, and score (all
+        descending, missing scores last) with dataset position breaking ties.
+        Similarities are computed in chunks of ``NEIGHBOR_QUERY_CHUNK_ROWS`` so
+        large batches do not materialize one query-by-corpus matrix at once.
+        """
+        results: list[tuple[np.ndarray, np.ndarray]] = []
+        for start in range(0, len(features_batch), NEIGHBOR_QUERY_CHUNK_ROWS):
+            matrix = self.similarity_matrix(
+                features_batch[start : start + NEIGHBOR_QUERY_CHUNK_ROWS]
+            )
+            results.extend(self._top_k(similarities, k_neighbors) for similarities in matrix)
+        return results
+
+    def _top_k(
+        self: _NeighborIndex,
+        similarities: np.ndarray,
+        k_neighbors: int,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        # argpartition narrows the candidates to rows at or above the k-th
+        # similarity so only the boundary ties go through the full lexsort.
+        row_count = len(similarities)
+        k_neighbors = min(max(1, k_neighbors), row_count)
+        candidates = self.positions
+        if k_neighbors < row_count:
+            kth = np.argpartition(-similarities, k_neighbors - 1)[k_neighbors - 1]
+            candidates = np.flatnonzero(similarities >= similarities[kth])
+
+        order = np.lexsort(
+            (
+                candidates,
+                -np.nan_to_num(self.score[candidates], nan=0.0),
+                self.score_missing[candidates],
+                ~self.completed_successfully[candidates],
+                -similarities[candidates],
+            )
+        )
+        selected = candidates[order[:k_neighbors]]
+        return selected, similarities[selected]
+
+
+@dataclass(frozen=True)
+class _RoleEvidence:
+    """Outcome columns of the rows that recorded one model for a role, in row order."""
+
+    completed_successfully: tuple[Any, ...]
+    score: tuple[Any, ...]
+    actual_cost_usd: tuple[Any, ...]
+    expected_cost_usd: tuple[Any, ...]
+
+
+@dataclass
+class _RoleRankCache:
+    """Per-request memo of role evidence groups and role rankings.
+
+    Keys use ``id()`` of the evidence frame. That is stable because a cache is
+    created for one prediction and never outlives the frames it describes.
+    """
+
+    groups: dict[tuple[int, str], dict[str, _RoleEvidence]] = field(default_factory=dict)
+    rankings: dict[tuple[Any, ...], list[RoleChoice]] = field(default_factory=dict)
+
+
 class TechnicalTaskRouterModel(mlflow.pyfunc.PythonModel):
     """Route technical tasks to the historically best Wavemill model set.
 
@@ -172,6 +397,8 @@ class TechnicalTaskRouterModel(mlflow.pyfunc.PythonModel):
     def __init__(self: TechnicalTaskRouterModel, *, k_neighbors: int = 40) -> None:
         self.k_neighbors = k_neighbors
         self._dataset: pd.DataFrame | None = None
+        self._neighbor_index: _NeighborIndex | None = None
+        self._role_statistics: dict[str, dict[str, _RoleEvidence]] | None = None
         self._global_defaults: dict[str, RoleChoice] = {}
 
     def __getstate__(self: TechnicalTaskRouterModel) -> dict[str, Any]:
@@ -221,6 +448,7 @@ class TechnicalTaskRouterModel(mlflow.pyfunc.PythonModel):
             # serializer existed. Preserve any embedded dataset if present;
             # otherwise MLflow will populate it via load_context().
             self._dataset = state.get("_dataset")
+        self._build_lookup_state()
 
         if "global_defaults_state" in state:
             self._global_defaults = {
@@ -241,6 +469,7 @@ class TechnicalTaskRouterModel(mlflow.pyfunc.PythonModel):
 
         dataset = pd.read_csv(dataset_path)
         self._dataset = _prepare_dataset(dataset)
+        self._build_lookup_state()
         self._global_defaults = {
             role: self._rank_role(role, self._dataset, {}, [])[0] for role in ROLE_COLUMNS
         }
@@ -258,28 +487,62 @@ class TechnicalTaskRouterModel(mlflow.pyfunc.PythonModel):
 
         frame = _coerce_input_frame(model_input)
         batch_defaults = _FeatureDefaultTracker(emit_metrics=False)
-        predictions = [
-            self._predict_row(row.to_dict(), default_tracker=batch_defaults)
-            for _, row in frame.iterrows()
-        ]
+        predictions = self._predict_batch(
+            [row.to_dict() for _, row in frame.iterrows()],
+            default_tracker=batch_defaults,
+        )
         result = pd.DataFrame(predictions)
         result.attrs["feature_default_counts"] = batch_defaults.as_dict()
         return result
 
-    def _predict_row(
+    def _predict_batch(
         self: TechnicalTaskRouterModel,
-        raw_row: dict[str, Any],
+        raw_rows: list[dict[str, Any]],
         *,
         default_tracker: _FeatureDefaultTracker | None = None,
-    ) -> dict[str, Any]:
-        normalized = _normalize_serving_features_with_counts(raw_row)
-        features = normalized.features
-        if default_tracker is not None:
-            default_tracker.merge(
-                _FeatureDefaultTracker(counts=normalized.default_counts, emit_metrics=False)
+    ) -> list[dict[str, Any]]:
+        """Route every input row with one similarity pass over the batch.
+
+        Rows that resolve to the same neighbor set and the same
+        ``ROUTE_FEATURE_KEYS`` values share one strategy enumeration; each
+        receives its own copy of the computed prediction.
+        """
+        features_batch: list[dict[str, Any]] = []
+        for raw_row in raw_rows:
+            normalized = _normalize_serving_features_with_counts(raw_row)
+            features_batch.append(normalized.features)
+            if default_tracker is not None:
+                default_tracker.merge(
+                    _FeatureDefaultTracker(counts=normalized.default_counts, emit_metrics=False)
+                )
+
+        index = self._ensure_neighbor_index()
+        routes: dict[tuple[Any, ...], dict[str, Any]] = {}
+        predictions: list[dict[str, Any]] = []
+        for features, (positions, similarities) in zip(
+            features_batch,
+            index.nearest_batch(features_batch, self.k_neighbors),
+        ):
+            route_key = _route_key(features, positions, similarities)
+            cached = routes.get(route_key)
+            if cached is not None:
+                predictions.append(copy.deepcopy(cached))
+                continue
+            prediction = self._predict_features(
+                features,
+                self._neighbor_frame(positions, similarities),
             )
-        neighbors = self._nearest_neighbors(features)
-        strategies = self._rank_strategies(neighbors, features)
+            routes[route_key] = prediction
+            predictions.append(prediction)
+        return predictions
+
+    def _predict_features(
+        self: TechnicalTaskRouterModel,
+        features: dict[str, Any],
+        neighbors: pd.DataFrame,
+    ) -> dict[str, Any]:
+        rank_cache = _RoleRankCache()
+        strategies = self._rank_strategies(neighbors, features, rank_cache=rank_cache)
         recommended_strategy = _recommended_strategy(strategies, features["routing_objective"])
         alternatives = _strategy_alternatives(strategies, recommended_strategy)
         tradeoffs = {
@@ -289,7 +552,13 @@ class TechnicalTaskRouterModel(mlflow.pyfunc.PythonModel):
         nearest_neighbors = _nearest_neighbors_summary(neighbors)
 
         role_choices = {
-            role: self._strategy_role_choice(recommended_strategy, role, neighbors, features)
+            role: self._strategy_role_choice(
+                recommended_strategy,
+                role,
+                neighbors,
+                features,
+                rank_cache=rank_cache,
+            )
             for role in ROLE_COLUMNS
         }
         selected_models = _unique_ordered(
@@ -323,8 +592,10 @@ class TechnicalTaskRouterModel(mlflow.pyfunc.PythonModel):
         self: TechnicalTaskRouterModel,
         neighbors: pd.DataFrame,
         features: dict[str, Any],
+        *,
+        rank_cache: _RoleRankCache | None = None,
     ) -> dict[str, list[StrategyCandidate]]:
-        candidates = self._strategy_candidates(neighbors, features)
+        candidates = self._strategy_candidates(neighbors, features, rank_cache=rank_cache)
         return {
             objective: sorted(
                 (candidate for candidate in candidates if candidate.objective == objective),
@@ -337,6 +608,8 @@ class TechnicalTaskRouterModel(mlflow.pyfunc.PythonModel):
         self: TechnicalTaskRouterModel,
         neighbors: pd.DataFrame,
         features: dict[str, Any],
+        *,
+        rank_cache: _RoleRankCache | None = None,
     ) -> list[StrategyCandidate]:
         stages = features["workflow_stages"]
         role_options: dict[str, list[RoleChoice | None]] = {}
@@ -345,9 +618,13 @@ class TechnicalTaskRouterModel(mlflow.pyfunc.PythonModel):
                 role_options[role] = [None]
                 continue
             allowed_models = _role_allowed_models(role, features)
-            ranked = self._rank_role(role, neighbors, features, allowed_models)
+            ranked = self._rank_role(
+                role, neighbors, features, allowed_models, rank_cache=rank_cache
+            )
             if not ranked:
-                ranked = self._rank_role(role, self._dataset, features, allowed_models)
+                ranked = self._rank_role(
+                    role, self._dataset, features, allowed_models, rank_cache=rank_cache
+                )
             if not ranked:
                 ranked = [self._fallback_role_choice(role, features, allowed_models)]
             role_options[role] = _apply_preference_bonus(
@@ -362,23 +639,28 @@ class TechnicalTaskRouterModel(mlflow.pyfunc.PythonModel):
             role_options["reviewer"],
         )
         seen: set[tuple[str | None, str | None, str | None]] = set()
+        match_masks: dict[tuple[str, str], pd.Series] = {}
         for planner_choice, coder_choice, reviewer_choice in combinations:
             key = _strategy_key(planner_choice, coder_choice, reviewer_choice)
             if key in seen:
                 continue
             seen.add(key)
-            for objective in STRATEGY_OBJECTIVES:
-                candidates.append(
-                    _estimate_strategy(
-                        objective,
-                        stages,
-                        neighbors,
-                        features,
-                        planner_choice,
-                        coder_choice,
-                        reviewer_choice,
-                    )
-                )
+            # Evidence for a combination does not depend on the objective, so
+            # estimate it once and fan the result out per objective.
+            estimate = _estimate_strategy(
+                STRATEGY_OBJECTIVES[0],
+                stages,
+                neighbors,
+                features,
+                planner_choice,
+                coder_choice,
+                reviewer_choice,
+                match_masks=match_masks,
+            )
+            candidates.extend(
+                _strategy_for_objective(estimate, objective, len(neighbors))
+                for objective in STRATEGY_OBJECTIVES
+            )
         return candidates
 
     def _fallback_role_choice(
@@ -409,11 +691,13 @@ class TechnicalTaskRouterModel(mlflow.pyfunc.PythonModel):
         role: str,
         neighbors: pd.DataFrame,
         features: dict[str, Any],
+        *,
+        rank_cache: _RoleRankCache | None = None,
     ) -> RoleChoice | None:
         model_id = getattr(strategy, f"{role}_model")
         if model_id is None:
             return None
-        ranked = self._rank_role(role, neighbors, features, [model_id])
+        ranked = self._rank_role(role, neighbors, features, [model_id], rank_cache=rank_cache)
         if ranked:
             return ranked[0]
         return RoleChoice(
@@ -431,18 +715,39 @@ class TechnicalTaskRouterModel(mlflow.pyfunc.PythonModel):
         self: TechnicalTaskRouterModel,
         features: dict[str, Any],
     ) -> pd.DataFrame:
+        positions, similarities = self._ensure_neighbor_index().nearest(features, self.k_neighbors)
+        return self._neighbor_frame(positions, similarities)
+
+    def _build_lookup_state(self: TechnicalTaskRouterModel) -> None:
+        """Precompute the neighbor index and full-dataset role statistics.
+
+        Neither is part of the serialized state; both are rebuilt from the
+        dataset after ``load_context`` and ``__setstate__``.
+        """
+        if self._dataset is None:
+            self._neighbor_index = None
+            self._role_statistics = None
+            return
+        self._neighbor_index = _NeighborIndex.from_dataset(self._dataset)
+        self._role_statistics = {
+            role: _role_evidence_groups(self._dataset, role_column)
+            for role, role_column in ROLE_COLUMNS.items()
+        }
+
+    def _ensure_neighbor_index(self: TechnicalTaskRouterModel) -> _NeighborIndex:
         if self._dataset is None:
             raise RuntimeError("TechnicalTaskRouterModel.load_context() has not been called")
+        if getattr(self, "_neighbor_index", None) is None:
+            self._build_lookup_state()
+        return self._neighbor_index
 
-        dataset = self._dataset.copy()
-        dataset["_similarity"] = dataset.apply(
-            lambda row: _similarity(features, row.to_dict()),
-            axis=1,
-        )
-        neighbors = dataset.sort_values(
-            by=["_similarity", "completed_successfully", "score"],
-            ascending=[False, False, False],
-        ).head(max(1, self.k_neighbors))
+    def _neighbor_frame(
+        self: TechnicalTaskRouterModel,
+        positions: np.ndarray,
+        similarities: np.ndarray,
+    ) -> pd.DataFrame:
+        neighbors = self._dataset.take(positions)
+        neighbors["_similarity"] = similarities
         return neighbors
 
     def _choose_role(
@@ -482,56 +787,44 @@ class TechnicalTaskRouterModel(mlflow.pyfunc.PythonModel):
         rows: pd.DataFrame | None,
         features: dict[str, Any],
         allowed_models: list[str],
+        *,
+        rank_cache: _RoleRankCache | None = None,
     ) -> list[RoleChoice]:
         if rows is None or rows.empty:
             return []
 
-        role_column = ROLE_COLUMNS[role]
-        candidates = rows.dropna(subset=[role_column]).copy()
-        candidates = candidates[candidates[role_column].astype(str).str.len() > 0]
-        candidates = _effective_role_evidence(candidates, role_column, allowed_models)
-        if candidates.empty:
-            return []
-
         max_cost = _feature_float(features, "max_cost_usd")
-        choices: list[RoleChoice] = []
-        for model_id, group in candidates.groupby("_effective_model_id"):
-            weights = group["_evidence_weight"]
-            success = _weighted_mean_bool(group["completed_successfully"], weights, default=0.5)
-            quality = _weighted_mean_number(group["score"], weights, default=success)
-            cost = _median_number(group["actual_cost_usd"])
-            if cost is None:
-                cost = _median_number(group["expected_cost_usd"])
-
-            direct_support = int((group["_evidence_source"] == "direct").sum())
-            borrowed = group[group["_evidence_source"] == "borrowed"]
-            borrowed_support = int(len(borrowed))
-            borrowed_from = {
-                str(source): int(count)
-                for source, count in borrowed["_source_model_id"]
-                .value_counts()
-                .sort_index()
-                .items()
-            }
-            weighted_support = float(weights.sum())
-            support = int(math.ceil(weighted_support))
-            support_bonus = min(math.log1p(weighted_support) / 10.0, 0.2)
-            cost_penalty = _cost_penalty(cost, max_cost)
-            route_score = 0.55 * success + 0.30 * quality + support_bonus - cost_penalty
-            choices.append(
-                RoleChoice(
-                    model_id=str(model_id),
-                    score=_clamp(route_score, 0.0, 1.0),
-                    support=support,
-                    expected_success=_clamp((success + quality) / 2.0, 0.0, 1.0),
-                    estimated_cost_usd=cost,
-                    direct_support=direct_support,
-                    borrowed_support=borrowed_support,
-                    borrowed_from=borrowed_from,
-                )
-            )
+        ranking_key = (id(rows), role, frozenset(allowed_models), max_cost)
+        if rank_cache is not None and ranking_key in rank_cache.rankings:
+            return rank_cache.rankings[ranking_key]
+
+        ranked = _rank_role_evidence(
+            self._role_evidence(role, rows, rank_cache),
+            allowed_models,
+            max_cost,
+        )
+        if rank_cache is not None:
+            rank_cache.rankings[ranking_key] = ranked
+        return ranked
 
-        return sorted(choices, key=lambda choice: choice.score, reverse=True)
+    def _role_evidence(
+        self: TechnicalTaskRouterModel,
+        role: str,
+        rows: pd.DataFrame,
+        rank_cache: _RoleRankCache | None,
+    ) -> dict[str, _RoleEvidence]:
+        if rows is self._dataset:
+            if getattr(self, "_role_statistics", None) is None:
+                self._build_lookup_state()
+            return self._role_statistics[role]
+
+        groups_key = (id(rows), role)
+        if rank_cache is not None and groups_key in rank_cache.groups:
+            return rank_cache.groups[groups_key]
+        groups = _role_evidence_groups(rows, ROLE_COLUMNS[role])
+        if rank_cache is not None:
+            rank_cache.groups[groups_key] = groups
+        return groups
 
 
 def _prepare_dataset(dataset: pd.DataFrame) -> pd.DataFrame:
@@ -715,31 +1008,17 @@ def _similarity(features: dict[str, Any], row: dict[str, Any]) -> float:
     score = 0.0
     total = 0.0
 
-    categorical_weights = {
-        "task_type": 2.0,
-        "language": 1.0,
-        "domain": 1.2,
-        "repo_size_bucket": 0.7,
-        "files_touched_bucket": 0.5,
-        "description_length_bucket": 0.4,
-        "risk_level": 0.8,
-    }
-    for key, weight in categorical_weights.items():
+    for key, weight in SIMILARITY_CATEGORICAL_WEIGHTS.items():
         total += weight
         if str(features.get(key, "")).lower() == str(row.get(key, "")).lower():
             score += weight
 
-    for key, weight in {
-        "requires_tests": 0.5,
-        "is_migration": 0.5,
-        "ui_heavy": 0.5,
-        "cross_service": 0.4,
-    }.items():
+    for key, weight in SIMILARITY_BOOLEAN_WEIGHTS.items():
         total += weight
         if _coerce_bool(features.get(key)) == _coerce_bool(row.get(key)):
             score += weight
 
-    total += 1.0
+    total += SIMILARITY_COMPLEXITY_WEIGHT
     feature_complexity = _feature_float(features, "complexity", default=5.0)
     row_complexity = _feature_float(row, "complexity", default=5.0)
     score += 1.0 - min(abs(feature_complexity - row_complexity) / 10.0, 1.0)
@@ -747,6 +1026,18 @@ def _similarity(features: dict[str, Any], row: dict[str, Any]) -> float:
     return score / total if total else 0.0
 
 
+def _route_key(
+    features: dict[str, Any],
+    positions: np.ndarray,
+    similarities: np.ndarray,
+) -> tuple[Any, ...]:
+    return (
+        positions.tobytes(),
+        similarities.tobytes(),
+        *(repr(features.get(key)) for key in ROUTE_FEATURE_KEYS),
+    )
+
+
 def _role_allowed_models(role: str, features: dict[str, Any]) -> list[str]:
     for column in AVAILABLE_COLUMNS[role]:
         values = _parse_json_list(features.get(column))
@@ -831,23 +1122,22 @@ def _estimate_strategy(
     planner_choice: RoleChoice | None,
     coder_choice: RoleChoice | None,
     reviewer_choice: RoleChoice | None,
+    *,
+    match_masks: dict[tuple[str, str], pd.Series] | None = None,
 ) -> StrategyCandidate:
     role_choices = {
         "planner": planner_choice,
         "coder": coder_choice,
         "reviewer": reviewer_choice,
     }
-    matched = _matching_strategy_rows(neighbors, role_choices)
+    matched = _matching_strategy_rows(neighbors, role_choices, match_masks=match_masks)
     support = int(len(matched))
     evidence = matched if not matched.empty else neighbors
     success = _estimate_success_under_budget(evidence, role_choices)
     cost = _estimate_strategy_cost(evidence, role_choices, features)
     duration = _estimate_strategy_duration(evidence)
     confidence = _estimate_strategy_confidence(neighbors, role_choices, support)
-    rationale = (
-        f"Estimated {objective} strategy from {support} exact route match(es) "
-        f"across {len(neighbors)} nearest Wavemill router row(s)."
-    )
+    rationale = _strategy_rationale(objective, support, len(neighbors))
     return StrategyCandidate(
         objective=objective,
         planner_model=planner_choice.model_id if planner_choice else None,
@@ -864,23 +1154,51 @@ def _estimate_strategy(
     )
 
 
+def _strategy_for_objective(
+    estimate: StrategyCandidate,
+    objective: str,
+    neighbor_count: int,
+) -> StrategyCandidate:
+    return replace(
+        estimate,
+        objective=objective,
+        rationale=_strategy_rationale(objective, estimate.support, neighbor_count),
+        role_evidence=copy.deepcopy(estimate.role_evidence),
+    )
+
+
+def _strategy_rationale(objective: str, support: int, neighbor_count: int) -> str:
+    return (
+        f"Estimated {objective} strategy from {support} exact route match(es) "
+        f"across {neighbor_count} nearest Wavemill router row(s)."
+    )
+
+
 def _matching_strategy_rows(
     rows: pd.DataFrame,
     role_choices: dict[str, RoleChoice | None],
+    *,
+    match_masks: dict[tuple[str, str], pd.Series] | None = None,
 ) -> pd.DataFrame:
     if rows.empty:
         return rows
+    if match_masks is None:
+        match_masks = {}
     mask = pd.Series(True, index=rows.index)
     for role, choice in role_choices.items():
         if choice is None:
             continue
         selected_model_id = choice.model_id
-        mask &= rows[ROLE_COLUMNS[role]].map(
-            lambda model_id, selected_model_id=selected_model_id: _role_row_matches_choice(
-                model_id,
-                selected_model_id,
+        role_mask = match_masks.get((role, selected_model_id))
+        if role_mask is None:
+            role_mask = rows[ROLE_COLUMNS[role]].map(
+                lambda model_id, selected_model_id=selected_model_id: _role_row_matches_choice(
+                    model_id,
+                    selected_model_id,
+                )
             )
-        )
+            match_masks[(role, selected_model_id)] = role_mask
+        mask &= role_mask
     return rows[mask]
 
 
@@ -1117,60 +1435,114 @@ def _positive_duration_values(values: Iterable[Any]) -> list[float]:
     return [float(v) for v in values if _is_finite_number(v) and float(v) > 0.0]
 
 
-def _effective_role_evidence(
-    rows: pd.DataFrame,
-    role_column: str,
+def _role_evidence_groups(rows: pd.DataFrame, role_column: str) -> dict[str, _RoleEvidence]:
+    """Group outcome columns by the model recorded for a role, keyed in sorted order."""
+    candidates = rows.dropna(subset=[role_column])
+    candidates = candidates[candidates[role_column].astype(str).str.len() > 0]
+    groups: dict[str, _RoleEvidence] = {}
+    for model_id, group in candidates.groupby(role_column, sort=True):
+        groups[str(model_id)] = _RoleEvidence(
+            completed_successfully=tuple(group["completed_successfully"].tolist()),
+            score=tuple(group["score"].tolist()),
+            actual_cost_usd=_optional_column_values(group, "actual_cost_usd"),
+            expected_cost_usd=_optional_column_values(group, "expected_cost_usd"),
+        )
+    return groups
+
+
+def _optional_column_values(rows: pd.DataFrame, column: str) -> tuple[Any, ...]:
+    if column not in rows.columns:
+        return (None,) * len(rows)
+    return tuple(rows[column].tolist())
+
+
+def _effective_role_sources(
+    groups: dict[str, _RoleEvidence],
     allowed_models: list[str],
-) -> pd.DataFrame:
-    """Expand retired role labels into weighted evidence for allowed successors."""
-    if rows.empty:
-        return _empty_effective_evidence(rows)
+) -> dict[str, list[tuple[str, str, float]]]:
+    """Map each effective model to its ``(source, evidence_source, weight)`` groups.
 
+    Retired role labels are expanded into weighted evidence for allowed
+    successors.
+    """
     allowed = set(allowed_models)
+    effective: dict[str, list[tuple[str, str, float]]] = {}
+    for source_model_id in groups:
+        if not allowed or source_model_id in allowed:
+            effective.setdefault(source_model_id, []).append((source_model_id, "direct", 1.0))
     if not allowed:
-        direct = rows.copy()
-        direct["_effective_model_id"] = direct[role_column].astype(str)
-        direct["_source_model_id"] = direct[role_column].astype(str)
-        direct["_evidence_source"] = "direct"
-        direct["_evidence_weight"] = 1.0
-        return direct
-
-    frames: list[pd.DataFrame] = []
-    direct_mask = rows[role_column].isin(allowed)
-    if direct_mask.any():
-        direct = rows[direct_mask].copy()
-        direct["_effective_model_id"] = direct[role_column].astype(str)
-        direct["_source_model_id"] = direct[role_column].astype(str)
-        direct["_evidence_source"] = "direct"
-        direct["_evidence_weight"] = 1.0
-        frames.append(direct)
-
-    for source_model_id, group in rows[~direct_mask].groupby(role_column):
-        successors = [
-            successor
-            for successor in _successor_candidates(str(source_model_id))
-            if successor in allowed
-        ]
-        for successor in successors:
-            borrowed = group.copy()
-            borrowed["_effective_model_id"] = successor
-            borrowed["_source_model_id"] = str(source_model_id)
-            borrowed["_evidence_source"] = "borrowed"
-            borrowed["_evidence_weight"] = BORROWED_EVIDENCE_WEIGHT
-            frames.append(borrowed)
+        return effective
+
+    for source_model_id in groups:
+        if source_model_id in allowed:
+            continue
+        for successor in _successor_candidates(source_model_id):
+            if successor in allowed:
+                effective.setdefault(successor, []).append(
+                    (source_model_id, "borrowed", BORROWED_EVIDENCE_WEIGHT)
+                )
+    return effective
+
+
+def _rank_role_evidence(
+    groups: dict[str, _RoleEvidence],
+    allowed_models: list[str],
+    max_cost: float | None,
+) -> list[RoleChoice]:
+    """Rank effective models for one role from grouped evidence.
 
-    if not frames:
-        return _empty_effective_evidence(rows)
-    return pd.concat(frames, ignore_index=True)
+    Direct rows come first for each effective model, followed by borrowed rows
+    from retired labels in sorted source order, so weighted means accumulate in
+    the same order as the historical concatenated-frame implementation.
+    """
+    effective = _effective_role_sources(groups, allowed_models)
+    choices: list[RoleChoice] = []
+    for model_id in sorted(effective):
+        success_values: list[Any] = []
+        score_values: list[Any] = []
+        actual_costs: list[Any] = []
+        expected_costs: list[Any] = []
+        weights: list[float] = []
+        direct_support = 0
+        borrowed_from: dict[str, int] = {}
+        for source_model_id, evidence_source, weight in effective[model_id]:
+            evidence = groups[source_model_id]
+            row_count = len(evidence.completed_successfully)
+            success_values.extend(evidence.completed_successfully)
+            score_values.extend(evidence.score)
+            actual_costs.extend(evidence.actual_cost_usd)
+            expected_costs.extend(evidence.expected_cost_usd)
+            weights.extend([weight] * row_count)
+            if evidence_source == "direct":
+                direct_support += row_count
+            else:
+                borrowed_from[source_model_id] = row_count
 
+        success = _weighted_mean_bool(success_values, weights, default=0.5)
+        quality = _weighted_mean_number(score_values, weights, default=success)
+        cost = _median_number(actual_costs)
+        if cost is None:
+            cost = _median_number(expected_costs)
+
+        weighted_support = float(sum(weights))
+        support = int(math.ceil(weighted_support))
+        support_bonus = min(math.log1p(weighted_support) / 10.0, 0.2)
+        cost_penalty = _cost_penalty(cost, max_cost)
+        route_score = 0.55 * success + 0.30 * quality + support_bonus - cost_penalty
+        choices.append(
+            RoleChoice(
+                model_id=model_id,
+                score=_clamp(route_score, 0.0, 1.0),
+                support=support,
+                expected_success=_clamp((success + quality) / 2.0, 0.0, 1.0),
+                estimated_cost_usd=cost,
+                direct_support=direct_support,
+                borrowed_support=sum(borrowed_from.values()),
+                borrowed_from=dict(sorted(borrowed_from.items())),
+            )
+        )
 
-def _empty_effective_evidence(rows: pd.DataFrame) -> pd.DataFrame:
-    empty = rows.iloc[0:0].copy()
-    empty["_effective_model_id"] = pd.Series(dtype="object")
-    empty["_source_model_id"] = pd.Series(dtype="object")
-    empty["_evidence_source"] = pd.Series(dtype="object")
-    empty["_evidence_weight"] = pd.Series(dtype="float64")
-    return empty
+    return sorted(choices, key=lambda choice: choice.score, reverse=True)
 
 
 def _successor_candidates(model_id: str) -> tuple[str, ...]:
@@ -1242,6 +1614,10 @@ def _feature_float(
     return default
 
 
+def _finite_float_or_default(value: Any, default: float) -> float:
+    return float(value) if _is_finite_number(value) else default
+
+
 def _is_finite_number(value: Any) -> bool:
     try:
         number = float(value)
@@ -10,6 +10,7 @@ import numpy as np
 import pandas as pd
 from sklearn.model_selection import train_test_split
 
+from ..utils.dataset_hash import dataframe_records_sha256
 from ..utils.mlflow_config import (
     log_dataset_info,
     log_step_metrics,
@@ -274,9 +275,8 @@ class DataIntegrator:
             SHA256 hash of data
 
         """
-        # Convert dataframe to string representation (sorted for consistency)
-        data_str = df.sort_index().sort_index(axis=1).to_json(orient="records")
-        return hashlib.sha256(data_str.encode()).hexdigest()
+        # Hash the index- and column-sorted JSON records, serialized in chunks
+        return dataframe_records_sha256(df)
 
     def create_data_manifest(self, df: pd.DataFrame, data_path: Path) -> dict:
         """Create manifest for contributed data.
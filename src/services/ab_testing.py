@@ -1,9 +1,12 @@
 """A/B testing framework for model comparison and traffic routing."""
 
+import asyncio
 import hashlib
 import json
 import logging
 import random
+import time
+from collections import defaultdict
 from dataclasses import asdict, dataclass
 from datetime import datetime
 from enum import Enum
@@ -11,9 +14,17 @@ from typing import Any, Optional
 
 import numpy as np
 import redis
+import redis.asyncio as redis_asyncio
 
 logger = logging.getLogger(__name__)
 
+# Bumped on every routing change so routers can poll one key instead of all tests
+ROUTING_VERSION_KEY = "ab_routing_version"
+METRICS_COUNTERS_KEY_PREFIX = "ab_counters"
+DEFAULT_ROUTING_REFRESH_SECONDS = 5.0
+DEFAULT_METRICS_FLUSH_SECONDS = 1.0
+ASSIGNMENT_LOG_TTL_SECONDS = 86400 * 7
+
 
 class ABTestStatus(Enum):
     """Status of an A/B test."""
@@ -106,17 +117,46 @@ class ABTestMetrics:
 
 
 class ModelTrafficRouter:
-    """Routes traffic between models for A/B testing."""
+    """Routes traffic between models for A/B testing.
 
-    def __init__(self, redis_client: redis.Redis) -> None:
+    Routing runs entirely against an in-memory snapshot of the active tests. The
+    snapshot is rebuilt when ``ab_routing_version`` changes, which is checked at
+    most once per ``routing_refresh_seconds``. Sticky assignments are derived by
+    hashing the test and user IDs, so they need no Redis lookup.
+
+    Assignment counts and prediction results are accumulated in local counters
+    and flushed every ``metrics_flush_seconds`` with ``HINCRBY``/``HINCRBYFLOAT``
+    into ``ab_counters:{test_id}:{variant}`` hashes. Increments from concurrent
+    workers therefore add up instead of overwriting each other.
+    """
+
+    def __init__(
+        self,
+        redis_client: redis.Redis,
+        async_redis_client: Optional[redis_asyncio.Redis] = None,
+        routing_refresh_seconds: float = DEFAULT_ROUTING_REFRESH_SECONDS,
+        metrics_flush_seconds: float = DEFAULT_METRICS_FLUSH_SECONDS,
+    ) -> None:
         """Initialize the traffic router.
 
         Args:
             redis_client: Redis client for storing routing rules and assignments
+            async_redis_client: Optional asyncio client for the async routing and
+                metrics paths used during inference
+            routing_refresh_seconds: How often to check for routing changes
+            metrics_flush_seconds: How often accumulated counters are written
 
         """
         self.redis = redis_client
+        self.async_redis = async_redis_client
+        self.routing_refresh_seconds = routing_refresh_seconds
+        self.metrics_flush_seconds = metrics_flush_seconds
         self.routing_rules = {}
+        self._pending_counters: defaultdict = defaultdict(lambda: defaultdict(int))
+        self._log_day: tuple[int, str] = (-1, "")
+        self._next_refresh = time.monotonic() + routing_refresh_seconds
+        self._next_flush = time.monotonic() + metrics_flush_seconds
+        self._routing_version = self._read_routing_version()
         self._load_active_tests()
 
     def create_ab_test(self, test_config: ABTestConfig) -> str:
@@ -142,6 +182,7 @@ class ModelTrafficRouter:
         if test_config.status == ABTestStatus.ACTIVE:
             self.redis.sadd("active_ab_tests", test_config.test_id)
             self.routing_rules[test_config.test_id] = test_config
+            self._bump_routing_version()
 
         logger.info(f"Created A/B test: {test_config.test_id}")
         return test_config.test_id
@@ -165,31 +206,43 @@ class ModelTrafficRouter:
             Tuple of (selected_model_id, test_id)
 
         """
-        # Find active test for this model family
-        active_test = self._find_active_test(model_family)
-        if not active_test:
-            # No active test, return default model
-            return self._get_default_model(model_family), ""
+        now = time.monotonic()
+        if now >= self._next_refresh:
+            self._refresh_routing(self._read_routing_version())
+        if now >= self._next_flush:
+            self.flush_metrics()
 
-        # Check if user is in target segment
-        if not self._is_in_segment(user_id, features, active_test.user_segments):
-            return self._get_default_model(model_family), ""
-
-        # Route based on strategy
-        if active_test.routing_strategy == RoutingStrategy.STICKY and user_id:
-            model_variant = self._get_sticky_assignment(user_id, active_test)
-        elif active_test.routing_strategy == RoutingStrategy.DETERMINISTIC:
-            model_variant = self._get_deterministic_assignment(request_id, active_test)
-        else:  # RANDOM or WEIGHTED
-            model_variant = self._get_random_assignment(active_test)
+        return self._route(request_id, model_family, user_id, features)
 
-        # Get actual model ID
-        model_id = active_test.model_a if model_variant == "model_a" else active_test.model_b
+    async def route_request_async(
+        self,
+        request_id: str,
+        model_family: str,
+        user_id: Optional[str] = None,
+        features: Optional[dict[str, Any]] = None,
+    ) -> tuple[str, str]:
+        """Async variant of ``route_request``.
 
-        # Record assignment
-        self._record_assignment(request_id, active_test.test_id, model_variant)
+        Routing itself never touches Redis; only the periodic routing-version
+        check and counter flush await the asyncio client.
+        """
+        if self.async_redis is None:
+            return self.route_request(request_id, model_family, user_id, features)
+
+        now = time.monotonic()
+        if now >= self._next_refresh:
+            self._next_refresh = now + self.routing_refresh_seconds
+            try:
+                version = await self.async_redis.get(ROUTING_VERSION_KEY)
+            except redis.RedisError as e:
+                logger.warning(f"Routing version check failed: {str(e)}")
+            else:
+                if version != self._routing_version:
+                    await asyncio.to_thread(self._refresh_routing, version)
+        if now >= self._next_flush:
+            await self.flush_metrics_async()
 
-        return model_id, active_test.test_id
+        return self._route(request_id, model_family, user_id, features)
 
     def update_traffic_split(self, test_id: str, splits: dict[str, float]) -> bool:
         """Update traffic distribution between models.
@@ -222,6 +275,7 @@ class ModelTrafficRouter:
         # Update in-memory rules if active
         if test_id in self.routing_rules:
             self.routing_rules[test_id] = test_config
+        self._bump_routing_version()
 
         logger.info(f"Updated traffic split for test {test_id}: {splits}")
         return True
@@ -247,6 +301,7 @@ class ModelTrafficRouter:
         self.redis.srem("active_ab_tests", test_id)
         if test_id in self.routing_rules:
             del self.routing_rules[test_id]
+        self._bump_routing_version()
 
         logger.info(f"Paused A/B test: {test_id}")
         return True
@@ -271,6 +326,7 @@ class ModelTrafficRouter:
         # Add to active tests
         self.redis.sadd("active_ab_tests", test_id)
         self.routing_rules[test_id] = test_config
+        self._bump_routing_version()
 
         logger.info(f"Resumed A/B test: {test_id}")
         return True
@@ -302,6 +358,7 @@ class ModelTrafficRouter:
         self.redis.srem("active_ab_tests", test_id)
         if test_id in self.routing_rules:
             del self.routing_rules[test_id]
+        self._bump_routing_version()
 
         logger.info(f"Completed A/B test: {test_id}, winner: {winner}")
         return True
@@ -319,6 +376,7 @@ class ModelTrafficRouter:
         metrics = {}
 
         for variant in ["model_a", "model_b"]:
+            # Snapshot written by earlier releases, kept as the starting point
             key = f"ab_metrics:{test_id}:{variant}"
             data = self.redis.get(key)
 
@@ -328,6 +386,15 @@ class ModelTrafficRouter:
             else:
                 metrics[variant] = ABTestMetrics(test_id=test_id, variant=variant)
 
+            counters_key = self._counters_key(test_id, variant)
+            counters = defaultdict(float)
+            for field, value in (self.redis.hgetall(counters_key) or {}).items():
+                field = field.decode() if isinstance(field, bytes) else field
+                counters[field] += float(value)
+            for field, value in self._pending_counters.get(counters_key, {}).items():
+                counters[field] += value
+            self._merge_counters(metrics[variant], counters)
+
         return metrics
 
     def record_prediction_result(
@@ -350,51 +417,192 @@ class ModelTrafficRouter:
             custom_metrics: Additional metrics to track
 
         """
-        key = f"ab_metrics:{test_id}:{variant}"
-
-        # Get current metrics
-        data = self.redis.get(key)
-        if data:
-            metrics = ABTestMetrics(**json.loads(data))
-        else:
-            metrics = ABTestMetrics(test_id=test_id, variant=variant)
-
-        # Update metrics
-        metrics.total_requests += 1
-        metrics.total_latency_ms += latency_ms
+        counters = self._pending_counters[self._counters_key(test_id, variant)]
+        counters["total_requests"] += 1
+        counters["total_latency_ms"] += float(latency_ms)
         if success:
-            metrics.successful_predictions += 1
+            counters["successful_predictions"] += 1
         else:
-            metrics.failed_predictions += 1
+            counters["failed_predictions"] += 1
         if cache_hit:
-            metrics.cache_hits += 1
-
-        # Update custom metrics
-        if custom_metrics:
-            for metric_name, value in custom_metrics.items():
-                if metric_name in metrics.custom_metrics:
-                    # Assuming we want to average custom metrics
-                    current_total = metrics.custom_metrics[metric_name] * (
-                        metrics.total_requests - 1
-                    )
-                    metrics.custom_metrics[metric_name] = (
-                        current_total + value
-                    ) / metrics.total_requests
-                else:
-                    metrics.custom_metrics[metric_name] = value
+            counters["cache_hits"] += 1
+
+        # Custom metrics are averaged over the results that report them
+        for metric_name, value in (custom_metrics or {}).items():
+            counters[f"custom:{metric_name}:sum"] += float(value)
+            counters[f"custom:{metric_name}:count"] += 1
 
-        # Save updated metrics
-        self.redis.set(key, json.dumps(asdict(metrics)))
+        if time.monotonic() >= self._next_flush and self.async_redis is None:
+            self.flush_metrics()
+
+    async def record_prediction_result_async(
+        self,
+        test_id: str,
+        variant: str,
+        latency_ms: float,
+        success: bool,
+        cache_hit: bool = False,
+        custom_metrics: Optional[dict[str, float]] = None,
+    ) -> None:
+        """Async variant of ``record_prediction_result``."""
+        self.record_prediction_result(
+            test_id, variant, latency_ms, success, cache_hit, custom_metrics
+        )
+        if self.async_redis is not None and time.monotonic() >= self._next_flush:
+            await self.flush_metrics_async()
+
+    def flush_metrics(self) -> None:
+        """Write accumulated assignment and prediction counters to Redis."""
+        pending = self._take_pending_counters()
+        if not pending:
+            return
+        pipe = self.redis.pipeline(transaction=False)
+        self._queue_counters(pipe, pending)
+        try:
+            pipe.execute()
+        except redis.RedisError as e:
+            logger.warning(f"A/B metrics flush failed, will retry: {str(e)}")
+            self._restore_pending_counters(pending)
+
+    async def flush_metrics_async(self) -> None:
+        """Async variant of ``flush_metrics``."""
+        if self.async_redis is None:
+            self.flush_metrics()
+            return
+        pending = self._take_pending_counters()
+        if not pending:
+            return
+        pipe = self.async_redis.pipeline(transaction=False)
+        self._queue_counters(pipe, pending)
+        try:
+            await pipe.execute()
+        except redis.RedisError as e:
+            logger.warning(f"A/B metrics flush failed, will retry: {str(e)}")
+            self._restore_pending_counters(pending)
+
+    def _take_pending_counters(self) -> dict[str, dict[str, float]]:
+        """Swap out the pending counters so new increments go to a fresh buffer."""
+        self._next_flush = time.monotonic() + self.metrics_flush_seconds
+        pending, self._pending_counters = (
+            self._pending_counters,
+            defaultdict(lambda: defaultdict(int)),
+        )
+        return pending
+
+    def _restore_pending_counters(self, pending: dict[str, dict[str, float]]) -> None:
+        for key, fields in pending.items():
+            counters = self._pending_counters[key]
+            for field, value in fields.items():
+                counters[field] += value
+
+    @staticmethod
+    def _queue_counters(pipe: Any, pending: dict[str, dict[str, float]]) -> None:
+        """Queue atomic increments for every pending counter on ``pipe``."""
+        for key, fields in pending.items():
+            for field, value in fields.items():
+                if isinstance(value, int):
+                    pipe.hincrby(key, field, value)
+                else:
+                    pipe.hincrbyfloat(key, field, value)
+            if key.startswith("ab_assignment_log:"):
+                pipe.expire(key, ASSIGNMENT_LOG_TTL_SECONDS)
+
+    @staticmethod
+    def _counters_key(test_id: str, variant: str) -> str:
+        return f"{METRICS_COUNTERS_KEY_PREFIX}:{test_id}:{variant}"
+
+    @staticmethod
+    def _merge_counters(metrics: ABTestMetrics, counters: dict[str, float]) -> None:
+        """Add flushed counters onto ``metrics`` in place."""
+        previous_requests = metrics.total_requests
+        metrics.total_requests += int(counters.get("total_requests", 0))
+        metrics.successful_predictions += int(counters.get("successful_predictions", 0))
+        metrics.failed_predictions += int(counters.get("failed_predictions", 0))
+        metrics.cache_hits += int(counters.get("cache_hits", 0))
+        metrics.total_latency_ms += counters.get("total_latency_ms", 0.0)
+
+        for field, total in counters.items():
+            if not (field.startswith("custom:") and field.endswith(":sum")):
+                continue
+            metric_name = field[len("custom:") : -len(":sum")]
+            count = counters.get(f"custom:{metric_name}:count", 0)
+            if metric_name in metrics.custom_metrics:
+                # Legacy snapshots averaged custom metrics over all requests
+                total += metrics.custom_metrics[metric_name] * previous_requests
+                count += previous_requests
+            if count:
+                metrics.custom_metrics[metric_name] = total / count
 
     def _load_active_tests(self):
         """Load active A/B tests from Redis."""
         active_test_ids = self.redis.smembers("active_ab_tests")
 
+        # Build the snapshot aside and swap it in, so concurrent routing never
+        # sees a partially loaded table
+        routing_rules = {}
         for test_id in active_test_ids:
             test_id = test_id.decode() if isinstance(test_id, bytes) else test_id
             test_config = self._load_test_config(test_id)
             if test_config and test_config.status == ABTestStatus.ACTIVE:
-                self.routing_rules[test_id] = test_config
+                routing_rules[test_id] = test_config
+        self.routing_rules = routing_rules
+
+    def _read_routing_version(self) -> Optional[bytes]:
+        try:
+            return self.redis.get(ROUTING_VERSION_KEY)
+        except redis.RedisError as e:
+            logger.warning(f"Routing version check failed: {str(e)}")
+            return self._routing_version
+
+    def _refresh_routing(self, version: Optional[bytes]) -> None:
+        """Reload the routing snapshot if the routing version changed."""
+        self._next_refresh = time.monotonic() + self.routing_refresh_seconds
+        if version == self._routing_version:
+            return
+        try:
+            self._load_active_tests()
+        except redis.RedisError as e:
+            logger.warning(f"Routing refresh failed, keeping previous snapshot: {str(e)}")
+            return
+        self._routing_version = version
+
+    def _bump_routing_version(self) -> None:
+        """Tell every router to reload its snapshot on its next refresh."""
+        self.redis.incr(ROUTING_VERSION_KEY)
+
+    def _route(
+        self,
+        request_id: str,
+        model_family: str,
+        user_id: Optional[str],
+        features: Optional[dict[str, Any]],
+    ) -> tuple[str, str]:
+        """Route a request using only the in-memory snapshot."""
+        # Find active test for this model family
+        active_test = self._find_active_test(model_family)
+        if not active_test:
+            # No active test, return default model
+            return self._get_default_model(model_family), ""
+
+        # Check if user is in target segment
+        if not self._is_in_segment(user_id, features, active_test.user_segments):
+            return self._get_default_model(model_family), ""
+
+        # Route based on strategy
+        if active_test.routing_strategy == RoutingStrategy.STICKY and user_id:
+            model_variant = self._get_sticky_assignment(user_id, active_test)
+        elif active_test.routing_strategy == RoutingStrategy.DETERMINISTIC:
+            model_variant = self._get_deterministic_assignment(request_id, active_test)
+        else:  # RANDOM or WEIGHTED
+            model_variant = self._get_random_assignment(active_test)
+
+        # Get actual model ID
+        model_id = active_test.model_a if model_variant == "model_a" else active_test.model_b
+
+        # Record assignment
+        self._record_assignment(request_id, active_test.test_id, model_variant)
+
+        return model_id, active_test.test_id
 
     def _find_active_test(self, model_family: str) -> Optional[ABTestConfig]:
         """Find active test for a model family."""
@@ -412,17 +620,12 @@ class ModelTrafficRouter:
         return None
 
     def _get_sticky_assignment(self, user_id: str, test_config: ABTestConfig) -> str:
-        """Get sticky assignment for a user."""
-        assignment_key = f"ab_assignment:{test_config.test_id}:{user_id}"
-        assignment = self.redis.get(assignment_key)
+        """Get sticky assignment for a user.
 
-        if assignment:
-            return assignment.decode() if isinstance(assignment, bytes) else assignment
-
-        # New assignment
-        variant = self._get_random_assignment(test_config)
-        self.redis.set(assignment_key, variant, ex=86400 * 30)  # 30 days TTL
-        return variant
+        The variant is a pure function of the test and user IDs, so every worker
+        assigns a user identically without storing the assignment.
+        """
+        return self._get_deterministic_assignment(f"{test_config.test_id}:{user_id}", test_config)
 
     def _get_deterministic_assignment(self, request_id: str, test_config: ABTestConfig) -> str:
         """Get deterministic assignment based on request ID."""
@@ -474,9 +677,15 @@ class ModelTrafficRouter:
 
     def _record_assignment(self, request_id: str, test_id: str, variant: str):
         """Record variant assignment for a request."""
-        key = f"ab_assignment_log:{test_id}:{datetime.utcnow().strftime('%Y%m%d')}"
-        self.redis.hincrby(key, variant, 1)
-        self.redis.expire(key, 86400 * 7)  # 7 days TTL
+        key = f"ab_assignment_log:{test_id}:{self._assignment_log_day()}"
+        self._pending_counters[key][variant] += 1
+
+    def _assignment_log_day(self) -> str:
+        """Return the UTC ``YYYYMMDD`` suffix, formatting it once per day."""
+        day = int(time.time() // 86400)
+        if day != self._log_day[0]:
+            self._log_day = (day, datetime.utcnow().strftime("%Y%m%d"))
+        return self._log_day[1]
 
     def _load_test_config(self, test_id: str) -> Optional[ABTestConfig]:
         """Load test configuration from Redis."""
@@ -7,7 +7,8 @@ import logging
 import pickle
 import time
 import zlib
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
+from collections.abc import Callable
 from concurrent.futures import ThreadPoolExecutor
 from dataclasses import asdict, dataclass
 from datetime import datetime
@@ -17,8 +18,14 @@ from typing import Any, Optional, Union
 import numpy as np
 import pandas as pd
 import redis
+import redis.asyncio as redis_asyncio
 from redis.exceptions import RedisError
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
 from .ab_testing import ModelTrafficRouter
 from .model_abstraction import HokusaiModel, ModelFactory
 from .model_registry import HokusaiModelRegistry
@@ -26,6 +33,182 @@ from .model_versioning import Environment, ModelVersionManager
 
 logger = logging.getLogger(__name__)
 
+# Cache accounting lives outside the ``inference:*`` keyspace so scans over cached
+# entries never pick it up.
+CACHE_INDEX_KEY = "inference_cache:index"
+CACHE_EXPIRY_KEY = "inference_cache:expiry"
+CACHE_SIZES_KEY = "inference_cache:sizes"
+CACHE_TOTAL_BYTES_KEY = "inference_cache:total_bytes"
+CACHE_ACCOUNTING_KEYS = (
+    CACHE_INDEX_KEY,
+    CACHE_EXPIRY_KEY,
+    CACHE_SIZES_KEY,
+    CACHE_TOTAL_BYTES_KEY,
+)
+EXPIRED_ENTRY_PRUNE_LIMIT = 100
+CACHE_GENERATION_KEY_PREFIX = "inference_cache:generation:"
+GENERATION_REFRESH_SECONDS = 1.0
+CACHE_KEY_DIGEST_SIZE = 16
+DEFAULT_MAX_BATCH_SIZE = 64
+DEFAULT_MAX_BATCH_WAIT_MS = 2.0
+DEFAULT_ASYNC_REDIS_MAX_CONNECTIONS = 64
+
+
+def _raw_buffer(values: np.ndarray) -> memoryview:
+    """Return a contiguous buffer over ``values``.
+
+    NumPy refuses to export datetime64/timedelta64 buffers, so those are viewed
+    as their underlying int64 ticks; the dtype header keeps units distinct.
+    """
+    if values.dtype.kind in "mM":
+        values = values.view("i8")
+    return np.ascontiguousarray(values).data
+
+
+def _hash_array(hasher: Any, array: np.ndarray) -> None:
+    """Feed an array's dtype, shape and raw buffer into ``hasher``."""
+    hasher.update(f"nd:{array.dtype.str}:{array.shape}|".encode())
+    if array.dtype.hasobject:
+        hasher.update(str(array.tolist()).encode())
+    else:
+        hasher.update(_raw_buffer(array))
+
+
+def _hash_dict(hasher: Any, features: dict[str, Any]) -> None:
+    """Feed a canonical, key-sorted serialization of ``features`` into ``hasher``."""
+    if orjson is not None:
+        try:
+            hasher.update(
+                orjson.dumps(
+                    features,
+                    option=orjson.OPT_SORT_KEYS
+                    | orjson.OPT_NON_STR_KEYS
+                    | orjson.OPT_SERIALIZE_NUMPY,
+                )
+            )
+            return
+        except TypeError:
+            pass
+    hasher.update(json.dumps(features, sort_keys=True).encode())
+
+
+def _hash_dataframe(hasher: Any, frame: pd.DataFrame) -> None:
+    """Feed a DataFrame column by column into ``hasher``.
+
+    Numeric columns contribute their raw buffers; other columns use pandas'
+    vectorized per-row hash. The index is ignored, as row labels do not change
+    the prediction.
+    """
+    hasher.update(f"df:{frame.shape}|".encode())
+    for name, column in frame.items():
+        hasher.update(f"{name!r}:{column.dtype}|".encode())
+        values = column.to_numpy()
+        if values.dtype.kind in "biufcmM":
+            hasher.update(_raw_buffer(values))
+        else:
+            hasher.update(pd.util.hash_pandas_object(column, index=False).to_numpy().data)
+
+
+def create_async_redis_client(
+    redis_url: str,
+    max_connections: int = DEFAULT_ASYNC_REDIS_MAX_CONNECTIONS,
+    pool_timeout: float = 5.0,
+) -> redis_asyncio.Redis:
+    """Create a pooled ``redis.asyncio`` client for the inference hot path.
+
+    The pool blocks for up to ``pool_timeout`` seconds when all connections are
+    in use instead of opening unbounded connections under load. Share one client
+    between the cache manager, traffic router and version manager.
+    """
+    pool = redis_asyncio.BlockingConnectionPool.from_url(
+        redis_url, max_connections=max_connections, timeout=pool_timeout
+    )
+    return redis_asyncio.Redis(connection_pool=pool)
+
+
+def feature_digest(model_id: str, features: Union[np.ndarray, pd.DataFrame, dict]) -> str:
+    """Return a canonical BLAKE2b digest of ``features`` for ``model_id``.
+
+    Arrays and DataFrames are hashed from their binary buffers with dtype and
+    shape headers, so key generation never serializes features to text.
+    """
+    hasher = hashlib.blake2b(model_id.encode(), digest_size=CACHE_KEY_DIGEST_SIZE)
+    if isinstance(features, dict):
+        _hash_dict(hasher, features)
+    elif isinstance(features, pd.DataFrame):
+        _hash_dataframe(hasher, features)
+    else:
+        _hash_array(hasher, np.asarray(features))
+    return hasher.hexdigest()
+
+
+# Store an entry and keep the eviction index, per-entry sizes and running total in
+# step, then evict lowest-scored entries until the cache fits. Every step is
+# O(log n) in the number of cached entries.
+#   KEYS: entry, index zset, expiry zset, sizes hash, total bytes counter
+#   ARGV: value, ttl, size, index score, expires at, now, max bytes, score mode,
+#         prune limit
+# Returns the number of entries evicted.
+CACHE_WRITE_LUA = """
+local entry, index, expiry, sizes, total_key = KEYS[1], KEYS[2], KEYS[3], KEYS[4], KEYS[5]
+local size = tonumber(ARGV[3])
+local max_bytes = tonumber(ARGV[7])
+
+local function forget(key)
+    redis.call('ZREM', index, key)
+    redis.call('ZREM', expiry, key)
+    local old = redis.call('HGET', sizes, key)
+    if old then
+        redis.call('HDEL', sizes, key)
+        redis.call('DECRBY', total_key, old)
+    end
+end
+
+local expired = redis.call('ZRANGEBYSCORE', expiry, '-inf', ARGV[6], 'LIMIT', 0, ARGV[9])
+for _, key in ipairs(expired) do
+    if key ~= entry then
+        forget(key)
+    end
+end
+
+forget(entry)
+redis.call('SET', entry, ARGV[1], 'EX', ARGV[2])
+redis.call('HSET', sizes, entry, size)
+redis.call('ZADD', expiry, ARGV[5], entry)
+local total = redis.call('INCRBY', total_key, size)
+if ARGV[8] == 'incr' then
+    redis.call('ZINCRBY', index, 1, entry)
+else
+    redis.call('ZADD', index, ARGV[4], entry)
+end
+
+local evicted = 0
+local kept_score = nil
+while total > max_bytes do
+    local popped = redis.call('ZPOPMIN', index)
+    if #popped == 0 then
+        break
+    end
+    local victim = popped[1]
+    if victim == entry then
+        kept_score = popped[2]
+    else
+        redis.call('ZREM', expiry, victim)
+        redis.call('DEL', victim)
+        local victim_size = redis.call('HGET', sizes, victim)
+        if victim_size then
+            redis.call('HDEL', sizes, victim)
+            total = redis.call('DECRBY', total_key, victim_size)
+        end
+        evicted = evicted + 1
+    end
+end
+if kept_score then
+    redis.call('ZADD', index, kept_score, entry)
+end
+return evicted
+"""
+
 
 class CacheStrategy(Enum):
     """Caching strategies for inference results."""
@@ -58,19 +241,13 @@ class InferenceRequest:
     timeout_ms: int = 1000
     use_cache: bool = True
 
-    def get_cache_key(self, model_id: str) -> str:
-        """Generate cache key for this request."""
-        # Convert features to consistent format
-        if isinstance(self.features, dict):
-            feature_str = json.dumps(self.features, sort_keys=True)
-        elif isinstance(self.features, pd.DataFrame):
-            feature_str = self.features.to_json(orient="records")
-        else:
-            feature_str = str(self.features.tolist())
+    def get_cache_key(self, model_id: str, generation: int = 0) -> str:
+        """Generate cache key for this request.
 
-        # Create hash
-        content = f"{model_id}:{feature_str}"
-        return f"inference:{hashlib.sha256(content.encode()).hexdigest()}"
+        Keys are namespaced by model and cache generation, so bumping a model's
+        generation orphans its entries without touching other models.
+        """
+        return f"inference:{model_id}:{generation}:{feature_digest(model_id, self.features)}"
 
 
 @dataclass
@@ -99,7 +276,14 @@ class InferenceResponse:
 
 
 class InferenceCacheManager:
-    """Manages caching for model inference with multiple strategies."""
+    """Manages caching for model inference with multiple strategies.
+
+    Entries are indexed in a sorted set scored by the configured strategy: last
+    access time for LRU and ADAPTIVE, hit count for LFU, and expiry time for TTL.
+    A hash of entry sizes and a running byte counter let writes check the size
+    budget without scanning, and eviction removes the lowest-scored entries in
+    the same Lua script as the write.
+    """
 
     def __init__(
         self,
@@ -107,6 +291,8 @@ class InferenceCacheManager:
         cache_strategy: CacheStrategy = CacheStrategy.TTL,
         default_ttl: int = 3600,
         max_cache_size_mb: int = 1024,
+        generation_refresh_seconds: float = GENERATION_REFRESH_SECONDS,
+        async_redis_client: Optional[redis_asyncio.Redis] = None,
     ) -> None:
         """Initialize cache manager.
 
@@ -115,13 +301,71 @@ class InferenceCacheManager:
             cache_strategy: Caching strategy to use
             default_ttl: Default TTL in seconds
             max_cache_size_mb: Maximum cache size in MB
+            generation_refresh_seconds: How long a model's cache generation is
+                reused in process before it is re-read from Redis
+            async_redis_client: Optional asyncio client used by the async lookup
+                and write paths so they never block the event loop
 
         """
         self.redis = redis_client
+        self.async_redis = async_redis_client
         self.cache_strategy = cache_strategy
         self.default_ttl = default_ttl
         self.max_cache_size_mb = max_cache_size_mb
+        self.generation_refresh_seconds = generation_refresh_seconds
         self._cache_stats = defaultdict(int)
+        self._model_stats: dict[str, defaultdict] = defaultdict(lambda: defaultdict(int))
+        self._generations: dict[str, tuple[float, int]] = {}
+        self._write_script = None
+        self._async_write_script = None
+
+    def get_cache_key(self, request: InferenceRequest, model_id: str) -> str:
+        """Build the cache key for a request in the model's current generation."""
+        return request.get_cache_key(model_id, generation=self.get_model_generation(model_id))
+
+    async def get_cache_key_async(self, request: InferenceRequest, model_id: str) -> str:
+        """Build the cache key like ``get_cache_key`` without blocking the event loop."""
+        generation = await self.get_model_generation_async(model_id)
+        return request.get_cache_key(model_id, generation=generation)
+
+    def get_model_generation(self, model_id: str) -> int:
+        """Return the model's cache generation, re-reading Redis at most once per refresh."""
+        cached = self._generations.get(model_id)
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1]
+
+        try:
+            generation = int(self.redis.get(f"{CACHE_GENERATION_KEY_PREFIX}{model_id}") or 0)
+        except RedisError as e:
+            logger.error(f"Cache generation lookup error: {str(e)}")
+            generation = cached[1] if cached is not None else 0
+
+        return self._remember_generation(model_id, generation)
+
+    async def get_model_generation_async(self, model_id: str) -> int:
+        """Async variant of ``get_model_generation``."""
+        if self.async_redis is None:
+            return self.get_model_generation(model_id)
+
+        cached = self._generations.get(model_id)
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1]
+
+        try:
+            value = await self.async_redis.get(f"{CACHE_GENERATION_KEY_PREFIX}{model_id}")
+            generation = int(value or 0)
+        except RedisError as e:
+            logger.error(f"Cache generation lookup error: {str(e)}")
+            generation = cached[1] if cached is not None else 0
+
+        return self._remember_generation(model_id, generation)
+
+    def _remember_generation(self, model_id: str, generation: int) -> int:
+        self._generations[model_id] = (
+            time.monotonic() + self.generation_refresh_seconds,
+            generation,
+        )
+        return generation
 
     async def get_cached_prediction(self, cache_key: str) -> Optional[np.ndarray]:
         """Retrieve cached prediction if available.
@@ -134,20 +378,29 @@ class InferenceCacheManager:
 
         """
         try:
-            # Get from cache
-            cached_data = self.redis.get(cache_key)
+            # Get from cache and bump its eviction score in one round-trip
+            if self.async_redis is not None:
+                pipe = self.async_redis.pipeline(transaction=False)
+                pipe.get(cache_key)
+                self._update_access_stats(pipe, cache_key)
+                cached_data = (await pipe.execute())[0]
+            else:
+                pipe = self.redis.pipeline(transaction=False)
+                pipe.get(cache_key)
+                self._update_access_stats(pipe, cache_key)
+                cached_data = pipe.execute()[0]
+            model_stats = self._model_stats[self._model_id_from_key(cache_key)]
             if not cached_data:
                 self._cache_stats["misses"] += 1
+                model_stats["misses"] += 1
                 return None
 
-            # Update access statistics
-            self._update_access_stats(cache_key)
-
             # Decompress and deserialize
             decompressed = zlib.decompress(cached_data)
             prediction = pickle.loads(decompressed)
 
             self._cache_stats["hits"] += 1
+            model_stats["hits"] += 1
             return prediction
 
         except (RedisError, pickle.PickleError, zlib.error) as e:
@@ -180,14 +433,15 @@ class InferenceCacheManager:
                 logger.warning(f"Prediction too large to cache: {size_mb:.2f}MB")
                 return False
 
-            # Store with TTL
+            # Store with TTL, update size accounting and evict if over budget
             ttl = ttl or self.default_ttl
-            self.redis.setex(cache_key, ttl, compressed)
-
-            # Update cache size tracking
-            self._track_cache_size(cache_key, len(compressed))
+            if self.async_redis is not None:
+                evicted = await self._store_entry_async(cache_key, compressed, ttl)
+            else:
+                evicted = self._store_entry(cache_key, compressed, ttl)
 
             self._cache_stats["writes"] += 1
+            self._cache_stats["evictions"] += evicted
             return True
 
         except (RedisError, pickle.PickleError) as e:
@@ -198,25 +452,22 @@ class InferenceCacheManager:
     def invalidate_model_cache(self, model_id: str) -> int:
         """Invalidate all cache entries for a model.
 
+        Bumps the model's cache generation, so lookups move to a fresh key
+        namespace while other models keep their entries. Orphaned entries age out
+        through their TTL or are evicted first as the least recently used.
+
         Args:
             model_id: Model identifier
 
         Returns:
-            Number of entries invalidated
+            The model's new cache generation
 
         """
-        pattern = "inference:*"
-        invalidated = 0
+        generation = int(self.redis.incr(f"{CACHE_GENERATION_KEY_PREFIX}{model_id}"))
+        self._remember_generation(model_id, generation)
 
-        # Scan for matching keys
-        for key in self.redis.scan_iter(match=pattern):
-            # Check if this key is for the specified model
-            # This would require storing model_id in cache metadata
-            self.redis.delete(key)
-            invalidated += 1
-
-        logger.info(f"Invalidated {invalidated} cache entries for model {model_id}")
-        return invalidated
+        logger.info(f"Invalidated cache for model {model_id} (generation {generation})")
+        return generation
 
     def get_cache_stats(self) -> dict[str, Any]:
         """Get cache statistics.
@@ -233,9 +484,20 @@ class InferenceCacheManager:
             "misses": self._cache_stats["misses"],
             "errors": self._cache_stats["errors"],
             "writes": self._cache_stats["writes"],
+            "evictions": self._cache_stats["evictions"],
             "hit_rate": hit_rate,
             "total_requests": total_requests,
             "cache_size_mb": self._get_total_cache_size_mb(),
+            "models": {
+                model_id: {
+                    "hits": stats["hits"],
+                    "misses": stats["misses"],
+                    "hit_rate": stats["hits"] / (stats["hits"] + stats["misses"])
+                    if stats["hits"] + stats["misses"] > 0
+                    else 0,
+                }
+                for model_id, stats in self._model_stats.items()
+            },
         }
 
     def clear_cache(self) -> int:
@@ -251,69 +513,99 @@ class InferenceCacheManager:
         for key in self.redis.scan_iter(match=pattern):
             self.redis.delete(key)
             cleared += 1
+        self.redis.delete(*CACHE_ACCOUNTING_KEYS)
 
         self._cache_stats.clear()
+        self._model_stats.clear()
         logger.info(f"Cleared {cleared} cache entries")
         return cleared
 
-    def _update_access_stats(self, cache_key: str):
-        """Update access statistics for cache entry."""
+    @staticmethod
+    def _model_id_from_key(cache_key: str) -> str:
+        """Extract the model ID from an ``inference:{model_id}:{generation}:{digest}`` key."""
+        parts = cache_key.split(":", 1)[-1].rsplit(":", 2)
+        return parts[0] if len(parts) == 3 else "unknown"
+
+    def _update_access_stats(self, pipe: Any, cache_key: str) -> None:
+        """Queue the eviction-score update for an accessed entry on ``pipe``.
+
+        ``XX`` only touches entries already in the index, so misses are no-ops.
+        """
         if self.cache_strategy == CacheStrategy.LFU:
-            # Increment frequency counter
-            freq_key = f"{cache_key}:freq"
-            self.redis.incr(freq_key)
-        elif self.cache_strategy == CacheStrategy.LRU:
-            # Update last access time
-            access_key = f"{cache_key}:access"
-            self.redis.set(access_key, int(time.time()))
-
-    def _track_cache_size(self, cache_key: str, size_bytes: int):
-        """Track cache entry size."""
-        size_key = f"{cache_key}:size"
-        self.redis.set(size_key, size_bytes)
-
-        # Check if eviction needed
-        if self._get_total_cache_size_mb() > self.max_cache_size_mb:
-            self._evict_entries()
+            pipe.zadd(CACHE_INDEX_KEY, {cache_key: 1}, xx=True, incr=True)
+        elif self.cache_strategy in (CacheStrategy.LRU, CacheStrategy.ADAPTIVE):
+            pipe.zadd(CACHE_INDEX_KEY, {cache_key: time.time()}, xx=True)
 
-    def _get_total_cache_size_mb(self) -> float:
-        """Get total cache size in MB."""
-        total_bytes = 0
-        for key in self.redis.scan_iter(match="inference:*:size"):
-            size = self.redis.get(key)
-            if size:
-                total_bytes += int(size)
-        return total_bytes / (1024 * 1024)
-
-    def _evict_entries(self):
-        """Evict cache entries based on strategy."""
-        # Simple implementation - evict oldest entries
-        # In production, implement proper LRU/LFU eviction
-        pattern = "inference:*"
-        entries = []
+    def _store_entry(self, cache_key: str, value: bytes, ttl: int) -> int:
+        """Write an entry and evict over-budget entries atomically.
 
-        for key in self.redis.scan_iter(match=pattern):
-            if not key.endswith(b":size") and not key.endswith(b":freq"):
-                entries.append(key)
+        Returns:
+            Number of entries evicted
 
-        # Delete 10% of entries
-        to_delete = max(1, len(entries) // 10)
-        for key in entries[:to_delete]:
-            self.redis.delete(key)
-            # Also delete metadata keys
-            self.redis.delete(f"{key}:size")
-            self.redis.delete(f"{key}:freq")
-            self.redis.delete(f"{key}:access")
+        """
+        if self._write_script is None:
+            self._write_script = self.redis.register_script(CACHE_WRITE_LUA)
+
+        return int(self._write_script(**self._write_script_params(cache_key, value, ttl)))
+
+    async def _store_entry_async(self, cache_key: str, value: bytes, ttl: int) -> int:
+        """Async variant of ``_store_entry`` using the asyncio client."""
+        if self._async_write_script is None:
+            self._async_write_script = self.async_redis.register_script(CACHE_WRITE_LUA)
+
+        params = self._write_script_params(cache_key, value, ttl)
+        return int(await self._async_write_script(**params))
+
+    def _write_script_params(self, cache_key: str, value: bytes, ttl: int) -> dict[str, list]:
+        """Build the keys and arguments for ``CACHE_WRITE_LUA``."""
+        now = time.time()
+        expires_at = now + ttl
+        if self.cache_strategy == CacheStrategy.TTL:
+            score = expires_at
+        else:
+            score = now
+        score_mode = "incr" if self.cache_strategy == CacheStrategy.LFU else "set"
+
+        return {
+            "keys": [cache_key, *CACHE_ACCOUNTING_KEYS],
+            "args": [
+                value,
+                ttl,
+                len(value),
+                score,
+                expires_at,
+                now,
+                int(self.max_cache_size_mb * 1024 * 1024),
+                score_mode,
+                EXPIRED_ENTRY_PRUNE_LIMIT,
+            ],
+        }
+
+    def _get_total_cache_size_mb(self) -> float:
+        """Get total cache size in MB."""
+        total_bytes = self.redis.get(CACHE_TOTAL_BYTES_KEY)
+        return int(total_bytes or 0) / (1024 * 1024)
 
 
 class ModelLoader:
-    """Handles model loading and caching in memory."""
+    """Handles model loading and caching in memory.
+
+    Concurrent requests for the same model share a single load, which runs in a
+    dedicated thread pool so the event loop is never blocked by MLflow. Loaded
+    models are kept in an LRU bounded by count and, optionally, by estimated
+    bytes. When the version manager promotes a version into
+    ``prefetch_environment``, that version is loaded in the background so the
+    first requests after a deploy do not pay for a cold start.
+    """
 
     def __init__(
         self,
         registry: HokusaiModelRegistry,
         version_manager: ModelVersionManager,
         max_models_in_memory: int = 10,
+        max_memory_bytes: Optional[int] = None,
+        prefetch_environment: Optional[Environment] = Environment.PRODUCTION,
+        load_workers: int = 2,
     ) -> None:
         """Initialize model loader.
 
@@ -321,13 +613,29 @@ class ModelLoader:
             registry: Model registry
             version_manager: Version manager
             max_models_in_memory: Maximum models to keep in memory
+            max_memory_bytes: Optional budget for the estimated size of cached models
+            prefetch_environment: Environment whose promotions trigger a background
+                load, or None to disable prefetching
+            load_workers: Threads dedicated to model loading
 
         """
         self.registry = registry
         self.version_manager = version_manager
         self.max_models_in_memory = max_models_in_memory
-        self._model_cache = {}
-        self._load_times = {}
+        self.max_memory_bytes = max_memory_bytes
+        self.prefetch_environment = prefetch_environment
+        self._model_cache: OrderedDict[str, HokusaiModel] = OrderedDict()
+        self._model_sizes: dict[str, int] = {}
+        self._total_bytes = 0
+        self._inflight: dict[str, asyncio.Task] = {}
+        self._executor = ThreadPoolExecutor(
+            max_workers=load_workers, thread_name_prefix="model-loader"
+        )
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._prefetch_tasks: set[asyncio.Task] = set()
+
+        if prefetch_environment is not None and hasattr(version_manager, "add_promotion_listener"):
+            version_manager.add_promotion_listener(self._on_version_promoted)
 
     async def load_model(
         self,
@@ -346,9 +654,13 @@ class ModelLoader:
             Loaded model
 
         """
+        self._loop = asyncio.get_running_loop()
+
         # Determine version
         if not version:
-            active_version = self.version_manager.get_active_version(model_family, environment)
+            active_version = await self.version_manager.get_active_version_async(
+                model_family, environment
+            )
             if not active_version:
                 raise ValueError(f"No active version for {model_family} in {environment.value}")
             version = active_version.version
@@ -356,13 +668,76 @@ class ModelLoader:
         model_key = f"{model_family}/{version}"
 
         # Check memory cache
-        if model_key in self._model_cache:
-            self._load_times[model_key] = time.time()
-            return self._model_cache[model_key]
+        model = self._model_cache.get(model_key)
+        if model is not None:
+            self._model_cache.move_to_end(model_key)
+            return model
+
+        # Join an in-flight load or start one
+        task = self._inflight.get(model_key)
+        if task is None:
+            task = self._loop.create_task(self._load(model_key, model_family, version))
+            self._inflight[model_key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(model_key, None))
 
-        # Load model
+        # Shield so one caller timing out does not abort the load for the others
+        return await asyncio.shield(task)
+
+    def prefetch(self, model_family: str, version: str) -> Optional[asyncio.Task]:
+        """Start loading a model in the background if it is not already cached.
+
+        Safe to call from any thread once the loader has served a request.
+        """
+        if f"{model_family}/{version}" in self._model_cache:
+            return None
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+
+        if loop is None:
+            if self._loop is None or self._loop.is_closed():
+                logger.debug(f"Skipping prefetch of {model_family}/{version}: no event loop")
+                return None
+            self._loop.call_soon_threadsafe(self.prefetch, model_family, version)
+            return None
+
+        task = loop.create_task(self._prefetch(model_family, version))
+        self._prefetch_tasks.add(task)
+        task.add_done_callback(self._prefetch_tasks.discard)
+        return task
+
+    async def _prefetch(self, model_family: str, version: str) -> None:
+        try:
+            await self.load_model(model_family, version)
+            logger.info(f"Prefetched model {model_family}/{version}")
+        except Exception as e:
+            logger.warning(f"Prefetch of {model_family}/{version} failed: {str(e)}")
+
+    def _on_version_promoted(
+        self, model_family: str, version_tag: str, environment: Environment
+    ) -> None:
+        if environment == self.prefetch_environment:
+            self.prefetch(model_family, version_tag)
+
+    async def _load(self, model_key: str, model_family: str, version: str) -> HokusaiModel:
         start_time = time.time()
+        loop = asyncio.get_running_loop()
+        model, size_bytes = await loop.run_in_executor(
+            self._executor, self._load_sync, model_key, model_family, version
+        )
 
+        load_time = time.time() - start_time
+        logger.info(f"Loaded model {model_key} in {load_time:.2f}s")
+
+        # Cache model
+        self._cache_model(model_key, model, size_bytes)
+
+        return model
+
+    def _load_sync(self, model_key: str, model_family: str, version: str) -> tuple:
+        """Fetch and wrap a model; runs on the loader thread pool."""
         # Get model metadata
         model_version = self.version_manager.get_version(model_family, version)
         if not model_version:
@@ -381,26 +756,197 @@ class ModelLoader:
             metadata=model_version.metadata,
         )
 
-        load_time = time.time() - start_time
-        logger.info(f"Loaded model {model_key} in {load_time:.2f}s")
+        return model, self._estimate_size(model_version.metadata, mlflow_model)
 
-        # Cache model
-        self._cache_model(model_key, model)
+    def _estimate_size(self, metadata: Optional[dict], model_instance: Any) -> int:
+        """Estimate a model's in-memory size in bytes.
 
-        return model
+        Uses ``model_size_bytes`` from the version metadata when present. Otherwise
+        the pickled size is used, but only when a memory budget is configured.
+        """
+        if metadata and metadata.get("model_size_bytes"):
+            return int(metadata["model_size_bytes"])
+        if self.max_memory_bytes is None:
+            return 0
+        try:
+            return len(pickle.dumps(model_instance, protocol=pickle.HIGHEST_PROTOCOL))
+        except Exception:
+            return 0
 
-    def _cache_model(self, model_key: str, model: HokusaiModel):
-        """Cache model in memory with eviction."""
-        # Check if eviction needed
-        if len(self._model_cache) >= self.max_models_in_memory:
-            # Evict least recently used
-            oldest_key = min(self._load_times, key=self._load_times.get)
-            del self._model_cache[oldest_key]
-            del self._load_times[oldest_key]
+    def _cache_model(self, model_key: str, model: HokusaiModel, size_bytes: int = 0):
+        """Cache model in memory with LRU eviction."""
+        if model_key in self._model_cache:
+            self._total_bytes -= self._model_sizes.pop(model_key, 0)
+            del self._model_cache[model_key]
+
+        # Evict least recently used until the new model fits
+        while self._model_cache and (
+            len(self._model_cache) >= self.max_models_in_memory
+            or (
+                self.max_memory_bytes is not None
+                and self._total_bytes + size_bytes > self.max_memory_bytes
+            )
+        ):
+            oldest_key, _ = self._model_cache.popitem(last=False)
+            self._total_bytes -= self._model_sizes.pop(oldest_key, 0)
             logger.info(f"Evicted model {oldest_key} from memory")
 
         self._model_cache[model_key] = model
-        self._load_times[model_key] = time.time()
+        self._model_sizes[model_key] = size_bytes
+        self._total_bytes += size_bytes
+
+
+@dataclass
+class _QueuedPrediction:
+    """One caller's features waiting to be folded into a micro-batch."""
+
+    features: Union[np.ndarray, pd.DataFrame]
+    rows: int
+    future: asyncio.Future
+
+
+class MicroBatcher:
+    """Coalesce concurrent predictions for the same model into one ``predict`` call.
+
+    Requests are grouped by model, model method (``predict`` or
+    ``predict_proba``) and feature layout. A group is flushed when it
+    reaches ``max_batch_size`` rows or ``max_wait_ms`` after its first request,
+    whichever comes first. The stacked features are predicted in a single
+    executor call and the output rows are scattered back to each caller. If the
+    vectorized call fails or returns an unexpected number of rows, the batch is
+    retried one request at a time so a single bad input cannot fail its peers.
+    """
+
+    def __init__(
+        self,
+        executor: ThreadPoolExecutor,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        max_wait_ms: float = DEFAULT_MAX_BATCH_WAIT_MS,
+    ) -> None:
+        """Initialize micro-batcher.
+
+        Args:
+            executor: Thread pool that runs model predictions
+            max_batch_size: Maximum number of rows per vectorized call
+            max_wait_ms: Maximum time a request waits for peers before flushing
+
+        """
+        self.executor = executor
+        self.max_batch_size = max_batch_size
+        self.max_wait_ms = max_wait_ms
+        self._queues: dict[tuple, list[_QueuedPrediction]] = {}
+        self._models: dict[tuple, HokusaiModel] = {}
+        self._timers: dict[tuple, asyncio.TimerHandle] = {}
+        self._tasks: set[asyncio.Task] = set()
+        self._stats = defaultdict(int)
+
+    @staticmethod
+    def batch_signature(features: Any) -> Optional[tuple]:
+        """Return a key identifying features that can be stacked, or None if unbatchable."""
+        if isinstance(features, pd.DataFrame):
+            return ("df", tuple(features.columns), tuple(str(t) for t in features.dtypes))
+        if isinstance(features, np.ndarray) and features.ndim >= 2 and not features.dtype.hasobject:
+            return ("nd", features.dtype.str, features.shape[1:])
+        return None
+
+    async def submit(
+        self,
+        model_id: str,
+        model: HokusaiModel,
+        features: Union[np.ndarray, pd.DataFrame],
+        method: str = "predict",
+    ) -> np.ndarray:
+        """Queue features for ``model.<method>`` and wait for this request's output slice."""
+        signature = self.batch_signature(features)
+        if signature is None:
+            raise ValueError("Features cannot be micro-batched")
+
+        loop = asyncio.get_running_loop()
+        group = (model_id, method, signature)
+        queued = _QueuedPrediction(features, len(features), loop.create_future())
+        queue = self._queues.setdefault(group, [])
+        self._models.setdefault(group, model)
+        queue.append(queued)
+
+        if sum(item.rows for item in queue) >= self.max_batch_size:
+            self._flush(group)
+        elif group not in self._timers:
+            self._timers[group] = loop.call_later(self.max_wait_ms / 1000.0, self._flush, group)
+
+        return await queued.future
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get micro-batching statistics."""
+        batches = self._stats["batches"]
+        return {
+            "batches": batches,
+            "batched_requests": self._stats["requests"],
+            "avg_batch_size": self._stats["requests"] / batches if batches else 0,
+            "fallbacks": self._stats["fallbacks"],
+        }
+
+    def _flush(self, group: tuple) -> None:
+        timer = self._timers.pop(group, None)
+        if timer is not None:
+            timer.cancel()
+        items = [item for item in self._queues.pop(group, []) if not item.future.done()]
+        model = self._models.pop(group, None)
+        if not items:
+            return
+
+        task = asyncio.get_running_loop().create_task(self._run_batch(model, group[1], items))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run_batch(
+        self, model: HokusaiModel, method: str, items: list[_QueuedPrediction]
+    ) -> None:
+        self._stats["batches"] += 1
+        self._stats["requests"] += len(items)
+        loop = asyncio.get_running_loop()
+        try:
+            results = await loop.run_in_executor(
+                self.executor, self._predict_items, getattr(model, method), items
+            )
+        except Exception as e:
+            results = [e] * len(items)
+
+        for item, result in zip(items, results):
+            if item.future.done():
+                continue
+            if isinstance(result, Exception):
+                item.future.set_exception(result)
+            else:
+                item.future.set_result(result)
+
+    def _predict_items(
+        self, predict: Callable[[Any], Any], items: list[_QueuedPrediction]
+    ) -> list[Union[np.ndarray, Exception]]:
+        """Predict a batch in one call, falling back to per-request calls on failure."""
+        if len(items) > 1:
+            try:
+                if isinstance(items[0].features, pd.DataFrame):
+                    stacked = pd.concat([item.features for item in items], ignore_index=True)
+                else:
+                    stacked = np.concatenate([item.features for item in items])
+                output = np.asarray(predict(stacked))
+                if len(output) == len(stacked):
+                    offsets = np.cumsum([item.rows for item in items])[:-1]
+                    return np.split(output, offsets)
+                logger.warning(
+                    f"Batched prediction returned {len(output)} rows for {len(stacked)} inputs"
+                )
+            except Exception as e:
+                logger.warning(f"Batched prediction failed, retrying individually: {str(e)}")
+            self._stats["fallbacks"] += 1
+
+        results = []
+        for item in items:
+            try:
+                results.append(predict(item.features))
+            except Exception as e:
+                results.append(e)
+        return results
 
 
 class HokusaiInferencePipeline:
@@ -414,6 +960,10 @@ class HokusaiInferencePipeline:
         cache_manager: InferenceCacheManager,
         redis_client: redis.Redis,
         enable_fallback: bool = True,
+        enable_micro_batching: bool = True,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        max_batch_wait_ms: float = DEFAULT_MAX_BATCH_WAIT_MS,
+        async_redis_client: Optional[redis_asyncio.Redis] = None,
     ) -> None:
         """Initialize inference pipeline.
 
@@ -424,6 +974,12 @@ class HokusaiInferencePipeline:
             cache_manager: Cache manager
             redis_client: Redis client
             enable_fallback: Enable fallback to previous version on error
+            enable_micro_batching: Coalesce concurrent requests for the same model
+            max_batch_size: Maximum rows per micro-batch
+            max_batch_wait_ms: Maximum time a request waits to be batched
+            async_redis_client: Optional asyncio client for metrics writes; pass the
+                same client to the cache manager, traffic router and version
+                manager to keep ``predict`` off the synchronous Redis client
 
         """
         self.registry = model_registry
@@ -431,6 +987,7 @@ class HokusaiInferencePipeline:
         self.router = traffic_router
         self.cache = cache_manager
         self.redis = redis_client
+        self.async_redis = async_redis_client
         self.enable_fallback = enable_fallback
 
         # Initialize model loader
@@ -441,6 +998,11 @@ class HokusaiInferencePipeline:
 
         # Thread pool for parallel operations
         self._executor = ThreadPoolExecutor(max_workers=4)
+        self.batcher = (
+            MicroBatcher(self._executor, max_batch_size, max_batch_wait_ms)
+            if enable_micro_batching
+            else None
+        )
 
     async def predict(self, request: InferenceRequest) -> InferenceResponse:
         """Main prediction endpoint with caching and routing.
@@ -456,7 +1018,7 @@ class HokusaiInferencePipeline:
 
         try:
             # 1. Determine which model to use (A/B testing)
-            model_id, ab_test_id = self.router.route_request(
+            model_id, ab_test_id = await self.router.route_request_async(
                 request.request_id, request.model_family, request.user_id, request.request_metadata
             )
 
@@ -466,7 +1028,7 @@ class HokusaiInferencePipeline:
             # 2. Check cache if enabled
             cache_key = None
             if request.use_cache:
-                cache_key = request.get_cache_key(model_id)
+                cache_key = await self.cache.get_cache_key_async(request, model_id)
                 cached_prediction = await self.cache.get_cached_prediction(cache_key)
 
                 if cached_prediction is not None:
@@ -474,7 +1036,7 @@ class HokusaiInferencePipeline:
 
                     # Record metrics
                     if ab_test_id:
-                        self.router.record_prediction_result(
+                        await self.router.record_prediction_result_async(
                             ab_test_id,
                             self._get_ab_variant(model_id, ab_test_id),
                             latency_ms,
@@ -497,9 +1059,9 @@ class HokusaiInferencePipeline:
             # 3. Load model
             model = await self.model_loader.load_model(model_family, model_version)
 
-            # 4. Make prediction
+            # 4. Make prediction (coalesced with concurrent requests when possible)
             prediction = await self._predict_with_timeout(
-                model, request.features, request.timeout_ms
+                model, request.features, request.timeout_ms, model_id=model_id
             )
 
             # 5. Cache result if enabled
@@ -510,10 +1072,10 @@ class HokusaiInferencePipeline:
             latency_ms = (time.time() - start_time) * 1000
 
             # 7. Record metrics
-            self._record_metrics(model_id, latency_ms, InferenceStatus.SUCCESS)
+            await self._record_metrics_async(model_id, latency_ms, InferenceStatus.SUCCESS)
 
             if ab_test_id:
-                self.router.record_prediction_result(
+                await self.router.record_prediction_result_async(
                     ab_test_id, self._get_ab_variant(model_id, ab_test_id), latency_ms, True, False
                 )
 
@@ -521,7 +1083,7 @@ class HokusaiInferencePipeline:
             confidence = None
             if hasattr(model, "predict_proba"):
                 try:
-                    proba = model.predict_proba(request.features)
+                    proba = await self._predict_proba(model, request.features, model_id)
                     confidence = float(np.max(proba))
                 except Exception:
                     pass
@@ -547,6 +1109,9 @@ class HokusaiInferencePipeline:
     async def predict_batch(self, requests: list[InferenceRequest]) -> list[InferenceResponse]:
         """Batch prediction with parallel processing.
 
+        Requests resolving to the same model are coalesced by the micro-batcher
+        into vectorized ``predict`` calls.
+
         Args:
             requests: List of inference requests
 
@@ -648,27 +1213,54 @@ class HokusaiInferencePipeline:
             else 0,
             "cache_stats": self.cache.get_cache_stats(),
             "models_in_memory": len(self.model_loader._model_cache),
+            "model_memory_bytes": self.model_loader._total_bytes,
+            "micro_batching": self.batcher.get_stats() if self.batcher else None,
         }
 
     async def _predict_with_timeout(
-        self, model: HokusaiModel, features: Union[np.ndarray, pd.DataFrame], timeout_ms: int
+        self,
+        model: HokusaiModel,
+        features: Union[np.ndarray, pd.DataFrame],
+        timeout_ms: int,
+        model_id: Optional[str] = None,
     ) -> np.ndarray:
         """Make prediction with timeout."""
+        timeout_seconds = timeout_ms / 1000.0
+
+        if (
+            self.batcher is not None
+            and model_id is not None
+            and MicroBatcher.batch_signature(features) is not None
+        ):
+            return await asyncio.wait_for(
+                self.batcher.submit(model_id, model, features), timeout=timeout_seconds
+            )
+
         loop = asyncio.get_event_loop()
 
         # Run prediction in thread pool
         future = loop.run_in_executor(self._executor, model.predict, features)
 
         # Wait with timeout
-        timeout_seconds = timeout_ms / 1000.0
         return await asyncio.wait_for(future, timeout=timeout_seconds)
 
+    async def _predict_proba(
+        self, model: HokusaiModel, features: Union[np.ndarray, pd.DataFrame], model_id: str
+    ) -> np.ndarray:
+        """Get class probabilities, coalesced with concurrent requests when possible."""
+        if self.batcher is not None and MicroBatcher.batch_signature(features) is not None:
+            return await self.batcher.submit(model_id, model, features, method="predict_proba")
+
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor, model.predict_proba, features
+        )
+
     async def _handle_timeout(
         self, request: InferenceRequest, model_id: str, start_time: float
     ) -> InferenceResponse:
         """Handle prediction timeout."""
         latency_ms = (time.time() - start_time) * 1000
-        self._record_metrics(model_id, latency_ms, InferenceStatus.TIMEOUT)
+        await self._record_metrics_async(model_id, latency_ms, InferenceStatus.TIMEOUT)
 
         # Try fallback if enabled
         if self.enable_fallback:
@@ -690,7 +1282,7 @@ class HokusaiInferencePipeline:
         """Handle prediction error."""
         latency_ms = (time.time() - start_time) * 1000
         logger.error(f"Prediction error for {model_id}: {str(error)}")
-        self._record_metrics(model_id, latency_ms, InferenceStatus.ERROR)
+        await self._record_metrics_async(model_id, latency_ms, InferenceStatus.ERROR)
 
         # Try fallback if enabled
         if self.enable_fallback:
@@ -713,7 +1305,9 @@ class HokusaiInferencePipeline:
         try:
             # Get previous version
             model_family, _ = self._parse_model_id(failed_model_id)
-            versions = self.version_manager.get_version_history(model_family, limit=2)
+            versions = await asyncio.get_running_loop().run_in_executor(
+                self._executor, self.version_manager.get_version_history, model_family, 2
+            )
 
             if len(versions) < 2:
                 raise ValueError("No fallback version available")
@@ -731,7 +1325,7 @@ class HokusaiInferencePipeline:
             )
 
             latency_ms = (time.time() - start_time) * 1000
-            self._record_metrics(failed_model_id, latency_ms, InferenceStatus.FALLBACK)
+            await self._record_metrics_async(failed_model_id, latency_ms, InferenceStatus.FALLBACK)
 
             return InferenceResponse(
                 request_id=request.request_id,
@@ -777,3 +1371,23 @@ class HokusaiInferencePipeline:
         self.redis.hincrby(metric_key, f"{status.value}_count", 1)
         self.redis.hincrbyfloat(metric_key, "total_latency_ms", latency_ms)
         self.redis.expire(metric_key, 86400 * 7)  # 7 days TTL
+
+    async def _record_metrics_async(
+        self, model_id: str, latency_ms: float, status: InferenceStatus
+    ) -> None:
+        """Record inference metrics in a single pipelined round-trip."""
+        if self.async_redis is None:
+            self._record_metrics(model_id, latency_ms, status)
+            return
+
+        self._metrics[status] += 1
+
+        metric_key = f"inference_metrics:{model_id}:{datetime.utcnow().strftime('%Y%m%d%H')}"
+        pipe = self.async_redis.pipeline(transaction=False)
+        pipe.hincrby(metric_key, f"{status.value}_count", 1)
+        pipe.hincrbyfloat(metric_key, "total_latency_ms", latency_ms)
+        pipe.expire(metric_key, 86400 * 7)  # 7 days TTL
+        try:
+            await pipe.execute()
+        except RedisError as e:
+            logger.error(f"Metrics write error: {str(e)}")
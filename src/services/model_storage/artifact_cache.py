@@ -0,0 +1,410 @@
+"""Persistent model artifact cache and bounded in-memory model cache.
+
+Artifacts downloaded from HuggingFace are stored once per content hash under
+``blobs/sha256/<hex>`` and referenced from ``refs/<repo>/<revision>/<file>.json``,
+so process restarts and in-memory evictions reuse the file on disk instead of
+downloading it again. Writes go through a temporary file on the same filesystem
+and ``os.replace``, and a per-artifact file lock keeps concurrent processes from
+downloading the same file twice.
+
+Whole-repository snapshots keep huggingface_hub's own layout under
+``snapshots/``; each repository directory there counts toward the same size
+budget and is evicted as a unit alongside blobs.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import shutil
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Optional
+from urllib.parse import quote
+
+from filelock import FileLock
+from huggingface_hub import get_hf_file_metadata, hf_hub_download, hf_hub_url, snapshot_download
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ARTIFACT_CACHE_DIR = os.path.join(
+    os.path.expanduser("~"), ".cache", "hokusai", "model-artifacts"
+)
+DEFAULT_ARTIFACT_CACHE_MAX_BYTES = 10 * 1024**3
+DEFAULT_REF_TTL_SECONDS = 3600.0
+_COMMIT_HASH_RE = re.compile(r"^[0-9a-f]{40}$")
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+
+class ModelArtifactCache:
+    """Content-addressed, size-bounded on-disk cache for model artifacts.
+
+    A reference pinned to a commit hash is trusted indefinitely. A reference to a
+    branch such as ``main`` is revalidated with a metadata request once it is
+    older than ``ref_ttl_seconds``; the cached file is still served if the Hub is
+    unreachable. Least recently used blobs and snapshot repositories are evicted
+    once the cache exceeds ``max_bytes``.
+    """
+
+    def __init__(
+        self,
+        root_dir: Optional[str] = None,
+        max_bytes: Optional[int] = None,
+        ref_ttl_seconds: float = DEFAULT_REF_TTL_SECONDS,
+    ) -> None:
+        """Initialize the artifact cache.
+
+        Args:
+        ----
+            root_dir: Cache directory (defaults to ``MODEL_ARTIFACT_CACHE_DIR``)
+            max_bytes: Size budget (defaults to ``MODEL_ARTIFACT_CACHE_MAX_BYTES``)
+            ref_ttl_seconds: How long a branch reference is trusted before revalidation
+
+        """
+        self.root = Path(
+            root_dir or os.getenv("MODEL_ARTIFACT_CACHE_DIR", DEFAULT_ARTIFACT_CACHE_DIR)
+        )
+        self.max_bytes = int(
+            max_bytes
+            if max_bytes is not None
+            else os.getenv("MODEL_ARTIFACT_CACHE_MAX_BYTES", DEFAULT_ARTIFACT_CACHE_MAX_BYTES)
+        )
+        self.ref_ttl_seconds = ref_ttl_seconds
+        self.blob_dir = self.root / "blobs" / "sha256"
+        self.ref_dir = self.root / "refs"
+        self.lock_dir = self.root / "locks"
+        self.tmp_dir = self.root / "tmp"
+        self.snapshot_dir = self.root / "snapshots"
+        for directory in (
+            self.blob_dir,
+            self.ref_dir,
+            self.lock_dir,
+            self.tmp_dir,
+            self.snapshot_dir,
+        ):
+            directory.mkdir(parents=True, exist_ok=True)
+
+    def fetch(
+        self,
+        repo_id: str,
+        filename: str,
+        token: Optional[str] = None,
+        revision: str = "main",
+    ) -> Path:
+        """Return a local path to ``filename`` from ``repo_id``, downloading only on a miss.
+
+        Args:
+        ----
+            repo_id: HuggingFace repository ID
+            filename: File within the repository
+            token: HuggingFace token
+            revision: Branch, tag or commit hash
+
+        Returns:
+        -------
+            Path to the cached blob
+
+        """
+        ref_path = self._ref_path(repo_id, revision, filename)
+        blob = self._lookup(ref_path, repo_id, filename, token, revision)
+        if blob is not None:
+            return blob
+
+        with FileLock(str(self.lock_dir / f"{self._key_digest(ref_path)}.lock")):
+            # Another process may have finished the download while we waited
+            blob = self._lookup(ref_path, repo_id, filename, token, revision)
+            if blob is not None:
+                return blob
+            blob = self._download(ref_path, repo_id, filename, token, revision)
+
+        self.evict(keep={blob.name})
+        return blob
+
+    def fetch_snapshot(
+        self,
+        repo_id: str,
+        token: Optional[str] = None,
+        revision: str = "main",
+    ) -> Path:
+        """Return a local snapshot of every file in ``repo_id``.
+
+        Args:
+        ----
+            repo_id: HuggingFace repository ID
+            token: HuggingFace token
+            revision: Branch, tag or commit hash
+
+        Returns:
+        -------
+            Path to the snapshot directory
+
+        """
+        repo_dir = self.snapshot_dir / f"models--{repo_id.replace('/', '--')}"
+        with FileLock(str(self.lock_dir / f"{self._key_digest(repo_dir)}.lock")):
+            snapshot = Path(
+                snapshot_download(
+                    repo_id=repo_id,
+                    revision=revision,
+                    token=token,
+                    cache_dir=str(self.snapshot_dir),
+                )
+            )
+        # Directory mtime doubles as the LRU timestamp
+        os.utime(repo_dir)
+        self.evict(keep={repo_dir.name})
+        return snapshot
+
+    def evict(self, keep: Optional[set[str]] = None) -> int:
+        """Delete least recently used entries until the cache fits its budget.
+
+        Entries are blobs and snapshot repository directories.
+
+        Args:
+        ----
+            keep: Blob or snapshot directory names that must not be evicted
+
+        Returns:
+        -------
+            Number of entries evicted
+
+        """
+        keep = keep or set()
+        with FileLock(str(self.lock_dir / "evict.lock")):
+            entries = []
+            for path in self.blob_dir.iterdir():
+                try:
+                    stat = path.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+            for path in self.snapshot_dir.iterdir():
+                # Skip huggingface_hub's own ``.locks`` directory
+                if path.name.startswith(".") or not path.is_dir():
+                    continue
+                try:
+                    mtime = path.stat().st_mtime
+                except FileNotFoundError:
+                    continue
+                entries.append((mtime, self._tree_size(path), path))
+
+            total = sum(size for _, size, _ in entries)
+            evicted = 0
+            for _, size, path in sorted(entries):
+                if total <= self.max_bytes:
+                    break
+                if path.name in keep:
+                    continue
+                if path.is_dir():
+                    shutil.rmtree(path, ignore_errors=True)
+                else:
+                    path.unlink(missing_ok=True)
+                total -= size
+                evicted += 1
+                logger.info(f"Evicted model artifact {path.name} ({size} bytes)")
+        return evicted
+
+    @staticmethod
+    def _tree_size(path: Path) -> int:
+        """Return the bytes stored under ``path``, counting symlinks as themselves."""
+        total = 0
+        for dirpath, _, filenames in os.walk(path):
+            for name in filenames:
+                try:
+                    total += os.lstat(os.path.join(dirpath, name)).st_size
+                except FileNotFoundError:
+                    continue
+        return total
+
+    def _lookup(
+        self,
+        ref_path: Path,
+        repo_id: str,
+        filename: str,
+        token: Optional[str],
+        revision: str,
+    ) -> Optional[Path]:
+        """Return the cached blob for a reference if it is present and current."""
+        try:
+            ref = json.loads(ref_path.read_text())
+        except (FileNotFoundError, ValueError):
+            return None
+
+        blob = self.blob_dir / ref["sha256"]
+        if not blob.exists():
+            return None
+
+        is_pinned = _COMMIT_HASH_RE.match(revision) is not None
+        if not is_pinned and time.time() - ref_path.stat().st_mtime > self.ref_ttl_seconds:
+            try:
+                metadata = get_hf_file_metadata(
+                    hf_hub_url(repo_id, filename, revision=revision), token=token
+                )
+            except Exception as e:
+                logger.warning(f"Could not revalidate {repo_id}/{filename}, using cached copy: {e}")
+            else:
+                if metadata.commit_hash != ref.get("commit"):
+                    return None
+            os.utime(ref_path)
+
+        # Blob mtime doubles as the LRU timestamp
+        os.utime(blob)
+        return blob
+
+    def _download(
+        self,
+        ref_path: Path,
+        repo_id: str,
+        filename: str,
+        token: Optional[str],
+        revision: str,
+    ) -> Path:
+        """Download an artifact, store it by content hash and point the reference at it."""
+        with tempfile.TemporaryDirectory(dir=self.tmp_dir) as staging:
+            downloaded = Path(
+                hf_hub_download(
+                    repo_id=repo_id,
+                    filename=filename,
+                    revision=revision,
+                    token=token,
+                    cache_dir=staging,
+                )
+            )
+            # hf_hub_download lays files out as <repo>/snapshots/<commit>/<filename>
+            parts = downloaded.relative_to(staging).parts
+            commit = parts[parts.index("snapshots") + 1] if "snapshots" in parts else None
+
+            digest = hashlib.sha256()
+            with open(downloaded, "rb") as f:
+                for chunk in iter(lambda: f.read(_HASH_CHUNK_SIZE), b""):
+                    digest.update(chunk)
+            sha256 = digest.hexdigest()
+
+            blob = self.blob_dir / sha256
+            if not blob.exists():
+                staged_blob = Path(staging) / f"{sha256}.partial"
+                shutil.copyfile(downloaded.resolve(), staged_blob)
+                os.replace(staged_blob, blob)
+
+        ref_path.parent.mkdir(parents=True, exist_ok=True)
+        self._write_atomic(
+            ref_path,
+            json.dumps({"sha256": sha256, "commit": commit, "size": blob.stat().st_size}),
+        )
+        logger.info(f"Cached model artifact {repo_id}/{filename}@{revision} as {sha256}")
+        return blob
+
+    def _write_atomic(self, path: Path, content: str) -> None:
+        fd, tmp_path = tempfile.mkstemp(dir=self.tmp_dir)
+        try:
+            with os.fdopen(fd, "w") as f:
+                f.write(content)
+            os.replace(tmp_path, path)
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+
+    def _ref_path(self, repo_id: str, revision: str, filename: str) -> Path:
+        return (
+            self.ref_dir
+            / quote(repo_id, safe="")
+            / quote(revision, safe="")
+            / f"{quote(filename, safe='')}.json"
+        )
+
+    @staticmethod
+    def _key_digest(ref_path: Path) -> str:
+        return hashlib.sha256(str(ref_path).encode()).hexdigest()[:32]
+
+
+class BoundedModelCache:
+    """Thread-safe LRU of loaded models bounded by count and accounted bytes.
+
+    Values are the serving service's cache entries; an entry's ``size_bytes``
+    (the artifact size when not set explicitly) counts toward ``max_bytes``. The
+    most recently inserted entry is always kept, even if it alone exceeds the
+    budget.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 8,
+        max_bytes: Optional[int] = None,
+        size_of: Optional[Callable[[Any], int]] = None,
+    ) -> None:
+        """Initialize the model cache.
+
+        Args:
+        ----
+            max_entries: Maximum number of models kept in memory
+            max_bytes: Optional budget for the summed ``size_bytes`` of entries
+            size_of: Function returning an entry's size in bytes
+
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._size_of = size_of or (lambda entry: int(entry.get("size_bytes", 0)))
+        self._entries: OrderedDict[str, Any] = OrderedDict()
+        self._sizes: dict[str, int] = {}
+        self._lock = threading.Lock()
+        self.total_bytes = 0
+
+    def get(self, key: str, default: Any = None) -> Any:  # noqa: ANN401
+        """Return an entry and mark it most recently used."""
+        with self._lock:
+            if key not in self._entries:
+                return default
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+    def __getitem__(self, key: str) -> Any:  # noqa: ANN401
+        entry = self.get(key, _MISSING)
+        if entry is _MISSING:
+            raise KeyError(key)
+        return entry
+
+    def __setitem__(self, key: str, entry: Any) -> None:  # noqa: ANN401
+        size = self._size_of(entry)
+        with self._lock:
+            self._discard(key)
+            self._entries[key] = entry
+            self._sizes[key] = size
+            self.total_bytes += size
+            while len(self._entries) > 1 and (
+                len(self._entries) > self.max_entries
+                or (self.max_bytes is not None and self.total_bytes > self.max_bytes)
+            ):
+                oldest = next(iter(self._entries))
+                self._discard(oldest)
+                logger.info(f"Evicted model {oldest} from memory")
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def pop(self, key: str, default: Any = None) -> Any:  # noqa: ANN401
+        """Remove and return an entry."""
+        with self._lock:
+            entry = self._entries.get(key, default)
+            self._discard(key)
+            return entry
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        with self._lock:
+            self._entries.clear()
+            self._sizes.clear()
+            self.total_bytes = 0
+
+    def _discard(self, key: str) -> None:
+        if key in self._entries:
+            del self._entries[key]
+            self.total_bytes -= self._sizes.pop(key, 0)
+
+
+_MISSING = object()
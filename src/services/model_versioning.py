@@ -6,9 +6,10 @@ import logging
 from dataclasses import asdict, dataclass
 from datetime import datetime
 from enum import Enum
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 
 import redis
+import redis.asyncio as redis_asyncio
 from packaging import version
 
 from .model_abstraction import HokusaiModel, ModelStatus
@@ -98,17 +99,38 @@ class VersionTransition:
 class ModelVersionManager:
     """Manages model versions and transitions."""
 
-    def __init__(self, registry: HokusaiModelRegistry, redis_client: redis.Redis) -> None:
+    def __init__(
+        self,
+        registry: HokusaiModelRegistry,
+        redis_client: redis.Redis,
+        async_redis_client: Optional[redis_asyncio.Redis] = None,
+    ) -> None:
         """Initialize the version manager.
 
         Args:
             registry: Model registry instance
             redis_client: Redis client for version tracking
+            async_redis_client: Optional asyncio client for the async lookups
 
         """
         self.registry = registry
         self.redis = redis_client
+        self.async_redis = async_redis_client
         self.version_history = {}
+        self._promotion_listeners: list[Callable[[str, str, Environment], None]] = []
+
+    def add_promotion_listener(self, listener: Callable[[str, str, Environment], None]) -> None:
+        """Register a callback invoked after a version becomes active in an environment.
+
+        Listeners receive ``(model_family, version_tag, environment)`` after a
+        promotion or rollback. Exceptions raised by a listener are logged and do
+        not affect the transition.
+
+        Args:
+            listener: Callback to invoke
+
+        """
+        self._promotion_listeners.append(listener)
 
     def register_version(
         self,
@@ -247,6 +269,7 @@ class ModelVersionManager:
         self._set_active_version(model_family, environment, version_tag)
 
         logger.info(f"Promoted {model_family}/{version_tag} to {environment.value}")
+        self._notify_promotion(model_family, version_tag, environment)
         return True
 
     def rollback_model(
@@ -317,6 +340,7 @@ class ModelVersionManager:
             f"Rolled back {model_family} from {current_version.version} "
             f"to {target_version} in {environment.value}"
         )
+        self._notify_promotion(model_family, target_version, environment)
         return True
 
     def deprecate_model(
@@ -411,6 +435,33 @@ class ModelVersionManager:
             return self.get_version(model_family, version_tag)
         return None
 
+    async def get_version_async(
+        self, model_family: str, version_tag: str
+    ) -> Optional[ModelVersion]:
+        """Async variant of ``get_version``; uses the sync client if no async one is set."""
+        if self.async_redis is None:
+            return self.get_version(model_family, version_tag)
+
+        data = await self.async_redis.get(f"model_version:{model_family}:{version_tag}")
+        if data:
+            return ModelVersion.from_dict(json.loads(data))
+        return None
+
+    async def get_active_version_async(
+        self, model_family: str, environment: Environment
+    ) -> Optional[ModelVersion]:
+        """Async variant of ``get_active_version``."""
+        if self.async_redis is None:
+            return self.get_active_version(model_family, environment)
+
+        version_tag = await self.async_redis.get(
+            f"active_version:{model_family}:{environment.value}"
+        )
+        if version_tag:
+            version_tag = version_tag.decode() if isinstance(version_tag, bytes) else version_tag
+            return await self.get_version_async(model_family, version_tag)
+        return None
+
     def get_version_history(self, model_family: str, limit: int = 10) -> list[ModelVersion]:
         """Get version history for a model family.
 
@@ -554,6 +605,16 @@ class ModelVersionManager:
 
         return candidates
 
+    def _notify_promotion(
+        self, model_family: str, version_tag: str, environment: Environment
+    ) -> None:
+        """Invoke promotion listeners, isolating the caller from their failures."""
+        for listener in self._promotion_listeners:
+            try:
+                listener(model_family, version_tag, environment)
+            except Exception as e:
+                logger.warning(f"Promotion listener failed for {model_family}/{version_tag}: {e}")
+
     def _version_exists(self, model_family: str, version_tag: str) -> bool:
         """Check if a version exists."""
         key = f"model_version:{model_family}:{version_tag}"
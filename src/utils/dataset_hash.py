@@ -2,7 +2,30 @@
 
 from __future__ import annotations
 
+import hashlib
+import heapq
+import json
+import os
 import re
+import shutil
+import tempfile
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+    import pyarrow.parquet as pq
+
+# Serialized rows held in memory before a sorted run is spilled to disk.
+DEFAULT_SORT_BUFFER_BYTES = 64 * 1024 * 1024
+# Rows read per parquet record batch or serialized per DataFrame chunk.
+DEFAULT_HASH_BATCH_ROWS = 65_536
+# Rough per-line cost of a buffered ``bytes`` object on top of its payload.
+_LINE_OVERHEAD_BYTES = 40
+# Sorted runs merged at once; more runs than this are merged in several passes.
+_MAX_MERGE_FAN_IN = 64
 
 SHA256_DATASET_VERSION_RE = re.compile(r"^sha256:[0-9a-f]{64}$")
 _SHA256_HEX_RE = re.compile(r"^[0-9a-f]{64}$")
@@ -25,3 +48,219 @@ def parse_sha256_dataset_version(value: object) -> str | None:
     if not is_canonical_sha256_dataset_version(value):
         return None
     return value
+
+
+def canonical_row_json(row: Any) -> str:  # noqa: ANN401
+    """Serialize one dataset row the way canonical dataset hashes do."""
+    return json.dumps(row, sort_keys=True, separators=(",", ":"))
+
+
+def canonical_rows_sha256(
+    rows: Iterable[Any],
+    *,
+    buffer_bytes: int = DEFAULT_SORT_BUFFER_BYTES,
+    tmp_dir: str | None = None,
+) -> str:
+    """Return the SHA-256 hex digest of ``rows`` as a row-order-independent JSON array.
+
+    The digest covers the canonical JSON array of the rows sorted by their
+    canonical serialization, i.e. ``json.dumps(sorted(rows, key=canonical_row_json))``
+    with sorted keys and compact separators. Rows are serialized as they stream in
+    and sorted externally: sorted runs of at most ``buffer_bytes`` are spilled to
+    temporary files and merged while hashing, so memory stays bounded regardless
+    of dataset size.
+    """
+    hasher = hashlib.sha256(b"[")
+    for index, line in enumerate(_sorted_canonical_lines(rows, buffer_bytes, tmp_dir)):
+        if index:
+            hasher.update(b",")
+        hasher.update(line)
+    hasher.update(b"]")
+    return hasher.hexdigest()
+
+
+def canonical_dataset_sha256(
+    path: str | Path,
+    *,
+    buffer_bytes: int = DEFAULT_SORT_BUFFER_BYTES,
+    batch_rows: int = DEFAULT_HASH_BATCH_ROWS,
+) -> str:
+    """Return the canonical ``sha256:<hex>`` hash of a JSON, JSONL or parquet dataset file.
+
+    JSONL and parquet files are streamed (parquet in record batches of
+    ``batch_rows``). A ``.json`` file is a single document and is parsed whole; a
+    JSON object (rather than an array of rows) hashes as that object.
+    """
+    path = Path(path)
+    suffix = path.suffix.lower()
+    if suffix == ".jsonl":
+        rows: Iterable[Any] = _iter_jsonl_rows(path)
+    elif suffix == ".parquet":
+        rows = _iter_parquet_rows(path, batch_rows)
+    else:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+        if not isinstance(payload, list):
+            digest = hashlib.sha256(canonical_row_json(payload).encode("utf-8")).hexdigest()
+            return format_sha256_dataset_version(digest)
+        rows = payload
+    return format_sha256_dataset_version(canonical_rows_sha256(rows, buffer_bytes=buffer_bytes))
+
+
+def dataframe_records_sha256(
+    frame: pd.DataFrame, *, chunk_rows: int = DEFAULT_HASH_BATCH_ROWS
+) -> str:
+    """Return the SHA-256 hex digest of a frame's index- and column-sorted JSON records.
+
+    Equal to hashing ``frame.sort_index().sort_index(axis=1).to_json(orient="records")``
+    but serializes ``chunk_rows`` rows at a time, so neither a sorted copy of the
+    frame nor the full JSON document is held in memory.
+    """
+    import pandas as pd
+
+    # A MultiIndex falls back to pandas' own sort, which copies the frame
+    if isinstance(frame.index, pd.MultiIndex):
+        frame = frame.sort_index()
+    if isinstance(frame.columns, pd.MultiIndex):
+        frame = frame.sort_index(axis=1)
+    row_order = _sort_positions(frame.index)
+    column_order = _sort_positions(frame.columns)
+
+    hasher = hashlib.sha256(b"[")
+    for start in range(0, len(frame), chunk_rows):
+        chunk = frame.iloc[row_order[start : start + chunk_rows], column_order]
+        if start:
+            hasher.update(b",")
+        hasher.update(chunk.to_json(orient="records")[1:-1].encode())
+    hasher.update(b"]")
+    return hasher.hexdigest()
+
+
+def _sorted_canonical_lines(
+    rows: Iterable[Any], buffer_bytes: int, tmp_dir: str | None
+) -> Iterator[bytes]:
+    buffer: list[bytes] = []
+    buffered = 0
+    runs: list[str] = []
+    spill_dir: str | None = None
+    try:
+        for row in rows:
+            # ensure_ascii output never contains a raw newline, so lines delimit rows
+            line = canonical_row_json(row).encode("ascii")
+            buffer.append(line)
+            buffered += len(line) + _LINE_OVERHEAD_BYTES
+            if buffered >= buffer_bytes:
+                if spill_dir is None:
+                    spill_dir = tempfile.mkdtemp(prefix="dataset-hash-", dir=tmp_dir)
+                buffer.sort()
+                runs.append(_spill_run(buffer, spill_dir))
+                buffer, buffered = [], 0
+
+        buffer.sort()
+        if spill_dir is None:
+            yield from buffer
+            return
+
+        # Keep the number of simultaneously open runs bounded on very large inputs
+        while len(runs) >= _MAX_MERGE_FAN_IN:
+            runs = [
+                _spill_run(_merged_runs(runs[start : start + _MAX_MERGE_FAN_IN]), spill_dir)
+                for start in range(0, len(runs), _MAX_MERGE_FAN_IN)
+            ]
+        yield from _merged_runs(runs, buffer)
+    finally:
+        if spill_dir is not None:
+            shutil.rmtree(spill_dir, ignore_errors=True)
+
+
+def _merged_runs(runs: list[str], *in_memory: list[bytes]) -> Iterator[bytes]:
+    files = [open(run, "rb") for run in runs]  # noqa: SIM115
+    try:
+        streams = [(line.rstrip(b"\n") for line in f) for f in files]
+        yield from heapq.merge(*streams, *in_memory)
+    finally:
+        for f in files:
+            f.close()
+        for run in runs:
+            os.remove(run)
+
+
+def _spill_run(lines: Iterable[bytes], spill_dir: str) -> str:
+    fd, run_path = tempfile.mkstemp(dir=spill_dir, suffix=".run")
+    with os.fdopen(fd, "wb") as f:
+        for line in lines:
+            f.write(line)
+            f.write(b"\n")
+    return run_path
+
+
+def _iter_jsonl_rows(path: Path) -> Iterator[dict[str, Any]]:
+    with path.open(encoding="utf-8") as f:
+        for line_number, line in enumerate(f, start=1):
+            if not line.strip():
+                continue
+            row = json.loads(line)
+            if not isinstance(row, dict):
+                raise ValueError(f"JSONL line {line_number} in {path} is not an object")
+            yield row
+
+
+def _iter_parquet_rows(path: Path, batch_rows: int) -> Iterator[dict[str, Any]]:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    parquet_file = pq.ParquetFile(path)
+    # Converting the whole file turns an integer column with any null into float64;
+    # apply the same cast to every batch so rows serialize identically.
+    nullable_ints = _integer_columns_with_nulls(parquet_file, batch_rows)
+    for batch in parquet_file.iter_batches(batch_size=batch_rows):
+        for name in nullable_ints:
+            index = batch.schema.get_field_index(name)
+            batch = batch.set_column(index, name, batch.column(index).cast(pa.float64()))
+        yield from batch.to_pandas().to_dict("records")
+
+
+def _integer_columns_with_nulls(parquet_file: pq.ParquetFile, batch_rows: int) -> list[str]:
+    import pyarrow as pa
+
+    schema = parquet_file.schema_arrow
+    candidates = [field.name for field in schema if pa.types.is_integer(field.type)]
+    if not candidates:
+        return []
+
+    metadata = parquet_file.metadata
+    leaf_indexes = {parquet_file.schema.column(i).path: i for i in range(metadata.num_columns)}
+    with_nulls: set[str] = set()
+    unknown: list[str] = []
+    for name in candidates:
+        null_count = _statistics_null_count(metadata, leaf_indexes.get(name, -1))
+        if null_count is None:
+            unknown.append(name)
+        elif null_count:
+            with_nulls.add(name)
+
+    if unknown:
+        for batch in parquet_file.iter_batches(batch_size=batch_rows, columns=unknown):
+            with_nulls.update(name for name in unknown if batch.column(name).null_count)
+    return [name for name in candidates if name in with_nulls]
+
+
+def _statistics_null_count(metadata: Any, column_index: int) -> int | None:  # noqa: ANN401
+    if column_index < 0:
+        return None
+    total = 0
+    for row_group in range(metadata.num_row_groups):
+        statistics = metadata.row_group(row_group).column(column_index).statistics
+        if statistics is None or not statistics.has_null_count:
+            return None
+        total += statistics.null_count
+    return total
+
+
+def _sort_positions(index: pd.Index) -> np.ndarray:
+    """Return positions that stably sort ``index`` without copying the labelled data."""
+    import numpy as np
+
+    if index.is_monotonic_increasing:
+        return np.arange(len(index))
+    _, positions = index.sort_values(return_indexer=True)
+    return positions
@@ -961,6 +961,44 @@ def test_resolve_contributor_wallets_mixed_wallet_and_escrow(monkeypatch) -> Non
     assert all("account_id" not in c for c in resolved)  # mapped to contributor_id
 
 
+def test_resolve_contributor_wallets_uses_batch_resolver(monkeypatch) -> None:
+    monkeypatch.setenv("PENDING_CLAIMS_ESCROW_ADDRESS", "0x" + "ee" * 20)
+
+    class _BatchResolver(_FakeWalletResolver):
+        def __init__(self, verified_wallets: dict[str, str]) -> None:
+            super().__init__(verified_wallets)
+            self.batches: list[list[str]] = []
+
+        def resolve_wallet(self, **kwargs) -> WalletResolution:
+            raise AssertionError("per-account resolution should not be used")
+
+        def resolve_wallets(self, account_ids) -> dict[str, WalletResolution]:
+            self.batches.append(list(account_ids))
+            return {
+                account_id: super(_BatchResolver, self).resolve_wallet(user_id=account_id)
+                for account_id in account_ids
+            }
+
+    orchestrator = _resolver_orchestrator({})
+    resolver = _BatchResolver({"user-a": "0x" + "aa" * 20})
+    orchestrator._reward_entitlement_notifier = resolver
+
+    resolved = orchestrator._resolve_contributor_wallets(
+        [
+            {"account_id": "user-a", "weight_bps": 5000},
+            {"wallet_address": "0x" + "cc" * 20, "weight_bps": 2500},
+            {"account_id": "user-b", "weight_bps": 2500},
+        ],
+        run_id="run-x",
+    )
+
+    assert resolver.batches == [["user-a", "user-b"]]
+    assert [c["recipient_kind"] for c in resolved if "recipient_kind" in c] == [
+        "wallet",
+        "escrow",
+    ]
+
+
 def test_notify_reward_entitlement_threads_kinds_and_tokens(monkeypatch) -> None:
     # HOK-2270: the orchestrator threads recipient_kind + reward_tokens into the notifier so
     # auth ingests account-centric rows with an explicit escrow flag (no address matching).
@@ -159,7 +159,11 @@ class TestWebhookIntegration:
                 "expected_exception": httpx.RequestError,
             },
         }
-        return WebhookPublisher(webhook_url=webhook_url, secret_key="test-secret", config=config)
+        publisher = WebhookPublisher(
+            webhook_url=webhook_url, secret_key="test-secret", config=config
+        )
+        yield publisher
+        publisher.close()
 
     @pytest.fixture
     def sample_message(self):
@@ -188,6 +192,7 @@ class TestWebhookIntegration:
         result = publisher.publish(sample_message.to_dict(), "test-queue")
 
         assert result is True
+        assert publisher.drain(timeout=10)
 
         # Verify webhook was received
         assert len(webhook_server.received_webhooks) == 1
@@ -225,6 +230,7 @@ class TestWebhookIntegration:
         result = publisher.publish(sample_message.to_dict(), "test-queue")
 
         assert result is True
+        assert publisher.drain(timeout=10)
         assert len(webhook_server.received_webhooks) == 1
 
         # Server validates signature internally - if we get here, signature was valid
@@ -238,6 +244,7 @@ class TestWebhookIntegration:
         result = publisher.publish(sample_message.to_dict(), "test-queue")
 
         assert result is True
+        assert publisher.drain(timeout=10)
         # Should have received 3 webhooks total (2 fails + 1 success)
         assert len(webhook_server.received_webhooks) == 3
 
@@ -249,7 +256,10 @@ class TestWebhookIntegration:
 
         result = publisher.publish(sample_message.to_dict(), "test-queue")
 
-        assert result is False
+        # Accepted immediately; the failure surfaces in the delivery stats
+        assert result is True
+        assert publisher.drain(timeout=10)
+        assert publisher.get_delivery_stats()["failed"] == 1
         # Should have received initial + retry attempts
         expected_attempts = 1 + len(publisher.retry_delays)
         assert len(webhook_server.received_webhooks) == expected_attempts
@@ -262,8 +272,9 @@ class TestWebhookIntegration:
 
         result = publisher.publish(sample_message.to_dict(), "test-queue")
 
-        assert result is False
-        # May have received webhook but client timed out
+        assert result is True
+        # Still retrying in the background; publish did not wait for the slow consumer
+        assert publisher.get_delivery_stats()["delivered"] == 0
 
     def test_circuit_breaker_integration(self, webhook_server, publisher, sample_message):
         """Test circuit breaker integration."""
@@ -273,7 +284,11 @@ class TestWebhookIntegration:
         # Make enough failing requests to open circuit breaker
         for i in range(publisher.circuit_breaker.failure_threshold):
             result = publisher.publish(sample_message.to_dict(), f"test-queue-{i}")
-            assert result is False
+            assert result is True
+            assert publisher.drain(timeout=10)
+        assert (
+            publisher.get_delivery_stats()["failed"] == publisher.circuit_breaker.failure_threshold
+        )
 
         # Circuit breaker should now be open
         assert publisher.circuit_breaker.state == "open"
@@ -281,7 +296,8 @@ class TestWebhookIntegration:
         # Next request should be blocked by circuit breaker
         initial_webhook_count = len(webhook_server.received_webhooks)
         result = publisher.publish(sample_message.to_dict(), "blocked-queue")
-        assert result is False
+        assert result is True
+        assert publisher.drain(timeout=10)
 
         # Should not have sent additional webhook
         assert len(webhook_server.received_webhooks) == initial_webhook_count
@@ -311,6 +327,7 @@ class TestWebhookIntegration:
 
         # All should succeed
         assert all(results)
+        assert publisher.drain(timeout=10)
         assert len(webhook_server.received_webhooks) == 5
 
         # Verify all received webhooks have the correct format
@@ -331,6 +348,7 @@ class TestWebhookIntegration:
 
         assert result1 is True
         assert result2 is True
+        assert publisher.drain(timeout=10)
 
         # Check we got at least 2 webhooks (may be more due to retries/health checks)
         import time
@@ -358,6 +376,7 @@ class TestWebhookIntegration:
 
         result3 = publisher.publish(different_message, "test-queue-3")
         assert result3 is True
+        assert publisher.drain(timeout=10)
 
         # Should have different idempotency key
         time.sleep(0.1)
@@ -410,6 +429,7 @@ class TestWebhookIntegration:
         )
 
         assert result is True
+        assert publisher.drain(timeout=10)
         assert len(webhook_server.received_webhooks) == 1
 
         received = webhook_server.received_webhooks[0]["body"]
@@ -454,6 +474,7 @@ class TestWebhookIntegration:
         result = publisher.publish(message.to_dict(), "schema-queue")
 
         assert result is True
+        assert publisher.drain(timeout=10)
         assert len(webhook_server.received_webhooks) == 1
 
         body = webhook_server.received_webhooks[0]["body"]
@@ -473,6 +494,7 @@ class TestWebhookIntegration:
         result = publisher.publish(sample_message.to_dict(), "test-queue")
 
         assert result is True
+        assert publisher.drain(timeout=10)
         assert len(webhook_server.received_webhooks) == 1
 
     def test_large_payload_handling(self, webhook_server, publisher):
@@ -498,6 +520,7 @@ class TestWebhookIntegration:
         result = publisher.publish(large_message.to_dict(), "large-queue")
 
         assert result is True
+        assert publisher.drain(timeout=10)
         assert len(webhook_server.received_webhooks) == 1
 
         # Verify payload was transmitted in the new format
@@ -32,7 +32,7 @@ async def test_validate_with_auth_service_uses_correct_service_id():
     # Mock the httpx client
     with patch("httpx.AsyncClient") as mock_client_class:
         mock_client = AsyncMock()
-        mock_client_class.return_value.__aenter__.return_value = mock_client
+        mock_client_class.return_value = mock_client
 
         # Mock successful response
         mock_response = Mock()
@@ -5,6 +5,7 @@ import logging
 from pathlib import Path
 
 import jsonschema
+import numpy as np
 import pandas as pd
 
 from src.evaluation.attribution.neighbor_provenance import attribute
@@ -415,3 +416,69 @@ def test_attribute_skips_neighbors_without_any_identity() -> None:
 
     assert [c["account_id"] for c in report["contributors"]] == ["user-1"]
     assert report["contributors"][0]["weight_bps"] == 10000
+
+
+def _row_by_row_raw_scores(candidate: pd.DataFrame) -> dict[str, tuple[float, int]]:
+    """Reference attribution that credits one improved row at a time."""
+    totals: dict[str, tuple[float, set[str]]] = {}
+    for row in candidate.itertuples(index=False):
+        neighbors = json.loads(row.neighbor_provenance)
+        weights = [max(float(neighbor.get("weight", 0.0)), 0.0) for neighbor in neighbors]
+        total_weight = sum(weights)
+        per_identity: dict[str, float] = {}
+        for neighbor, weight in zip(neighbors, weights, strict=True):
+            share = weight / total_weight if total_weight > 0 else 1.0 / len(neighbors)
+            identity = neighbor.get("account_id") or neighbor.get("wallet")
+            if share > 0 and identity is not None:
+                per_identity[identity] = per_identity.get(identity, 0.0) + share
+        for identity, share in per_identity.items():
+            raw_score, rows = totals.get(identity, (0.0, set()))
+            totals[identity] = (raw_score + share, rows | {row.row_id})
+    return {
+        identity: (round(raw_score, 12), len(rows))
+        for identity, (raw_score, rows) in totals.items()
+    }
+
+
+def test_attribute_matches_row_by_row_credit() -> None:
+    rng = np.random.default_rng(7)
+    identities = [{"account_id": f"user-{i}"} for i in range(12)] + [
+        {"wallet": "0x" + str(i) * 40} for i in range(1, 6)
+    ]
+    rows = []
+    for index in range(400):
+        neighbors = []
+        for slot in range(int(rng.integers(1, 8))):
+            neighbor = dict(identities[int(rng.integers(len(identities)))])
+            neighbor["submission_id"] = f"sub-{index}-{slot}"
+            neighbor["weight"] = float(rng.choice([0.0, rng.random()], p=[0.1, 0.9]))
+            neighbors.append(neighbor)
+        rows.append(
+            {
+                "row_id": f"r{index}",
+                "completed_successfully": True,
+                "neighbor_provenance": _encoded(neighbors),
+            }
+        )
+    candidate = _frame(rows)
+    baseline = candidate.assign(completed_successfully=False)
+
+    report = attribute(
+        baseline,
+        candidate,
+        model_id="30",
+        baseline_run_id="base",
+        candidate_run_id="cand",
+        created_at="2026-06-05T00:00:00Z",
+    )
+
+    credited = {
+        contributor.get("account_id", contributor.get("wallet")): (
+            contributor["raw_score"],
+            contributor["rows_credited"],
+        )
+        for contributor in report["contributors"]
+    }
+    assert credited == _row_by_row_raw_scores(candidate)
+    assert report["weight_bps_total"] == 10000
+    jsonschema.validate(instance=report, schema=_schema())
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from random import Random
 
@@ -342,3 +343,116 @@ def test_dataset_and_manifest_hash_recorded() -> None:
 
     assert report["method_details"]["dataset_hash"] == "sha256:" + "a" * 64
     assert report["method_details"]["manifest_hash"] == "sha256:" + "b" * 64
+
+
+def _interaction_train(included_ids: frozenset[str], seed: int) -> frozenset[str]:
+    return frozenset(included_ids)
+
+
+def _interaction_eval(handle: frozenset[str], eval_seed: int) -> float:
+    return 0.4 if {"A", "B"}.issubset(handle) else 0.05 * len(handle)
+
+
+def _attribute_with(cohorts: list[Cohort], **kwargs: object) -> dict[str, object]:
+    return attribute(
+        cohorts=cohorts,
+        model_id="30",
+        baseline_run_id="baseline-run",
+        candidate_run_id="candidate-run",
+        created_at="2026-06-05T00:00:00Z",
+        dataset_hash="sha256:" + "1" * 64,
+        manifest_hash="sha256:" + "2" * 64,
+        total_rows_evaluated=256,
+        config=RetrainingConfig(tau=0.10, budget=16),
+        **kwargs,
+    )
+
+
+def _abc_cohorts() -> list[Cohort]:
+    return [_cohort(name, wallet=_wallet(index + 1)) for index, name in enumerate("ABC")]
+
+
+def test_parallel_retrains_match_sequential_report() -> None:
+    sequential = _attribute_with(
+        _abc_cohorts(), train_fn=_interaction_train, eval_fn=_interaction_eval, max_workers=1
+    )
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        threaded = _attribute_with(
+            _abc_cohorts(),
+            train_fn=_interaction_train,
+            eval_fn=_interaction_eval,
+            executor=executor,
+        )
+    process_pool = _attribute_with(
+        _abc_cohorts(), train_fn=_interaction_train, eval_fn=_interaction_eval, max_workers=2
+    )
+
+    assert sequential["method_details"]["tier"] == "shapley_exact"
+    assert json.dumps(threaded, sort_keys=True) == json.dumps(sequential, sort_keys=True)
+    assert json.dumps(process_pool, sort_keys=True) == json.dumps(sequential, sort_keys=True)
+
+
+def test_subset_score_cache_reuses_retrains_across_runs(tmp_path: Path) -> None:
+    trained: list[frozenset[str]] = []
+
+    def train_fn(included_ids: frozenset[str], seed: int) -> frozenset[str]:
+        trained.append(frozenset(included_ids))
+        return frozenset(included_ids)
+
+    first = _attribute_with(
+        _abc_cohorts(), train_fn=train_fn, eval_fn=_interaction_eval, score_cache_dir=tmp_path
+    )
+    first_count = len(trained)
+    second = _attribute_with(
+        _abc_cohorts(), train_fn=train_fn, eval_fn=_interaction_eval, score_cache_dir=tmp_path
+    )
+
+    # Only the full-set baseline is retrained on the second run
+    assert trained[first_count:] == [frozenset("ABC")]
+    assert json.dumps(second, sort_keys=True) == json.dumps(first, sort_keys=True)
+
+    _attribute_with(
+        _abc_cohorts(),
+        train_fn=train_fn,
+        eval_fn=_interaction_eval,
+        score_cache_dir=tmp_path,
+        train_config={"learning_rate": 0.1},
+    )
+    assert len(trained) - first_count - 1 == first_count
+
+
+def test_subset_score_cache_is_keyed_by_train_and_eval_functions(tmp_path: Path) -> None:
+    trained: list[frozenset[str]] = []
+
+    def train_fn(included_ids: frozenset[str], seed: int) -> frozenset[str]:
+        trained.append(frozenset(included_ids))
+        return frozenset(included_ids)
+
+    def other_eval(handle: frozenset[str], eval_seed: int) -> float:
+        return _interaction_eval(handle, eval_seed)
+
+    _attribute_with(
+        _abc_cohorts(), train_fn=train_fn, eval_fn=_interaction_eval, score_cache_dir=tmp_path
+    )
+    first_count = len(trained)
+    _attribute_with(_abc_cohorts(), train_fn=train_fn, eval_fn=other_eval, score_cache_dir=tmp_path)
+
+    # A different eval function must not reuse the first run's scores
+    assert len(trained) == 2 * first_count
+
+
+def test_environment_cache_requires_train_config(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("ATTRIBUTION_SUBSET_CACHE_DIR", str(tmp_path))
+
+    _attribute_with(_abc_cohorts(), train_fn=_interaction_train, eval_fn=_interaction_eval)
+    assert list(tmp_path.iterdir()) == []
+
+    _attribute_with(
+        _abc_cohorts(),
+        train_fn=_interaction_train,
+        eval_fn=_interaction_eval,
+        train_config={"learning_rate": 0.1},
+    )
+    assert len(list(tmp_path.iterdir())) == 1
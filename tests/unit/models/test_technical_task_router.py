@@ -27,7 +27,10 @@ from src.lineage.weight_commitment import compute_weight_commitment
 from src.models.technical_task_router import (
     ROUTER_DATASET_ARTIFACT,
     TechnicalTaskRouterModel,
+    _normalize_serving_features,
     _normalize_serving_features_with_counts,
+    _RoleRankCache,
+    _similarity,
 )
 
 FIXTURE = Path(__file__).with_name("technical_task_router_fixture.csv")
@@ -237,6 +240,133 @@ def test_predict_neighbor_provenance_tie_breaks_by_training_row_index(tmp_path:
     assert [entry["training_row_index"] for entry in out["neighbor_provenance"]] == [0, 1, 2]
 
 
+def _row_wise_neighbors(router: TechnicalTaskRouterModel, features: dict[str, Any]) -> pd.DataFrame:
+    dataset = router._dataset.copy()
+    dataset["_similarity"] = dataset.apply(
+        lambda row: _similarity(features, row.to_dict()),
+        axis=1,
+    )
+    return dataset.sort_values(
+        by=["_similarity", "completed_successfully", "score"],
+        ascending=[False, False, False],
+    ).head(max(1, router.k_neighbors))
+
+
+@pytest.mark.parametrize("k_neighbors", [1, 4, 11, 48])
+def test_neighbor_index_matches_row_wise_similarity_ranking(
+    tmp_path: Path,
+    k_neighbors: int,
+) -> None:
+    rows = []
+    for index in range(48):
+        rows.append(
+            {
+                "task_type": ["refactor", "Bugfix", "feature"][index % 3],
+                "language": ["py", "ts"][index % 2],
+                "domain": ["payments", "backend", ""][index % 3],
+                "risk_level": ["low", "medium"][index % 2],
+                "requires_tests": index % 4 == 0,
+                "ui_heavy": ["true", "no", None][index % 3],
+                "complexity": [3, 5, None, 8][index % 4],
+                "completed_successfully": index % 5 != 0,
+                "score": [0.9, None, 0.5, 0.9][index % 4],
+                "planner_model": "planner-a",
+                "coder_model": f"coder-{index % 3}",
+                "reviewer_model": "reviewer-a",
+                "expected_cost_usd": 0.5,
+                "actual_cost_usd": 0.4,
+            }
+        )
+    csv_path = tmp_path / "router.csv"
+    pd.DataFrame(rows).to_csv(csv_path, index=False)
+    router = TechnicalTaskRouterModel(k_neighbors=k_neighbors)
+    router.load_context(SimpleNamespace(artifacts={ROUTER_DATASET_ARTIFACT: str(csv_path)}))
+
+    for serving_row in (
+        _well_formed_serving_row(),
+        _well_formed_serving_row(task_type="BUGFIX", language="typescript", complexity=4),
+        {"task_type": "unseen-task"},
+    ):
+        features = _normalize_serving_features(serving_row)
+        expected = _row_wise_neighbors(router, features)
+
+        actual = router._nearest_neighbors(features)
+
+        pd.testing.assert_frame_equal(actual, expected)
+
+
+def test_neighbor_index_is_rebuilt_after_cloudpickle_round_trip() -> None:
+    import cloudpickle
+
+    router = _loaded_model(k_neighbors=3)
+    restored = cloudpickle.loads(cloudpickle.dumps(router))
+    features = _normalize_serving_features(_well_formed_serving_row())
+
+    assert restored._neighbor_index is not None
+    pd.testing.assert_frame_equal(
+        restored._nearest_neighbors(features),
+        router._nearest_neighbors(features),
+    )
+
+
+def test_batch_predict_matches_row_by_row_predictions() -> None:
+    router = _loaded_model(k_neighbors=2)
+    serving_rows = [
+        _well_formed_serving_row(),
+        _well_formed_serving_row(routing_objective="lowest_cost"),
+        _well_formed_serving_row(task_type="bugfix", workflow_stages='["code"]'),
+        _well_formed_serving_row(),
+    ]
+
+    batch = router.predict(None, pd.DataFrame(serving_rows))
+    single = [router.predict(None, pd.DataFrame([row])).iloc[0].to_dict() for row in serving_rows]
+
+    assert batch.to_dict(orient="records") == single
+
+
+def test_batch_predict_returns_independent_copies_for_duplicate_rows() -> None:
+    router = _loaded_model(k_neighbors=2)
+
+    batch = router.predict(None, pd.DataFrame([_well_formed_serving_row()] * 2))
+
+    first = batch.iloc[0]["recommended_strategy"]
+    second = batch.iloc[1]["recommended_strategy"]
+    assert first == second
+    assert first is not second
+
+
+@pytest.mark.parametrize(
+    "allowed_models",
+    [[], ["claude-sonnet-4-6"], ["gpt-5.4", "claude-sonnet-4-6"]],
+)
+def test_precomputed_role_statistics_match_frame_ranking(allowed_models: list[str]) -> None:
+    router = _loaded_model()
+    features = {"max_cost_usd": 0.5}
+
+    for role in ("planner", "coder", "reviewer"):
+        precomputed = router._rank_role(role, router._dataset, features, allowed_models)
+        from_frame = router._rank_role(role, router._dataset.copy(), features, allowed_models)
+
+        assert precomputed == from_frame
+
+
+def test_rank_role_memoizes_per_request_rankings() -> None:
+    router = _loaded_model()
+    rank_cache = _RoleRankCache()
+    neighbors = router._dataset.head(2)
+
+    first = router._rank_role("coder", neighbors, {}, ["gpt-5.4"], rank_cache=rank_cache)
+    second = router._rank_role("coder", neighbors, {}, ["gpt-5.4"], rank_cache=rank_cache)
+    other_budget = router._rank_role(
+        "coder", neighbors, {"max_cost_usd": 0.01}, ["gpt-5.4"], rank_cache=rank_cache
+    )
+
+    assert second is first
+    assert other_budget is not first
+    assert len(rank_cache.groups) == 1
+    assert len(rank_cache.rankings) == 2
+
+
 def test_strategy_router_respects_available_models_and_requested_stages() -> None:
     model = _loaded_model()
     features = _feature_frame()
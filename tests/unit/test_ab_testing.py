@@ -226,24 +226,31 @@ class TestModelTrafficRouter:
         assert model_id1 == model_id2
 
     def test_route_request_sticky(self):
-        """Test sticky routing."""
+        """Test sticky routing is a pure function of test and user IDs."""
         self.test_config.routing_strategy = RoutingStrategy.STICKY
         self.test_config.status = ABTestStatus.ACTIVE
         self.router.routing_rules["test_001"] = self.test_config
 
-        # First request for user
-        self.mock_redis.get.return_value = None
-        with patch("random.random", return_value=0.7):
-            model_id1, _ = self.router.route_request("req_123", "model_family", user_id="user_001")
-
-        # Should have saved assignment
-        self.mock_redis.set.assert_called()
-
-        # Second request for same user should get cached assignment
-        self.mock_redis.get.return_value = b"model_b"
-        model_id2, _ = self.router.route_request("req_456", "model_family", user_id="user_001")
-
-        assert model_id2 == "model_family/v2"  # model_b
+        model_ids = {
+            self.router.route_request(f"req_{i}", "model_family", user_id="user_001")[0]
+            for i in range(20)
+        }
+        other_router = ModelTrafficRouter(self.mock_redis)
+        other_router.routing_rules["test_001"] = self.test_config
+        self.mock_redis.reset_mock()
+        other_model_id, _ = other_router.route_request("req_x", "model_family", user_id="user_001")
+
+        # Same user always gets the same variant, in every worker, without Redis
+        assert model_ids == {other_model_id}
+        self.mock_redis.get.assert_not_called()
+        self.mock_redis.set.assert_not_called()
+
+        # Users are spread across both variants according to the split
+        variants = {
+            self.router.route_request("req", "model_family", user_id=f"user_{i}")[0]
+            for i in range(200)
+        }
+        assert variants == {"model_family/v1", "model_family/v2"}
 
     def test_update_traffic_split(self):
         """Test updating traffic split."""
@@ -311,6 +318,7 @@ class TestModelTrafficRouter:
         }
 
         self.mock_redis.get.side_effect = [json.dumps(metrics_data), None]  # No data for model_b
+        self.mock_redis.hgetall.return_value = {}
 
         metrics = self.router.get_test_metrics("test_001")
 
@@ -320,9 +328,8 @@ class TestModelTrafficRouter:
         assert metrics["model_b"].total_requests == 0
 
     def test_record_prediction_result(self):
-        """Test recording prediction results."""
-        # No existing metrics
-        self.mock_redis.get.return_value = None
+        """Test results are accumulated locally and flushed as atomic increments."""
+        self.mock_redis.reset_mock()
 
         self.router.record_prediction_result(
             "test_001",
@@ -333,17 +340,25 @@ class TestModelTrafficRouter:
             custom_metrics={"accuracy": 0.95},
         )
 
-        # Should save updated metrics
-        self.mock_redis.set.assert_called_once()
-        saved_data = json.loads(self.mock_redis.set.call_args[0][1])
+        # Nothing is written per prediction
+        self.mock_redis.get.assert_not_called()
+        self.mock_redis.set.assert_not_called()
 
-        assert saved_data["total_requests"] == 1
-        assert saved_data["successful_predictions"] == 1
-        assert saved_data["total_latency_ms"] == 50.0
-        assert saved_data["custom_metrics"]["accuracy"] == 0.95
+        self.router.flush_metrics()
+
+        pipe = self.mock_redis.pipeline.return_value
+        pipe.hincrby.assert_any_call("ab_counters:test_001:model_a", "total_requests", 1)
+        pipe.hincrby.assert_any_call("ab_counters:test_001:model_a", "successful_predictions", 1)
+        pipe.hincrbyfloat.assert_any_call("ab_counters:test_001:model_a", "total_latency_ms", 50.0)
+        pipe.hincrbyfloat.assert_any_call(
+            "ab_counters:test_001:model_a", "custom:accuracy:sum", 0.95
+        )
+        pipe.execute.assert_called_once()
 
     def test_record_prediction_result_existing_metrics(self):
-        """Test recording results with existing metrics."""
+        """Test concurrent routers add up and merge with legacy metric snapshots."""
+        fakeredis = pytest.importorskip("fakeredis")
+        shared_redis = fakeredis.FakeRedis()
         existing_metrics = {
             "test_id": "test_001",
             "variant": "model_a",
@@ -354,10 +369,10 @@ class TestModelTrafficRouter:
             "cache_hits": 2,
             "custom_metrics": {"accuracy": 0.9},
         }
+        shared_redis.set("ab_metrics:test_001:model_a", json.dumps(existing_metrics))
+        workers = [ModelTrafficRouter(shared_redis) for _ in range(2)]
 
-        self.mock_redis.get.return_value = json.dumps(existing_metrics)
-
-        self.router.record_prediction_result(
+        workers[0].record_prediction_result(
             "test_001",
             "model_a",
             latency_ms=60.0,
@@ -365,16 +380,34 @@ class TestModelTrafficRouter:
             cache_hit=True,
             custom_metrics={"accuracy": 0.8},
         )
+        workers[1].record_prediction_result("test_001", "model_a", latency_ms=40.0, success=True)
+        for worker in workers:
+            worker.flush_metrics()
 
-        saved_data = json.loads(self.mock_redis.set.call_args[0][1])
+        metrics = ModelTrafficRouter(shared_redis).get_test_metrics("test_001")["model_a"]
 
-        assert saved_data["total_requests"] == 11
-        assert saved_data["successful_predictions"] == 9
-        assert saved_data["failed_predictions"] == 2
-        assert saved_data["cache_hits"] == 3
+        assert metrics.total_requests == 12
+        assert metrics.successful_predictions == 10
+        assert metrics.failed_predictions == 2
+        assert metrics.cache_hits == 3
+        assert metrics.total_latency_ms == 600.0
         # Custom metric should be averaged
         expected_accuracy = (0.9 * 10 + 0.8) / 11
-        assert abs(saved_data["custom_metrics"]["accuracy"] - expected_accuracy) < 0.001
+        assert abs(metrics.custom_metrics["accuracy"] - expected_accuracy) < 0.001
+
+    def test_routing_snapshot_refreshes_on_version_change(self):
+        """Test a router picks up another worker's test changes after the refresh interval."""
+        fakeredis = pytest.importorskip("fakeredis")
+        shared_redis = fakeredis.FakeRedis()
+        admin = ModelTrafficRouter(shared_redis)
+        worker = ModelTrafficRouter(shared_redis, routing_refresh_seconds=30)
+        self.test_config.status = ABTestStatus.ACTIVE
+
+        admin.create_ab_test(self.test_config)
+
+        assert worker.route_request("req_1", "model_family")[1] == ""
+        with patch("src.services.ab_testing.time.monotonic", return_value=10**9):
+            assert worker.route_request("req_2", "model_family")[1] == "test_001"
 
     def test_segment_filtering(self):
         """Test user segment filtering."""
@@ -418,6 +451,31 @@ class TestModelTrafficRouter:
         assert model_id == "model_family/production"
         assert test_id == ""
 
+    @pytest.mark.asyncio
+    async def test_route_request_async_uses_async_client(self):
+        """Test async routing and metric flushes never touch the sync client."""
+        fakeredis = pytest.importorskip("fakeredis")
+        async_redis = fakeredis.aioredis.FakeRedis()
+        router = ModelTrafficRouter(self.mock_redis, async_redis_client=async_redis)
+        self.test_config.status = ABTestStatus.ACTIVE
+        self.test_config.routing_strategy = RoutingStrategy.STICKY
+        router.routing_rules["test_001"] = self.test_config
+        self.mock_redis.reset_mock()
+
+        first = await router.route_request_async("req_1", "model_family", user_id="user_1")
+        second = await router.route_request_async("req_2", "model_family", user_id="user_1")
+        await router.record_prediction_result_async("test_001", "model_a", 12.0, True)
+        await router.flush_metrics_async()
+
+        assert first == second
+        assert first[1] == "test_001"
+        log_key = f"ab_assignment_log:test_001:{datetime.utcnow().strftime('%Y%m%d')}"
+        assert sum(int(v) for v in (await async_redis.hgetall(log_key)).values()) == 2
+        assert await async_redis.ttl(log_key) > 0
+        counters = await async_redis.hgetall("ab_counters:test_001:model_a")
+        assert counters[b"total_requests"] == b"1"
+        assert self.mock_redis.method_calls == []
+
 
 class TestABTestAnalyzer:
     """Test suite for ABTestAnalyzer class."""
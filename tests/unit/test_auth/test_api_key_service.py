@@ -7,6 +7,7 @@ import pytest
 
 from src.auth.api_key_service import (
     APIKey,
+    APIKeyError,
     APIKeyService,
     APIKeyCreationError,
     APIKeyNotFoundError,
@@ -20,7 +21,10 @@ class TestAPIKeyService:
     @pytest.fixture
     def mock_db(self):
         """Mock database connection."""
-        return Mock()
+        db = Mock()
+        # Default to rows issued before lookup digests existed
+        db.get_api_key_by_lookup_hash.return_value = None
+        return db
 
     @pytest.fixture
     def api_key_service(self, mock_db):
@@ -134,7 +138,7 @@ class TestAPIKeyService:
         mock_hash = "$2b$12$mocked_hash_value"
         
         # Mock the database to return a key with this hash
-        mock_db.get_all_api_keys.return_value = [{
+        mock_db.get_unmigrated_api_keys.return_value = [{
             "key_id": "key123",
             "user_id": "user123",
             "key_hash": mock_hash,
@@ -162,7 +166,7 @@ class TestAPIKeyService:
         expired_time = (datetime.datetime.now(datetime.timezone.utc) - datetime.timedelta(days=1)).isoformat()
         mock_hash = "$2b$12$mocked_hash_value"
         
-        mock_db.get_all_api_keys.return_value = [{
+        mock_db.get_unmigrated_api_keys.return_value = [{
             "key_id": "key123",
             "user_id": "user123",
             "key_hash": mock_hash,
@@ -186,7 +190,7 @@ class TestAPIKeyService:
         api_key = "hk_live_inactive_key_123"
         mock_hash = "$2b$12$mocked_hash_value"
         
-        mock_db.get_all_api_keys.return_value = [{
+        mock_db.get_unmigrated_api_keys.return_value = [{
             "key_id": "key123",
             "user_id": "user123",
             "key_hash": mock_hash,
@@ -210,7 +214,7 @@ class TestAPIKeyService:
         api_key = "hk_live_ip_restricted_key_123"
         mock_hash = "$2b$12$mocked_hash_value"
         
-        mock_db.get_all_api_keys.return_value = [{
+        mock_db.get_unmigrated_api_keys.return_value = [{
             "key_id": "key123",
             "user_id": "user123",
             "key_hash": mock_hash,
@@ -234,7 +238,7 @@ class TestAPIKeyService:
         """Test validation of non-existent API key."""
         # Arrange
         api_key = "hk_live_not_found_key_123"
-        mock_db.get_all_api_keys.return_value = []
+        mock_db.get_unmigrated_api_keys.return_value = []
         
         with patch('src.auth.api_key_service.bcrypt.checkpw', return_value=False):
             # Act
@@ -423,4 +427,219 @@ class TestAPIKeyService:
         
         # Act & Assert
         assert api_key_service._verify_api_key(api_key, hash_value) is True
-        assert api_key_service._verify_api_key("wrong_key", hash_value) is False
\ No newline at end of file
+        assert api_key_service._verify_api_key("wrong_key", hash_value) is False
+
+    def test_validate_api_key_uses_single_indexed_lookup(self, api_key_service, mock_db):
+        """Test validation fetches one row by lookup digest and runs one bcrypt check."""
+        # Arrange
+        api_key = "hk_live_indexed_key_123"
+        mock_db.get_api_key_by_lookup_hash.return_value = {
+            "key_id": "key123",
+            "user_id": "user123",
+            "key_hash": "$2b$12$mocked_hash_value",
+            "key_lookup_hash": api_key_service._lookup_hash(api_key),
+            "is_active": True,
+            "expires_at": None,
+            "rate_limit_per_hour": 100,
+            "allowed_ips": None
+        }
+
+        with patch('src.auth.api_key_service.bcrypt.checkpw', return_value=True) as checkpw:
+            # Act
+            result = api_key_service.validate_api_key(api_key)
+
+        # Assert
+        assert result.is_valid is True
+        assert result.key_id == "key123"
+        mock_db.get_api_key_by_lookup_hash.assert_called_once_with(
+            api_key_service._lookup_hash(api_key)
+        )
+        assert checkpw.call_count == 1
+        mock_db.get_unmigrated_api_keys.assert_not_called()
+
+    def test_validate_api_key_rejects_digest_hit_with_bcrypt_mismatch(self, api_key_service, mock_db):
+        """Test a lookup digest hit still requires the bcrypt hash to verify."""
+        # Arrange
+        mock_db.get_api_key_by_lookup_hash.return_value = {
+            "key_id": "key123",
+            "key_hash": "$2b$12$mocked_hash_value",
+            "is_active": True,
+        }
+
+        with patch('src.auth.api_key_service.bcrypt.checkpw', return_value=False):
+            # Act
+            result = api_key_service.validate_api_key("hk_live_forged_key")
+
+        # Assert
+        assert result.is_valid is False
+        assert result.error == "API key not found"
+        mock_db.get_unmigrated_api_keys.assert_not_called()
+
+    def test_lookup_hash_is_deterministic_and_keyed(self, mock_db):
+        """Test lookup digests are stable per secret and differ across secrets."""
+        # Arrange
+        service = APIKeyService(db=mock_db, lookup_secret="secret-a")
+        other = APIKeyService(db=mock_db, lookup_secret="secret-b")
+
+        # Act
+        digest = service._lookup_hash("hk_live_abc")
+
+        # Assert
+        assert digest == service._lookup_hash("hk_live_abc")
+        assert digest != service._lookup_hash("hk_live_abd")
+        assert digest != other._lookup_hash("hk_live_abc")
+        assert "hk_live_abc" not in digest
+
+    def test_validate_api_key_backfills_legacy_lookup_hash(self, api_key_service, mock_db):
+        """Test legacy rows are found by a filtered scan and backfilled on first use."""
+        # Arrange
+        api_key = "hk_live_abcLegacyKey"
+        mock_db.get_unmigrated_api_keys.return_value = [
+            {
+                "key_id": "migrated",
+                "key_hash": "h1",
+                "key_lookup_hash": "digest",
+                "key_lookup_version": api_key_service._lookup_version,
+            },
+            {"key_id": "other-prefix", "key_hash": "h2", "key_prefix": "hk_live_xyz"},
+            {
+                "key_id": "legacy",
+                "user_id": "user123",
+                "key_hash": "h3",
+                "key_prefix": "hk_live_abc",
+                "is_active": True,
+            },
+        ]
+
+        with patch('src.auth.api_key_service.bcrypt.checkpw', return_value=True) as checkpw:
+            # Act
+            result = api_key_service.validate_api_key(api_key)
+
+        # Assert
+        assert result.is_valid is True
+        assert result.key_id == "legacy"
+        assert checkpw.call_count == 1
+        mock_db.update_api_key.assert_called_once_with(
+            "legacy",
+            {
+                "key_lookup_hash": api_key_service._lookup_hash(api_key),
+                "key_lookup_version": api_key_service._lookup_version,
+            }
+        )
+
+    def test_rotated_secret_rescans_and_redigests_stale_rows(self, mock_db):
+        """Test rows digested under a previous secret are found and re-keyed."""
+        # Arrange
+        api_key = "hk_live_abcRotatedKey"
+        old = APIKeyService(db=mock_db, lookup_secret="secret-a")
+        service = APIKeyService(db=mock_db, lookup_secret="secret-b")
+        mock_db.get_unmigrated_api_keys.return_value = [
+            {
+                "key_id": "rotated",
+                "user_id": "user123",
+                "key_hash": "h1",
+                "key_prefix": "hk_live_abc",
+                "key_lookup_hash": old._lookup_hash(api_key),
+                "key_lookup_version": old._lookup_version,
+                "is_active": True,
+            },
+        ]
+
+        with patch('src.auth.api_key_service.bcrypt.checkpw', return_value=True):
+            # Act
+            result = service.validate_api_key(api_key)
+
+        # Assert
+        assert result.is_valid is True
+        assert result.key_id == "rotated"
+        assert old._lookup_version != service._lookup_version
+        mock_db.update_api_key.assert_called_once_with(
+            "rotated",
+            {
+                "key_lookup_hash": service._lookup_hash(api_key),
+                "key_lookup_version": service._lookup_version,
+            }
+        )
+
+    @pytest.mark.parametrize("environment", ["production", "staging"])
+    def test_missing_lookup_secret_fails_closed_in_protected_environments(
+        self, mock_db, monkeypatch, environment
+    ):
+        """Test an unset lookup secret is refused where digests must be keyed."""
+        # Arrange
+        monkeypatch.delenv("API_KEY_LOOKUP_SECRET", raising=False)
+        monkeypatch.setenv("ENVIRONMENT", environment)
+
+        # Act & Assert
+        with pytest.raises(APIKeyError, match="API_KEY_LOOKUP_SECRET"):
+            APIKeyService(db=mock_db)
+
+    def test_missing_lookup_secret_warns_in_development(self, mock_db, monkeypatch, caplog):
+        """Test an unset lookup secret is logged loudly outside protected environments."""
+        # Arrange
+        monkeypatch.delenv("API_KEY_LOOKUP_SECRET", raising=False)
+        monkeypatch.setenv("ENVIRONMENT", "development")
+
+        # Act
+        with caplog.at_level("WARNING", logger="src.auth.api_key_service"):
+            APIKeyService(db=mock_db)
+
+        # Assert
+        assert "API_KEY_LOOKUP_SECRET is not set" in caplog.text
+
+    def test_validate_api_key_without_legacy_lookup_skips_scan(self, mock_db):
+        """Test disabling the legacy scan once all rows carry lookup digests."""
+        # Arrange
+        service = APIKeyService(db=mock_db, legacy_lookup=False)
+
+        # Act
+        result = service.validate_api_key("hk_live_unknown_key")
+
+        # Assert
+        assert result.is_valid is False
+        assert result.error == "API key not found"
+        mock_db.get_unmigrated_api_keys.assert_not_called()
+
+    def test_legacy_lookup_defaults_to_environment_flag(self, mock_db, monkeypatch):
+        """Test API_KEY_LEGACY_LOOKUP switches the legacy scan off after the backfill."""
+        # Arrange
+        monkeypatch.setenv("API_KEY_LEGACY_LOOKUP", "false")
+        service = APIKeyService(db=mock_db)
+
+        # Act
+        result = service.validate_api_key("hk_live_unknown_key")
+
+        # Assert
+        assert result.is_valid is False
+        mock_db.get_unmigrated_api_keys.assert_not_called()
+
+    def test_unknown_key_queries_only_unmigrated_rows_for_its_prefix(
+        self, api_key_service, mock_db
+    ):
+        """Test a digest miss never loads the whole key table."""
+        # Arrange
+        mock_db.get_unmigrated_api_keys.return_value = []
+
+        with patch('src.auth.api_key_service.bcrypt.checkpw') as checkpw:
+            # Act
+            result = api_key_service.validate_api_key("hk_test_zzzUnknownKey")
+
+        # Assert
+        assert result.is_valid is False
+        assert result.error == "API key not found"
+        mock_db.get_all_api_keys.assert_not_called()
+        mock_db.get_unmigrated_api_keys.assert_called_once_with(
+            key_prefix="hk_test_zzz", lookup_version=api_key_service._lookup_version
+        )
+        checkpw.assert_not_called()
+
+    @pytest.mark.parametrize("api_key", ["", "not-a-key", "hk_live_", "hk_prod_abcdef"])
+    def test_malformed_key_skips_legacy_lookup(self, api_key_service, mock_db, api_key):
+        """Test keys that cannot carry a stored prefix never reach the database scan."""
+        # Act
+        result = api_key_service.validate_api_key(api_key)
+
+        # Assert
+        assert result.is_valid is False
+        mock_db.get_all_api_keys.assert_not_called()
+        mock_db.get_unmigrated_api_keys.assert_not_called()
@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 from datetime import datetime, timezone
-from unittest.mock import Mock
+from unittest.mock import AsyncMock, Mock
 
 import httpx
 import pytest
@@ -87,7 +88,7 @@ def test_notifier_posts_payload_on_success(monkeypatch: pytest.MonkeyPatch) -> N
     )
     response = Mock(status_code=201, text="")
     post_mock = Mock(return_value=response)
-    monkeypatch.setattr("src.api.services.auth_service_notifier.httpx.post", post_mock)
+    monkeypatch.setattr("src.api.services.auth_service_notifier.httpx.Client.post", post_mock)
 
     notifier.notify_accepted(record=_record(), auth=_auth(), storage_ref="s3://bucket/key")
 
@@ -127,7 +128,7 @@ def test_notifier_treats_conflict_as_non_retryable(
     )
     response = Mock(status_code=409, text="conflict")
     post_mock = Mock(return_value=response)
-    monkeypatch.setattr("src.api.services.auth_service_notifier.httpx.post", post_mock)
+    monkeypatch.setattr("src.api.services.auth_service_notifier.httpx.Client.post", post_mock)
 
     notifier.notify_accepted(record=_record(), auth=_auth())
 
@@ -147,7 +148,7 @@ def test_notifier_retries_retryable_failures(
         retry_attempts=2,
     )
     post_mock = Mock(side_effect=httpx.TimeoutException("request timed out"))
-    monkeypatch.setattr("src.api.services.auth_service_notifier.httpx.post", post_mock)
+    monkeypatch.setattr("src.api.services.auth_service_notifier.httpx.Client.post", post_mock)
 
     notifier.notify_accepted(record=_record(), auth=_auth())
 
@@ -167,7 +168,7 @@ def test_notifier_dry_run_skips_http_call(monkeypatch: pytest.MonkeyPatch) -> No
         dry_run=True,
     )
     post_mock = Mock()
-    monkeypatch.setattr("src.api.services.auth_service_notifier.httpx.post", post_mock)
+    monkeypatch.setattr("src.api.services.auth_service_notifier.httpx.Client.post", post_mock)
 
     notifier.notify_accepted(record=_record(), auth=_auth())
 
@@ -206,7 +207,7 @@ def test_notify_lifecycle_update_returns_true_on_success(
     )
     response = Mock(status_code=200, text="")
     post_mock = Mock(return_value=response)
-    monkeypatch.setattr("src.api.services.auth_service_notifier.httpx.post", post_mock)
+    monkeypatch.setattr("src.api.services.auth_service_notifier.httpx.Client.post", post_mock)
 
     delivered, error = notifier.notify_lifecycle_update(_lifecycle_payload())
 
@@ -262,7 +263,7 @@ def test_notify_lifecycle_update_returns_false_on_retryable_failure(
     )
     response = Mock(status_code=503, text="downstream unavailable")
     post_mock = Mock(return_value=response)
-    monkeypatch.setattr("src.api.services.auth_service_notifier.httpx.post", post_mock)
+    monkeypatch.setattr("src.api.services.auth_service_notifier.httpx.Client.post", post_mock)
 
     delivered, error = notifier.notify_lifecycle_update(_lifecycle_payload())
 
@@ -280,7 +281,7 @@ def test_notify_lifecycle_update_dry_run_skips_http_call(
         dry_run=True,
     )
     post_mock = Mock()
-    monkeypatch.setattr("src.api.services.auth_service_notifier.httpx.post", post_mock)
+    monkeypatch.setattr("src.api.services.auth_service_notifier.httpx.Client.post", post_mock)
 
     delivered, error = notifier.notify_lifecycle_update(_lifecycle_payload())
 
@@ -299,7 +300,7 @@ def test_notify_reward_entitlement_ingests_one_row_per_contributor(
     )
     response = Mock(status_code=201, text="")
     post_mock = Mock(return_value=response)
-    monkeypatch.setattr("src.api.services.auth_service_notifier.httpx.post", post_mock)
+    monkeypatch.setattr("src.api.services.auth_service_notifier.httpx.Client.post", post_mock)
 
     delivered, error = notifier.notify_reward_entitlement(
         mint_request=_mint_request(),
@@ -340,7 +341,7 @@ def test_notify_reward_entitlement_dry_run_skips_http_call(
         dry_run=True,
     )
     post_mock = Mock()
-    monkeypatch.setattr("src.api.services.auth_service_notifier.httpx.post", post_mock)
+    monkeypatch.setattr("src.api.services.auth_service_notifier.httpx.Client.post", post_mock)
 
     delivered, error = notifier.notify_reward_entitlement(
         mint_request=_mint_request(),
@@ -363,7 +364,7 @@ def test_notify_reward_entitlement_skips_contributor_without_account(
     )
     response = Mock(status_code=201, text="")
     post_mock = Mock(return_value=response)
-    monkeypatch.setattr("src.api.services.auth_service_notifier.httpx.post", post_mock)
+    monkeypatch.setattr("src.api.services.auth_service_notifier.httpx.Client.post", post_mock)
 
     mint_request = _mint_request()
     # A legacy wallet-only contributor (no account/contributor_id) cannot be ingested
@@ -392,7 +393,7 @@ def test_notify_reward_entitlement_retries_and_returns_false(
     )
     response = Mock(status_code=503, text="downstream unavailable")
     post_mock = Mock(return_value=response)
-    monkeypatch.setattr("src.api.services.auth_service_notifier.httpx.post", post_mock)
+    monkeypatch.setattr("src.api.services.auth_service_notifier.httpx.Client.post", post_mock)
 
     mint_request = _mint_request()
     del mint_request.contributors[1]  # single contributor -> deterministic retry count
@@ -418,7 +419,7 @@ def test_notify_reward_entitlement_includes_claimable_vesting(
     )
     response = Mock(status_code=200, text="")
     post_mock = Mock(return_value=response)
-    monkeypatch.setattr("src.api.services.auth_service_notifier.httpx.post", post_mock)
+    monkeypatch.setattr("src.api.services.auth_service_notifier.httpx.Client.post", post_mock)
 
     delivered, error = notifier.notify_reward_entitlement(
         mint_request=_mint_request(),
@@ -451,7 +452,7 @@ def test_notify_reward_entitlement_marks_pending_wallet_as_mint_pending(
         dry_run=False,
     )
     post_mock = Mock(return_value=Mock(status_code=201, text=""))
-    monkeypatch.setattr("src.api.services.auth_service_notifier.httpx.post", post_mock)
+    monkeypatch.setattr("src.api.services.auth_service_notifier.httpx.Client.post", post_mock)
 
     delivered, error = notifier.notify_reward_entitlement(
         mint_request=_mint_request(),
@@ -475,7 +476,7 @@ def test_notify_direct_mint_settlement_posts_claimed_rows(
         dry_run=False,
     )
     post_mock = Mock(return_value=Mock(status_code=200, text=""))
-    monkeypatch.setattr("src.api.services.auth_service_notifier.httpx.post", post_mock)
+    monkeypatch.setattr("src.api.services.auth_service_notifier.httpx.Client.post", post_mock)
     mint_request = _mint_request()
 
     delivered, error = notifier.notify_direct_mint_settlement(
@@ -569,7 +570,7 @@ def test_resolve_wallet_verified_200(monkeypatch: pytest.MonkeyPatch) -> None:
             ),
         )
     )
-    monkeypatch.setattr("src.api.services.auth_service_notifier.httpx.get", get_mock)
+    monkeypatch.setattr("src.api.services.auth_service_notifier.httpx.Client.get", get_mock)
 
     result = _notifier().resolve_wallet(user_id="11111111-1111-1111-1111-111111111111")
 
@@ -599,7 +600,7 @@ def test_resolve_wallet_unverified_200_routes_to_escrow(
             ),
         )
     )
-    monkeypatch.setattr("src.api.services.auth_service_notifier.httpx.get", get_mock)
+    monkeypatch.setattr("src.api.services.auth_service_notifier.httpx.Client.get", get_mock)
 
     result = _notifier().resolve_wallet(user_id="11111111-1111-1111-1111-111111111111")
 
@@ -611,7 +612,7 @@ def test_resolve_wallet_unverified_200_routes_to_escrow(
 
 def test_resolve_wallet_unresolved_on_404(monkeypatch: pytest.MonkeyPatch) -> None:
     get_mock = Mock(return_value=Mock(status_code=404, text="missing"))
-    monkeypatch.setattr("src.api.services.auth_service_notifier.httpx.get", get_mock)
+    monkeypatch.setattr("src.api.services.auth_service_notifier.httpx.Client.get", get_mock)
 
     result = _notifier().resolve_wallet(user_id="11111111-1111-1111-1111-111111111111")
 
@@ -623,7 +624,7 @@ def test_resolve_wallet_unresolved_on_404(monkeypatch: pytest.MonkeyPatch) -> No
 
 def test_resolve_wallet_unresolved_on_403(monkeypatch: pytest.MonkeyPatch) -> None:
     get_mock = Mock(return_value=Mock(status_code=403, text="forbidden"))
-    monkeypatch.setattr("src.api.services.auth_service_notifier.httpx.get", get_mock)
+    monkeypatch.setattr("src.api.services.auth_service_notifier.httpx.Client.get", get_mock)
 
     result = _notifier().resolve_wallet(user_id="11111111-1111-1111-1111-111111111111")
 
@@ -638,7 +639,7 @@ def test_resolve_wallet_dry_run_skips_http(monkeypatch: pytest.MonkeyPatch) -> N
         dry_run=True,
     )
     get_mock = Mock()
-    monkeypatch.setattr("src.api.services.auth_service_notifier.httpx.get", get_mock)
+    monkeypatch.setattr("src.api.services.auth_service_notifier.httpx.Client.get", get_mock)
 
     result = notifier.resolve_wallet(user_id="11111111-1111-1111-1111-111111111111")
 
@@ -646,6 +647,124 @@ def test_resolve_wallet_dry_run_skips_http(monkeypatch: pytest.MonkeyPatch) -> N
     assert get_mock.call_count == 0
 
 
+def _wallet_response(user_id: str) -> Mock:
+    return Mock(
+        status_code=200,
+        json=Mock(
+            return_value={
+                "wallet_address": f"0x{user_id}",
+                "has_verified_wallet": True,
+            }
+        ),
+    )
+
+
+def test_resolve_wallets_dedupes_and_caches(monkeypatch: pytest.MonkeyPatch) -> None:
+    get_mock = Mock(side_effect=lambda url, **kwargs: _wallet_response(url.split("/")[-2]))
+    monkeypatch.setattr("src.api.services.auth_service_notifier.httpx.Client.get", get_mock)
+    notifier = _notifier()
+
+    first = notifier.resolve_wallets(["aa", "bb", "aa", "cc", ""])
+    second = notifier.resolve_wallets(["cc", "bb"])
+
+    assert list(first) == ["aa", "bb", "cc"]
+    assert first["bb"].wallet_address == "0xbb"
+    assert second == {"cc": first["cc"], "bb": first["bb"]}
+    assert get_mock.call_count == 3
+
+
+def test_resolve_wallet_does_not_cache_retryable_failures(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    get_mock = Mock(side_effect=[Mock(status_code=503), _wallet_response("aa")])
+    monkeypatch.setattr("src.api.services.auth_service_notifier.httpx.Client.get", get_mock)
+    notifier = AuthServiceNotifier(
+        auth_service_url="https://auth.service.local",
+        internal_token="secret-token",
+        dry_run=False,
+        retry_attempts=1,
+    )
+
+    assert notifier.resolve_wallet(user_id="aa").resolved is False
+    assert notifier.resolve_wallet(user_id="aa").wallet_address == "0xaa"
+    assert notifier.resolve_wallet(user_id="aa").wallet_address == "0xaa"
+    assert get_mock.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_aresolve_wallets_uses_async_client(monkeypatch: pytest.MonkeyPatch) -> None:
+    get_mock = AsyncMock(side_effect=lambda url, **kwargs: _wallet_response(url.split("/")[-2]))
+    monkeypatch.setattr("src.api.services.auth_service_notifier.httpx.AsyncClient.get", get_mock)
+    notifier = _notifier()
+
+    result = await notifier.aresolve_wallets(["aa", "bb"])
+    await notifier.aclose()
+
+    assert {user_id: r.wallet_address for user_id, r in result.items()} == {
+        "aa": "0xaa",
+        "bb": "0xbb",
+    }
+    assert get_mock.await_count == 2
+
+
+def test_async_clients_are_per_loop_and_all_closed() -> None:
+    notifier = _notifier()
+
+    async def client_for_loop() -> httpx.AsyncClient:
+        return notifier._get_async_client()
+
+    # The first loop closes before the second one starts, so its client is dropped
+    first = asyncio.run(client_for_loop())
+
+    async def use_and_close() -> tuple[httpx.AsyncClient, httpx.AsyncClient, int]:
+        second = notifier._get_async_client()
+        again = notifier._get_async_client()
+        live = len(notifier._async_clients)
+        await notifier.aclose()
+        return second, again, live
+
+    second, again, live = asyncio.run(use_and_close())
+
+    assert second is again
+    assert second is not first
+    assert live == 1
+    assert second.is_closed
+    assert notifier._async_clients == {}
+
+
+def test_submit_lifecycle_update_delivers_through_outbox(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    post_mock = Mock(return_value=Mock(status_code=200, text="ok"))
+    monkeypatch.setattr("src.api.services.auth_service_notifier.httpx.Client.post", post_mock)
+    notifier = _notifier()
+    results: list[tuple[bool, str | None]] = []
+
+    notifier.submit_lifecycle_update(
+        _lifecycle_payload(), lambda delivered, error: results.append((delivered, error))
+    )
+    assert notifier.outbox.drain(timeout=5)
+    notifier.close()
+
+    assert results == [(True, None)]
+    assert post_mock.call_args.args[0] == (
+        "https://auth.service.local/api/v1/internal/data-submissions/processed"
+    )
+
+
+def test_submit_accepted_delivers_inline_when_outbox_is_full(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    post_mock = Mock(return_value=Mock(status_code=201, text="ok"))
+    monkeypatch.setattr("src.api.services.auth_service_notifier.httpx.Client.post", post_mock)
+    notifier = _notifier()
+    notifier.outbox.close()
+
+    notifier.submit_accepted(record=_record(), auth=_auth())
+
+    assert post_mock.call_count == 1
+
+
 @pytest.mark.parametrize(
     ("cause", "expected"),
     [
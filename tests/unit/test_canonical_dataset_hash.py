@@ -0,0 +1,115 @@
+"""Unit tests for streaming canonical dataset hashing."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import random
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from src.evaluation.custom_eval import compute_dataset_hash
+from src.utils import dataset_hash
+from src.utils.dataset_hash import (
+    canonical_dataset_sha256,
+    canonical_rows_sha256,
+    dataframe_records_sha256,
+)
+
+
+def _rows(count: int = 400) -> list[dict]:
+    rng = random.Random(5)
+    return [
+        {
+            "id": index,
+            "label": rng.choice(["a", "ü", None]),
+            "score": rng.random(),
+            "ok": rng.choice([True, False]),
+        }
+        for index in range(count)
+    ]
+
+
+def _in_memory_hash(payload: object) -> str:
+    """The whole-dataset canonical hash the streaming routines must reproduce."""
+    if isinstance(payload, list):
+        payload = sorted(
+            payload, key=lambda row: json.dumps(row, sort_keys=True, separators=(",", ":"))
+        )
+    canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+    return "sha256:" + hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+@pytest.mark.parametrize("buffer_bytes", [64 * 1024 * 1024, 512])
+def test_rows_hash_matches_in_memory_sort(buffer_bytes: int) -> None:
+    rows = _rows()
+    shuffled = random.Random(1).sample(rows, len(rows))
+
+    digest = canonical_rows_sha256(shuffled, buffer_bytes=buffer_bytes)
+
+    # 512 bytes forces dozens of spilled runs through the merge
+    assert "sha256:" + digest == _in_memory_hash(rows)
+
+
+def test_many_spilled_runs_merge_in_passes(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(dataset_hash, "_MAX_MERGE_FAN_IN", 3)
+    rows = _rows()
+
+    digest = canonical_rows_sha256(reversed(rows), buffer_bytes=256)
+
+    assert "sha256:" + digest == _in_memory_hash(rows)
+
+
+def test_dataset_files_hash_like_loaded_rows(tmp_path: Path) -> None:
+    rows = _rows()
+    (tmp_path / "rows.json").write_text(json.dumps(rows), encoding="utf-8")
+    (tmp_path / "row.json").write_text(json.dumps(rows[0]), encoding="utf-8")
+    (tmp_path / "rows.jsonl").write_text(
+        "\n".join(json.dumps(row) for row in rows) + "\n\n", encoding="utf-8"
+    )
+
+    assert canonical_dataset_sha256(tmp_path / "rows.json") == _in_memory_hash(rows)
+    assert canonical_dataset_sha256(tmp_path / "row.json") == _in_memory_hash(rows[0])
+    assert canonical_dataset_sha256(tmp_path / "rows.jsonl", buffer_bytes=1024) == _in_memory_hash(
+        rows
+    )
+
+
+def test_parquet_batches_hash_like_whole_file(tmp_path: Path) -> None:
+    frame = pd.DataFrame(_rows())
+    # A single null late in the file turns the whole column into floats on load
+    frame["count"] = pd.array([*range(len(frame) - 1), None], dtype="Int64")
+    path = tmp_path / "rows.parquet"
+    frame.to_parquet(path, row_group_size=100)
+
+    expected = _in_memory_hash(pd.read_parquet(path).to_dict("records"))
+
+    assert canonical_dataset_sha256(path, batch_rows=64, buffer_bytes=4096) == expected
+    assert compute_dataset_hash(None, str(path)) == expected
+
+
+def test_jsonl_row_that_is_not_an_object_is_rejected(tmp_path: Path) -> None:
+    path = tmp_path / "rows.jsonl"
+    path.write_text('{"a": 1}\n[1, 2]\n', encoding="utf-8")
+
+    with pytest.raises(ValueError, match="line 2"):
+        canonical_dataset_sha256(path)
+
+
+@pytest.mark.parametrize(
+    "frame",
+    [
+        pd.DataFrame(_rows()).sample(frac=1, random_state=3)[["score", "ok", "id", "label"]],
+        pd.DataFrame(_rows()).set_index(["ok", "label"]),
+        pd.DataFrame({"b": [1, 2], "a": [3.5, None]}, index=["y", "x"]),
+        pd.DataFrame(),
+    ],
+)
+def test_dataframe_hash_matches_sorted_to_json(frame: pd.DataFrame) -> None:
+    expected = frame.sort_index().sort_index(axis=1).to_json(orient="records")
+
+    digest = dataframe_records_sha256(frame, chunk_rows=37)
+
+    assert digest == hashlib.sha256(expected.encode()).hexdigest()
@@ -0,0 +1,159 @@
+"""Unit tests for columnar scorers and fused multi-scorer evaluation."""
+
+from __future__ import annotations
+
+import copy
+import json
+import random
+from pathlib import Path
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+
+from src.evaluation.custom_eval import _load_sales_outcome_frame
+from src.evaluation.schema import MetricFamily
+from src.evaluation.scorers import Aggregation, list_scorers, register_scorer, resolve_scorer
+from src.evaluation.scorers import builtin as builtin_scorers
+from src.evaluation.scorers.columnar import ScorerFrame, evaluate_scorers
+
+EXAMPLES_DIR = Path(__file__).resolve().parents[2] / "schema" / "examples"
+
+
+@pytest.fixture(autouse=True)
+def _isolated_scorer_registry():
+    """Snapshot built-in registrations, restore after test."""
+    from src.evaluation.scorers import registry as _reg
+
+    snapshot = dict(_reg._REGISTRY)
+    yield
+    _reg._REGISTRY.clear()
+    _reg._REGISTRY.update(snapshot)
+
+
+def _load_example(name: str) -> dict:
+    return json.loads((EXAMPLES_DIR / name).read_text(encoding="utf-8"))
+
+
+def _task_router_rows() -> list[dict]:
+    rows = copy.deepcopy(
+        _load_example("technical_task_router_benchmark_score.v2.golden.json")["rows"]
+    )
+    rng = random.Random(11)
+    for row in list(rows):
+        variant = copy.deepcopy(row)
+        variant["selected_models"] = rng.choice([[], ["unlisted"], None, [1]])
+        variant["completed_successfully"] = rng.choice([True, False, 1])
+        variant["actual_cost_usd"] = rng.choice([0.0, variant["max_cost_usd"], 10.0])
+        variant.pop(rng.choice(["estimated_cost_usd", "actual_time_seconds", "max_cost_usd"]), None)
+        rows.append(variant)
+    return rows
+
+
+def _sales_rows() -> list[dict]:
+    rows = []
+    for name in (
+        "sales_outcome_row.qualified_meeting.v1.json",
+        "sales_outcome_row.lead_scoring_unqualified.v1.json",
+        "sales_outcome_row.revenue.v1.json",
+        "sales_outcome_row.spam_complaint.v1.json",
+        "sales_outcome_row.unsubscribe.v1.json",
+    ):
+        row = _load_example(name)
+        rows.extend([row, {**row, "delivered_count": 0}, {**row, "revenue_amount_cents": None}])
+    return rows
+
+
+@pytest.mark.parametrize(
+    ("prefix", "rows"),
+    [("technical_task_router.", _task_router_rows()), ("sales:", _sales_rows())],
+)
+def test_builtin_columnar_scorers_match_row_scorers(prefix: str, rows: list[dict]) -> None:
+    frame = ScorerFrame.from_rows(rows)
+    refs = [meta.scorer_ref for meta in list_scorers() if meta.scorer_ref.startswith(prefix)]
+
+    for ref in refs:
+        registered = resolve_scorer(ref)
+        assert registered.columnar_ is not None, ref
+        assert registered.columnar_(frame) == registered.callable_(rows), ref
+
+
+def test_columnar_scorer_raises_like_row_scorer() -> None:
+    rows = [{"schema_version": "sales_outcome_row/v1", "unsubscribe": True, "delivered_count": -3}]
+    registered = resolve_scorer("sales:unsubscribe_rate")
+
+    with pytest.raises(ValueError, match=r"Negative delivered_count is not allowed: -3$"):
+        registered.columnar_(ScorerFrame.from_rows(rows))
+
+
+def test_fused_pass_partitions_rows_and_shims_row_scorers() -> None:
+    seen: list[list[dict]] = []
+
+    def _row_count(rows: list[dict]) -> float:
+        seen.append(rows)
+        return float(len(rows))
+
+    register_scorer(
+        "custom:row_count",
+        callable_=_row_count,
+        version="1.0.0",
+        input_schema={"type": "array"},
+        output_metric_keys=("custom:row_count",),
+        metric_family=MetricFamily.QUALITY,
+        aggregation=Aggregation.SUM,
+    )
+    rows = [
+        {"scorer_ref": "sales:qualified_meeting_rate", "qualified_meeting": True},
+        {"scorer_ref": "custom:row_count"},
+        {"metric_name": "custom:row_count", "qualified_meeting": False},
+        {"scorer_ref": "sales:qualified_meeting_rate", "qualified_meeting": False},
+    ]
+
+    values = evaluate_scorers(
+        ScorerFrame.from_rows(rows),
+        [
+            resolve_scorer("sales:qualified_meeting_rate"),
+            resolve_scorer("custom:row_count"),
+            resolve_scorer("custom:row_count"),
+        ],
+        partition_by=("scorer_ref", "metric_name"),
+    )
+
+    assert values == {"sales:qualified_meeting_rate": 0.5, "custom:row_count": 2.0}
+    # The row scorer runs once and sees the original dicts, absent keys included.
+    assert seen == [[rows[1], rows[2]]]
+
+
+def test_fused_pass_derives_shared_task_router_masks_once() -> None:
+    rows = _task_router_rows()
+    scorers = [
+        resolve_scorer(meta.scorer_ref)
+        for meta in list_scorers()
+        if meta.scorer_ref.startswith("technical_task_router.")
+    ]
+
+    with patch.object(
+        builtin_scorers,
+        "_compute_task_router_selection_valid",
+        wraps=builtin_scorers._compute_task_router_selection_valid,
+    ) as selection_valid:
+        values = evaluate_scorers(ScorerFrame.from_rows(rows), scorers)
+
+    assert selection_valid.call_count == 1
+    assert values == {
+        registered.metadata.scorer_ref: registered.callable_(rows) for registered in scorers
+    }
+
+
+def test_parquet_dataset_loads_as_columns(tmp_path: Path) -> None:
+    path = tmp_path / "sales.parquet"
+    pd.DataFrame(_sales_rows()).to_parquet(path)
+
+    frame = _load_sales_outcome_frame(str(path))
+
+    assert len(frame) == len(_sales_rows())
+    assert evaluate_scorers(frame, [resolve_scorer("sales:qualified_meeting_rate")]) == {
+        "sales:qualified_meeting_rate": resolve_scorer("sales:qualified_meeting_rate").callable_(
+            _sales_rows()
+        )
+    }
@@ -502,7 +502,7 @@ class TestClusterBootstrap:
         assert result_a.ci_high == pytest.approx(result_b.ci_high, rel=1e-9)
 
     def test_cluster_bootstrap_ci_matches_reference_within_tolerance(self) -> None:
-        """Cluster CI from comparator matches inline reference bootstrap."""
+        """Cluster CI from comparator agrees with a per-iteration reference bootstrap."""
         rng = np.random.default_rng(55)
         treatment, t_ids = self._make_clustered_data(rng, n_clusters=40, mean_spend=2.0)
         control, c_ids = self._make_clustered_data(rng, n_clusters=40, mean_spend=1.0)
@@ -516,7 +516,8 @@ class TestClusterBootstrap:
             _rng=np.random.default_rng(0),
         )
 
-        # Reference inline cluster bootstrap with same RNG seed
+        # Reference loop bootstrap; the vectorized draws consume the RNG differently,
+        # so the bounds agree up to Monte Carlo error rather than exactly
         ref_rng = np.random.default_rng(0)
         unique_t = np.unique(t_ids)
         unique_c = np.unique(c_ids)
@@ -531,9 +532,46 @@ class TestClusterBootstrap:
             deltas.append(t_rows.mean() - c_rows.mean())
         ref_ci_low = float(np.percentile(deltas, 2.5))
         ref_ci_high = float(np.percentile(deltas, 97.5))
+        tolerance = 0.05 * (ref_ci_high - ref_ci_low)
 
-        assert result.ci_low == pytest.approx(ref_ci_low, rel=1e-6)
-        assert result.ci_high == pytest.approx(ref_ci_high, rel=1e-6)
+        assert result.ci_low == pytest.approx(ref_ci_low, abs=tolerance)
+        assert result.ci_high == pytest.approx(ref_ci_high, abs=tolerance)
+
+    def test_cluster_resample_means_match_concatenated_rows(self) -> None:
+        """Each replicate mean equals the mean of the drawn clusters' concatenated rows."""
+        rng = np.random.default_rng(9)
+        values, ids = self._make_clustered_data(rng, n_clusters=12, obs_per_cluster=5)
+        ids = np.where(ids % 3 == 0, ids * 7, ids)  # non-contiguous cluster labels
+        values, ids = values[:-2], ids[:-2]  # uneven cluster sizes
+
+        means = zero_inflated._cluster_resample_means(
+            values, ids, n_bootstrap=50, rng=np.random.default_rng(4)
+        )
+
+        unique_ids = np.unique(ids)
+        draws = np.random.default_rng(4).integers(0, len(unique_ids), size=(50, len(unique_ids)))
+        expected = [
+            np.concatenate([values[ids == unique_ids[k]] for k in row]).mean() for row in draws
+        ]
+        np.testing.assert_allclose(means, expected, rtol=1e-12)
+
+    @pytest.mark.parametrize("max_cells", [12, 12 * 7, 1 << 22])
+    def test_cluster_resample_means_do_not_depend_on_chunk_size(
+        self, monkeypatch: pytest.MonkeyPatch, max_cells: int
+    ) -> None:
+        """Seeded replicates are identical however many are drawn per block."""
+        rng = np.random.default_rng(10)
+        values, ids = self._make_clustered_data(rng, n_clusters=12, obs_per_cluster=4)
+        reference = zero_inflated._cluster_resample_means(
+            values, ids, n_bootstrap=50, rng=np.random.default_rng(4)
+        )
+
+        monkeypatch.setattr(zero_inflated, "_MAX_BOOTSTRAP_MATRIX_CELLS", max_cells)
+        means = zero_inflated._cluster_resample_means(
+            values, ids, n_bootstrap=50, rng=np.random.default_rng(4)
+        )
+
+        np.testing.assert_array_equal(means, reference)
 
     def test_mismatched_unit_ids_shape_falls_back_to_iid(self) -> None:
         """If unit_ids length != array length, treat as unclustered."""
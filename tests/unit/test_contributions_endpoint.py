@@ -468,7 +468,7 @@ def test_notifier_skipped_when_uuid_fields_invalid(
     )
     post_calls: list[dict[str, Any]] = []
     monkeypatch.setattr(
-        "src.api.services.auth_service_notifier.httpx.post",
+        "src.api.services.auth_service_notifier.httpx.Client.post",
         lambda *args, **kwargs: post_calls.append({"args": args, "kwargs": kwargs}),
     )
     record = StoredContributionRecord(
@@ -0,0 +1,147 @@
+"""Unit tests for FallbackPublisher."""
+
+from datetime import datetime
+from unittest.mock import Mock
+
+import pytest
+
+from src.events.publishers.fallback_publisher import FallbackPublisher
+
+
+class RecordingPublisher:
+    """Target publisher that records replayed messages and can fail on demand."""
+
+    def __init__(self, fail_on=None):
+        self.published = []
+        self.fail_on = fail_on
+
+    def publish(self, message, queue_name):
+        if message.get("n") == self.fail_on:
+            return False
+        self.published.append((queue_name, message["n"]))
+        return True
+
+
+class TestInMemoryFallbackPublisher:
+    """Test the default in-memory queue."""
+
+    def test_queue_depth_tracks_evictions(self, monkeypatch):
+        """Test per-queue depth stays correct when the oldest message is dropped."""
+        monkeypatch.delenv("FALLBACK_PUBLISHER_STORAGE_DIR", raising=False)
+        publisher = FallbackPublisher(max_queued_messages=3, enable_message_logging=False)
+
+        publisher.publish({"n": 1}, "a")
+        for n in range(2, 5):
+            publisher.publish({"n": n}, "b")
+
+        assert not publisher.durable
+        assert publisher.get_queue_depth("a") == 0
+        assert publisher.get_queue_depth("b") == 3
+        assert publisher.messages_dropped == 1
+
+
+class TestDurableFallbackPublisher:
+    """Test the segment-log backend."""
+
+    @pytest.fixture
+    def storage_dir(self, tmp_path):
+        """Directory for the segment log."""
+        return str(tmp_path / "fallback")
+
+    def _publisher(self, storage_dir, **kwargs):
+        return FallbackPublisher(
+            max_queued_messages=2,
+            enable_message_logging=False,
+            storage_dir=storage_dir,
+            **kwargs,
+        )
+
+    def test_messages_beyond_memory_limit_are_kept(self, storage_dir):
+        """Test the durable log drops nothing and answers per-queue lookups."""
+        publisher = self._publisher(storage_dir)
+
+        for n in range(10):
+            publisher.publish({"n": n}, "even" if n % 2 == 0 else "odd")
+
+        assert publisher.durable
+        assert publisher.messages_dropped == 0
+        assert publisher.get_queue_depth("even") == 5
+        assert publisher.get_queue_depth("missing") == 0
+        odd = publisher.get_messages_for_queue("odd")
+        assert [msg["payload"]["n"] for msg in odd] == [1, 3, 5, 7, 9]
+        assert isinstance(odd[0]["queued_at"], datetime)
+        assert publisher.health_check()["statistics"]["current_queue_size"] == 10
+
+    def test_queued_messages_survive_restart(self, storage_dir):
+        """Test a new process recovers the index and ignores a torn final record."""
+        publisher = self._publisher(storage_dir, segment_max_bytes=300)
+        for n in range(6):
+            publisher.publish({"n": n}, "events")
+        publisher.close()
+
+        segments = publisher._log.segments()
+        assert len(segments) > 1
+        with open(publisher._log._segment_path(segments[-1]), "ab") as f:
+            f.write(b'{"message_id": "half-writ')
+
+        recovered = self._publisher(storage_dir, segment_max_bytes=300)
+
+        assert recovered.get_queue_depth("events") == 6
+        messages = recovered.get_all_queued_messages()
+        assert [msg["payload"]["n"] for msg in messages] == list(range(6))
+
+        recovered.publish({"n": 6}, "events")
+        assert [msg["payload"]["n"] for msg in recovered.get_messages_for_queue("events")] == list(
+            range(7)
+        )
+
+    def test_replay_checkpoints_batches_and_resumes(self, storage_dir):
+        """Test replay stops at a failure and resumes after it in a new process."""
+        publisher = self._publisher(storage_dir, segment_max_bytes=200, replay_batch_size=2)
+        for n in range(7):
+            publisher.publish({"n": n}, "a" if n < 4 else "b")
+
+        failing = RecordingPublisher(fail_on=5)
+        stats = publisher.replay_messages(failing)
+
+        assert failing.published == [("a", 0), ("a", 1), ("a", 2), ("a", 3), ("b", 4)]
+        assert stats["total_messages"] == 7
+        assert stats["successful_replays"] == 5
+        assert stats["failed_replays"] == 1
+        assert publisher.get_queue_depth("a") == 0
+        assert publisher.get_queue_depth("b") == 2
+        publisher.close()
+
+        recovered = self._publisher(storage_dir, segment_max_bytes=200)
+        target = RecordingPublisher()
+        stats = recovered.replay_messages(target, batch_size=10)
+
+        assert target.published == [("b", 5), ("b", 6)]
+        assert stats["failed_replays"] == 0
+        assert recovered.get_all_queued_messages() == []
+        # Fully replayed segments are removed
+        assert recovered._log.segments() == [recovered._log.end_position()[0]]
+
+    def test_replay_exception_keeps_message(self, storage_dir):
+        """Test a message whose replay raises stays queued for the next attempt."""
+        publisher = self._publisher(storage_dir)
+        publisher.publish({"n": 0}, "events")
+        target = Mock()
+        target.publish.side_effect = ConnectionError("down")
+
+        stats = publisher.replay_messages(target)
+
+        assert stats["failed_replays"] == 1
+        assert "down" in stats["errors"][0]
+        assert publisher.get_queue_depth("events") == 1
+
+    def test_clear_queue_discards_log(self, storage_dir):
+        """Test clearing advances the checkpoint past every stored message."""
+        publisher = self._publisher(storage_dir)
+        for n in range(3):
+            publisher.publish({"n": n}, "events")
+
+        assert publisher.clear_queue() == 3
+        publisher.close()
+
+        assert self._publisher(storage_dir).get_queue_depth("events") == 0
@@ -0,0 +1,565 @@
+"""Unit tests for the inference pipeline cache manager."""
+
+import asyncio
+import pickle
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import AsyncMock, Mock, patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.services.inference_pipeline import (
+    CACHE_EXPIRY_KEY,
+    CACHE_INDEX_KEY,
+    CACHE_SIZES_KEY,
+    CacheStrategy,
+    HokusaiInferencePipeline,
+    InferenceCacheManager,
+    InferenceRequest,
+    MicroBatcher,
+    ModelLoader,
+    feature_digest,
+)
+from src.services.model_versioning import Environment
+
+
+@pytest.fixture
+def fake_redis():
+    """In-memory Redis with Lua scripting support."""
+    pytest.importorskip("lupa")
+    fakeredis = pytest.importorskip("fakeredis")
+    return fakeredis.FakeRedis()
+
+
+def _entry_size(manager, key):
+    return int(manager.redis.hget(CACHE_SIZES_KEY, key))
+
+
+class TestInferenceCacheEviction:
+    """Test size-aware eviction in InferenceCacheManager."""
+
+    @pytest.mark.asyncio
+    async def test_write_tracks_running_total_without_scanning(self, fake_redis):
+        """Test writes maintain the byte counter instead of scanning size keys."""
+        manager = InferenceCacheManager(fake_redis, max_cache_size_mb=1)
+
+        with patch.object(fake_redis, "scan_iter", side_effect=AssertionError("scanned")):
+            await manager.cache_prediction("inference:a", np.arange(10))
+            await manager.cache_prediction("inference:b", np.arange(20))
+            # Overwriting an entry replaces its size rather than double counting
+            await manager.cache_prediction("inference:a", np.arange(30))
+            stats = manager.get_cache_stats()
+
+        expected = _entry_size(manager, "inference:a") + _entry_size(manager, "inference:b")
+        assert stats["cache_size_mb"] == pytest.approx(expected / (1024 * 1024))
+        assert fake_redis.zcard(CACHE_INDEX_KEY) == 2
+
+    @pytest.mark.asyncio
+    async def test_lru_evicts_least_recently_accessed_entry(self, fake_redis):
+        """Test LRU eviction removes the entry read least recently."""
+        manager = InferenceCacheManager(fake_redis, cache_strategy=CacheStrategy.LRU)
+        prediction = np.arange(100)
+
+        await manager.cache_prediction("inference:a", prediction)
+        await manager.cache_prediction("inference:b", prediction)
+        await manager.get_cached_prediction("inference:a")
+        entry_size = _entry_size(manager, "inference:a")
+        manager.max_cache_size_mb = (2 * entry_size + 1) / (1024 * 1024)
+
+        await manager.cache_prediction("inference:c", prediction)
+
+        assert fake_redis.exists("inference:b") == 0
+        assert fake_redis.exists("inference:a") == 1
+        assert fake_redis.exists("inference:c") == 1
+        assert manager.get_cache_stats()["evictions"] == 1
+        assert manager._get_total_cache_size_mb() * 1024 * 1024 == pytest.approx(2 * entry_size)
+
+    @pytest.mark.asyncio
+    async def test_lfu_evicts_least_frequently_used_entry(self, fake_redis):
+        """Test LFU eviction keeps hot entries and never evicts the entry being written."""
+        manager = InferenceCacheManager(fake_redis, cache_strategy=CacheStrategy.LFU)
+        prediction = np.arange(100)
+        await manager.cache_prediction("inference:hot", prediction)
+        await manager.cache_prediction("inference:cold", prediction)
+        for _ in range(3):
+            await manager.get_cached_prediction("inference:hot")
+        await manager.get_cached_prediction("inference:cold")
+        entry_size = _entry_size(manager, "inference:hot")
+        manager.max_cache_size_mb = (2 * entry_size + 1) / (1024 * 1024)
+
+        await manager.cache_prediction("inference:new", prediction)
+
+        assert fake_redis.exists("inference:cold") == 0
+        assert fake_redis.exists("inference:hot") == 1
+        assert fake_redis.exists("inference:new") == 1
+        assert fake_redis.zscore(CACHE_INDEX_KEY, "inference:hot") == 4
+
+    @pytest.mark.asyncio
+    async def test_expired_entries_are_dropped_from_accounting(self, fake_redis):
+        """Test entries whose TTL elapsed stop counting toward the size budget."""
+        manager = InferenceCacheManager(fake_redis)
+
+        await manager.cache_prediction("inference:old", np.arange(10), ttl=60)
+        # Simulate the entry's TTL having elapsed in Redis
+        fake_redis.delete("inference:old")
+        fake_redis.zadd(CACHE_EXPIRY_KEY, {"inference:old": 0})
+
+        await manager.cache_prediction("inference:new", np.arange(10), ttl=60)
+
+        assert fake_redis.hexists(CACHE_SIZES_KEY, "inference:old") == 0
+        assert fake_redis.zscore(CACHE_INDEX_KEY, "inference:old") is None
+        assert manager._get_total_cache_size_mb() * 1024 * 1024 == _entry_size(
+            manager, "inference:new"
+        )
+
+    @pytest.mark.asyncio
+    async def test_clear_cache_resets_accounting(self, fake_redis):
+        """Test clearing the cache also clears the index and size counter."""
+        manager = InferenceCacheManager(fake_redis)
+        await manager.cache_prediction("inference:a", np.arange(10))
+
+        manager.clear_cache()
+
+        assert manager._get_total_cache_size_mb() == 0
+        assert fake_redis.zcard(CACHE_INDEX_KEY) == 0
+
+    @pytest.mark.asyncio
+    async def test_cache_hit_reads_and_scores_in_one_round_trip(self):
+        """Test a lookup pipelines the GET with the eviction-score update."""
+        redis_client = Mock()
+        pipe = redis_client.pipeline.return_value
+        pipe.execute.return_value = [None, 0]
+        manager = InferenceCacheManager(redis_client, cache_strategy=CacheStrategy.LRU)
+
+        result = await manager.get_cached_prediction("inference:a")
+
+        assert result is None
+        redis_client.pipeline.assert_called_once_with(transaction=False)
+        pipe.get.assert_called_once_with("inference:a")
+        assert pipe.zadd.call_args.kwargs == {"xx": True}
+        redis_client.get.assert_not_called()
+
+
+class TestModelScopedInvalidation:
+    """Test per-model cache namespaces and statistics."""
+
+    @pytest.fixture
+    def request_features(self):
+        return InferenceRequest(request_id="r1", model_family="fam", features={"x": 1})
+
+    def test_cache_key_is_namespaced_by_model_and_generation(self, request_features):
+        """Test keys differ across models and generations for the same features."""
+        key = request_features.get_cache_key("fam/1")
+
+        assert key.startswith("inference:fam/1:0:")
+        assert key != request_features.get_cache_key("fam/2")
+        assert key != request_features.get_cache_key("fam/1", generation=1)
+
+    def test_invalidating_one_model_is_a_single_incr(self, request_features):
+        """Test invalidation bumps one generation counter without scanning or deleting."""
+        fakeredis = pytest.importorskip("fakeredis")
+        redis_client = fakeredis.FakeRedis()
+        manager = InferenceCacheManager(redis_client)
+        before_a = manager.get_cache_key(request_features, "fam/1")
+        before_b = manager.get_cache_key(request_features, "other/1")
+
+        with (
+            patch.object(redis_client, "scan_iter") as scan_iter,
+            patch.object(redis_client, "delete") as delete,
+        ):
+            generation = manager.invalidate_model_cache("fam/1")
+
+        assert generation == 1
+        scan_iter.assert_not_called()
+        delete.assert_not_called()
+        assert manager.get_cache_key(request_features, "fam/1") != before_a
+        assert manager.get_cache_key(request_features, "other/1") == before_b
+
+    def test_other_processes_see_invalidation_after_refresh(self, request_features):
+        """Test generations are re-read from Redis once the local copy goes stale."""
+        fakeredis = pytest.importorskip("fakeredis")
+        redis_client = fakeredis.FakeRedis()
+        invalidator = InferenceCacheManager(redis_client)
+        reader = InferenceCacheManager(redis_client, generation_refresh_seconds=30)
+        assert reader.get_model_generation("fam/1") == 0
+
+        invalidator.invalidate_model_cache("fam/1")
+
+        assert reader.get_model_generation("fam/1") == 0
+        with patch("src.services.inference_pipeline.time.monotonic", return_value=10**9):
+            assert reader.get_model_generation("fam/1") == 1
+
+    @pytest.mark.asyncio
+    async def test_cache_stats_include_per_model_hit_rate(self, request_features):
+        """Test hits and misses are broken down by model."""
+        redis_client = Mock()
+        pipe = redis_client.pipeline.return_value
+        pipe.execute.side_effect = [
+            [zlib.compress(pickle.dumps([1.0])), 1],
+            [None, 0],
+            [None, 0],
+        ]
+        redis_client.get.return_value = None
+        manager = InferenceCacheManager(redis_client)
+
+        await manager.get_cached_prediction(request_features.get_cache_key("fam/1"))
+        await manager.get_cached_prediction(request_features.get_cache_key("fam/1"))
+        await manager.get_cached_prediction(request_features.get_cache_key("other/2", 3))
+        stats = manager.get_cache_stats()
+
+        assert stats["models"] == {
+            "fam/1": {"hits": 1, "misses": 1, "hit_rate": 0.5},
+            "other/2": {"hits": 0, "misses": 1, "hit_rate": 0},
+        }
+
+
+class TestFeatureDigest:
+    """Test canonical feature hashing used for cache keys."""
+
+    def test_array_digest_is_stable_and_sensitive_to_dtype_and_shape(self):
+        """Test equal arrays hash equally while dtype, shape and values change the digest."""
+        features = np.arange(12, dtype=np.float64)
+
+        digest = feature_digest("m/1", features)
+
+        assert digest == feature_digest("m/1", features.copy())
+        assert digest == feature_digest("m/1", features.reshape(3, 4).T.copy().T.ravel())
+        assert digest != feature_digest("m/1", features.astype(np.float32))
+        assert digest != feature_digest("m/1", features.reshape(3, 4))
+        assert digest != feature_digest("m/1", features + 1)
+        assert digest != feature_digest("m/2", features)
+
+    def test_non_contiguous_array_matches_contiguous_copy(self):
+        """Test strided views hash by value, not by memory layout."""
+        matrix = np.arange(20, dtype=np.int64).reshape(4, 5)
+
+        assert feature_digest("m", matrix[:, ::2]) == feature_digest(
+            "m", np.ascontiguousarray(matrix[:, ::2])
+        )
+
+    def test_dataframe_digest_ignores_index_but_not_columns(self):
+        """Test row labels do not affect the key while column names and values do."""
+        frame = pd.DataFrame({"a": [1.0, 2.0], "b": ["x", "y"]})
+
+        digest = feature_digest("m", frame)
+
+        assert digest == feature_digest("m", frame.set_axis([10, 11]))
+        assert digest != feature_digest("m", frame.rename(columns={"a": "c"}))
+        assert digest != feature_digest("m", frame[["b", "a"]])
+        assert digest != feature_digest("m", frame.assign(b=["x", "z"]))
+
+    def test_datetime_and_timedelta_features_are_hashed(self):
+        """Test datetime64/timedelta64 inputs, which cannot export buffers, still hash."""
+        frame = pd.DataFrame(
+            {
+                "ts": pd.to_datetime(["2024-01-01", "2024-01-02"]),
+                "age": pd.to_timedelta([1, 2], unit="D"),
+            }
+        )
+        stamps = frame["ts"].to_numpy()
+
+        digest = feature_digest("m", frame)
+
+        assert digest == feature_digest("m", frame.copy())
+        assert digest != feature_digest("m", frame.assign(ts=frame["ts"] + pd.Timedelta("1s")))
+        assert feature_digest("m", stamps) == feature_digest("m", stamps.copy())
+        assert feature_digest("m", stamps) != feature_digest("m", stamps.view("i8"))
+        assert feature_digest("m", stamps) != feature_digest("m", stamps.astype("M8[s]"))
+
+    def test_dict_digest_ignores_key_order(self):
+        """Test dictionaries with the same items hash equally regardless of insertion order."""
+        assert feature_digest("m", {"a": 1, "b": [1, 2]}) == feature_digest(
+            "m", {"b": [1, 2], "a": 1}
+        )
+        assert feature_digest("m", {"a": 1}) != feature_digest("m", {"a": 2})
+
+
+class _RecordingModel:
+    """Model stub that records the row count of every predict call."""
+
+    def __init__(self, fail_on=None):
+        self.calls = []
+        self.fail_on = fail_on
+
+    def predict(self, features):
+        rows = np.asarray(features)
+        self.calls.append(len(rows))
+        if self.fail_on is not None and (rows == self.fail_on).any():
+            raise ValueError("bad row")
+        return rows.sum(axis=1)
+
+
+class _RecordingClassifier(_RecordingModel):
+    """Classifier stub that also records the row count of every predict_proba call."""
+
+    def __init__(self):
+        super().__init__()
+        self.proba_calls = []
+
+    def predict_proba(self, features):
+        rows = np.asarray(features)
+        self.proba_calls.append(len(rows))
+        return np.column_stack([np.full(len(rows), 0.25), np.full(len(rows), 0.75)])
+
+
+class TestMicroBatcher:
+    """Test coalescing concurrent predictions into vectorized calls."""
+
+    @pytest.fixture
+    def executor(self):
+        executor = ThreadPoolExecutor(max_workers=1)
+        yield executor
+        executor.shutdown(wait=True)
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_share_one_predict_call(self, executor):
+        """Test requests within the wait window are stacked and results scattered back."""
+        model = _RecordingModel()
+        batcher = MicroBatcher(executor, max_batch_size=64, max_wait_ms=50)
+        features = [np.full((1, 3), i, dtype=float) for i in range(5)]
+
+        results = await asyncio.gather(*(batcher.submit("m/1", model, f) for f in features))
+
+        assert model.calls == [5]
+        assert [r.tolist() for r in results] == [[3.0 * i] for i in range(5)]
+        assert batcher.get_stats()["avg_batch_size"] == 5
+
+    @pytest.mark.asyncio
+    async def test_full_batch_flushes_before_window(self, executor):
+        """Test reaching max_batch_size rows flushes without waiting for the timer."""
+        model = _RecordingModel()
+        batcher = MicroBatcher(executor, max_batch_size=4, max_wait_ms=10_000)
+        features = [np.ones((2, 3)), np.ones((2, 3))]
+
+        results = await asyncio.wait_for(
+            asyncio.gather(*(batcher.submit("m/1", model, f) for f in features)), timeout=5
+        )
+
+        assert model.calls == [4]
+        assert [r.shape for r in results] == [(2,), (2,)]
+
+    @pytest.mark.asyncio
+    async def test_incompatible_features_are_not_mixed(self, executor):
+        """Test different models and feature widths go to separate calls."""
+        model = _RecordingModel()
+        batcher = MicroBatcher(executor, max_wait_ms=10)
+
+        await asyncio.gather(
+            batcher.submit("m/1", model, np.ones((1, 3))),
+            batcher.submit("m/2", model, np.ones((1, 3))),
+            batcher.submit("m/1", model, np.ones((1, 4))),
+        )
+
+        assert sorted(model.calls) == [1, 1, 1]
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_is_retried_per_request(self, executor):
+        """Test one bad input fails only its own caller."""
+        model = _RecordingModel(fail_on=-1)
+        batcher = MicroBatcher(executor, max_wait_ms=10)
+
+        good, bad = await asyncio.gather(
+            batcher.submit("m/1", model, np.ones((1, 2))),
+            batcher.submit("m/1", model, np.full((1, 2), -1.0)),
+            return_exceptions=True,
+        )
+
+        assert good.tolist() == [2.0]
+        assert isinstance(bad, ValueError)
+        assert model.calls == [2, 1, 1]
+        assert batcher.get_stats()["fallbacks"] == 1
+
+    @pytest.mark.asyncio
+    async def test_dataframes_are_concatenated(self, executor):
+        """Test DataFrame features with matching columns are batched together."""
+        model = _RecordingModel()
+        batcher = MicroBatcher(executor, max_wait_ms=10)
+        frames = [pd.DataFrame({"a": [1.0], "b": [2.0]}, index=[i]) for i in range(3)]
+
+        results = await asyncio.gather(*(batcher.submit("m/1", model, f) for f in frames))
+
+        assert model.calls == [3]
+        assert [r.tolist() for r in results] == [[3.0]] * 3
+
+    @pytest.mark.asyncio
+    async def test_predict_batch_makes_one_model_call_per_resolved_model(self):
+        """Test the pipeline routes concurrent batch members through the micro-batcher."""
+        model = _RecordingModel()
+        router = Mock()
+        router.route_request_async = AsyncMock(return_value=("fam/1", None))
+        pipeline = HokusaiInferencePipeline(
+            Mock(), Mock(), router, Mock(), Mock(), max_batch_wait_ms=20
+        )
+        pipeline.model_loader.load_model = AsyncMock(return_value=model)
+        requests = [
+            InferenceRequest(
+                request_id=f"r{i}",
+                model_family="fam",
+                features=np.full((1, 2), i, dtype=float),
+                use_cache=False,
+            )
+            for i in range(8)
+        ]
+
+        responses = await pipeline.predict_batch(requests)
+
+        assert model.calls == [8]
+        assert [r.prediction.tolist() for r in responses] == [[2.0 * i] for i in range(8)]
+        assert pipeline.get_pipeline_metrics()["micro_batching"]["batches"] == 1
+
+    @pytest.mark.asyncio
+    async def test_predict_proba_is_batched_alongside_predict(self):
+        """Test classifier confidence comes from one vectorized predict_proba call."""
+        model = _RecordingClassifier()
+        router = Mock()
+        router.route_request_async = AsyncMock(return_value=("fam/1", None))
+        pipeline = HokusaiInferencePipeline(
+            Mock(), Mock(), router, Mock(), Mock(), max_batch_wait_ms=20
+        )
+        pipeline.model_loader.load_model = AsyncMock(return_value=model)
+        requests = [
+            InferenceRequest(
+                request_id=f"r{i}",
+                model_family="fam",
+                features=np.full((1, 2), i, dtype=float),
+                use_cache=False,
+            )
+            for i in range(6)
+        ]
+
+        responses = await pipeline.predict_batch(requests)
+
+        assert model.calls == [6]
+        assert model.proba_calls == [6]
+        assert [r.confidence for r in responses] == [0.75] * 6
+
+
+class TestModelLoader:
+    """Test single-flight loading, LRU eviction and promotion prefetch."""
+
+    @pytest.fixture
+    def version_manager(self):
+        manager = Mock()
+        manager.get_version.side_effect = lambda family, version: Mock(
+            model_id=f"{family}/{version}", metadata={"model_size_bytes": 100}
+        )
+        return manager
+
+    @pytest.fixture
+    def loader_factory(self, version_manager):
+        loaders = []
+
+        def build(**kwargs):
+            loader = ModelLoader(Mock(), version_manager, **kwargs)
+            loaders.append(loader)
+            return loader
+
+        yield build
+        for loader in loaders:
+            loader._executor.shutdown(wait=True)
+
+    @pytest.mark.asyncio
+    async def test_concurrent_cold_requests_share_one_load(self, loader_factory):
+        """Test N concurrent requests for one model trigger a single MLflow load."""
+        loader = loader_factory()
+        with (
+            patch("mlflow.pyfunc.load_model") as load_model,
+            patch("src.services.inference_pipeline.ModelFactory.create_model") as create_model,
+        ):
+            create_model.side_effect = lambda **kwargs: object()
+            models = await asyncio.gather(*(loader.load_model("fam", "1.0.0") for _ in range(10)))
+
+        load_model.assert_called_once_with("models:/fam/1.0.0")
+        assert all(model is models[0] for model in models)
+        assert loader._inflight == {}
+
+    @pytest.mark.asyncio
+    async def test_lru_eviction_respects_memory_budget(self, loader_factory):
+        """Test the least recently used model is evicted once the byte budget is exceeded."""
+        loader = loader_factory(max_memory_bytes=250)
+        with (
+            patch("mlflow.pyfunc.load_model"),
+            patch("src.services.inference_pipeline.ModelFactory.create_model") as create_model,
+        ):
+            create_model.side_effect = lambda **kwargs: object()
+            await loader.load_model("fam", "1")
+            await loader.load_model("fam", "2")
+            await loader.load_model("fam", "1")
+            await loader.load_model("fam", "3")
+
+        assert list(loader._model_cache) == ["fam/1", "fam/3"]
+        assert loader._total_bytes == 200
+
+    @pytest.mark.asyncio
+    async def test_promotion_prefetches_model(self, loader_factory, version_manager):
+        """Test a production promotion starts a background load of the new version."""
+        loader = loader_factory()
+        listener = version_manager.add_promotion_listener.call_args.args[0]
+        with (
+            patch("mlflow.pyfunc.load_model"),
+            patch("src.services.inference_pipeline.ModelFactory.create_model") as create_model,
+        ):
+            create_model.side_effect = lambda **kwargs: object()
+            listener("fam", "2.0.0", Environment.STAGING)
+            assert not loader._prefetch_tasks
+            listener("fam", "2.0.0", Environment.PRODUCTION)
+            await asyncio.gather(*loader._prefetch_tasks)
+
+        assert "fam/2.0.0" in loader._model_cache
+
+
+class TestAsyncRedisBackend:
+    """Test the inference hot path runs on the asyncio Redis client."""
+
+    @pytest.fixture
+    def clients(self):
+        pytest.importorskip("lupa")
+        fakeredis = pytest.importorskip("fakeredis")
+        server = fakeredis.FakeServer()
+        sync_redis = Mock(wraps=fakeredis.FakeRedis(server=server))
+        return sync_redis, fakeredis.aioredis.FakeRedis(server=server)
+
+    @pytest.mark.asyncio
+    async def test_cache_round_trip_uses_async_client(self, clients):
+        """Test lookups and writes go through the asyncio client and share accounting."""
+        sync_redis, async_redis = clients
+        manager = InferenceCacheManager(
+            sync_redis, cache_strategy=CacheStrategy.LRU, async_redis_client=async_redis
+        )
+        request = InferenceRequest(request_id="r", model_family="fam", features={"x": 1})
+
+        key = await manager.get_cache_key_async(request, "fam/1")
+        assert await manager.get_cached_prediction(key) is None
+        assert await manager.cache_prediction(key, np.arange(5))
+        cached = await manager.get_cached_prediction(key)
+
+        assert cached.tolist() == [0, 1, 2, 3, 4]
+        assert sync_redis.method_calls == []
+        assert await async_redis.zscore(CACHE_INDEX_KEY, key) is not None
+        assert manager.get_cache_stats()["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_predict_does_not_touch_sync_client(self, clients):
+        """Test a cached predict path only uses the asyncio client."""
+        sync_redis, async_redis = clients
+        router = Mock()
+        router.route_request_async = AsyncMock(return_value=("fam/1", ""))
+        cache = InferenceCacheManager(sync_redis, async_redis_client=async_redis)
+        pipeline = HokusaiInferencePipeline(
+            Mock(), Mock(), router, cache, sync_redis, async_redis_client=async_redis
+        )
+        pipeline.model_loader.load_model = AsyncMock(return_value=_RecordingModel())
+        request = InferenceRequest(
+            request_id="r", model_family="fam", features=np.ones((1, 2)), use_cache=True
+        )
+
+        first = await pipeline.predict(request)
+        second = await pipeline.predict(request)
+
+        assert first.status.value == "success"
+        assert second.cached is True
+        assert sync_redis.method_calls == []
+        metric_keys = [key async for key in async_redis.scan_iter("inference_metrics:*")]
+        assert len(metric_keys) == 1
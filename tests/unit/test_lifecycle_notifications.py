@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from typing import Any
 
 import pytest
@@ -50,6 +50,22 @@ class RecordingLifecycleNotifier:
         return True, None
 
 
+class QueuedLifecycleNotifier(RecordingLifecycleNotifier):
+    """Hold submitted lifecycle notifications until the test delivers them."""
+
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.queued: list[tuple[LifecycleUpdatePayload, Any]] = []
+
+    def submit_lifecycle_update(self, payload: LifecycleUpdatePayload, on_complete: Any) -> None:
+        self.queued.append((payload, on_complete))
+
+    def deliver_queued(self) -> None:
+        for payload, on_complete in self.queued:
+            on_complete(*self.notify_lifecycle_update(payload))
+        self.queued.clear()
+
+
 @pytest.fixture()
 def lifecycle_session_factory() -> sessionmaker:
     engine = create_engine(
@@ -187,6 +203,65 @@ def test_retry_failed_callbacks_delivers_and_skips_rows_at_max_attempts(
     assert _fetch_row(lifecycle_session_factory, "skip-me").callback_status == "failed"
 
 
+def test_outbox_delivery_records_callback_status_when_it_completes(
+    lifecycle_session_factory: sessionmaker,
+) -> None:
+    notifier = QueuedLifecycleNotifier(results=[(False, "503: unavailable")])
+    service = ContributionService(
+        lifecycle_session_factory=lifecycle_session_factory,
+        notifier=notifier,
+    )
+
+    service.advance_lifecycle_state(
+        submission_id="batch-queued",
+        state="processed",
+        accepted_row_count=2,
+        rejected_row_count=0,
+    )
+
+    assert notifier.calls == []
+    row = _fetch_row(lifecycle_session_factory, "batch-queued")
+    assert row.callback_status == "pending"
+    assert row.callback_attempts == 1
+
+    notifier.deliver_queued()
+
+    row = _fetch_row(lifecycle_session_factory, "batch-queued")
+    assert row.callback_status == "failed"
+    assert row.callback_last_error == "503: unavailable"
+
+
+def test_retry_failed_callbacks_picks_up_stale_pending_rows(
+    lifecycle_session_factory: sessionmaker,
+) -> None:
+    notifier = QueuedLifecycleNotifier()
+    service = ContributionService(
+        lifecycle_session_factory=lifecycle_session_factory,
+        notifier=notifier,
+    )
+    for submission_id in ("stale", "fresh"):
+        service.advance_lifecycle_state(
+            submission_id=submission_id,
+            state="processed",
+            accepted_row_count=1,
+            rejected_row_count=0,
+        )
+    # The outbox entry for "stale" was lost, e.g. in a restart
+    notifier.queued.clear()
+    _update_callback_state(
+        lifecycle_session_factory,
+        "stale",
+        callback_last_attempt_at=datetime.now(timezone.utc) - timedelta(hours=1),
+    )
+
+    delivered = service.retry_failed_callbacks(limit=10)
+
+    assert delivered == 1
+    assert [payload.submission_id for payload in notifier.calls] == ["stale"]
+    assert _fetch_row(lifecycle_session_factory, "stale").callback_status == "delivered"
+    assert _fetch_row(lifecycle_session_factory, "fresh").callback_status == "pending"
+
+
 def _fetch_row(
     lifecycle_session_factory: sessionmaker,
     submission_id: str,
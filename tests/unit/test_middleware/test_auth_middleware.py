@@ -1,7 +1,8 @@
 """Unit tests for API key validation middleware using external auth service."""
 
+import asyncio
 import json
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
 import httpx
 import pytest
@@ -9,7 +10,12 @@ from fastapi import FastAPI, Request
 from fastapi.testclient import TestClient
 from starlette.datastructures import Headers
 
-from src.middleware.auth import APIKeyAuthMiddleware, get_api_key_from_request
+from src.middleware.auth import (
+    APIKeyAuthMiddleware,
+    ValidationResult,
+    _ValidationCache,
+    get_api_key_from_request,
+)
 
 
 class TestAPIKeyAuthMiddleware:
@@ -309,6 +315,183 @@ class TestAPIKeyAuthMiddleware:
         assert response.json()["detail"] == "Invalid or expired API key"
 
 
+class TestValidationCacheTier:
+    """Test the in-process validation tier in front of Redis."""
+
+    @pytest.fixture
+    def middleware(self):
+        async def app(scope, receive, send):
+            pass
+
+        return APIKeyAuthMiddleware(
+            app=app,
+            auth_service_url="https://auth.test.hokus.ai",
+            cache=None,
+        )
+
+    def test_cache_evicts_least_recently_used_entry(self):
+        """Test the local tier stays bounded and keeps recently used keys."""
+        # Arrange
+        cache = _ValidationCache(maxsize=2, ttl=60)
+        cache.put("a", ValidationResult(is_valid=True, key_id="a"))
+        cache.put("b", ValidationResult(is_valid=True, key_id="b"))
+        cache.get("a")
+
+        # Act
+        cache.put("c", ValidationResult(is_valid=True, key_id="c"))
+
+        # Assert
+        assert len(cache) == 2
+        assert cache.get("b") is None
+        assert cache.get("a").key_id == "a"
+        assert cache.get("c").key_id == "c"
+
+    def test_cache_expires_entries_after_ttl(self):
+        """Test local entries are dropped once their TTL elapses."""
+        # Arrange
+        cache = _ValidationCache(maxsize=10, ttl=5)
+        with patch("src.middleware.auth.time.monotonic", return_value=100.0):
+            cache.put("a", ValidationResult(is_valid=True))
+
+        # Act / Assert
+        with patch("src.middleware.auth.time.monotonic", return_value=104.0):
+            assert cache.get("a") is not None
+        with patch("src.middleware.auth.time.monotonic", return_value=105.0):
+            assert cache.get("a") is None
+        assert len(cache) == 0
+
+    @pytest.mark.asyncio
+    async def test_repeat_lookup_is_served_from_process_memory(self, middleware):
+        """Test a validated key skips Redis and the auth service on the next request."""
+        # Arrange
+        middleware.cache = Mock()
+        middleware.cache.get = AsyncMock(return_value=None)
+        middleware.cache.setex = AsyncMock()
+        valid = ValidationResult(is_valid=True, user_id="user123", key_id="key123")
+
+        with patch.object(
+            middleware, "validate_with_auth_service", new_callable=AsyncMock, return_value=valid
+        ) as mock_validate:
+            # Act
+            first = await middleware._resolve_validation("hk_live_key", "1.2.3.4")
+            second = await middleware._resolve_validation("hk_live_key", "5.6.7.8")
+
+        # Assert
+        assert first is valid and second is valid
+        mock_validate.assert_awaited_once()
+        middleware.cache.get.assert_awaited_once()
+        middleware.cache.setex.assert_awaited_once()
+        assert middleware.cache.setex.await_args[0][1] == 60
+
+    @pytest.mark.asyncio
+    async def test_invalid_key_is_negatively_cached_per_client_ip(self, middleware):
+        """Test rejected keys are remembered briefly, scoped to the client IP."""
+        # Arrange
+        invalid = ValidationResult(is_valid=False, error="Invalid or expired API key")
+
+        with patch.object(
+            middleware, "validate_with_auth_service", new_callable=AsyncMock, return_value=invalid
+        ) as mock_validate:
+            # Act
+            await middleware._resolve_validation("hk_live_bad", "1.2.3.4")
+            await middleware._resolve_validation("hk_live_bad", "1.2.3.4")
+            await middleware._resolve_validation("hk_live_bad", "5.6.7.8")
+
+        # Assert
+        assert mock_validate.await_count == 2
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("error_type", ["unavailable", "rate_limited"])
+    async def test_transient_failures_are_not_cached(self, middleware, error_type):
+        """Test upstream outages and rate limiting are retried on the next request."""
+        # Arrange
+        failure = ValidationResult(is_valid=False, error="boom", error_type=error_type)
+
+        with patch.object(
+            middleware, "validate_with_auth_service", new_callable=AsyncMock, return_value=failure
+        ) as mock_validate:
+            # Act
+            await middleware._resolve_validation("hk_live_key", "1.2.3.4")
+            await middleware._resolve_validation("hk_live_key", "1.2.3.4")
+
+        # Assert
+        assert mock_validate.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_share_one_upstream_validation(self, middleware):
+        """Test a burst of requests with the same key triggers a single validation."""
+        # Arrange
+        release = asyncio.Event()
+        calls = 0
+
+        async def slow_validate(api_key, client_ip=None):
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return ValidationResult(is_valid=True, key_id="key123")
+
+        with patch.object(middleware, "validate_with_auth_service", side_effect=slow_validate):
+            # Act
+            waiters = [
+                asyncio.ensure_future(middleware._resolve_validation("hk_live_key", "1.2.3.4"))
+                for _ in range(10)
+            ]
+            await asyncio.sleep(0)
+            release.set()
+            results = await asyncio.gather(*waiters)
+
+        # Assert
+        assert calls == 1
+        assert all(result.key_id == "key123" for result in results)
+        assert middleware._inflight_validations == {}
+
+    @pytest.mark.asyncio
+    async def test_auth_service_client_is_pooled_across_requests(self, middleware):
+        """Test validations reuse one HTTP client instead of opening one per request."""
+        # Arrange
+        mock_response = Mock(status_code=401)
+
+        with patch("httpx.AsyncClient") as mock_client_class:
+            mock_client_class.return_value.post = AsyncMock(return_value=mock_response)
+            mock_client_class.return_value.aclose = AsyncMock()
+
+            # Act
+            await middleware.validate_with_auth_service("hk_live_one")
+            await middleware.validate_with_auth_service("hk_live_two")
+            await middleware.aclose()
+
+        # Assert
+        mock_client_class.assert_called_once()
+        assert mock_client_class.return_value.post.await_count == 2
+        mock_client_class.return_value.aclose.assert_awaited_once()
+
+    def test_auth_service_clients_are_per_loop_and_all_closed(self, middleware):
+        """Test a loop change opens a new client and closed loops' clients are dropped."""
+
+        async def client_for_loop():
+            return middleware._get_http_client()
+
+        # The first loop closes before the second one starts, so its client is dropped
+        first = asyncio.run(client_for_loop())
+
+        async def use_and_close():
+            second = middleware._get_http_client()
+            again = middleware._get_http_client()
+            live = len(middleware._http_clients)
+            await middleware.aclose()
+            return second, again, live
+
+        # Act
+        second, again, live = asyncio.run(use_and_close())
+
+        # Assert
+        assert second is again
+        assert second is not first
+        assert live == 1
+        assert second.is_closed
+        assert middleware._http_clients == {}
+
+
 class TestGetAPIKeyFromRequest:
     """Test cases for extracting API key from request."""
 
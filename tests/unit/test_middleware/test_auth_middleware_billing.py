@@ -1472,6 +1472,54 @@ class TestContributionDebitBypass:
             request_state=request.state,
         )
 
+    @pytest.mark.asyncio
+    async def test_served_batch_debits_remaining_records(self, middleware):
+        """A batch the endpoint validated and served is billed one prediction per record."""
+        request = _make_authenticated_request("/api/v1/models/21/predict")
+
+        with (
+            patch.object(
+                middleware, "validate_with_auth_service", return_value=_valid_platform_validation()
+            ),
+            patch.object(
+                middleware, "_debit_usage", new_callable=AsyncMock, return_value="accepted"
+            ) as mock_debit,
+        ):
+
+            async def mock_call_next(req):
+                req.state.predictions_count = 25
+                return Response(content="OK", status_code=200)
+
+            response = await middleware.dispatch(request, mock_call_next)
+
+        assert response.status_code == 200
+        admission, batch = mock_debit.await_args_list
+        assert admission.kwargs.get("predictions_count", 1) == 1
+        assert batch.kwargs["predictions_count"] == 24
+        assert batch.kwargs["idempotency_suffix"] == "batch-records"
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("status_code", [400, 500])
+    async def test_rejected_batch_is_billed_once(self, middleware, status_code):
+        """A batch that fails validation or prediction only pays the admission debit."""
+        request = _make_authenticated_request("/api/v1/models/21/predict")
+
+        with (
+            patch.object(
+                middleware, "validate_with_auth_service", return_value=_valid_platform_validation()
+            ),
+            patch.object(
+                middleware, "_debit_usage", new_callable=AsyncMock, return_value="accepted"
+            ) as mock_debit,
+        ):
+
+            async def mock_call_next(req):
+                return Response(content="Bad batch", status_code=status_code)
+
+            await middleware.dispatch(request, mock_call_next)
+
+        mock_debit.assert_awaited_once()
+
     # -------------------------------------------------------------------------
     # 6. Prediction route returns 402 on debit rejection
     # -------------------------------------------------------------------------
@@ -1534,9 +1582,7 @@ class TestValidateWithAuthServiceNonDictResponse:
             patch("httpx.AsyncClient") as mock_client_class,
             patch("src.middleware.auth.logger") as mock_logger,
         ):
-            mock_client_class.return_value.__aenter__.return_value.post = AsyncMock(
-                return_value=mock_response
-            )
+            mock_client_class.return_value.post = AsyncMock(return_value=mock_response)
 
             result = await middleware.validate_with_auth_service("test-api-key")
 
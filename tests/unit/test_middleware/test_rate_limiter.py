@@ -7,7 +7,7 @@ import pytest
 from fastapi import FastAPI, Request
 from fastapi.testclient import TestClient
 
-from src.middleware.rate_limiter import RateLimiter, RateLimitExceeded
+from src.middleware.rate_limiter import LocalRateLimiter, RateLimiter, RateLimitExceeded
 
 
 class TestRateLimiter:
@@ -101,11 +101,9 @@ class TestRateLimiter:
         limit = 100
         window_seconds = 3600
         
-        # Mock Redis sorted set operations for sliding window
-        mock_redis.zremrangebyscore = Mock(return_value=10)  # Removed 10 old entries
-        mock_redis.zadd = Mock(return_value=1)
-        mock_redis.zcard = Mock(return_value=50)  # 50 requests in window
-        mock_redis.expire = Mock(return_value=True)
+        # Mock the Lua script: allowed, 50 requests in window, reset time
+        script = Mock(return_value=[1, 50, 1700000000])
+        mock_redis.register_script = Mock(return_value=script)
         
         # Act
         result = rate_limiter.check_sliding_window(key_id, limit, window_seconds)
@@ -114,11 +112,62 @@ class TestRateLimiter:
         assert result.allowed is True
         assert result.current_requests == 50
         assert result.limit == 100
+        assert result.remaining == 50
+        assert result.reset_time == 1700000000
+        
+        # Verify a single script round-trip replaces the separate Redis calls
+        script.assert_called_once()
+        assert script.call_args.kwargs["keys"] == [f"rate_limit:sliding:{key_id}"]
+        mock_redis.zremrangebyscore.assert_not_called()
+        mock_redis.zadd.assert_not_called()
+
+    def test_sliding_window_registers_script_once(self, rate_limiter, mock_redis):
+        """Test the Lua script is registered once and reused across checks."""
+        # Arrange
+        script = Mock(return_value=[0, 101, 1700000000])
+        mock_redis.register_script = Mock(return_value=script)
+        
+        # Act
+        rate_limiter.check_sliding_window("key123", 100)
+        result = rate_limiter.check_sliding_window("key123", 100)
+        
+        # Assert
+        assert result.allowed is False
+        assert result.remaining == 0
+        mock_redis.register_script.assert_called_once()
+        assert script.call_count == 2
+
+    def test_sliding_window_falls_back_to_local_limiter(self, rate_limiter, mock_redis):
+        """Test Redis failures fall back to the in-process limiter instead of failing open."""
+        # Arrange
+        mock_redis.register_script = Mock(side_effect=Exception("Redis down"))
         
-        # Verify Redis operations
-        mock_redis.zremrangebyscore.assert_called_once()
-        mock_redis.zadd.assert_called_once()
-        mock_redis.zcard.assert_called_once()
+        # Act
+        results = [rate_limiter.check_sliding_window("key123", 2, 60) for _ in range(3)]
+        
+        # Assert
+        assert [result.allowed for result in results] == [True, True, False]
+
+    def test_sliding_window_lua_script_is_atomic_and_accurate(self):
+        """Test the Lua script against a Redis server implementation."""
+        pytest.importorskip("lupa")
+        fakeredis = pytest.importorskip("fakeredis")
+        
+        # Arrange
+        limiter = RateLimiter(redis_client=fakeredis.FakeRedis(decode_responses=True))
+        
+        # Act
+        with patch("src.middleware.rate_limiter.time.time", return_value=1000.0):
+            results = [limiter.check_sliding_window("key123", 3, 60) for _ in range(4)]
+        with patch("src.middleware.rate_limiter.time.time", return_value=1061.0):
+            after_window = limiter.check_sliding_window("key123", 3, 60)
+        
+        # Assert
+        assert [result.allowed for result in results] == [True, True, True, False]
+        assert [result.remaining for result in results] == [2, 1, 0, 0]
+        assert results[-1].reset_time == 1060
+        assert after_window.allowed is True
+        assert after_window.current_requests == 1
 
     def test_get_rate_limit_info(self, rate_limiter, mock_redis):
         """Test getting rate limit information."""
@@ -146,6 +195,68 @@ class TestRateLimiter:
         mock_redis.delete.assert_called_with(f"rate_limit:hourly:{key_id}")
 
 
+class TestLocalRateLimiter:
+    """Test cases for the in-process fallback limiter."""
+
+    def test_local_limiter_enforces_limit_per_key(self):
+        """Test each key gets its own budget within a window."""
+        # Arrange
+        limiter = LocalRateLimiter()
+        
+        # Act
+        with patch("src.middleware.rate_limiter.time.time", return_value=7200.0):
+            first = [limiter.check("a", 2, 3600).allowed for _ in range(3)]
+            other = limiter.check("b", 2, 3600)
+        
+        # Assert
+        assert first == [True, True, False]
+        assert other.allowed is True
+        assert other.remaining == 1
+        assert other.reset_time == 10800
+
+    def test_local_limiter_weights_previous_window(self):
+        """Test the previous window's requests decay across the current window."""
+        # Arrange
+        limiter = LocalRateLimiter()
+        with patch("src.middleware.rate_limiter.time.time", return_value=0.0):
+            for _ in range(10):
+                limiter.check("a", 10, 100)
+        
+        # Act
+        with patch("src.middleware.rate_limiter.time.time", return_value=150.0):
+            halfway = limiter.check("a", 10, 100)
+        with patch("src.middleware.rate_limiter.time.time", return_value=250.0):
+            two_windows_later = limiter.check("a", 10, 100)
+        
+        # Assert
+        assert halfway.current_requests == 6
+        assert two_windows_later.current_requests == 1
+
+    def test_local_limiter_bounds_tracked_keys(self):
+        """Test least recently used keys are evicted past max_keys."""
+        # Arrange
+        limiter = LocalRateLimiter(max_keys=2)
+        
+        # Act
+        for key in ("a", "b", "c"):
+            limiter.check(key, 10, 60)
+        
+        # Assert
+        assert list(limiter._windows) == ["b", "c"]
+
+    def test_rate_limiter_without_redis_uses_local_limiter(self):
+        """Test check_rate_limit enforces limits per process when Redis is absent."""
+        # Arrange
+        limiter = RateLimiter(redis_client=Mock())
+        limiter.redis = None
+        
+        # Act
+        results = [limiter.check_rate_limit("key123", 1, burst_limit=1) for _ in range(3)]
+        
+        # Assert
+        assert [result.allowed for result in results] == [True, True, False]
+
+
 class TestRateLimitMiddleware:
     """Test cases for rate limit middleware integration."""
 
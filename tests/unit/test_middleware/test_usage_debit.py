@@ -0,0 +1,237 @@
+"""Unit tests for the batched usage-debit aggregator."""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.middleware.auth import APIKeyAuthMiddleware
+from src.middleware.usage_debit import UsageDebitAggregator
+
+
+def _recording_sender(outcome="accepted", reason=None, reason_code=None):
+    """Build a sender that records payloads and returns a fixed outcome."""
+    sent = []
+
+    async def send(key_id, model_id, endpoint, payload, request_state):
+        sent.append((key_id, payload))
+        if outcome == "rejected":
+            request_state._debit_reject_reason = reason
+            request_state._debit_reject_reason_code = reason_code
+        return outcome
+
+    return send, sent
+
+
+class TestUsageDebitAggregator:
+    """Test batching, credit snapshots and backpressure."""
+
+    @pytest.mark.asyncio
+    async def test_debits_for_same_key_are_coalesced(self):
+        """Test one POST per key/model/endpoint carries the combined usage."""
+        # Arrange
+        send, sent = _recording_sender()
+        aggregator = UsageDebitAggregator(send=send, service_id="platform", flush_interval=60)
+
+        # Act
+        for i in range(3):
+            outcome = await aggregator.submit(
+                "key123", "model-1", "/predict", 10, 200, f"key123-{i}"
+            )
+            assert outcome == "queued"
+        await aggregator.submit("key456", "model-1", "/predict", 7, 200, "key456-0")
+        await aggregator.close()
+
+        # Assert
+        payloads = dict(sent)
+        assert len(sent) == 2
+        assert payloads["key123"] == {
+            "model_id": "model-1",
+            "endpoint": "/predict",
+            "response_time_ms": 30,
+            "status_code": 200,
+            "service_id": "platform",
+            "idempotency_key": "key123-0-batch3",
+            "compute_ms": 30,
+            "predictions_count": 3,
+        }
+        assert payloads["key456"]["idempotency_key"] == "key456-0"
+        assert payloads["key456"]["predictions_count"] == 1
+        assert aggregator.pending_count == 0
+
+    @pytest.mark.asyncio
+    async def test_full_batch_is_flushed_without_waiting_for_window(self):
+        """Test reaching the batch size wakes the flusher immediately."""
+        # Arrange
+        send, sent = _recording_sender()
+        aggregator = UsageDebitAggregator(
+            send=send, service_id="platform", max_batch_size=2, flush_interval=60
+        )
+
+        # Act
+        await aggregator.submit("key123", "model-1", "/predict", 1, 200, "a")
+        await aggregator.submit("key123", "model-1", "/predict", 1, 200, "b")
+        for _ in range(5):
+            await asyncio.sleep(0)
+
+        # Assert
+        assert len(sent) == 1
+        assert sent[0][1]["predictions_count"] == 2
+        await aggregator.close()
+
+    @pytest.mark.asyncio
+    async def test_batch_requests_add_their_record_counts(self):
+        """Test batch predict debits contribute their record count, not one each."""
+        # Arrange
+        send, sent = _recording_sender()
+        aggregator = UsageDebitAggregator(send=send, service_id="platform", flush_interval=60)
+
+        # Act
+        await aggregator.submit(
+            "key123", "model-21", "/predict", 5, 200, "a", predictions_count=500
+        )
+        await aggregator.submit("key123", "model-21", "/predict", 5, 200, "b")
+        await aggregator.close()
+
+        # Assert
+        assert len(sent) == 1
+        assert sent[0][1]["predictions_count"] == 501
+        assert sent[0][1]["idempotency_key"] == "a-batch2"
+
+    @pytest.mark.asyncio
+    async def test_partial_batch_is_flushed_after_window(self):
+        """Test a partial batch is sent once the flush window elapses."""
+        # Arrange
+        send, sent = _recording_sender()
+        aggregator = UsageDebitAggregator(send=send, service_id="platform", flush_interval=0.01)
+
+        # Act
+        await aggregator.submit("key123", "model-1", "/predict", 1, 200, "a")
+        await asyncio.sleep(0.05)
+
+        # Assert
+        assert len(sent) == 1
+        await aggregator.close()
+
+    @pytest.mark.asyncio
+    async def test_rejected_batch_rejects_later_requests_from_snapshot(self):
+        """Test a 402 from a flushed batch rejects the key until the snapshot expires."""
+        # Arrange
+        send, sent = _recording_sender(
+            outcome="rejected", reason="Out of credits", reason_code="INSUFFICIENT_BALANCE"
+        )
+        aggregator = UsageDebitAggregator(
+            send=send, service_id="platform", flush_interval=60, credit_snapshot_ttl=5
+        )
+        await aggregator.submit("key123", "model-1", "/predict", 1, 200, "a")
+        with patch("src.middleware.usage_debit.time.monotonic", return_value=100.0):
+            await aggregator.flush()
+        state = SimpleNamespace()
+
+        # Act
+        with patch("src.middleware.usage_debit.time.monotonic", return_value=104.0):
+            rejected = await aggregator.submit(
+                "key123", "model-1", "/predict", 1, 200, "b", request_state=state
+            )
+            other_key = await aggregator.submit("key456", "model-1", "/predict", 1, 200, "c")
+        with patch("src.middleware.usage_debit.time.monotonic", return_value=105.0):
+            expired = await aggregator.submit("key123", "model-1", "/predict", 1, 200, "d")
+
+        # Assert
+        assert rejected == "rejected"
+        assert state._debit_reject_reason == "Out of credits"
+        assert state._debit_reject_reason_code == "INSUFFICIENT_BALANCE"
+        assert other_key == "queued"
+        assert expired == "queued"
+        assert len(sent) == 1
+        await aggregator.close()
+
+    @pytest.mark.asyncio
+    async def test_submit_flushes_inline_when_buffer_is_full(self):
+        """Test callers push through a flush once max_pending debits are buffered."""
+        # Arrange
+        send, sent = _recording_sender()
+        aggregator = UsageDebitAggregator(
+            send=send, service_id="platform", flush_interval=60, max_pending=2
+        )
+        await aggregator.submit("key1", "model-1", "/predict", 1, 200, "a")
+        await aggregator.submit("key2", "model-1", "/predict", 1, 200, "b")
+
+        # Act
+        await aggregator.submit("key3", "model-1", "/predict", 1, 200, "c")
+
+        # Assert
+        assert sorted(key for key, _ in sent) == ["key1", "key2"]
+        assert aggregator.pending_count == 1
+        await aggregator.close()
+
+    @pytest.mark.asyncio
+    async def test_submit_after_close_sends_directly(self):
+        """Test debits arriving after shutdown are not stranded in the buffer."""
+        # Arrange
+        send, sent = _recording_sender()
+        aggregator = UsageDebitAggregator(send=send, service_id="platform")
+        await aggregator.close()
+
+        # Act
+        outcome = await aggregator.submit("key123", "model-1", "/predict", 1, 200, "a")
+
+        # Assert
+        assert outcome == "accepted"
+        assert sent[0][1]["idempotency_key"] == "a"
+
+
+class TestMiddlewareDebitBatching:
+    """Test the middleware routes debits through the aggregator when enabled."""
+
+    @pytest.mark.asyncio
+    async def test_debits_are_queued_and_flushed_on_close(self):
+        """Test queued debits are posted through the pooled client at shutdown."""
+
+        # Arrange
+        async def app(scope, receive, send):
+            pass
+
+        middleware = APIKeyAuthMiddleware(
+            app=app,
+            auth_service_url="http://test-auth-service",
+            cache=None,
+            debit_batching=True,
+        )
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+
+        with patch("httpx.AsyncClient") as mock_client_cls:
+            mock_client = AsyncMock()
+            mock_client.post.return_value = mock_response
+            mock_client_cls.return_value = mock_client
+
+            # Act
+            outcomes = [
+                await middleware._debit_usage("key123", "model-1", "/predict", 5, 200)
+                for _ in range(4)
+            ]
+            await middleware.aclose()
+
+        # Assert
+        assert outcomes == ["queued"] * 4
+        mock_client_cls.assert_called_once()
+        mock_client.post.assert_awaited_once()
+        call_args = mock_client.post.call_args
+        assert call_args[0][0] == "http://test-auth-service/api/v1/usage/key123/debit"
+        assert call_args.kwargs["json"]["predictions_count"] == 4
+        assert call_args.kwargs["json"]["compute_ms"] == 20
+        mock_client.aclose.assert_awaited_once()
+
+    def test_batching_defaults_to_environment_flag(self, monkeypatch):
+        """Test ENABLE_USAGE_DEBIT_BATCHING opts a deployment into batching."""
+
+        async def app(scope, receive, send):
+            pass
+
+        monkeypatch.delenv("ENABLE_USAGE_DEBIT_BATCHING", raising=False)
+        assert APIKeyAuthMiddleware(app=app, cache=None)._debit_aggregator is None
+
+        monkeypatch.setenv("ENABLE_USAGE_DEBIT_BATCHING", "true")
+        assert APIKeyAuthMiddleware(app=app, cache=None)._debit_aggregator is not None
@@ -37,9 +37,10 @@ async def test_auth_headers_are_forwarded_after_fix():
     mock_request.body = mock_body
     
     # Mock httpx client to capture the forwarded request
-    with patch('src.api.routes.mlflow_proxy_improved.httpx.AsyncClient') as mock_client_class:
+    with patch('src.api.routes.mlflow_proxy_improved.get_proxy_client') as mock_get_client:
         mock_client = AsyncMock()
-        mock_client_class.return_value.__aenter__.return_value = mock_client
+        mock_client.build_request = Mock()
+        mock_get_client.return_value = mock_client
         
         # Create a mock response
         mock_response = Mock()
@@ -48,7 +49,7 @@ async def test_auth_headers_are_forwarded_after_fix():
         mock_response.headers = {"content-type": "application/json"}
         mock_response.text = '{"model_id": "123", "status": "success"}'
         
-        mock_client.request.return_value = mock_response
+        mock_client.send.return_value = mock_response
         
         # Call the proxy function
         result = await proxy_request(
@@ -58,10 +59,10 @@ async def test_auth_headers_are_forwarded_after_fix():
         )
         
         # Verify the request was made
-        mock_client.request.assert_called_once()
+        mock_client.build_request.assert_called_once()
         
         # Get the actual call arguments
-        call_args = mock_client.request.call_args
+        call_args = mock_client.build_request.call_args
         forwarded_headers = call_args.kwargs['headers']
         
         # CRITICAL ASSERTIONS: Auth headers should NOW be forwarded after the fix
@@ -111,9 +112,10 @@ async def test_mlflow_request_with_all_auth_formats():
             return b''
         mock_request.body = mock_body
         
-        with patch('src.api.routes.mlflow_proxy_improved.httpx.AsyncClient') as mock_client_class:
+        with patch('src.api.routes.mlflow_proxy_improved.get_proxy_client') as mock_get_client:
             mock_client = AsyncMock()
-            mock_client_class.return_value.__aenter__.return_value = mock_client
+            mock_client.build_request = Mock()
+            mock_get_client.return_value = mock_client
             
             mock_response = Mock()
             mock_response.status_code = 200
@@ -121,7 +123,7 @@ async def test_mlflow_request_with_all_auth_formats():
             mock_response.headers = {"content-type": "application/json"}
             mock_response.text = '{"success": true}'
             
-            mock_client.request.return_value = mock_response
+            mock_client.send.return_value = mock_response
             
             await proxy_request(
                 request=mock_request,
@@ -129,7 +131,7 @@ async def test_mlflow_request_with_all_auth_formats():
                 mlflow_base_url="http://mlflow:5000"
             )
             
-            call_args = mock_client.request.call_args
+            call_args = mock_client.build_request.call_args
             forwarded_headers = call_args.kwargs['headers']
             
             assert 'authorization' in forwarded_headers, f"{description} should be forwarded"
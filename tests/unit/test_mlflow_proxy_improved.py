@@ -1,13 +1,21 @@
 """Unit tests for improved MLflow proxy routing."""
 
+import asyncio
 import json
 from unittest.mock import AsyncMock, Mock, patch
 
 import httpx
 import pytest
 from fastapi import HTTPException, Request
+from fastapi.responses import StreamingResponse
 
-from src.api.routes.mlflow_proxy_improved import mlflow_health_check, proxy_request
+from src.api.routes.mlflow_proxy_improved import (
+    PROXY_LIMITS,
+    close_proxy_client,
+    get_proxy_client,
+    mlflow_health_check,
+    proxy_request,
+)
 
 
 @pytest.mark.asyncio
@@ -30,14 +38,15 @@ class TestMLflowProxyImproved:
     @pytest.mark.asyncio
     async def test_proxy_request_internal_mlflow(self, mock_request):
         """Test proxying to internal MLflow service."""
-        with patch("httpx.AsyncClient") as mock_client_class:
+        with patch("src.api.routes.mlflow_proxy_improved.get_proxy_client") as mock_get_client:
             mock_client = AsyncMock()
+            mock_client.build_request = Mock()
             mock_response = Mock()
             mock_response.status_code = 200
             mock_response.content = b'{"experiments": []}'
             mock_response.headers = {}
-            mock_client.request.return_value = mock_response
-            mock_client_class.return_value.__aenter__.return_value = mock_client
+            mock_client.send.return_value = mock_response
+            mock_get_client.return_value = mock_client
 
             # Test with internal MLflow URL
             with patch(
@@ -47,8 +56,8 @@ class TestMLflowProxyImproved:
                 response = await proxy_request(mock_request, "api/2.0/mlflow/experiments/search")
 
             # Verify the request was made to the correct URL
-            mock_client.request.assert_called_once()
-            call_args = mock_client.request.call_args
+            mock_client.build_request.assert_called_once()
+            call_args = mock_client.build_request.call_args
             assert (
                 call_args[1]["url"]
                 == "http://mlflow.hokusai-development.local:5000/api/2.0/mlflow/experiments/search"
@@ -58,14 +67,15 @@ class TestMLflowProxyImproved:
     @pytest.mark.asyncio
     async def test_proxy_request_external_mlflow(self, mock_request):
         """Test proxying to external MLflow with ajax-api conversion."""
-        with patch("httpx.AsyncClient") as mock_client_class:
+        with patch("src.api.routes.mlflow_proxy_improved.get_proxy_client") as mock_get_client:
             mock_client = AsyncMock()
+            mock_client.build_request = Mock()
             mock_response = Mock()
             mock_response.status_code = 200
             mock_response.content = b'{"experiments": []}'
             mock_response.headers = {}
-            mock_client.request.return_value = mock_response
-            mock_client_class.return_value.__aenter__.return_value = mock_client
+            mock_client.send.return_value = mock_response
+            mock_get_client.return_value = mock_client
 
             # Test with external MLflow URL - pass it directly to proxy_request
             response = await proxy_request(
@@ -75,8 +85,8 @@ class TestMLflowProxyImproved:
             )
 
             # Verify ajax-api conversion happened
-            mock_client.request.assert_called_once()
-            call_args = mock_client.request.call_args
+            mock_client.build_request.assert_called_once()
+            call_args = mock_client.build_request.call_args
             assert (
                 call_args[1]["url"]
                 == "https://registry.hokus.ai/mlflow/ajax-api/2.0/mlflow/experiments/search"
@@ -86,19 +96,20 @@ class TestMLflowProxyImproved:
     @pytest.mark.asyncio
     async def test_proxy_artifact_request(self, mock_request):
         """Test proxying artifact requests."""
-        with patch("httpx.AsyncClient") as mock_client_class:
+        with patch("src.api.routes.mlflow_proxy_improved.get_proxy_client") as mock_get_client:
             mock_client = AsyncMock()
+            mock_client.build_request = Mock()
             mock_response = Mock()
             mock_response.status_code = 200
             mock_response.content = b"artifact data"
             mock_response.headers = {}
-            mock_client.request.return_value = mock_response
-            mock_client_class.return_value.__aenter__.return_value = mock_client
+            mock_client.send.return_value = mock_response
+            mock_get_client.return_value = mock_client
 
             response = await proxy_request(mock_request, "api/2.0/mlflow-artifacts/artifacts/123")
 
             # Verify artifact request was proxied
-            mock_client.request.assert_called_once()
+            mock_client.build_request.assert_called_once()
             assert response.status_code == 200
 
     @pytest.mark.asyncio
@@ -111,19 +122,20 @@ class TestMLflowProxyImproved:
             "user-agent": "test-client",
         }
 
-        with patch("httpx.AsyncClient") as mock_client_class:
+        with patch("src.api.routes.mlflow_proxy_improved.get_proxy_client") as mock_get_client:
             mock_client = AsyncMock()
+            mock_client.build_request = Mock()
             mock_response = Mock()
             mock_response.status_code = 200
             mock_response.content = b"{}"
             mock_response.headers = {}
-            mock_client.request.return_value = mock_response
-            mock_client_class.return_value.__aenter__.return_value = mock_client
+            mock_client.send.return_value = mock_response
+            mock_get_client.return_value = mock_client
 
             await proxy_request(mock_request, "api/2.0/mlflow/experiments/search")
 
             # Verify auth headers were preserved
-            call_args = mock_client.request.call_args
+            call_args = mock_client.build_request.call_args
             headers = call_args[1]["headers"]
             assert "authorization" in headers
             assert "x-api-key" in headers
@@ -132,19 +144,20 @@ class TestMLflowProxyImproved:
     @pytest.mark.asyncio
     async def test_proxy_adds_user_context(self, mock_request):
         """Test that user context headers are added."""
-        with patch("httpx.AsyncClient") as mock_client_class:
+        with patch("src.api.routes.mlflow_proxy_improved.get_proxy_client") as mock_get_client:
             mock_client = AsyncMock()
+            mock_client.build_request = Mock()
             mock_response = Mock()
             mock_response.status_code = 200
             mock_response.content = b"{}"
             mock_response.headers = {}
-            mock_client.request.return_value = mock_response
-            mock_client_class.return_value.__aenter__.return_value = mock_client
+            mock_client.send.return_value = mock_response
+            mock_get_client.return_value = mock_client
 
             await proxy_request(mock_request, "api/2.0/mlflow/experiments/search")
 
             # Verify user context headers were added
-            call_args = mock_client.request.call_args
+            call_args = mock_client.build_request.call_args
             headers = call_args[1]["headers"]
             assert headers["X-Hokusai-User-Id"] == "test-user-123"
             assert headers["X-Hokusai-API-Key-Id"] == "key-456"
@@ -152,10 +165,11 @@ class TestMLflowProxyImproved:
     @pytest.mark.asyncio
     async def test_proxy_timeout_error(self, mock_request):
         """Test handling of timeout errors."""
-        with patch("httpx.AsyncClient") as mock_client_class:
+        with patch("src.api.routes.mlflow_proxy_improved.get_proxy_client") as mock_get_client:
             mock_client = AsyncMock()
-            mock_client.request.side_effect = httpx.TimeoutException("Request timed out")
-            mock_client_class.return_value.__aenter__.return_value = mock_client
+            mock_client.build_request = Mock()
+            mock_client.send.side_effect = httpx.TimeoutException("Request timed out")
+            mock_get_client.return_value = mock_client
 
             with pytest.raises(HTTPException) as exc_info:
                 await proxy_request(mock_request, "api/2.0/mlflow/experiments/search")
@@ -166,10 +180,11 @@ class TestMLflowProxyImproved:
     @pytest.mark.asyncio
     async def test_proxy_connection_error(self, mock_request):
         """Test handling of connection errors."""
-        with patch("httpx.AsyncClient") as mock_client_class:
+        with patch("src.api.routes.mlflow_proxy_improved.get_proxy_client") as mock_get_client:
             mock_client = AsyncMock()
-            mock_client.request.side_effect = httpx.ConnectError("Connection refused")
-            mock_client_class.return_value.__aenter__.return_value = mock_client
+            mock_client.build_request = Mock()
+            mock_client.send.side_effect = httpx.ConnectError("Connection refused")
+            mock_get_client.return_value = mock_client
 
             with pytest.raises(HTTPException) as exc_info:
                 await proxy_request(mock_request, "api/2.0/mlflow/experiments/search")
@@ -219,14 +234,15 @@ class TestMLflowProxyImproved:
     @pytest.mark.asyncio
     async def test_artifact_path_translation_external(self, mock_request):
         """Test artifact path translation for external MLflow (registry.hokus.ai)."""
-        with patch("httpx.AsyncClient") as mock_client_class:
+        with patch("src.api.routes.mlflow_proxy_improved.get_proxy_client") as mock_get_client:
             mock_client = AsyncMock()
+            mock_client.build_request = Mock()
             mock_response = Mock()
             mock_response.status_code = 200
             mock_response.content = b"{}"
             mock_response.headers = {}
-            mock_client.request.return_value = mock_response
-            mock_client_class.return_value.__aenter__.return_value = mock_client
+            mock_client.send.return_value = mock_response
+            mock_get_client.return_value = mock_client
 
             # Test with external MLflow URL (registry.hokus.ai)
             await proxy_request(
@@ -234,8 +250,8 @@ class TestMLflowProxyImproved:
             )
 
             # Verify the artifact path was translated to ajax-api
-            mock_client.request.assert_called_once()
-            call_args = mock_client.request.call_args
+            mock_client.build_request.assert_called_once()
+            call_args = mock_client.build_request.call_args
             assert (
                 call_args[1]["url"]
                 == "https://registry.hokus.ai/ajax-api/2.0/mlflow-artifacts/artifacts"
@@ -244,14 +260,15 @@ class TestMLflowProxyImproved:
     @pytest.mark.asyncio
     async def test_artifact_path_no_translation_internal(self, mock_request):
         """Test artifact path is NOT translated for internal MLflow."""
-        with patch("httpx.AsyncClient") as mock_client_class:
+        with patch("src.api.routes.mlflow_proxy_improved.get_proxy_client") as mock_get_client:
             mock_client = AsyncMock()
+            mock_client.build_request = Mock()
             mock_response = Mock()
             mock_response.status_code = 200
             mock_response.content = b"{}"
             mock_response.headers = {}
-            mock_client.request.return_value = mock_response
-            mock_client_class.return_value.__aenter__.return_value = mock_client
+            mock_client.send.return_value = mock_response
+            mock_get_client.return_value = mock_client
 
             # Test with internal MLflow URL
             await proxy_request(
@@ -259,8 +276,8 @@ class TestMLflowProxyImproved:
             )
 
             # Verify the artifact path was NOT translated
-            mock_client.request.assert_called_once()
-            call_args = mock_client.request.call_args
+            mock_client.build_request.assert_called_once()
+            call_args = mock_client.build_request.call_args
             assert (
                 call_args[1]["url"]
                 == "http://mlflow.internal:5000/api/2.0/mlflow-artifacts/artifacts"
@@ -269,15 +286,18 @@ class TestMLflowProxyImproved:
     @pytest.mark.asyncio
     async def test_html_404_to_json_conversion(self, mock_request):
         """Test HTML 404 responses are converted to JSON."""
-        with patch("httpx.AsyncClient") as mock_client_class:
+        with patch("src.api.routes.mlflow_proxy_improved.get_proxy_client") as mock_get_client:
             mock_client = AsyncMock()
+            mock_client.build_request = Mock()
             mock_response = Mock()
+            mock_response.aread = AsyncMock()
+            mock_response.aclose = AsyncMock()
             mock_response.status_code = 404
             mock_response.content = b"<!doctype html><html><title>404 Not Found</title></html>"
             mock_response.text = "<!doctype html><html><title>404 Not Found</title></html>"
             mock_response.headers = {"Content-Type": "text/html; charset=utf-8"}
-            mock_client.request.return_value = mock_response
-            mock_client_class.return_value.__aenter__.return_value = mock_client
+            mock_client.send.return_value = mock_response
+            mock_get_client.return_value = mock_client
 
             # Test with a path that returns HTML 404
             response = await proxy_request(mock_request, "api/2.0/mlflow-artifacts/test-artifact")
@@ -294,15 +314,18 @@ class TestMLflowProxyImproved:
     @pytest.mark.asyncio
     async def test_json_404_not_converted(self, mock_request):
         """Test JSON 404 responses are NOT converted."""
-        with patch("httpx.AsyncClient") as mock_client_class:
+        with patch("src.api.routes.mlflow_proxy_improved.get_proxy_client") as mock_get_client:
             mock_client = AsyncMock()
+            mock_client.build_request = Mock()
             mock_response = Mock()
+            mock_response.aread = AsyncMock()
+            mock_response.aclose = AsyncMock()
             mock_response.status_code = 404
             mock_response.content = b'{"error": "Not found"}'
             mock_response.text = '{"error": "Not found"}'
             mock_response.headers = {"Content-Type": "application/json"}
-            mock_client.request.return_value = mock_response
-            mock_client_class.return_value.__aenter__.return_value = mock_client
+            mock_client.send.return_value = mock_response
+            mock_get_client.return_value = mock_client
 
             # Test with a path that returns JSON 404
             response = await proxy_request(mock_request, "api/2.0/mlflow/experiments/get")
@@ -310,3 +333,137 @@ class TestMLflowProxyImproved:
             # Verify the response was NOT converted
             assert response.status_code == 404
             assert response.body == b'{"error": "Not found"}'
+
+
+@pytest.mark.asyncio
+class TestMLflowProxyStreaming:
+    """Test the pooled client and streamed request/response bodies."""
+
+    async def test_upload_and_download_are_streamed(self):
+        """Test request chunks reach MLflow and the response is relayed as a stream."""
+        received = {}
+
+        async def handler(upstream_request):
+            received["headers"] = upstream_request.headers
+            received["body"] = upstream_request.content
+            return httpx.Response(
+                200,
+                headers={"content-type": "application/octet-stream"},
+                content=artifact_chunks(),
+            )
+
+        async def artifact_chunks():
+            for _ in range(1000):
+                yield b"model-bytes"
+
+        async def body_chunks():
+            yield b"chunk-1/"
+            yield b"chunk-2"
+
+        request = Mock(spec=Request)
+        request.method = "PUT"
+        request.headers = {"content-type": "application/octet-stream", "content-length": "15"}
+        request.query_params = {}
+        request.state = Mock()
+        request.state.user_id = "test-user-123"
+        request.state.api_key_id = "key-456"
+        request.stream = body_chunks
+        request.body = AsyncMock(side_effect=AssertionError("body must not be buffered"))
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        with patch("src.api.routes.mlflow_proxy_improved.get_proxy_client", return_value=client):
+            response = await proxy_request(
+                request, "api/2.0/mlflow-artifacts/artifacts/1/model.pkl", "http://mlflow:5000"
+            )
+            downloaded = b"".join([chunk async for chunk in response.body_iterator])
+            await response.background()
+        await client.aclose()
+
+        assert isinstance(response, StreamingResponse)
+        assert received["body"] == b"chunk-1/chunk-2"
+        assert received["headers"]["content-length"] == "15"
+        assert "transfer-encoding" not in received["headers"]
+        assert downloaded == b"model-bytes" * 1000
+
+    async def test_hop_by_hop_headers_are_not_forwarded(self):
+        """Test connection-specific headers are stripped in both directions."""
+        received = {}
+
+        async def handler(upstream_request):
+            received["headers"] = upstream_request.headers
+            return httpx.Response(
+                200,
+                headers={"content-type": "application/json", "connection": "close, x-hop"},
+                content=b"{}",
+            )
+
+        request = Mock(spec=Request)
+        request.method = "GET"
+        request.headers = {
+            "authorization": "Bearer token",
+            "connection": "keep-alive, X-Custom-Hop",
+            "keep-alive": "timeout=5",
+            "proxy-connection": "keep-alive",
+            "te": "trailers",
+            "upgrade": "h2c",
+            "x-custom-hop": "1",
+            "x-request-id": "abc",
+        }
+        request.query_params = {}
+        request.state = Mock(spec=[])
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        with patch("src.api.routes.mlflow_proxy_improved.get_proxy_client", return_value=client):
+            response = await proxy_request(
+                request, "api/2.0/mlflow/experiments/list", "http://mlflow:5000"
+            )
+            await response.background()
+        await client.aclose()
+
+        forwarded = {key.lower() for key in received["headers"].keys()}
+        for name in ("keep-alive", "proxy-connection", "te", "upgrade", "x-custom-hop"):
+            assert name not in forwarded
+        assert received["headers"]["authorization"] == "Bearer token"
+        assert received["headers"]["x-request-id"] == "abc"
+        assert "connection" not in response.headers
+        assert "x-hop" not in response.headers
+
+    async def test_pooled_client_is_reused_until_closed(self):
+        """Test one client serves every proxied request on the loop."""
+        with patch("src.api.routes.mlflow_proxy_improved.httpx.AsyncClient") as mock_client_class:
+            mock_client_class.return_value = AsyncMock()
+
+            first = get_proxy_client()
+            second = get_proxy_client()
+            await close_proxy_client()
+
+        assert first is second
+        mock_client_class.assert_called_once()
+        assert mock_client_class.call_args.kwargs["limits"] is PROXY_LIMITS
+        first.aclose.assert_awaited_once()
+
+
+def test_proxy_clients_are_per_loop_and_all_closed():
+    """Test a loop change opens a new client and shutdown closes every live one."""
+    from src.api.routes import mlflow_proxy_improved
+
+    async def client_for_loop():
+        return get_proxy_client()
+
+    # The first loop closes before the second one starts, so its client is dropped
+    first = asyncio.run(client_for_loop())
+
+    async def use_and_close():
+        second = get_proxy_client()
+        again = get_proxy_client()
+        live = len(mlflow_proxy_improved._proxy_clients)
+        await close_proxy_client()
+        return second, again, live
+
+    second, again, live = asyncio.run(use_and_close())
+
+    assert second is again
+    assert second is not first
+    assert live == 1
+    assert second.is_closed
+    assert mlflow_proxy_improved._proxy_clients == {}
@@ -0,0 +1,185 @@
+"""Unit tests for the persistent model artifact cache."""
+
+from __future__ import annotations
+
+import os
+import pickle
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from src.services.model_storage.artifact_cache import BoundedModelCache, ModelArtifactCache
+
+COMMIT_A = "a" * 40
+COMMIT_B = "b" * 40
+
+
+class FakeHub:
+    """Stand-in for ``hf_hub_download`` that serves in-memory repository files."""
+
+    def __init__(self) -> None:
+        self.files: dict[tuple[str, str], bytes] = {}
+        self.commit = COMMIT_A
+        self.downloads = 0
+
+    def download(self, repo_id, filename, revision, token, cache_dir):
+        self.downloads += 1
+        folder = Path(cache_dir) / f"models--{repo_id.replace('/', '--')}"
+        path = folder / "snapshots" / self.commit / filename
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(self.files[(repo_id, filename)])
+        return str(path)
+
+    def metadata(self, url, token=None):
+        return SimpleNamespace(commit_hash=self.commit)
+
+
+@pytest.fixture()
+def hub():
+    fake = FakeHub()
+    with (
+        patch(
+            "src.services.model_storage.artifact_cache.hf_hub_download",
+            side_effect=fake.download,
+        ),
+        patch(
+            "src.services.model_storage.artifact_cache.get_hf_file_metadata",
+            side_effect=fake.metadata,
+        ),
+    ):
+        yield fake
+
+
+def test_artifact_survives_restart_without_redownload(tmp_path, hub) -> None:
+    hub.files[("org/model", "model.pkl")] = b"weights"
+
+    first = ModelArtifactCache(root_dir=str(tmp_path)).fetch("org/model", "model.pkl")
+    # A new instance stands in for a restarted process
+    second = ModelArtifactCache(root_dir=str(tmp_path)).fetch("org/model", "model.pkl")
+
+    assert first == second
+    assert second.read_bytes() == b"weights"
+    assert hub.downloads == 1
+    assert not any((tmp_path / "tmp").iterdir())
+
+
+def test_identical_content_is_stored_once(tmp_path, hub) -> None:
+    hub.files[("org/a", "model.pkl")] = b"same"
+    hub.files[("org/b", "model.pkl")] = b"same"
+    cache = ModelArtifactCache(root_dir=str(tmp_path))
+
+    assert cache.fetch("org/a", "model.pkl") == cache.fetch("org/b", "model.pkl")
+    assert len(list(cache.blob_dir.iterdir())) == 1
+
+
+def test_least_recently_used_blob_is_evicted(tmp_path, hub) -> None:
+    for name in ("a", "b", "c"):
+        hub.files[(f"org/{name}", "model.pkl")] = name.encode() * 10
+    cache = ModelArtifactCache(root_dir=str(tmp_path), max_bytes=25)
+
+    blob_a = cache.fetch("org/a", "model.pkl")
+    blob_b = cache.fetch("org/b", "model.pkl")
+    old = time.time() - 100
+    os.utime(blob_b, (old, old))
+    cache.fetch("org/c", "model.pkl")
+
+    assert blob_a.exists()
+    assert not blob_b.exists()
+    # The evicted artifact is downloaded again on its next use
+    cache.fetch("org/b", "model.pkl")
+    assert hub.downloads == 4
+
+
+def test_stale_branch_reference_is_revalidated(tmp_path, hub) -> None:
+    hub.files[("org/model", "model.pkl")] = b"v1"
+    cache = ModelArtifactCache(root_dir=str(tmp_path), ref_ttl_seconds=0)
+    cache.fetch("org/model", "model.pkl")
+
+    # Unchanged commit: metadata check only
+    assert cache.fetch("org/model", "model.pkl").read_bytes() == b"v1"
+    assert hub.downloads == 1
+
+    # New commit on the branch: download the new artifact
+    hub.commit = COMMIT_B
+    hub.files[("org/model", "model.pkl")] = b"v2"
+    assert cache.fetch("org/model", "model.pkl").read_bytes() == b"v2"
+    assert hub.downloads == 2
+
+
+def test_cached_copy_is_served_when_hub_is_unreachable(tmp_path, hub) -> None:
+    hub.files[("org/model", "model.pkl")] = b"v1"
+    cache = ModelArtifactCache(root_dir=str(tmp_path), ref_ttl_seconds=0)
+    cache.fetch("org/model", "model.pkl")
+
+    with patch(
+        "src.services.model_storage.artifact_cache.get_hf_file_metadata",
+        side_effect=ConnectionError("offline"),
+    ):
+        assert cache.fetch("org/model", "model.pkl").read_bytes() == b"v1"
+    assert hub.downloads == 1
+
+
+def _fake_snapshot_download(repo_id, revision, token, cache_dir):
+    """Lay out a repository snapshot the way huggingface_hub does."""
+    repo_dir = Path(cache_dir) / f"models--{repo_id.replace('/', '--')}"
+    snapshot = repo_dir / "snapshots" / COMMIT_A
+    snapshot.mkdir(parents=True, exist_ok=True)
+    (repo_dir / "blobs").mkdir(exist_ok=True)
+    (repo_dir / "blobs" / "weights").write_bytes(b"x" * 20)
+    (Path(cache_dir) / ".locks").mkdir(exist_ok=True)
+    return str(snapshot)
+
+
+def test_snapshots_count_toward_budget_and_are_evicted(tmp_path, hub) -> None:
+    hub.files[("org/pkl", "model.pkl")] = b"p" * 10
+    cache = ModelArtifactCache(root_dir=str(tmp_path), max_bytes=45)
+
+    with patch(
+        "src.services.model_storage.artifact_cache.snapshot_download",
+        side_effect=_fake_snapshot_download,
+    ):
+        first = cache.fetch_snapshot("org/first")
+        old = time.time() - 100
+        os.utime(cache.snapshot_dir / "models--org--first", (old, old))
+        blob = cache.fetch("org/pkl", "model.pkl")
+        second = cache.fetch_snapshot("org/second")
+
+    # 20 + 10 + 20 bytes exceeds the budget, so the oldest snapshot goes
+    assert not first.exists()
+    assert second.exists()
+    assert blob.exists()
+    assert (cache.snapshot_dir / ".locks").exists()
+
+
+def test_bounded_model_cache_accounts_bytes() -> None:
+    cache = BoundedModelCache(max_entries=10, max_bytes=100)
+    cache["a"] = {"model": "a", "size_bytes": 40}
+    cache["b"] = {"model": "b", "size_bytes": 40}
+    cache.get("a")
+
+    cache["c"] = {"model": "c", "size_bytes": 40}
+
+    assert "b" not in cache
+    assert "a" in cache and "c" in cache
+    assert cache.total_bytes == 80
+    # A single oversized model is still kept
+    cache["huge"] = {"model": "huge", "size_bytes": 500}
+    assert len(cache) == 1
+
+
+def test_serving_service_loads_from_persistent_cache(tmp_path, hub, monkeypatch) -> None:
+    from src.api.endpoints.model_serving import ModelServingService
+
+    monkeypatch.setenv("MODEL_ARTIFACT_CACHE_DIR", str(tmp_path))
+    monkeypatch.setenv("HUGGINGFACE_API_KEY", "token")
+    hub.files[("org/model", "model.pkl")] = pickle.dumps({"weights": [1, 2]})
+
+    for _ in range(2):
+        service = ModelServingService()
+        model = service._load_model_from_huggingface_sync("org/model", "sklearn")
+
+    assert model == {"weights": [1, 2]}
+    assert hub.downloads == 1
@@ -12,6 +12,7 @@ from dataclasses import replace
 from unittest.mock import AsyncMock, patch
 from uuid import uuid4
 
+import numpy as np
 import pytest
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
@@ -205,7 +206,7 @@ def test_model_21_info_endpoint_shape_is_stable(client: TestClient) -> None:
         "storage": "huggingface_private",
         "is_available": True,
         "inference_methods": ["api", "local"],
-        "max_batch_size": 100,
+        "max_batch_size": 1000,
     }
 
 
@@ -919,3 +920,109 @@ def test_model_21_info_health_predict_regression(client: TestClient) -> None:
     assert predict_response.status_code == 200
     assert predict_response.json()["model_id"] == "21"
     assert predict_response.json()["predictions"]["lead_score"] == 75
+
+
+class _CountingLeadClassifier:
+    """Logistic stand-in for the model 21 sklearn artifact that counts calls."""
+
+    classes_ = [0, 1]
+
+    def __init__(self) -> None:
+        self.proba_calls = 0
+        self.predict_calls = 0
+
+    def predict(self, features):
+        self.predict_calls += 1
+        return self.predict_proba(features).argmax(axis=1)
+
+    def predict_proba(self, features):
+        self.proba_calls += 1
+        logits = (features[:, 1] - 50) / 10 + features[:, 9] - features[:, 8]
+        positive = 1 / (1 + np.exp(-logits))
+        return np.column_stack([1 - positive, positive])
+
+
+def _sales_leads() -> list[dict]:
+    return [
+        {
+            "company_size": 1000,
+            "engagement_score": 85,
+            "industry": "Technology",
+            "decision_timeline": "Q1 2025",
+            "title": "VP of Sales",
+            "demo_requested": True,
+            "budget_confirmed": True,
+        },
+        {"engagement_score": 40, "title": "Marketing Manager", "industry": "Retail"},
+        {"title": "Director, Vice President Office", "decision_timeline": "Unknown"},
+        {"company_size": 10.5, "industry": "Aerospace", "email_opens": 3},
+    ]
+
+
+def test_sales_lead_batch_features_match_single_row_features() -> None:
+    service = model_serving.serving_service
+    leads = _sales_leads()
+
+    batch = service._prepare_sales_lead_features_batch(leads)
+    rows = np.vstack([service._prepare_sales_lead_features(lead) for lead in leads])
+
+    np.testing.assert_array_equal(batch, rows.astype(float))
+
+
+def test_model_21_batch_predict_scores_all_leads_in_one_call(client: TestClient) -> None:
+    classifier = _CountingLeadClassifier()
+    leads = _sales_leads()
+    model_serving.serving_service.model_cache["model_21"] = {"model": {"model": classifier}}
+
+    response = client.post("/api/v1/models/21/predict", json={"inputs": leads})
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["metadata"]["batch_size"] == len(leads)
+    assert body["predictions"]["count"] == len(leads)
+    assert classifier.proba_calls == 1
+    assert classifier.predict_calls == 0
+
+    expected = [
+        model_serving.serving_service._predict_sales_lead_local(classifier, lead) for lead in leads
+    ]
+    assert body["predictions"]["results"] == pytest.approx(expected)
+
+
+def test_batch_predict_rejects_unsupported_model_and_oversized_batch(client: TestClient) -> None:
+    _replace_registry_entry("21", max_batch_size=2)
+    model_serving.serving_service.model_cache["model_21"] = {
+        "model": {"model": _CountingLeadClassifier()}
+    }
+
+    oversized = client.post("/api/v1/models/21/predict", json={"inputs": _sales_leads()})
+    unsupported = client.post("/api/v1/models/27/predict", json={"inputs": [_model_27_inputs()]})
+
+    assert oversized.status_code == 400
+    assert "max_batch_size" in oversized.json()["detail"]
+    assert unsupported.status_code == 400
+
+
+def test_only_served_batches_report_their_record_count(app: FastAPI) -> None:
+    billed: list[object] = []
+
+    @app.middleware("http")
+    async def record_predictions_count(request, call_next):
+        response = await call_next(request)
+        billed.append(getattr(request.state, "predictions_count", None))
+        return response
+
+    client = TestClient(app)
+    model_serving.serving_service.model_cache["model_21"] = {
+        "model": {"model": _CountingLeadClassifier()}
+    }
+    leads = _sales_leads()
+
+    served = client.post("/api/v1/models/21/predict", json={"inputs": leads})
+    _replace_registry_entry("21", max_batch_size=len(leads) - 1)
+    oversized = client.post("/api/v1/models/21/predict", json={"inputs": leads})
+    unsupported = client.post("/api/v1/models/27/predict", json={"inputs": [_model_27_inputs()]})
+
+    assert [served.status_code, oversized.status_code, unsupported.status_code] == [200, 400, 400]
+    # APIKeyAuthMiddleware bills per record only when the count is set
+    assert billed == [len(leads), None, None]
@@ -86,7 +86,7 @@ def mock_auth_service():
             "rate_limit_per_hour": 1000,
         }
 
-        mock_client.return_value.__aenter__.return_value.post = AsyncMock(
+        mock_client.return_value.post = AsyncMock(
             return_value=mock_response
         )
 
@@ -345,7 +345,7 @@ class TestAuthPerformance:
         with patch("src.middleware.auth.httpx.AsyncClient") as mock_client:
             from httpx import TimeoutException
 
-            mock_client.return_value.__aenter__.return_value.post = AsyncMock(
+            mock_client.return_value.post = AsyncMock(
                 side_effect=TimeoutException("Auth service timeout")
             )
 
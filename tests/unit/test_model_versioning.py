@@ -4,6 +4,7 @@ import json
 from datetime import datetime, timedelta
 from unittest.mock import Mock, patch
 
+import pytest
 import redis
 
 from src.services.model_abstraction import ModelStatus
@@ -292,6 +293,59 @@ class TestModelVersionManager:
         # Check that version was updated
         assert self.mock_redis.set.call_count >= 2  # Version and transition
 
+    @pytest.mark.asyncio
+    async def test_get_active_version_async_uses_async_client(self):
+        """Test async active-version lookups go through the asyncio client."""
+        fakeredis = pytest.importorskip("fakeredis")
+        async_redis = fakeredis.aioredis.FakeRedis()
+        manager = ModelVersionManager(self.mock_registry, self.mock_redis, async_redis)
+        version = ModelVersion(
+            model_family="lead_scoring",
+            version="1.5.0",
+            model_id="model_123",
+            status=ModelStatus.PRODUCTION,
+            environment=Environment.PRODUCTION,
+            created_at=datetime.now(),
+            updated_at=datetime.now(),
+            created_by="user@example.com",
+            metadata={},
+            performance_metrics={},
+        )
+        await async_redis.set("active_version:lead_scoring:production", "1.5.0")
+        await async_redis.set("model_version:lead_scoring:1.5.0", json.dumps(version.to_dict()))
+
+        active = await manager.get_active_version_async("lead_scoring", Environment.PRODUCTION)
+
+        assert active.model_id == "model_123"
+        self.mock_redis.get.assert_not_called()
+
+    def test_promote_notifies_listeners(self):
+        """Test promotion listeners are called and their failures are isolated."""
+        current_version = ModelVersion(
+            model_family="lead_scoring",
+            version="1.5.0",
+            model_id="model_123",
+            status=ModelStatus.STAGING,
+            environment=Environment.STAGING,
+            created_at=datetime.now(),
+            updated_at=datetime.now(),
+            created_by="user@example.com",
+            metadata={},
+            performance_metrics={},
+        )
+        self.mock_redis.get.return_value = json.dumps(current_version.to_dict())
+        failing = Mock(side_effect=RuntimeError("boom"))
+        listener = Mock()
+        self.manager.add_promotion_listener(failing)
+        self.manager.add_promotion_listener(listener)
+
+        result = self.manager.promote_model(
+            "lead_scoring", "1.5.0", Environment.PRODUCTION, "admin@example.com", "Passed all tests"
+        )
+
+        assert result is True
+        listener.assert_called_once_with("lead_scoring", "1.5.0", Environment.PRODUCTION)
+
     def test_rollback_version(self):
         """Test rolling back to a previous version."""
         # Mock versions
@@ -6,6 +6,8 @@ import hmac
 import json
 import os
 import sys
+import threading
+import time
 from datetime import datetime
 from unittest.mock import AsyncMock, Mock, patch
 
@@ -360,6 +362,7 @@ class TestWebhookPublisher:
             result = publisher.publish(sample_message.to_dict(), "test-queue")
 
             assert result is True
+            assert publisher.drain(timeout=5)
             mock_send.assert_called_once()
 
     def test_publish_sync_invalid_message(self, publisher):
@@ -427,10 +430,10 @@ class TestWebhookPublisher:
             assert health["status"] == "unhealthy"
             assert "error" in health
 
-    def test_get_queue_depth_not_supported(self, publisher):
-        """Test get_queue_depth returns None (not supported for webhooks)."""
+    def test_get_queue_depth_empty(self, publisher):
+        """Test get_queue_depth reports no pending webhooks on a fresh publisher."""
         depth = publisher.get_queue_depth("test-queue")
-        assert depth is None
+        assert depth == 0
 
     def test_close_publisher(self, publisher):
         """Test closing the publisher."""
@@ -616,3 +619,159 @@ class TestWebhookPublisher:
 
             # Check that error was logged
             assert "Connection failed" in caplog.text
+
+
+class TestWebhookDeliveryQueue:
+    """Test background delivery, backpressure and spill-to-disk."""
+
+    webhook_url = "https://api.example.com/webhooks/model-ready"
+
+    @staticmethod
+    def _message(i=0):
+        return ModelReadyToDeployMessage(
+            model_id=f"queued-model-{i}",
+            token_symbol=f"TOKEN-{i}",
+            metric_name="accuracy",
+            baseline_value=0.8,
+            current_value=0.9,
+            model_name="queued_model",
+            model_version="v1",
+            mlflow_run_id=f"run-{i}",
+        ).to_dict()
+
+    @staticmethod
+    def _gated_sender(gate, delivered):
+        async def send(payload):
+            while not gate.is_set():
+                await asyncio.sleep(0.005)
+            delivered.append(payload["model"]["id"])
+            return True
+
+        return send
+
+    def test_publish_returns_before_delivery_completes(self):
+        """Test a slow consumer does not block the publishing caller."""
+        gate = threading.Event()
+        delivered = []
+        publisher = WebhookPublisher(webhook_url=self.webhook_url)
+        publisher._send_with_circuit_breaker = self._gated_sender(gate, delivered)
+
+        assert publisher.publish(self._message(), "queue") is True
+        assert delivered == []
+        assert publisher.get_delivery_stats()["in_flight"] + publisher.get_queue_depth("q") == 1
+
+        gate.set()
+        publisher.close()
+
+        assert delivered == ["token-0"]
+        assert publisher.get_delivery_stats()["delivered"] == 1
+
+    def test_deliveries_run_concurrently(self):
+        """Test several webhooks are in flight at once."""
+        active = []
+        peak = []
+
+        async def send(payload):
+            active.append(payload)
+            peak.append(len(active))
+            await asyncio.sleep(0.05)
+            active.remove(payload)
+            return True
+
+        publisher = WebhookPublisher(
+            webhook_url=self.webhook_url, config={"max_concurrent_deliveries": 3}
+        )
+        publisher._send_with_circuit_breaker = send
+
+        for i in range(6):
+            publisher.publish(self._message(i))
+        assert publisher.drain(timeout=5)
+        publisher.close()
+
+        assert max(peak) == 3
+        assert publisher.get_delivery_stats()["delivered"] == 6
+
+    def test_full_queue_drops_without_spill_dir(self):
+        """Test the bounded queue rejects messages once full."""
+        gate = threading.Event()
+        publisher = WebhookPublisher(
+            webhook_url=self.webhook_url,
+            config={"max_queue_size": 2, "max_concurrent_deliveries": 1},
+        )
+        publisher._send_with_circuit_breaker = self._gated_sender(gate, [])
+
+        results = [publisher.publish(self._message(i)) for i in range(5)]
+
+        # One in flight, two queued, the rest rejected
+        deadline = time.monotonic() + 5
+        while publisher.get_delivery_stats()["in_flight"] != 1 and time.monotonic() < deadline:
+            time.sleep(0.005)
+        assert results.count(False) >= 2
+        assert publisher.get_delivery_stats()["dropped"] == results.count(False)
+        gate.set()
+        publisher.close()
+
+    def test_overflow_is_spilled_and_replayed_in_order(self, tmp_path):
+        """Test overflow goes to disk and is delivered after the queue drains."""
+        gate = threading.Event()
+        delivered = []
+        publisher = WebhookPublisher(
+            webhook_url=self.webhook_url,
+            config={"max_queue_size": 1, "max_concurrent_deliveries": 1, "spill_dir": tmp_path},
+        )
+        publisher._send_with_circuit_breaker = self._gated_sender(gate, delivered)
+
+        assert all(publisher.publish(self._message(i)) for i in range(4))
+        assert publisher.get_delivery_stats()["spilled"] >= 2
+
+        gate.set()
+        assert publisher.drain(timeout=5)
+        publisher.close()
+
+        assert delivered == [f"token-{i}" for i in range(4)]
+        assert list(tmp_path.glob("*.json")) == []
+
+    def test_spilled_webhooks_survive_restart(self, tmp_path):
+        """Test undelivered webhooks are written to disk on close and replayed by a new process."""
+        never = threading.Event()
+        config = {
+            "max_queue_size": 10,
+            "max_concurrent_deliveries": 1,
+            "spill_dir": tmp_path,
+            "drain_timeout": 0.05,
+        }
+        first = WebhookPublisher(webhook_url=self.webhook_url, config=config)
+        first._send_with_circuit_breaker = self._gated_sender(never, [])
+        for i in range(3):
+            first.publish(self._message(i))
+        first.close()
+
+        assert len(list(tmp_path.glob("*.json"))) == 3
+
+        restarted = WebhookPublisher(webhook_url=self.webhook_url, config=config)
+        restarted._send_with_circuit_breaker = AsyncMock(return_value=True)
+        assert restarted.get_queue_depth("q") == 3
+        restarted._ensure_worker()
+        assert restarted.drain(timeout=5)
+        restarted.close()
+
+        assert restarted._send_with_circuit_breaker.await_count == 3
+        assert list(tmp_path.glob("*.json")) == []
+
+    def test_worker_registers_atexit_drain_until_closed(self):
+        """Test callers that never close the publisher still drain it at exit."""
+        publisher = WebhookPublisher(webhook_url=self.webhook_url)
+        publisher._send_with_circuit_breaker = AsyncMock(return_value=True)
+
+        with (
+            patch("src.events.publishers.webhook_publisher.atexit.register") as register,
+            patch("src.events.publishers.webhook_publisher.atexit.unregister") as unregister,
+        ):
+            publisher.publish(self._message())
+            register.assert_called_once_with(publisher.close)
+
+            # Simulate interpreter exit running the registered hook
+            register.call_args.args[0]()
+
+        unregister.assert_called_once_with(publisher.close)
+        assert publisher.get_delivery_stats()["delivered"] == 1